@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark authenticated GET /status throughput of the REST API.
+
+Drives concurrent authenticated requests against an in-process app (no
+network, via httpx's ASGI transport) with CLAUDETM_PASSWORD_HASH set, and
+prints requests/sec and p99 latency for each PasswordAuthMiddleware setup:
+    - inline: bcrypt on every request, on the event loop (previous behavior)
+    - threadpool: bcrypt on every request, in a worker thread
+    - cached: verified tokens cached, bcrypt only on the first request
+
+Each setup gets one untimed warm-up request first.
+
+Usage:
+    python scripts/benchmark_auth.py                     # 200 requests, 20 concurrent
+    python scripts/benchmark_auth.py --requests 500 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+# Allow running from a source checkout without installing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import httpx  # noqa: E402
+from starlette.middleware import Middleware  # noqa: E402
+
+from claude_task_master.api.server import create_app  # noqa: E402
+from claude_task_master.auth import middleware as auth_middleware  # noqa: E402
+from claude_task_master.auth.cache import VerifiedTokenCache  # noqa: E402
+from claude_task_master.auth.middleware import PasswordAuthMiddleware  # noqa: E402
+from claude_task_master.auth.password import hash_password  # noqa: E402
+from claude_task_master.core.state import StateManager, TaskOptions  # noqa: E402
+
+PASSWORD = "benchmark-password"
+
+
+async def _run_inline(func: Any, *args: Any) -> Any:
+    """Stand-in for run_in_threadpool that blocks the event loop."""
+    return func(*args)
+
+
+def build_app(working_dir: Path, cache: bool) -> Any:
+    """Create the API app with the auth middleware configured for a run."""
+    app = create_app(working_dir=working_dir, include_docs=False)
+    ttl = 300.0 if cache else 0.0
+    app.user_middleware = [
+        Middleware(PasswordAuthMiddleware, token_cache=VerifiedTokenCache(ttl=ttl))
+        if m.cls is PasswordAuthMiddleware
+        else m
+        for m in app.user_middleware
+    ]
+    return app
+
+
+async def drive(app: Any, requests: int, concurrency: int) -> tuple[float, float]:
+    """Send authenticated GET /status requests and return (req/s, p99 ms)."""
+    headers = {"Authorization": f"Bearer {PASSWORD}"}
+    transport = httpx.ASGITransport(app=app)
+    samples: list[float] = []
+    remaining = iter(range(requests))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/status", headers=headers)  # Warm-up, not timed
+
+        async def worker() -> None:
+            for _ in remaining:
+                start = time.perf_counter()
+                response = await client.get("/status", headers=headers)
+                samples.append((time.perf_counter() - start) * 1000)
+                if response.status_code != 200:
+                    raise RuntimeError(f"GET /status returned {response.status_code}")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    samples.sort()
+    return requests / elapsed, samples[max(0, int(len(samples) * 0.99) - 1)]
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark authenticated /status throughput")
+    parser.add_argument(
+        "--requests", type=int, default=200, help="Requests per setup (default: 200)"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=20, help="Concurrent clients (default: 20)"
+    )
+    args = parser.parse_args()
+
+    os.environ.pop("CLAUDETM_PASSWORD", None)
+    os.environ["CLAUDETM_PASSWORD_HASH"] = hash_password(PASSWORD)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        working_dir = Path(tmp)
+        StateManager(working_dir / ".claude-task-master").initialize(
+            goal="Benchmark", model="sonnet", options=TaskOptions()
+        )
+
+        print(f"{'setup':<12} {'req/s':>8} {'p99 ms':>8}")
+        rates: list[float] = []
+        for name, cache, inline in [
+            ("inline", False, True),
+            ("threadpool", False, False),
+            ("cached", True, False),
+        ]:
+            app = build_app(working_dir, cache)
+            if inline:
+                with patch.object(auth_middleware, "run_in_threadpool", _run_inline):
+                    rate, p99 = asyncio.run(drive(app, args.requests, args.concurrency))
+            else:
+                rate, p99 = asyncio.run(drive(app, args.requests, args.concurrency))
+            rates.append(rate)
+            print(f"{name:<12} {rate:>8.1f} {p99:>8.1f}")
+
+    print(f"\ncached vs inline: {rates[-1] / rates[0]:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
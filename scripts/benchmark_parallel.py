@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Benchmark ParallelExecutor execution backends.
+
+Runs the same workloads on the thread, process and asyncio backends and
+prints wall time and throughput for each:
+    - cpu: Parse and summarise large synthetic plans (GIL-bound)
+    - io: Sleep to simulate waiting on the network or a subprocess
+    - mixed: Half cpu tasks, half io tasks
+
+Usage:
+    python scripts/benchmark_parallel.py                  # All workloads
+    python scripts/benchmark_parallel.py --workload cpu   # One workload
+    python scripts/benchmark_parallel.py --tasks 32 --workers 8
+"""
+
+import argparse
+import functools
+import re
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Allow running from a source checkout without installing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from claude_task_master.core.parallel import (  # noqa: E402
+    ExecutorBackend,
+    ParallelExecutor,
+    ParallelExecutorConfig,
+    ParallelTask,
+)
+
+CHECKBOX_PATTERN = re.compile(r"^\s*- \[([ xX])\] (.+)$", re.MULTILINE)
+
+
+def parse_plan(lines: int) -> int:
+    """CPU-bound task: build a plan document and count completed tasks."""
+    plan = "\n".join(
+        f"- [{'x' if i % 3 == 0 else ' '}] Task {i}: update module_{i % 17}.py"
+        for i in range(lines)
+    )
+    completed = 0
+    for _ in range(20):
+        completed = sum(1 for mark, _ in CHECKBOX_PATTERN.findall(plan) if mark != " ")
+    return completed
+
+
+def wait_io(seconds: float) -> float:
+    """I/O-bound task: sleep for a fixed time."""
+    time.sleep(seconds)
+    return seconds
+
+
+def build_workload(name: str, tasks: int) -> list[Callable[[], Any]]:
+    """Build the task functions for a workload."""
+    cpu = functools.partial(parse_plan, 5000)
+    io = functools.partial(wait_io, 0.05)
+    if name == "cpu":
+        return [cpu] * tasks
+    if name == "io":
+        return [io] * tasks
+    return [cpu if i % 2 == 0 else io for i in range(tasks)]
+
+
+def run_backend(backend: ExecutorBackend, funcs: list[Callable[[], Any]], workers: int) -> float:
+    """Run one workload on one backend and return the wall time."""
+    executor = ParallelExecutor(
+        config=ParallelExecutorConfig(
+            max_workers=workers, backend=backend, use_circuit_breaker=False, max_retries=0
+        )
+    )
+    for i, func in enumerate(funcs):
+        executor.add_task(ParallelTask(task_id=f"task{i}", func=func))
+
+    start = time.perf_counter()
+    results = executor.execute_all()
+    elapsed = time.perf_counter() - start
+
+    failed = [r.task_id for r in results.values() if not r.is_success]
+    if failed:
+        raise RuntimeError(f"{backend.value}: {len(failed)} tasks failed")
+    return elapsed
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark ParallelExecutor backends")
+    parser.add_argument(
+        "--workload",
+        choices=["cpu", "io", "mixed", "all"],
+        default="all",
+        help="Workload to run (default: all)",
+    )
+    parser.add_argument("--tasks", type=int, default=16, help="Tasks per workload (default: 16)")
+    parser.add_argument("--workers", type=int, default=4, help="max_workers (default: 4)")
+    args = parser.parse_args()
+
+    workloads = ["cpu", "io", "mixed"] if args.workload == "all" else [args.workload]
+
+    print(f"{'workload':<8} {'backend':<8} {'wall (s)':>9} {'tasks/s':>9}")
+    for workload in workloads:
+        funcs = build_workload(workload, args.tasks)
+        for backend in ExecutorBackend:
+            elapsed = run_backend(backend, funcs, args.workers)
+            print(f"{workload:<8} {backend.value:<8} {elapsed:>9.3f} {args.tasks / elapsed:>9.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
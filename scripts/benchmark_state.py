@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark state.json save/load latency across state formats.
+
+Saves and loads the same TaskState through StateManager for each format and
+prints the file size and the mean/p99 latency of each operation:
+    - json: Pretty-printed JSON (indent=2, the default)
+    - compact: Single-line JSON using the standard library
+    - compact+orjson: Single-line JSON using orjson (if installed)
+
+Loads bypass the process-wide read cache so every iteration parses the file.
+
+Usage:
+    python scripts/benchmark_state.py                   # 500 iterations
+    python scripts/benchmark_state.py --iterations 2000
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Allow running from a source checkout without installing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from claude_task_master.core import state_codec  # noqa: E402
+from claude_task_master.core.state import StateManager, TaskOptions, TaskState  # noqa: E402
+from claude_task_master.core.state_codec import StateFormat  # noqa: E402
+
+
+def build_state() -> TaskState:
+    """Build a representative state mid-run."""
+    return TaskState(
+        status="working",
+        workflow_stage="waiting_ci",
+        current_task_index=17,
+        session_count=42,
+        current_pr=128,
+        created_at="2025-01-01T00:00:00",
+        updated_at="2025-01-01T00:00:00",
+        run_id="20250101-000000",
+        model="opus",
+        options=TaskOptions(
+            max_sessions=100,
+            webhook_url="https://example.com/hooks/claudetm",
+            webhook_secret="s" * 32,
+        ),
+    )
+
+
+def measure(func: Callable[[], object], iterations: int) -> tuple[float, float]:
+    """Run func repeatedly and return (mean, p99) latency in microseconds."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return statistics.fmean(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+def run_format(fmt: StateFormat, use_orjson: bool, iterations: int) -> tuple[int, ...]:
+    """Benchmark one format and return (size, save mean, save p99, load mean, load p99)."""
+    state_codec.ORJSON_AVAILABLE = use_orjson
+    state = build_state()
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = StateManager(Path(tmp), state_format=fmt)
+        manager.save_state(state, validate_transition=False)
+        size = manager.state_file.stat().st_size
+
+        save_mean, save_p99 = measure(
+            lambda: manager.save_state(state, validate_transition=False), iterations
+        )
+        load_mean, load_p99 = measure(manager._load_state_internal, iterations)
+    return size, round(save_mean), round(save_p99), round(load_mean), round(load_p99)
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark state.json formats")
+    parser.add_argument(
+        "--iterations", type=int, default=500, help="Saves/loads per format (default: 500)"
+    )
+    args = parser.parse_args()
+
+    orjson_installed = state_codec.ORJSON_AVAILABLE
+    variants = [("json", StateFormat.JSON, False), ("compact", StateFormat.COMPACT, False)]
+    if orjson_installed:
+        variants.append(("compact+orjson", StateFormat.COMPACT, True))
+    else:
+        print("orjson not installed; skipping compact+orjson (pip install orjson)\n")
+
+    print(
+        f"{'format':<15} {'bytes':>6} {'save µs':>8} {'save p99':>9} {'load µs':>8} {'load p99':>9}"
+    )
+    for name, fmt, use_orjson in variants:
+        size, save_mean, save_p99, load_mean, load_p99 = run_format(
+            fmt, use_orjson, args.iterations
+        )
+        print(f"{name:<15} {size:>6} {save_mean:>8} {save_p99:>9} {load_mean:>8} {load_p99:>9}")
+
+    state_codec.ORJSON_AVAILABLE = orjson_installed
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
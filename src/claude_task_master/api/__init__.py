@@ -10,6 +10,7 @@ Currently Implemented Endpoints:
 - GET /progress: Get progress summary
 - GET /context: Get accumulated context/learnings
 - GET /health: Health check endpoint
+- GET /events: Server-sent event stream of run changes
 
 Usage:
     # Import and create the app
@@ -27,6 +28,7 @@ Usage:
 from claude_task_master.api.models import (
     # Response models
     APIInfo,
+    CircuitBreakerInfo,
     # Request models
     ConfigUpdateRequest,
     ContextResponse,
@@ -88,6 +90,7 @@ __all__: list[str] = [
     "TaskListItem",
     "TaskListResponse",
     "HealthResponse",
+    "CircuitBreakerInfo",
     "TaskInitResponse",
     "TaskDeleteResponse",
     "ErrorResponse",
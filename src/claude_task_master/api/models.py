@@ -18,6 +18,7 @@ Response Models:
 - ProgressResponse: Progress summary
 - ContextResponse: Accumulated context/learnings
 - HealthResponse: Server health status
+- CircuitBreakerInfo: Circuit breaker snapshot in health responses
 - ErrorResponse: Standard error response
 
 Usage:
@@ -83,6 +84,7 @@ class LogFormat(str, Enum):
 
     TEXT = "text"
     JSON = "json"
+    JSONL = "jsonl"
 
 
 # =============================================================================
@@ -149,7 +151,7 @@ class ConfigUpdateRequest(BaseModel):
         pause_on_pr: Whether to pause after creating PR for manual review.
         enable_checkpointing: Whether to enable state checkpointing.
         log_level: Log level (quiet, normal, verbose).
-        log_format: Log format (text, json).
+        log_format: Log format (text, json, jsonl).
         pr_per_task: Whether to create PR per task vs per group.
     """
 
@@ -177,7 +179,7 @@ class ConfigUpdateRequest(BaseModel):
     )
     log_format: LogFormat | None = Field(
         default=None,
-        description="Log format (text, json)",
+        description="Log format (text, json, jsonl)",
     )
     pr_per_task: bool | None = Field(
         default=None,
@@ -385,14 +387,22 @@ class LogsResponse(BaseModel):
 
     Attributes:
         success: Whether the request succeeded.
-        log_content: The log content (last N lines).
+        log_content: The log content (last N lines, or lines after since_offset).
         log_file: Path to the log file.
+        next_offset: Byte offset to pass as since_offset on the next poll.
+        file_id: Identity of the log file, to pass as since_file_id.
+        reset: True if since_offset was past the end of the file or the file
+            was replaced (log rotated or truncated) and content was read from
+            the start.
         error: Error message if request failed.
     """
 
     success: bool
     log_content: str | None = None
     log_file: str | None = None
+    next_offset: int | None = None
+    file_id: str | None = None
+    reset: bool = False
     error: str | None = None
 
 
@@ -458,6 +468,31 @@ class TaskListResponse(BaseModel):
     error: str | None = None
 
 
+class CircuitBreakerInfo(BaseModel):
+    """Snapshot of one circuit breaker, as reported by the health check.
+
+    Attributes:
+        name: Circuit breaker name.
+        state: Circuit state ("closed", "open", "half_open").
+        mode: Trip mode ("consecutive" or "sliding_window").
+        time_until_retry: Seconds until an open circuit allows a trial call.
+        metrics: Lifetime call counts and failure rate.
+        window: Calls, failures, slow calls and rates in the sliding window
+            (sliding-window mode only).
+        latency: Latency histogram with mean and p50/p90/p99 (ms).
+        transitions: Recent state transitions, oldest first.
+    """
+
+    name: str
+    state: str = Field(examples=["closed", "open", "half_open"])
+    mode: str = Field(examples=["consecutive", "sliding_window"])
+    time_until_retry: float = 0.0
+    metrics: dict[str, Any] = Field(default_factory=dict)
+    window: dict[str, Any] | None = None
+    latency: dict[str, Any] = Field(default_factory=dict)
+    transitions: list[dict[str, Any]] = Field(default_factory=list)
+
+
 class HealthResponse(BaseModel):
     """Response model for health check.
 
@@ -468,6 +503,7 @@ class HealthResponse(BaseModel):
         uptime_seconds: Server uptime in seconds (if available).
         active_tasks: Number of active tasks.
         timestamp: Current server timestamp.
+        circuit_breakers: Registered circuit breakers, by name.
     """
 
     status: str = Field(examples=["healthy", "degraded", "unhealthy"])
@@ -476,6 +512,7 @@ class HealthResponse(BaseModel):
     uptime_seconds: float | None = None
     active_tasks: int = 0
     timestamp: datetime = Field(default_factory=datetime.now)
+    circuit_breakers: dict[str, CircuitBreakerInfo] = Field(default_factory=dict)
 
 
 class TaskInitResponse(BaseModel):
@@ -15,6 +15,7 @@ Endpoints:
 - POST /control/stop: Stop a running task with optional cleanup
 - POST /control/resume: Resume a paused or blocked task
 - PATCH /config: Update runtime configuration options
+- GET /events: Server-sent event stream of log, state and plan changes
 
 Usage:
     from claude_task_master.api.routes import (
@@ -44,6 +45,7 @@ from typing import TYPE_CHECKING, Any
 
 from claude_task_master import __version__
 from claude_task_master.api.models import (
+    CircuitBreakerInfo,
     ConfigUpdateRequest,
     ContextResponse,
     ControlResponse,
@@ -64,10 +66,17 @@ from claude_task_master.api.models import (
     WebhookStatusInfo,
     WorkflowStage,
 )
+from claude_task_master.api.routes_events import create_events_router
 from claude_task_master.api.routes_webhooks import create_webhooks_router
 from claude_task_master.core.agent import ModelType
+from claude_task_master.core.circuit_breaker import (
+    CircuitBreakerRegistry,
+    CircuitBreakerSnapshotFile,
+)
 from claude_task_master.core.control import ControlManager
 from claude_task_master.core.credentials import CredentialManager
+from claude_task_master.core.log_reader import read_since, read_tail
+from claude_task_master.core.logger import get_log_file_for_format
 from claude_task_master.core.state import StateManager, TaskOptions
 
 if TYPE_CHECKING:
@@ -91,25 +100,6 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
-def _parse_plan_tasks(plan: str) -> list[tuple[str, bool]]:
-    """Parse task checkboxes from plan markdown.
-
-    Args:
-        plan: The plan content in markdown format.
-
-    Returns:
-        List of (task_description, is_completed) tuples.
-    """
-    tasks: list[tuple[str, bool]] = []
-    for line in plan.splitlines():
-        line = line.strip()
-        if line.startswith("- [ ] "):
-            tasks.append((line[6:], False))
-        elif line.startswith("- [x] ") or line.startswith("- [X] "):
-            tasks.append((line[6:], True))
-    return tasks
-
-
 def _get_state_manager(request: Request) -> StateManager:
     """Get state manager from request, using working directory from app state.
 
@@ -230,11 +220,10 @@ def create_info_router() -> APIRouter:
 
             # Calculate task progress from plan
             tasks_info: TaskProgressInfo | None = None
-            plan = state_manager.load_plan()
-            if plan:
-                tasks = _parse_plan_tasks(plan)
-                completed = sum(1 for _, done in tasks if done)
-                total = len(tasks)
+            if state_manager.load_plan():
+                plan_index = state_manager.load_plan_index()
+                completed = plan_index.completed_count
+                total = plan_index.total
                 tasks_info = TaskProgressInfo(
                     completed=completed,
                     total=total,
@@ -378,13 +367,30 @@ def create_info_router() -> APIRouter:
             le=10000,
             description="Number of lines to return from the end of the log",
         ),
+        since_offset: int | None = Query(
+            default=None,
+            ge=0,
+            description="Byte offset from a previous response's next_offset; "
+            "returns only lines appended since then (tail is ignored)",
+        ),
+        since_file_id: str | None = Query(
+            default=None,
+            description="file_id from the same previous response; a different "
+            "file (log rotated) restarts reading at offset 0",
+        ),
     ) -> LogsResponse | JSONResponse:
         """Get log content.
 
-        Returns the last N lines from the current run's log file.
+        Returns the last N lines from the current run's log file, or, when
+        since_offset is given, the complete lines appended after that offset.
+        Only the requested part of the file is read.
 
         Args:
             tail: Number of lines to return (default: 100, max: 10000).
+            since_offset: Cursor for incremental polling (next_offset of the
+                previous response).
+            since_file_id: file_id of the previous response, used to detect
+                a rotated log.
 
         Returns:
             LogsResponse with log content and file path.
@@ -407,7 +413,9 @@ def create_info_router() -> APIRouter:
 
         try:
             state = state_manager.load_state()
-            log_file = state_manager.get_log_file(state.run_id)
+            log_file = get_log_file_for_format(
+                state_manager.get_log_file(state.run_id), state.options.log_format
+            )
 
             if not log_file.exists():
                 return JSONResponse(
@@ -419,16 +427,18 @@ def create_info_router() -> APIRouter:
                     ).model_dump(),
                 )
 
-            with open(log_file) as f:
-                lines = f.readlines()
-
-            # Return last N lines
-            log_content = "".join(lines[-tail:])
+            if since_offset is not None:
+                chunk = read_since(log_file, since_offset, file_id=since_file_id)
+            else:
+                chunk = read_tail(log_file, tail)
 
             return LogsResponse(
                 success=True,
-                log_content=log_content,
+                log_content=chunk.content,
                 log_file=str(log_file),
+                next_offset=chunk.next_offset,
+                file_id=chunk.file_id,
+                reset=chunk.reset,
             )
 
         except Exception as e:
@@ -571,6 +581,7 @@ def create_info_router() -> APIRouter:
         - Version information
         - Uptime in seconds
         - Number of active tasks
+        - Circuit breaker state, window rates, latency and transitions
 
         This endpoint is suitable for load balancer health checks
         and monitoring systems.
@@ -596,12 +607,22 @@ def create_info_router() -> APIRouter:
                 # Can't load state - might be degraded
                 status = "degraded"
 
+        # Breakers live in the runner process, which publishes them to the
+        # state directory; breakers registered in this process take precedence
+        breakers = {
+            **CircuitBreakerSnapshotFile.read_state_dir(state_manager.state_dir),
+            **CircuitBreakerRegistry().snapshot_all(),
+        }
+
         return HealthResponse(
             status=status,
             version=__version__,
             server_name="claude-task-master-api",
             uptime_seconds=uptime,
             active_tasks=active_tasks,
+            circuit_breakers={
+                name: CircuitBreakerInfo(**snapshot) for name, snapshot in breakers.items()
+            },
         )
 
     return router
@@ -815,7 +836,7 @@ def create_control_router() -> APIRouter:
         - pause_on_pr: Whether to pause after creating PR for manual review
         - enable_checkpointing: Whether to enable state checkpointing
         - log_level: Log level (quiet, normal, verbose)
-        - log_format: Log format (text, json)
+        - log_format: Log format (text, json, jsonl)
         - pr_per_task: Whether to create PR per task vs per group
 
         Args:
@@ -1129,7 +1150,12 @@ def register_routes(app: FastAPI) -> None:
     webhooks_router = create_webhooks_router()
     app.include_router(webhooks_router, prefix="/webhooks")
 
+    # Create and register event stream router
+    events_router = create_events_router()
+    app.include_router(events_router)
+
     logger.debug("Registered info routes: /status, /plan, /logs, /progress, /context, /health")
     logger.debug("Registered control routes: /control/stop, /control/resume, /config")
     logger.debug("Registered task routes: /task/init, /task")
     logger.debug("Registered webhook routes: /webhooks, /webhooks/{id}, /webhooks/test")
+    logger.debug("Registered event routes: /events")
@@ -0,0 +1,485 @@
+"""Server-sent event stream for following a run over the REST API.
+
+This module provides the GET /events endpoint, which pushes changes to the
+state directory as they happen instead of having clients re-poll /status,
+/logs and /progress.
+
+A single StateWatcher polls ``.claude-task-master/`` (stat first, read only
+when mtime/size change) and an EventHub fans its events out to every
+subscriber. Each subscriber has a bounded queue: when a slow client falls
+behind, the oldest events are dropped and a ``lagged`` event tells it to
+resync from the REST endpoints, so one slow dashboard never stalls the others.
+
+Event types:
+- snapshot: Current state and plan summary, sent once on connect
+- state: TaskState fields changed (status, workflow stage, task index, ...)
+- plan: Plan checkboxes flipped
+- log: New complete lines appended to the run log
+- lagged: Events were dropped for this subscriber
+
+Usage:
+    from claude_task_master.api.routes_events import create_events_router
+
+    router = create_events_router()
+    app.include_router(router)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from claude_task_master.core.log_reader import file_id_of, read_since
+from claude_task_master.core.logger import get_log_file_for_format
+from claude_task_master.core.plan_index import PlanIndex
+
+if TYPE_CHECKING:
+    from fastapi import APIRouter, Request
+    from fastapi.responses import StreamingResponse
+
+# Import FastAPI - using try/except for graceful degradation
+try:
+    from fastapi import APIRouter, Request
+    from fastapi.responses import StreamingResponse
+
+    FASTAPI_AVAILABLE = True
+except ImportError:
+    FASTAPI_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Watcher defaults
+DEFAULT_POLL_INTERVAL = 0.5  # seconds between state directory scans
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 256  # events buffered per subscriber
+KEEPALIVE_INTERVAL = 15.0  # seconds of silence before an SSE comment is sent
+
+# TaskState fields reported in state events
+TRACKED_STATE_FIELDS = (
+    "status",
+    "workflow_stage",
+    "current_task_index",
+    "session_count",
+    "current_pr",
+    "run_id",
+)
+
+
+# =============================================================================
+# Events
+# =============================================================================
+
+
+@dataclass
+class StateEvent:
+    """A single event pushed to subscribers.
+
+    Attributes:
+        type: Event type (snapshot, state, plan, log, lagged).
+        data: JSON-serializable event payload.
+        id: Monotonic event id assigned by the hub.
+    """
+
+    type: str
+    data: dict[str, Any]
+    id: int = 0
+
+    def to_sse(self) -> str:
+        """Format the event as a server-sent event frame."""
+        payload = json.dumps(self.data, separators=(",", ":"), default=str)
+        return f"id: {self.id}\nevent: {self.type}\ndata: {payload}\n\n"
+
+
+@dataclass
+class _FileSignature:
+    """Cheap change detector for a watched file."""
+
+    mtime_ns: int
+    size: int
+    file_id: str
+
+    @classmethod
+    def of(cls, path: Path) -> _FileSignature | None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return cls(mtime_ns=st.st_mtime_ns, size=st.st_size, file_id=file_id_of(st))
+
+
+# =============================================================================
+# Watcher
+# =============================================================================
+
+
+class StateWatcher:
+    """Polls a state directory and turns file changes into events.
+
+    Each poll stats state.json, plan.md and the active log file, and only
+    reads the ones whose signature changed. The first poll records a baseline
+    without emitting events; log lines that already exist are not replayed.
+    """
+
+    def __init__(self, state_dir: Path):
+        """Initialize the watcher.
+
+        Args:
+            state_dir: Path to the .claude-task-master directory.
+        """
+        self.state_dir = state_dir
+        self._state_sig: _FileSignature | None = None
+        self._plan_sig: _FileSignature | None = None
+        self._state: dict[str, Any] = {}
+        self._log_format = "text"
+        self._plan: list[tuple[str, bool]] = []
+        self._log_file: Path | None = None
+        self._log_offset = 0
+        self._log_file_id: str | None = None
+        self._primed = False
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the last observed state and plan summary."""
+        return {
+            "state": dict(self._state),
+            "plan": self._plan_summary(),
+        }
+
+    def _plan_summary(self) -> dict[str, int]:
+        completed = sum(1 for _, done in self._plan if done)
+        return {"completed": completed, "total": len(self._plan)}
+
+    def poll(self) -> list[StateEvent]:
+        """Scan the state directory once.
+
+        Returns:
+            Events for everything that changed since the previous poll.
+        """
+        events: list[StateEvent] = []
+        emit = self._primed
+
+        state_event = self._poll_state()
+        if state_event and emit:
+            events.append(state_event)
+
+        plan_event = self._poll_plan()
+        if plan_event and emit:
+            events.append(plan_event)
+
+        log_event = self._poll_log(replay=emit)
+        if log_event:
+            events.append(log_event)
+
+        self._primed = True
+        return events
+
+    def _poll_state(self) -> StateEvent | None:
+        state_file = self.state_dir / "state.json"
+        sig = _FileSignature.of(state_file)
+        if sig == self._state_sig:
+            return None
+        self._state_sig = sig
+        if sig is None:
+            return None
+
+        try:
+            raw = json.loads(state_file.read_text())
+        except (OSError, json.JSONDecodeError):
+            # Mid-write or removed; try again on the next poll
+            self._state_sig = None
+            return None
+
+        new_state = {key: raw.get(key) for key in TRACKED_STATE_FIELDS}
+        self._log_format = (raw.get("options") or {}).get("log_format", "text")
+        changes = {
+            key: {"from": self._state.get(key), "to": value}
+            for key, value in new_state.items()
+            if self._state.get(key) != value
+        }
+        self._state = new_state
+        if not changes:
+            return None
+        return StateEvent(type="state", data={"changes": changes, "state": dict(new_state)})
+
+    def _poll_plan(self) -> StateEvent | None:
+        plan_file = self.state_dir / "plan.md"
+        sig = _FileSignature.of(plan_file)
+        if sig == self._plan_sig:
+            return None
+        self._plan_sig = sig
+
+        try:
+            plan = PlanIndex.from_text(plan_file.read_text()).items() if sig else []
+        except OSError:
+            self._plan_sig = None
+            return None
+
+        changes = [
+            {"index": i, "task": task, "completed": done}
+            for i, (task, done) in enumerate(plan)
+            if i >= len(self._plan) or self._plan[i] != (task, done)
+        ]
+        replanned = len(plan) != len(self._plan)
+        self._plan = plan
+        if not changes and not replanned:
+            return None
+        return StateEvent(
+            type="plan",
+            data={"changes": changes, "replanned": replanned, **self._plan_summary()},
+        )
+
+    def _poll_log(self, replay: bool) -> StateEvent | None:
+        run_id = self._state.get("run_id")
+        if not run_id:
+            return None
+
+        base = self.state_dir / "logs" / f"run-{run_id}.txt"
+        log_file = get_log_file_for_format(base, self._log_format)
+        if log_file != self._log_file:
+            self._log_file = log_file
+            self._log_offset = 0
+            self._log_file_id = None
+            if not replay:
+                # Start following from the current end of an existing log
+                sig = _FileSignature.of(log_file)
+                if sig:
+                    self._log_offset = sig.size
+                    self._log_file_id = sig.file_id
+
+        sig = _FileSignature.of(log_file)
+        if sig is None or (sig.size == self._log_offset and sig.file_id == self._log_file_id):
+            return None
+
+        try:
+            chunk = read_since(log_file, self._log_offset, file_id=self._log_file_id)
+        except OSError:
+            return None
+        self._log_offset = chunk.next_offset
+        self._log_file_id = chunk.file_id
+        if not chunk.content and not chunk.reset:
+            return None
+        return StateEvent(
+            type="log",
+            data={
+                "content": chunk.content,
+                "offset": chunk.start_offset,
+                "next_offset": chunk.next_offset,
+                "reset": chunk.reset,
+            },
+        )
+
+
+# =============================================================================
+# Hub
+# =============================================================================
+
+
+@dataclass(eq=False)
+class EventSubscription:
+    """A subscriber's bounded event queue.
+
+    Attributes:
+        max_queue: Maximum events buffered before the oldest are dropped.
+        dropped: Total events dropped because the subscriber fell behind.
+    """
+
+    max_queue: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE
+    dropped: int = 0
+    _queue: asyncio.Queue[StateEvent] = field(init=False)
+    _pending_lag: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+
+    def put(self, event: StateEvent) -> None:
+        """Enqueue an event, dropping the oldest one if the queue is full."""
+        if self._queue.full():
+            with contextlib.suppress(asyncio.QueueEmpty):
+                self._queue.get_nowait()
+                self.dropped += 1
+                self._pending_lag += 1
+        self._queue.put_nowait(event)
+
+    async def get(self, timeout: float | None = None) -> StateEvent | None:
+        """Wait for the next event.
+
+        Returns a ``lagged`` event first if events were dropped since the last
+        call, and None if nothing arrived within ``timeout``.
+        """
+        if self._pending_lag:
+            dropped, self._pending_lag = self._pending_lag, 0
+            return StateEvent(type="lagged", data={"dropped": dropped})
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventHub:
+    """Shares one StateWatcher between all subscribers of a state directory.
+
+    The polling task starts with the first subscriber and stops when the last
+    one disconnects, so an idle server does no filesystem work.
+    """
+
+    def __init__(
+        self,
+        state_dir: Path,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_queue: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+    ):
+        """Initialize the hub.
+
+        Args:
+            state_dir: Path to the .claude-task-master directory.
+            poll_interval: Seconds between scans of the state directory.
+            max_queue: Events buffered per subscriber before dropping.
+        """
+        self.watcher = StateWatcher(state_dir)
+        self.poll_interval = poll_interval
+        self.max_queue = max_queue
+        self._subscribers: set[EventSubscription] = set()
+        self._task: asyncio.Task[None] | None = None
+        self._next_id = 0
+        # StateWatcher isn't thread-safe: one poll at a time, and snapshots
+        # are never taken while a poll's events are still unpublished
+        self._poll_lock = asyncio.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of connected subscribers."""
+        return len(self._subscribers)
+
+    @property
+    def running(self) -> bool:
+        """Whether the polling task is active."""
+        return self._task is not None and not self._task.done()
+
+    async def subscribe(self) -> EventSubscription:
+        """Register a subscriber and queue its initial snapshot."""
+        subscription = EventSubscription(max_queue=self.max_queue)
+        async with self._poll_lock:
+            if not self.running:
+                # Prime the watcher so the snapshot reflects current files
+                await asyncio.to_thread(self.watcher.poll)
+            self._subscribers.add(subscription)
+            snapshot = StateEvent(type="snapshot", data=self.watcher.snapshot())
+            subscription.put(self._stamp(snapshot))
+            if not self.running:
+                self._task = asyncio.create_task(self._run())
+        return subscription
+
+    async def unsubscribe(self, subscription: EventSubscription) -> None:
+        """Remove a subscriber, stopping the watcher if it was the last one."""
+        self._subscribers.discard(subscription)
+        if not self._subscribers:
+            await self.close()
+
+    async def close(self) -> None:
+        """Stop the polling task."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def publish(self, event: StateEvent) -> None:
+        """Fan an event out to every subscriber."""
+        self._stamp(event)
+        for subscription in list(self._subscribers):
+            subscription.put(event)
+
+    def _stamp(self, event: StateEvent) -> StateEvent:
+        self._next_id += 1
+        event.id = self._next_id
+        return event
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            async with self._poll_lock:
+                try:
+                    events = await asyncio.to_thread(self.watcher.poll)
+                except Exception:
+                    logger.exception("Error polling state directory for events")
+                    continue
+                for event in events:
+                    self.publish(event)
+
+
+# =============================================================================
+# Router
+# =============================================================================
+
+
+def _get_event_hub(request: Request) -> EventHub:
+    """Get or create the app-wide event hub for the working directory."""
+    hub: EventHub | None = getattr(request.app.state, "event_hub", None)
+    if hub is None:
+        working_dir: Path = getattr(request.app.state, "working_dir", Path.cwd())
+        hub = EventHub(working_dir / ".claude-task-master")
+        request.app.state.event_hub = hub
+    return hub
+
+
+async def _event_stream(
+    request: Request, hub: EventHub, subscription: EventSubscription
+) -> AsyncGenerator[str, None]:
+    """Yield SSE frames for a subscriber until the client disconnects."""
+    try:
+        while not await request.is_disconnected():
+            event = await subscription.get(timeout=KEEPALIVE_INTERVAL)
+            if event is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield event.to_sse()
+    finally:
+        await hub.unsubscribe(subscription)
+
+
+def create_events_router() -> APIRouter:
+    """Create router for the server-sent event stream.
+
+    Returns:
+        APIRouter configured with the /events endpoint.
+
+    Raises:
+        ImportError: If FastAPI is not installed.
+    """
+    if not FASTAPI_AVAILABLE:
+        raise ImportError(
+            "FastAPI not installed. Install with: pip install claude-task-master[api]"
+        )
+
+    router = APIRouter(tags=["Events"])
+
+    @router.get(
+        "/events",
+        summary="Event Stream",
+        description=(
+            "Server-sent event stream of log appends, task state changes and plan "
+            "checkbox flips for the current run."
+        ),
+        response_class=StreamingResponse,
+    )
+    async def stream_events(request: Request) -> StreamingResponse:
+        """Stream run events as server-sent events.
+
+        Sends a ``snapshot`` event on connect, then ``state``, ``plan`` and
+        ``log`` events as the state directory changes. Clients that fall too
+        far behind receive a ``lagged`` event and should resync via /status.
+        """
+        hub = _get_event_hub(request)
+        subscription = await hub.subscribe()
+        return StreamingResponse(
+            _event_stream(request, hub, subscription),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    return router
@@ -9,6 +9,7 @@ Endpoints:
 - PUT /webhooks/{webhook_id}: Update a webhook configuration
 - DELETE /webhooks/{webhook_id}: Delete a webhook configuration
 - POST /webhooks/test: Send a test webhook to verify configuration
+- POST /webhooks/replay: Redeliver events from the outbox by ID or time range
 
 Webhooks are stored in the state directory as webhooks.json and are used
 by the orchestrator to send notifications about task lifecycle events.
@@ -32,11 +33,13 @@ from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field, field_validator
 
+from claude_task_master.core.state import StateError, StateManager
 from claude_task_master.webhooks import (
     EventType,
     WebhookClient,
     WebhookDeliveryResult,
 )
+from claude_task_master.webhooks.outbox import WebhookOutbox, replay_records
 
 if TYPE_CHECKING:
     from fastapi import APIRouter, Request
@@ -46,6 +49,7 @@ if TYPE_CHECKING:
 try:
     from fastapi import APIRouter, Request
     from fastapi.responses import JSONResponse
+    from starlette.concurrency import run_in_threadpool
 
     FASTAPI_AVAILABLE = True
 except ImportError:
@@ -254,6 +258,40 @@ class WebhookTestRequest(BaseModel):
         return v
 
 
+class WebhookReplayRequest(BaseModel):
+    """Request model for redelivering events from the webhook outbox.
+
+    Events are selected by ID and/or the time they were written to the
+    outbox. They are sent to an existing webhook, a direct URL, or (if
+    neither is given) the webhook configured for the current run.
+
+    Attributes:
+        event_ids: Event IDs to redeliver.
+        since: Only events written at or after this time.
+        until: Only events written at or before this time.
+        webhook_id: ID of an existing webhook to send to.
+        url: URL to send to directly (if not using webhook_id).
+        secret: Secret for direct URL delivery.
+        dry_run: Only list the matching events.
+    """
+
+    event_ids: list[str] = Field(default_factory=list, description="Event IDs to redeliver")
+    since: datetime | None = Field(default=None, description="Start of the time range")
+    until: datetime | None = Field(default=None, description="End of the time range")
+    webhook_id: str | None = Field(default=None, description="ID of an existing webhook")
+    url: str | None = Field(default=None, description="URL to send to directly")
+    secret: str | None = Field(default=None, description="Secret for direct URL delivery")
+    dry_run: bool = Field(default=False, description="Only list the matching events")
+
+    @field_validator("url")
+    @classmethod
+    def validate_url_scheme(cls, v: str | None) -> str | None:
+        """Ensure URL uses http:// or https:// scheme."""
+        if v is not None and not v.startswith(("http://", "https://")):
+            raise ValueError("Webhook URL must start with http:// or https://")
+        return v
+
+
 class WebhookResponse(BaseModel):
     """Response model for a single webhook.
 
@@ -347,6 +385,44 @@ class WebhookTestResponse(BaseModel):
     error: str | None = None
 
 
+class WebhookReplayItem(BaseModel):
+    """Result of redelivering one event.
+
+    Attributes:
+        event_id: The redelivered event ID.
+        event_type: The event type.
+        appended_at: When the event was written to the outbox.
+        success: Whether the delivery succeeded (None for dry runs).
+        status_code: HTTP status of the last attempt.
+        error: Error message if the delivery failed.
+    """
+
+    event_id: str | None
+    event_type: str | None
+    appended_at: str
+    success: bool | None = None
+    status_code: int | None = None
+    error: str | None = None
+
+
+class WebhookReplayResponse(BaseModel):
+    """Response model for webhook replay.
+
+    Attributes:
+        success: Whether every matching event was redelivered.
+        message: Human-readable result message.
+        matched: Number of matching events.
+        delivered: Number of events delivered.
+        events: Per-event results in outbox order.
+    """
+
+    success: bool
+    message: str
+    matched: int
+    delivered: int = 0
+    events: list[WebhookReplayItem] = Field(default_factory=list)
+
+
 class WebhookErrorResponse(BaseModel):
     """Error response for webhook endpoints.
 
@@ -377,9 +453,13 @@ def _get_webhooks_file(request: Request) -> Path:
     Returns:
         Path to the webhooks.json file.
     """
+    return _get_state_dir(request) / WEBHOOKS_FILE
+
+
+def _get_state_dir(request: Request) -> Path:
+    """Get the state directory for the app's working directory."""
     working_dir: Path = getattr(request.app.state, "working_dir", Path.cwd())
-    state_dir = working_dir / ".claude-task-master"
-    return state_dir / WEBHOOKS_FILE
+    return working_dir / ".claude-task-master"
 
 
 def _load_webhooks(webhooks_file: Path) -> dict[str, dict[str, Any]]:
@@ -959,6 +1039,147 @@ def create_webhooks_router() -> APIRouter:
                 ).model_dump(),
             )
 
+    # =========================================================================
+    # POST /webhooks/replay - Redeliver events from the outbox
+    # =========================================================================
+
+    @router.post(
+        "/replay",
+        response_model=WebhookReplayResponse,
+        responses={
+            400: {"model": WebhookErrorResponse, "description": "Invalid request"},
+            404: {"model": WebhookErrorResponse, "description": "Webhook or events not found"},
+            500: {"model": WebhookErrorResponse, "description": "Internal server error"},
+        },
+        summary="Replay Webhook Events",
+        description="Redeliver events from the webhook outbox by event ID or time range.",
+    )
+    async def replay_webhooks(
+        request: Request, replay_request: WebhookReplayRequest
+    ) -> WebhookReplayResponse | JSONResponse:
+        """Redeliver events from the durable webhook outbox.
+
+        Events are sent in outbox order with their original delivery IDs.
+        Endpoint cursors are not changed.
+
+        Args:
+            replay_request: Event filters and the target webhook.
+
+        Returns:
+            WebhookReplayResponse with per-event results.
+        """
+        if not replay_request.event_ids and not (replay_request.since or replay_request.until):
+            return JSONResponse(
+                status_code=400,
+                content=WebhookErrorResponse(
+                    error="invalid_request",
+                    message="Either event_ids or a since/until time range must be provided",
+                ).model_dump(),
+            )
+
+        try:
+            state_dir = _get_state_dir(request)
+            # Scanning outbox segments is blocking file I/O
+            records = await run_in_threadpool(
+                WebhookOutbox.for_state_dir(state_dir).find,
+                event_ids=replay_request.event_ids or None,
+                since=replay_request.since,
+                until=replay_request.until,
+            )
+            if not records:
+                return JSONResponse(
+                    status_code=404,
+                    content=WebhookErrorResponse(
+                        error="not_found",
+                        message="No matching events in the webhook outbox",
+                    ).model_dump(),
+                )
+
+            if replay_request.dry_run:
+                return WebhookReplayResponse(
+                    success=True,
+                    message=f"{len(records)} event(s) would be redelivered",
+                    matched=len(records),
+                    events=[
+                        WebhookReplayItem(
+                            event_id=r.event_id,
+                            event_type=r.event_type,
+                            appended_at=r.appended_at,
+                        )
+                        for r in records
+                    ],
+                )
+
+            # Determine the target webhook
+            if replay_request.webhook_id:
+                webhooks = _load_webhooks(_get_webhooks_file(request))
+                if replay_request.webhook_id not in webhooks:
+                    return JSONResponse(
+                        status_code=404,
+                        content=WebhookErrorResponse(
+                            error="not_found",
+                            message=f"Webhook '{replay_request.webhook_id}' not found",
+                        ).model_dump(),
+                    )
+                webhook = webhooks[replay_request.webhook_id]
+                client = WebhookClient(
+                    url=webhook["url"],
+                    secret=webhook.get("secret"),
+                    timeout=webhook.get("timeout", 30.0),
+                    max_retries=webhook.get("max_retries", 3),
+                    verify_ssl=webhook.get("verify_ssl", True),
+                    headers=webhook.get("headers", {}),
+                )
+            elif replay_request.url:
+                client = WebhookClient(url=replay_request.url, secret=replay_request.secret)
+            else:
+                state_manager = StateManager(state_dir=state_dir)
+                try:
+                    options = state_manager.load_state().options if state_manager.exists() else None
+                except StateError:
+                    options = None
+                if options is None or not options.webhook_url:
+                    return JSONResponse(
+                        status_code=400,
+                        content=WebhookErrorResponse(
+                            error="invalid_request",
+                            message="Either webhook_id or url must be provided "
+                            "(no webhook is configured for the current run)",
+                        ).model_dump(),
+                    )
+                client = WebhookClient(url=options.webhook_url, secret=options.webhook_secret)
+
+            results = await replay_records(records, client)
+            delivered = sum(1 for _, result in results if result.success)
+            return WebhookReplayResponse(
+                success=delivered == len(results),
+                message=f"Redelivered {delivered}/{len(results)} event(s)",
+                matched=len(records),
+                delivered=delivered,
+                events=[
+                    WebhookReplayItem(
+                        event_id=record.event_id,
+                        event_type=record.event_type,
+                        appended_at=record.appended_at,
+                        success=result.success,
+                        status_code=result.status_code,
+                        error=result.error,
+                    )
+                    for record, result in results
+                ],
+            )
+
+        except Exception as e:
+            logger.exception("Error replaying webhooks")
+            return JSONResponse(
+                status_code=500,
+                content=WebhookErrorResponse(
+                    error="internal_error",
+                    message="Failed to replay webhooks",
+                    detail=str(e),
+                ).model_dump(),
+            )
+
     return router
 
 
@@ -971,10 +1192,13 @@ __all__ = [
     "WebhookCreateRequest",
     "WebhookUpdateRequest",
     "WebhookTestRequest",
+    "WebhookReplayRequest",
     "WebhookResponse",
     "WebhooksListResponse",
     "WebhookCreateResponse",
     "WebhookDeleteResponse",
     "WebhookTestResponse",
+    "WebhookReplayItem",
+    "WebhookReplayResponse",
     "WebhookErrorResponse",
 ]
@@ -125,6 +125,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     - Recording server start time for uptime tracking
     - Logging startup/shutdown messages
     - Logging authentication status
+    - Stopping the /events state watcher
     - Future: graceful shutdown of running tasks
 
     Args:
@@ -148,6 +149,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
 
     # Shutdown
+    event_hub = getattr(app.state, "event_hub", None)
+    if event_hub is not None:
+        await event_hub.close()
     logger.info("Claude Task Master API shutting down")
 
 
@@ -6,6 +6,7 @@ and webhook authentication. It uses passlib with bcrypt for secure password hash
 Key Components:
 - Password hashing and verification using bcrypt
 - Environment variable based password configuration
+- Verified-token cache and failed-attempt limiter for fast, safe re-authentication
 - FastAPI middleware for password-based authentication
 - MCP transport authentication handlers
 
@@ -32,6 +33,11 @@ Example:
     False
 """
 
+from claude_task_master.auth.cache import (
+    FailedAttemptLimiter,
+    VerifiedTokenCache,
+    get_failed_attempt_limiter,
+)
 from claude_task_master.auth.password import (
     AuthenticationError,
     InvalidPasswordError,
@@ -76,6 +82,10 @@ __all__ = [
     "is_password_hash",
     "authenticate",
     "is_auth_enabled",
+    # Verification cache
+    "VerifiedTokenCache",
+    "FailedAttemptLimiter",
+    "get_failed_attempt_limiter",
     # Exceptions
     "AuthenticationError",
     "InvalidPasswordError",
@@ -0,0 +1,252 @@
+"""Verified-credential cache and failed-attempt limiter for authentication.
+
+Verifying a bearer password against ``CLAUDETM_PASSWORD_HASH`` is a 12-round
+bcrypt check (hundreds of milliseconds of CPU). ``VerifiedTokenCache``
+remembers recently verified tokens so repeat requests skip bcrypt:
+
+- Entries are keyed by an HMAC-SHA256 of the configured credential and the
+  token, under a random per-process key. No plaintext token is kept, and a
+  changed password configuration never matches old entries.
+- Entries expire after ``ttl`` seconds; at most ``max_entries`` are kept
+  (least recently used are evicted first).
+
+``FailedAttemptLimiter`` blocks a client for ``lockout`` seconds after
+``max_failures`` failed attempts within ``window`` seconds, so the cache
+can't be used to make brute-forcing cheaper. It tracks at most
+``max_clients`` clients (least recently failed are dropped first) and
+forgets expired failures and lockouts, so spraying addresses can't grow it
+without bound. ``PasswordAuthMiddleware`` and ``get_password_auth_dependency``
+share one process-wide instance (``get_failed_attempt_limiter()``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import OrderedDict, deque
+
+# Default configuration
+DEFAULT_CACHE_TTL = 300.0  # seconds a verified token stays valid
+DEFAULT_CACHE_MAX_ENTRIES = 256
+DEFAULT_MAX_FAILURES = 10
+DEFAULT_FAILURE_WINDOW = 60.0  # seconds
+DEFAULT_LOCKOUT = 60.0  # seconds
+DEFAULT_MAX_TRACKED_CLIENTS = 4096
+
+
+# =============================================================================
+# Verified Token Cache
+# =============================================================================
+
+
+class VerifiedTokenCache:
+    """Thread-safe TTL + LRU cache of verified bearer tokens.
+
+    Example:
+        >>> cache = VerifiedTokenCache(ttl=60)
+        >>> cache.contains("secret", configured="$2b$12$...")
+        False
+        >>> cache.add("secret", configured="$2b$12$...")
+        >>> cache.contains("secret", configured="$2b$12$...")
+        True
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_CACHE_TTL,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a verified token is trusted. 0 disables caching.
+            max_entries: Maximum number of cached tokens. 0 disables caching.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._key = secrets.token_bytes(32)
+        self._entries: OrderedDict[bytes, float] = OrderedDict()  # digest -> expiry
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether the cache stores anything."""
+        return self.ttl > 0 and self.max_entries > 0
+
+    def _digest(self, token: str, configured: str) -> bytes:
+        message = configured.encode("utf-8") + b"\x00" + token.encode("utf-8")
+        return hmac.new(self._key, message, hashlib.sha256).digest()
+
+    def contains(self, token: str, configured: str) -> bool:
+        """Check whether a token was verified against configured recently.
+
+        Args:
+            token: The bearer token from the request.
+            configured: The configured password or password hash.
+
+        Returns:
+            True if the token is cached and not expired.
+        """
+        if not self.enabled:
+            return False
+        digest = self._digest(token, configured)
+        now = time.monotonic()
+        with self._lock:
+            expiry = self._entries.get(digest)
+            if expiry is None or expiry <= now:
+                if expiry is not None:
+                    del self._entries[digest]
+                self.misses += 1
+                return False
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return True
+
+    def add(self, token: str, configured: str) -> None:
+        """Remember a token that was verified against configured.
+
+        Args:
+            token: The verified bearer token.
+            configured: The configured password or password hash.
+        """
+        if not self.enabled:
+            return
+        digest = self._digest(token, configured)
+        with self._lock:
+            self._entries[digest] = time.monotonic() + self.ttl
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget all cached tokens."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached tokens (including expired ones)."""
+        return len(self._entries)
+
+
+# =============================================================================
+# Failed Attempt Limiter
+# =============================================================================
+
+
+class FailedAttemptLimiter:
+    """Thread-safe per-client limiter for failed authentication attempts."""
+
+    def __init__(
+        self,
+        max_failures: int = DEFAULT_MAX_FAILURES,
+        window: float = DEFAULT_FAILURE_WINDOW,
+        lockout: float = DEFAULT_LOCKOUT,
+        max_clients: int = DEFAULT_MAX_TRACKED_CLIENTS,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            max_failures: Failures within window that trigger a lockout.
+                0 disables limiting.
+            window: Seconds over which failures are counted.
+            lockout: Seconds a client is blocked once the limit is reached.
+            max_clients: Maximum number of clients tracked with recent
+                failures, and separately with lockouts.
+        """
+        self.max_failures = max_failures
+        self.window = window
+        self.lockout = lockout
+        self.max_clients = max_clients
+        # Both ordered oldest first: failures by last failure, lockouts by start
+        self._failures: OrderedDict[str, deque[float]] = OrderedDict()
+        self._blocked_until: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def retry_after(self, client: str) -> float:
+        """Get the seconds until a client may try again (0.0 if not blocked).
+
+        Args:
+            client: Client identifier (e.g. remote address).
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            until = self._blocked_until.get(client)
+            return 0.0 if until is None else until - now
+
+    def record_failure(self, client: str) -> bool:
+        """Record a failed attempt.
+
+        Args:
+            client: Client identifier (e.g. remote address).
+
+        Returns:
+            True if the client is now blocked.
+        """
+        if self.max_failures <= 0:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            failures = self._failures.setdefault(client, deque())
+            self._failures.move_to_end(client)
+            failures.append(now)
+            while failures and failures[0] <= now - self.window:
+                failures.popleft()
+            if len(failures) < self.max_failures:
+                while len(self._failures) > self.max_clients:
+                    self._failures.popitem(last=False)
+                return False
+            del self._failures[client]
+            self._blocked_until.pop(client, None)
+            self._blocked_until[client] = now + self.lockout
+            while len(self._blocked_until) > self.max_clients:
+                self._blocked_until.popitem(last=False)
+            return True
+
+    def _expire(self, now: float) -> None:
+        """Drop lockouts that ended and clients with no failures in the window.
+
+        Both maps are ordered oldest first, so this stops at the first entry
+        that is still current.
+        """
+        while self._blocked_until:
+            client, until = next(iter(self._blocked_until.items()))
+            if until > now:
+                break
+            del self._blocked_until[client]
+        while self._failures:
+            client, failures = next(iter(self._failures.items()))
+            if failures and failures[-1] > now - self.window:
+                break
+            del self._failures[client]
+
+    def reset(self, client: str) -> None:
+        """Clear a client's failures after a successful attempt."""
+        with self._lock:
+            self._failures.pop(client, None)
+            self._blocked_until.pop(client, None)
+
+    def clear(self) -> None:
+        """Forget all failures and lockouts."""
+        with self._lock:
+            self._failures.clear()
+            self._blocked_until.clear()
+
+    def __len__(self) -> int:
+        """Return the number of clients tracked (failures or lockouts)."""
+        with self._lock:
+            return len(self._failures.keys() | self._blocked_until.keys())
+
+
+_failed_attempt_limiter = FailedAttemptLimiter()
+
+
+def get_failed_attempt_limiter() -> FailedAttemptLimiter:
+    """Get the process-wide limiter shared by the auth middleware and dependency."""
+    return _failed_attempt_limiter
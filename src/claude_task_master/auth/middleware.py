@@ -7,7 +7,10 @@ The middleware:
 - Validates Authorization headers on protected endpoints
 - Skips authentication for health/info endpoints and OPTIONS requests
 - Supports both plaintext and bcrypt-hashed passwords via environment config
-- Returns proper 401/403 responses for authentication failures
+- Caches recently verified tokens (HMAC-keyed, TTL + LRU) and runs cache
+  misses in a thread pool, so bcrypt never blocks the event loop
+- Rate-limits failed attempts per client
+- Returns proper 401/403/429 responses for authentication failures
 
 Usage:
     from fastapi import FastAPI
@@ -27,6 +30,12 @@ import logging
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING
 
+from claude_task_master.auth.cache import (
+    FailedAttemptLimiter,
+    VerifiedTokenCache,
+    get_failed_attempt_limiter,
+)
+
 if TYPE_CHECKING:
     from starlette.requests import Request
     from starlette.responses import Response
@@ -34,6 +43,7 @@ if TYPE_CHECKING:
 
 # Try to import Starlette/FastAPI components
 try:
+    from starlette.concurrency import run_in_threadpool
     from starlette.middleware.base import BaseHTTPMiddleware
     from starlette.requests import Request
     from starlette.responses import JSONResponse, Response
@@ -208,6 +218,28 @@ def _create_403_response() -> JSONResponse:
     )
 
 
+def _create_429_response(retry_after: float) -> JSONResponse:
+    """Create a 429 Too Many Requests response.
+
+    Args:
+        retry_after: Seconds until the client may try again.
+
+    Returns:
+        JSONResponse with 429 status and Retry-After header.
+    """
+    _ensure_starlette()
+    seconds = max(1, int(retry_after + 0.999))
+    return JSONResponse(
+        status_code=429,
+        content={
+            "detail": "Too many failed attempts",
+            "error": "rate_limited",
+            "message": f"Too many failed authentication attempts. Retry in {seconds}s.",
+        },
+        headers={"Retry-After": str(seconds)},
+    )
+
+
 def _create_500_response(message: str) -> JSONResponse:
     """Create a 500 Internal Server Error response.
 
@@ -244,6 +276,8 @@ class PasswordAuthMiddleware(BaseHTTPMiddleware):
         public_paths: Set of paths that don't require authentication.
         public_methods: Set of HTTP methods that don't require authentication.
         require_auth: Whether to require authentication (can be disabled for testing).
+        token_cache: Cache of recently verified tokens.
+        rate_limiter: Limiter for failed attempts per client address.
 
     Example:
         from fastapi import FastAPI
@@ -265,6 +299,8 @@ class PasswordAuthMiddleware(BaseHTTPMiddleware):
         public_paths: set[str] | frozenset[str] | None = None,
         public_methods: set[str] | frozenset[str] | None = None,
         require_auth: bool = True,
+        token_cache: VerifiedTokenCache | None = None,
+        rate_limiter: FailedAttemptLimiter | None = None,
     ) -> None:
         """Initialize the middleware.
 
@@ -273,6 +309,9 @@ class PasswordAuthMiddleware(BaseHTTPMiddleware):
             public_paths: Set of paths that don't require auth. Defaults to PUBLIC_PATHS.
             public_methods: Set of methods that don't require auth. Defaults to PUBLIC_METHODS.
             require_auth: Whether to require authentication. Set to False to disable.
+            token_cache: Verified-token cache. Defaults to a new VerifiedTokenCache.
+            rate_limiter: Failed-attempt limiter. Defaults to the process-wide
+                limiter shared with ``get_password_auth_dependency``.
         """
         _ensure_starlette()
         super().__init__(app)
@@ -280,6 +319,10 @@ class PasswordAuthMiddleware(BaseHTTPMiddleware):
         self.public_paths = frozenset(public_paths) if public_paths else PUBLIC_PATHS
         self.public_methods = frozenset(public_methods) if public_methods else PUBLIC_METHODS
         self.require_auth = require_auth
+        self.token_cache = token_cache if token_cache is not None else VerifiedTokenCache()
+        self.rate_limiter = (
+            rate_limiter if rate_limiter is not None else get_failed_attempt_limiter()
+        )
 
         logger.debug(
             f"PasswordAuthMiddleware initialized: require_auth={require_auth}, "
@@ -317,6 +360,7 @@ class PasswordAuthMiddleware(BaseHTTPMiddleware):
         from claude_task_master.auth.password import (
             PasswordNotConfiguredError,
             authenticate,
+            get_password_from_env,
             is_auth_enabled,
         )
 
@@ -341,11 +385,25 @@ class PasswordAuthMiddleware(BaseHTTPMiddleware):
             logger.debug(f"Missing or invalid Authorization header for {request.method} {path}")
             return _create_401_response()
 
-        # Verify the password
+        # Reject clients with too many recent failures
+        client = request.client.host if request.client else "unknown"
+        retry_after = self.rate_limiter.retry_after(client)
+        if retry_after:
+            return _create_429_response(retry_after)
+
+        # Verify the password (bcrypt runs in a worker thread on cache misses).
+        # Cache entries are keyed by the configured credential, so changing
+        # the password invalidates them.
+        configured = get_password_from_env() or ""
         try:
-            if not authenticate(token):
-                logger.warning(f"Invalid password attempt for {request.method} {path}")
-                return _create_403_response()
+            if not self.token_cache.contains(token, configured):
+                if not await run_in_threadpool(authenticate, token):
+                    logger.warning(f"Invalid password attempt for {request.method} {path}")
+                    if self.rate_limiter.record_failure(client):
+                        logger.warning(f"Blocking {client} after repeated failed attempts")
+                    return _create_403_response()
+                self.token_cache.add(token, configured)
+                self.rate_limiter.reset(client)
         except PasswordNotConfiguredError:
             # Should not happen since we checked is_auth_enabled(), but handle it
             logger.error("Password configuration error during authentication")
@@ -367,14 +425,19 @@ class PasswordAuthMiddleware(BaseHTTPMiddleware):
 
 def get_password_auth_dependency(
     public_paths: set[str] | frozenset[str] | None = None,
+    rate_limiter: FailedAttemptLimiter | None = None,
 ) -> Callable[..., None]:
     """Create a FastAPI dependency for password authentication.
 
     This is an alternative to using middleware, useful when you want more
-    granular control over which endpoints require authentication.
+    granular control over which endpoints require authentication. FastAPI
+    runs the (sync) dependency in a worker thread; verified tokens are
+    cached and failed attempts rate-limited like in PasswordAuthMiddleware.
 
     Args:
         public_paths: Set of paths that don't require authentication.
+        rate_limiter: Failed-attempt limiter. Defaults to the process-wide
+            limiter shared with ``PasswordAuthMiddleware``.
 
     Returns:
         A FastAPI dependency function.
@@ -397,10 +460,13 @@ def get_password_auth_dependency(
     from claude_task_master.auth.password import (
         PasswordNotConfiguredError,
         authenticate,
+        get_password_from_env,
         is_auth_enabled,
     )
 
     paths = frozenset(public_paths) if public_paths else PUBLIC_PATHS
+    token_cache = VerifiedTokenCache()
+    limiter = rate_limiter if rate_limiter is not None else get_failed_attempt_limiter()
 
     def verify_auth(request: Request) -> None:
         """Verify authentication for the request.
@@ -433,12 +499,30 @@ def get_password_auth_dependency(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        configured = get_password_from_env() or ""
+        if token_cache.contains(token, configured):
+            return
+
+        # Reject clients with too many recent failures
+        client = request.client.host if request.client else "unknown"
+        retry_after = limiter.retry_after(client)
+        if retry_after:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many failed attempts",
+                headers={"Retry-After": str(max(1, int(retry_after + 0.999)))},
+            )
+
         try:
             if not authenticate(token):
+                if limiter.record_failure(client):
+                    logger.warning(f"Blocking {client} after repeated failed attempts")
                 raise HTTPException(
                     status_code=403,
                     detail="Invalid credentials",
                 )
+            token_cache.add(token, configured)
+            limiter.reset(client)
         except PasswordNotConfiguredError as err:
             raise HTTPException(
                 status_code=500,
@@ -11,6 +11,7 @@ from .cli_commands.control import register_control_commands
 from .cli_commands.fix_pr import register_fix_pr_command
 from .cli_commands.github import register_github_commands
 from .cli_commands.info import register_info_commands
+from .cli_commands.webhooks import register_webhooks_commands
 from .cli_commands.workflow import register_workflow_commands
 from .core.state import StateManager
 from .utils.debug_claude_md import debug_claude_md_detection
@@ -64,11 +65,12 @@ def main(
 
 # Register commands from submodules
 register_workflow_commands(app)  # start, resume
-register_info_commands(app)  # status, plan, logs, context, progress
+register_info_commands(app)  # status, plan, logs, context, progress, export-state
 register_github_commands(app)  # ci-status, ci-logs, pr-comments, pr-status
 register_config_commands(app)  # config init, config show, config path
 register_control_commands(app)  # pause, stop, config-update
 register_fix_pr_command(app)  # fix-pr
+register_webhooks_commands(app)  # webhooks status, webhooks replay
 
 
 @app.command()
@@ -174,6 +174,9 @@ def _display_env_overrides() -> None:
 | `CLAUDETM_MODEL_OPUS` | `models.opus` | Opus model name |
 | `CLAUDETM_MODEL_HAIKU` | `models.haiku` | Haiku model name |
 | `CLAUDETM_TARGET_BRANCH` | `git.target_branch` | Target branch for PRs |
+| `CLAUDETM_STATE_FORMAT` | `state.format` | state.json encoding (json/compact) |
+| `CLAUDETM_GITHUB_TRANSPORT` | `github.transport` | GitHub API transport (gh/http) |
+| `CLAUDETM_CONVERSATION_MODE` | `agent.conversation_mode` | One conversation per PR group |
 """
         console.print(Markdown(env_vars_md))
         return
@@ -10,6 +10,7 @@ import typer
 
 from ..core import console
 from ..core.agent import AgentWrapper, ModelType
+from ..core.circuit_breaker import CircuitBreakerSnapshotFile
 from ..core.credentials import CredentialManager
 from ..core.pr_context import PRContextManager
 from ..core.state import StateManager
@@ -119,6 +120,10 @@ def fix_pr(
             model=ModelType.OPUS,
             working_dir=str(working_dir),
         )
+        # Publish breaker state for /health and health_check (other processes)
+        breaker_snapshots = CircuitBreakerSnapshotFile.for_state_dir(state_manager.state_dir)
+        breaker_snapshots.attach(agent.circuit_breaker)
+        breaker_snapshots.write()
 
         # Initialize PR context manager
         pr_context = PRContextManager(state_manager, github_client)
@@ -1,9 +1,13 @@
 """Info commands for Claude Task Master - status and read-only operations."""
 
+from pathlib import Path
+
 import typer
 from rich.console import Console
 from rich.markdown import Markdown
 
+from ..core.log_reader import tail_lines
+from ..core.logger import get_log_file_for_format
 from ..core.state import StateManager
 
 console = Console()
@@ -112,7 +116,9 @@ def logs(
 
     try:
         state = state_manager.load_state()
-        log_file = state_manager.get_log_file(state.run_id)
+        log_file = get_log_file_for_format(
+            state_manager.get_log_file(state.run_id), state.options.log_format
+        )
 
         if not log_file.exists():
             console.print("[yellow]No log file found.[/yellow]")
@@ -120,11 +126,8 @@ def logs(
 
         console.print(f"\n[bold blue]Logs[/bold blue] ({log_file})\n")
 
-        with open(log_file) as f:
-            lines = f.readlines()
-
-        # Show last N lines
-        for line in lines[-tail:]:
+        # Show last N lines (reads only the tail of the file)
+        for line in tail_lines(log_file, tail):
             print(line, end="")
 
     except typer.Exit:
@@ -196,6 +199,43 @@ def progress() -> None:
         raise typer.Exit(1) from None
 
 
+def export_state(
+    output: str | None = typer.Option(
+        None, "--output", "-o", help="Write to a file instead of stdout"
+    ),
+) -> None:
+    """Export state.json as pretty-printed JSON.
+
+    Works for every on-disk state format (including compact state files),
+    so the state can always be inspected or diffed by humans.
+
+    Examples:
+        claudetm export-state
+        claudetm export-state -o state-pretty.json
+    """
+    state_manager = StateManager()
+
+    if not state_manager.exists():
+        console.print("[yellow]No active task found.[/yellow]")
+        raise typer.Exit(1)
+
+    try:
+        exported = state_manager.export_state()
+
+        if output is None:
+            print(exported)
+            return
+
+        Path(output).write_text(exported + "\n")
+        console.print(f"[green]State exported to {output}[/green]")
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from None
+
+
 def register_info_commands(app: typer.Typer) -> None:
     """Register info commands with the Typer app."""
     app.command()(status)
@@ -203,3 +243,4 @@ def register_info_commands(app: typer.Typer) -> None:
     app.command()(logs)
     app.command()(context)
     app.command()(progress)
+    app.command()(export_state)
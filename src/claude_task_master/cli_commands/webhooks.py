@@ -0,0 +1,153 @@
+"""Webhook commands for Claude Task Master - durable outbox management.
+
+Provides commands for the .claude-task-master/webhooks/outbox/ event log:
+- status: Show outbox segments and undelivered events per endpoint
+- replay: Redeliver events by event ID or time range
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Annotated
+
+import typer
+from rich.console import Console
+
+from ..core.state import StateError, StateManager
+from ..webhooks import WebhookClient
+from ..webhooks.outbox import WebhookOutbox, replay_records
+
+console = Console()
+
+# Create the webhooks command group (sub-app)
+webhooks_app = typer.Typer(
+    name="webhooks",
+    help="📨 Inspect and replay webhook deliveries.",
+    no_args_is_help=True,
+)
+
+
+def _parse_time(value: str | None, option: str) -> datetime | None:
+    """Parse an ISO 8601 option value."""
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        console.print(f"[red]Invalid {option} time (expected ISO 8601): {value}[/red]")
+        raise typer.Exit(1) from None
+
+
+def _state_webhook(state_manager: StateManager) -> tuple[str | None, str | None]:
+    """Get the webhook URL and secret configured for the current run."""
+    if not state_manager.exists():
+        return None, None
+    try:
+        options = state_manager.load_state().options
+    except StateError:
+        return None, None
+    return options.webhook_url, options.webhook_secret
+
+
+@webhooks_app.command(name="status")
+def webhooks_status() -> None:
+    """📊 Show the webhook outbox and undelivered events per endpoint.
+
+    Examples:
+        claudetm webhooks status
+    """
+    outbox = WebhookOutbox.for_state_dir(StateManager().state_dir)
+    segments = outbox.segments()
+    if not segments:
+        console.print("[yellow]Webhook outbox is empty.[/yellow]")
+        return
+
+    console.print(f"[cyan]Outbox:[/cyan] {outbox.root}")
+    console.print(f"[cyan]Segments:[/cyan] {len(segments)} ({segments[0]}-{segments[-1]})")
+    cursors = outbox.cursors()
+    if not cursors:
+        console.print("[dim]No endpoints have received events yet.[/dim]")
+    for url in sorted(cursors):
+        pending = outbox.pending(url)
+        color = "yellow" if pending else "green"
+        console.print(f"  {url}: [{color}]{pending} pending[/{color}]")
+
+
+@webhooks_app.command(name="replay")
+def webhooks_replay(
+    event_id: Annotated[
+        list[str] | None,
+        typer.Option("--event-id", "-e", help="Event ID to redeliver (repeatable)"),
+    ] = None,
+    since: str | None = typer.Option(
+        None, "--since", help="Redeliver events written at or after this ISO 8601 time"
+    ),
+    until: str | None = typer.Option(
+        None, "--until", help="Redeliver events written at or before this ISO 8601 time"
+    ),
+    url: str | None = typer.Option(None, "--url", help="Endpoint (default: the run's webhook)"),
+    secret: str | None = typer.Option(None, "--secret", help="HMAC secret for --url"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="List matching events only"),
+) -> None:
+    """🔁 Redeliver webhook events from the outbox.
+
+    Events are selected by event ID and/or the time they were written, and
+    sent in their original order with their original delivery IDs, so
+    receivers can de-duplicate. Endpoint cursors are not changed.
+
+    Examples:
+        claudetm webhooks replay --event-id 3f2a...
+        claudetm webhooks replay --since 2025-01-01T10:00:00Z
+        claudetm webhooks replay --since 2025-01-01T10:00 --url https://example.com/hook
+    """
+    if not event_id and since is None and until is None:
+        console.print("[red]Specify --event-id, --since or --until.[/red]")
+        raise typer.Exit(1)
+    since_time = _parse_time(since, "--since")
+    until_time = _parse_time(until, "--until")
+
+    state_manager = StateManager()
+    outbox = WebhookOutbox.for_state_dir(state_manager.state_dir)
+    records = outbox.find(event_ids=event_id, since=since_time, until=until_time)
+    if not records:
+        console.print("[yellow]No matching webhook events in the outbox.[/yellow]")
+        raise typer.Exit(1)
+
+    if dry_run:
+        for record in records:
+            console.print(f"  {record.appended_at}  {record.event_type}  {record.event_id}")
+        console.print(f"\n[cyan]{len(records)} event(s) would be redelivered.[/cyan]")
+        return
+
+    if url is None:
+        url, state_secret = _state_webhook(state_manager)
+        secret = secret or state_secret
+    if url is None:
+        console.print("[red]No webhook URL configured for this run; pass --url.[/red]")
+        raise typer.Exit(1)
+    try:
+        client = WebhookClient(url=url, secret=secret)
+    except ValueError as e:
+        console.print(f"[red]Invalid webhook configuration: {e}[/red]")
+        raise typer.Exit(1) from None
+
+    results = asyncio.run(replay_records(records, client))
+
+    failed = 0
+    for record, result in results:
+        if result.success:
+            console.print(f"  [green]✓[/green] {record.event_type} {record.event_id}")
+        else:
+            failed += 1
+            console.print(f"  [red]✗[/red] {record.event_type} {record.event_id}: {result.error}")
+    console.print(f"\n[cyan]Redelivered {len(results) - failed}/{len(results)} event(s).[/cyan]")
+    if failed:
+        raise typer.Exit(1)
+
+
+def register_webhooks_commands(app: typer.Typer) -> None:
+    """Register webhooks command group with the Typer app.
+
+    Args:
+        app: The main Typer application.
+    """
+    app.add_typer(webhooks_app, name="webhooks")
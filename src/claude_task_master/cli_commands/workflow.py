@@ -8,14 +8,21 @@ from rich.console import Console
 from rich.markdown import Markdown
 
 from ..core.agent import AgentWrapper, ModelType
-from ..core.config_loader import initialize_config
+from ..core.circuit_breaker import CircuitBreakerSnapshotFile
+from ..core.config_loader import get_config, initialize_config
 from ..core.context_accumulator import ContextAccumulator
 from ..core.credentials import CredentialManager
-from ..core.logger import LogFormat, LogLevel, TaskLogger
+from ..core.logger import LogFormat, LogLevel, TaskLogger, get_log_file_for_format
 from ..core.orchestrator import WorkLoopOrchestrator
 from ..core.planner import Planner
 from ..core.state import StateManager, StateResumeValidationError, TaskOptions
 from ..webhooks import WebhookClient
+from ..webhooks.dispatch import WebhookDispatchQueue
+from ..webhooks.fanout import WebhookFanout
+from ..webhooks.outbox import OutboxSender, WebhookOutbox
+
+# Where queued webhook deliveries overflow to (inside the state directory)
+WEBHOOK_SPILL_FILE = "webhook-spill.jsonl"
 
 console = Console()
 
@@ -27,9 +34,7 @@ def _initialize_logger(
     log_format: LogFormat,
 ) -> TaskLogger:
     """Initialize the task logger with configured level and format."""
-    log_file = state_manager.get_log_file(run_id)
-    if log_format == LogFormat.JSON:
-        log_file = log_file.with_suffix(".json")
+    log_file = get_log_file_for_format(state_manager.get_log_file(run_id), log_format)
     return TaskLogger(log_file, level=log_level, log_format=log_format)
 
 
@@ -41,12 +46,54 @@ def _initialize_components(
     logger: TaskLogger,
 ) -> tuple[AgentWrapper, Planner]:
     """Initialize the agent and planner components."""
-    agent = AgentWrapper(access_token, model_type, str(working_dir), logger=logger)
+    agent_config = get_config().agent
+    agent = AgentWrapper(
+        access_token,
+        model_type,
+        str(working_dir),
+        logger=logger,
+        conversation_mode=agent_config.conversation_mode,
+        client_idle_timeout=agent_config.client_idle_timeout,
+    )
     planner = Planner(agent, state_manager)
     ContextAccumulator(state_manager)
     return agent, planner
 
 
+def _create_webhook_dispatcher(
+    state_manager: StateManager,
+    webhook_client: WebhookClient,
+) -> WebhookDispatchQueue | OutboxSender:
+    """Create the background webhook sender from config, flushed on shutdown.
+
+    Durable mode (the default) delivers through the on-disk outbox, so
+    events that can't be delivered now are sent on the next run or with
+    ``claudetm webhooks replay``. Outbox cursors of endpoints other than
+    ``webhook_client``'s (a previous ``--webhook-url``) are retired.
+    """
+    queue_config = get_config().webhook_queue
+    dispatcher: WebhookDispatchQueue | OutboxSender
+    if queue_config.durable:
+        outbox = WebhookOutbox.for_state_dir(state_manager.state_dir)
+        outbox.retire_cursors([webhook_client.url])
+        dispatcher = OutboxSender(
+            outbox,
+            max_backoff=queue_config.max_backoff,
+            flush_timeout=queue_config.flush_timeout,
+        )
+        dispatcher.register_shutdown_hook()
+        return dispatcher
+    dispatcher = WebhookDispatchQueue(
+        max_size=queue_config.max_size,
+        endpoint_concurrency=queue_config.endpoint_concurrency,
+        overflow=queue_config.overflow,
+        spill_path=state_manager.state_dir / WEBHOOK_SPILL_FILE,
+        flush_timeout=queue_config.flush_timeout,
+    )
+    dispatcher.register_shutdown_hook()
+    return dispatcher
+
+
 def _run_work_loop(
     agent: AgentWrapper,
     state_manager: StateManager,
@@ -55,10 +102,52 @@ def _run_work_loop(
     webhook_client: WebhookClient | None = None,
 ) -> int:
     """Run the work loop and return exit code."""
+    dispatcher = (
+        _create_webhook_dispatcher(state_manager, webhook_client) if webhook_client else None
+    )
+    # Endpoints in webhooks.json (watched for changes during the run), minus
+    # the --webhook-url endpoint, which already gets every event
+    fanout = WebhookFanout.for_state_dir(
+        state_manager.state_dir, exclude_urls=[webhook_client.url] if webhook_client else []
+    )
+    fanout.register_shutdown_hook()
+    # /health and health_check run in another process and read this file
+    breaker_snapshots = CircuitBreakerSnapshotFile.for_state_dir(state_manager.state_dir)
+    breaker_snapshots.attach(agent.circuit_breaker)
+    breaker_snapshots.write()
     orchestrator = WorkLoopOrchestrator(
-        agent, state_manager, planner, logger=logger, webhook_client=webhook_client
+        agent,
+        state_manager,
+        planner,
+        logger=logger,
+        webhook_client=webhook_client,
+        webhook_dispatcher=dispatcher,
+        webhook_fanout=fanout,
     )
-    return orchestrator.run()
+    try:
+        return orchestrator.run()
+    finally:
+        breaker_snapshots.write()
+        # Disconnect pooled SDK clients and stop the agent's event loop
+        agent.close()
+        if not fanout.close():
+            console.print("[yellow]Some webhooks.json deliveries did not finish in time[/yellow]")
+        if isinstance(dispatcher, OutboxSender):
+            if not dispatcher.close():
+                console.print(
+                    f"[yellow]{dispatcher.pending()} webhook event(s) not yet delivered; "
+                    "they are kept in the outbox and sent on the next run "
+                    "(or run 'claudetm webhooks replay')[/yellow]"
+                )
+        elif dispatcher is not None:
+            if not dispatcher.close():
+                console.print("[yellow]Some webhook deliveries did not finish in time[/yellow]")
+            stats = dispatcher.stats
+            if stats.dropped or stats.spilled:
+                console.print(
+                    f"[yellow]Webhooks: {stats.dropped} dropped, {stats.spilled} spilled to "
+                    f"{state_manager.state_dir / WEBHOOK_SPILL_FILE}[/yellow]"
+                )
 
 
 def _display_exit_message(exit_code: int) -> None:
@@ -86,7 +175,7 @@ def _validate_log_options(log_level: str, log_format: str) -> tuple[LogLevel, Lo
         log_format_enum = LogFormat(log_format.lower())
     except ValueError:
         console.print(
-            f"[red]Error: Invalid log format '{log_format}'. Valid options: text, json[/red]"
+            f"[red]Error: Invalid log format '{log_format}'. Valid options: text, json, jsonl[/red]"
         )
         raise typer.Exit(1) from None
 
@@ -131,7 +220,8 @@ def start(
     log_format: str = typer.Option(
         "text",
         "--log-format",
-        help="Log output format: text (human-readable, default), json (structured)",
+        help="Log output format: text (human-readable, default), json (structured), "
+        "jsonl (append-only JSON lines)",
     ),
     pr_per_task: bool = typer.Option(
         False,
@@ -229,6 +319,9 @@ def start(
             access_token, model_type, working_dir, state_manager, logger
         )
 
+        # Keep the OAuth token fresh for the whole run
+        refresher = cred_manager.start_background_refresh()
+
         # Run planning phase
         console.print("\n[bold cyan]Phase 1: Planning[/bold cyan]")
         logger.start_session(0, "planning")
@@ -251,6 +344,7 @@ def start(
         except Exception as e:
             logger.log_error(str(e))
             logger.end_session("failed")
+            refresher.stop()
             console.print(f"\n[red]Planning failed: {e}[/red]")
             raise typer.Exit(1) from None
 
@@ -260,7 +354,11 @@ def start(
 
         # Run work loop
         console.print("\n[bold cyan]Phase 2: Execution[/bold cyan]")
-        exit_code = _run_work_loop(agent, state_manager, planner, logger, wh_client)
+        try:
+            exit_code = _run_work_loop(agent, state_manager, planner, logger, wh_client)
+        finally:
+            refresher.stop()
+            logger.close()
         _display_exit_message(exit_code)
         raise typer.Exit(exit_code)
 
@@ -391,9 +489,16 @@ def resume(
             )
             console.print("[dim]Webhook notifications enabled[/dim]")
 
+        # Keep the OAuth token fresh for the whole run
+        refresher = cred_manager.start_background_refresh()
+
         # Run work loop
         console.print("\n[bold cyan]Resuming Execution[/bold cyan]")
-        exit_code = _run_work_loop(agent, state_manager, planner, logger, wh_client)
+        try:
+            exit_code = _run_work_loop(agent, state_manager, planner, logger, wh_client)
+        finally:
+            refresher.stop()
+            logger.close()
         _display_exit_message(exit_code)
         raise typer.Exit(exit_code)
 
@@ -2,6 +2,7 @@
 
 from claude_task_master.core import console
 from claude_task_master.core.agent import AgentWrapper
+from claude_task_master.core.agent_concurrency import GroupWorkSession
 from claude_task_master.core.agent_exceptions import (
     TRANSIENT_ERRORS,
     AgentError,
@@ -16,6 +17,7 @@ from claude_task_master.core.agent_exceptions import (
     SDKInitializationError,
     WorkingDirectoryError,
 )
+from claude_task_master.core.agent_loop import BackgroundEventLoop
 from claude_task_master.core.agent_message import MessageProcessor
 from claude_task_master.core.agent_models import (
     DEFAULT_COMPACT_THRESHOLD_PERCENT,
@@ -44,15 +46,26 @@ from claude_task_master.core.circuit_breaker import (
     CircuitBreakerError,
     CircuitBreakerMetrics,
     CircuitBreakerRegistry,
+    CircuitBreakerSnapshotFile,
     CircuitState,
+    LatencyHistogram,
+    SlidingWindow,
     get_circuit_breaker,
 )
+from claude_task_master.core.client_pool import (
+    ClientPoolStats,
+    ConnectionSetup,
+    SDKClientPool,
+)
 from claude_task_master.core.config import (
     APIConfig,
     ClaudeTaskMasterConfig,
     GitConfig,
+    GitHubConfig,
     ModelConfig,
+    StateConfig,
     ToolsConfig,
+    WebhookQueueConfig,
     generate_default_config,
     generate_default_config_dict,
     generate_default_config_json,
@@ -89,11 +102,13 @@ from claude_task_master.core.credentials import (
     CredentialManager,
     CredentialNotFoundError,
     CredentialPermissionError,
+    CredentialRefresher,
     Credentials,
     InvalidCredentialsError,
     InvalidTokenResponseError,
     NetworkConnectionError,
     NetworkTimeoutError,
+    RefreshLockTimeoutError,
     TokenRefreshError,
     TokenRefreshHTTPError,
 )
@@ -114,9 +129,13 @@ from claude_task_master.core.orchestrator import (
 )
 from claude_task_master.core.parallel import (
     AsyncParallelExecutor,
+    CancellationToken,
+    ExecutorBackend,
     ParallelExecutor,
     ParallelExecutorConfig,
     ParallelTask,
+    StreamMetrics,
+    TaskCancelledError,
     TaskResult,
     TaskStatus,
 )
@@ -138,6 +157,13 @@ from claude_task_master.core.prompts import (
     build_work_prompt,
 )
 from claude_task_master.core.rate_limit import RateLimitConfig
+from claude_task_master.core.retry import (
+    Backoff,
+    ErrorKind,
+    RetryPolicies,
+    RetryPolicy,
+    TokenBucket,
+)
 from claude_task_master.core.shutdown import (
     ShutdownManager,
     add_shutdown_callback,
@@ -164,6 +190,8 @@ from claude_task_master.core.state import (
     TaskOptions,
     TaskState,
 )
+from claude_task_master.core.state_cache import StateReadCache, get_state_read_cache
+from claude_task_master.core.state_codec import STATE_SCHEMA_VERSION, StateFormat
 from claude_task_master.core.task_runner import (
     NoPlanFoundError,
     NoTasksFoundError,
@@ -179,7 +207,10 @@ __all__ = [
     "APIConfig",
     "ModelConfig",
     "GitConfig",
+    "GitHubConfig",
     "ToolsConfig",
+    "StateConfig",
+    "WebhookQueueConfig",
     "generate_default_config",
     "generate_default_config_dict",
     "generate_default_config_json",
@@ -215,9 +246,11 @@ __all__ = [
     "NetworkConnectionError",
     "TokenRefreshHTTPError",
     "InvalidTokenResponseError",
+    "RefreshLockTimeoutError",
     # Credential classes
     "Credentials",
     "CredentialManager",
+    "CredentialRefresher",
     # Agent exceptions
     "AgentError",
     "SDKImportError",
@@ -240,12 +273,25 @@ __all__ = [
     "AgentQueryExecutor",
     "MessageProcessor",
     "parse_task_complexity",
+    # Persistent event loop and SDK client pool (conversation mode)
+    "BackgroundEventLoop",
+    "SDKClientPool",
+    "ConnectionSetup",
+    "ClientPoolStats",
+    # Concurrent work sessions for independent PR groups
+    "GroupWorkSession",
     # Model context configuration
     "MODEL_CONTEXT_WINDOWS",
     "MODEL_CONTEXT_WINDOWS_STANDARD",
     "DEFAULT_COMPACT_THRESHOLD_PERCENT",
     # Rate limit classes
     "RateLimitConfig",
+    # Retry engine
+    "ErrorKind",
+    "RetryPolicy",
+    "RetryPolicies",
+    "Backoff",
+    "TokenBucket",
     # Checkpoint exceptions
     "CheckpointError",
     "CheckpointNotFoundError",
@@ -268,6 +314,10 @@ __all__ = [
     "StateManager",
     "TaskState",
     "TaskOptions",
+    "StateReadCache",
+    "get_state_read_cache",
+    "StateFormat",
+    "STATE_SCHEMA_VERSION",
     # Orchestrator exceptions
     "OrchestratorError",
     "StateRecoveryError",
@@ -326,13 +376,20 @@ __all__ = [
     "CircuitBreakerError",
     "CircuitBreakerMetrics",
     "CircuitBreakerRegistry",
+    "CircuitBreakerSnapshotFile",
     "CircuitState",
+    "LatencyHistogram",
+    "SlidingWindow",
     "get_circuit_breaker",
     # Parallel executor classes
     "AsyncParallelExecutor",
+    "CancellationToken",
+    "ExecutorBackend",
     "ParallelExecutor",
     "ParallelExecutorConfig",
     "ParallelTask",
+    "StreamMetrics",
+    "TaskCancelledError",
     "TaskResult",
     "TaskStatus",
     # Execution tracker classes
@@ -3,14 +3,24 @@
 This module provides single-turn queries via `query()` for planning and
 verification phases. For multi-turn conversations within task groups,
 see the `conversation` module which uses `ClaudeSDKClient`.
+
+In conversation mode, work sessions for a PR group run on a long-lived
+background event loop owned by the wrapper, with connected SDK clients
+pooled per ``(group_id, model, tools)`` so tasks in the same group skip the
+connect handshake and keep conversation context.
 """
 
-from typing import TYPE_CHECKING, Any
+import copy
+import threading
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any, TypeVar
 
+from .agent_concurrency import GroupWorkSession, run_group_sessions
 from .agent_exceptions import (
     SDKImportError,
     SDKInitializationError,
 )
+from .agent_loop import BackgroundEventLoop
 from .agent_message import MessageProcessor
 from .agent_models import (
     ModelType,
@@ -23,18 +33,27 @@ from .agent_query import AgentQueryExecutor
 from .circuit_breaker import (
     CircuitBreaker,
     CircuitBreakerConfig,
+    CircuitBreakerRegistry,
 )
+from .client_pool import DEFAULT_IDLE_TIMEOUT, SDKClientPool
 from .config_loader import get_config
+from .conversation import ConversationManager
+from .parallel import ParallelExecutorConfig, TaskResult
+from .prompts import build_work_prompt
 from .rate_limit import RateLimitConfig
+from .retry import TokenBucket
 from .subagents import get_agents_for_working_dir
 
 if TYPE_CHECKING:
     from .hooks import HookMatcher
     from .logger import TaskLogger
 
+T = TypeVar("T")
+
 # Re-export for backward compatibility
 __all__ = [
     "AgentWrapper",
+    "GroupWorkSession",
     "ModelType",
     "TaskComplexity",
     "ToolConfig",
@@ -54,6 +73,8 @@ class AgentWrapper:
         enable_safety_hooks: bool = True,
         logger: "TaskLogger | None" = None,
         circuit_breaker_config: CircuitBreakerConfig | None = None,
+        conversation_mode: bool = False,
+        client_idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
     ):
         """Initialize agent wrapper.
 
@@ -66,6 +87,11 @@ class AgentWrapper:
             enable_safety_hooks: If True and hooks is None, create default safety hooks.
             logger: Optional TaskLogger for capturing tool usage and responses.
             circuit_breaker_config: Optional circuit breaker config for fault tolerance.
+            conversation_mode: If True, work sessions that carry a PR group ID
+                run as multi-turn conversations on a persistent event loop,
+                reusing one connected SDK client per group/model/tools.
+            client_idle_timeout: Seconds a pooled SDK client stays connected
+                while idle (conversation mode only).
 
         Raises:
             SDKImportError: If claude-agent-sdk is not installed.
@@ -75,6 +101,10 @@ class AgentWrapper:
         self.model = model
         self.working_dir = working_dir
         self.rate_limit_config = rate_limit_config or RateLimitConfig.default()
+        # Shared with sibling wrappers (for_working_dir), so concurrent
+        # sessions back off together after a 429; it also throttles them to
+        # one budget when requests_per_second is set
+        self.rate_limiter = TokenBucket.from_rate_limit_config(self.rate_limit_config)
         self.hooks = hooks
         self.enable_safety_hooks = enable_safety_hooks
         self.logger = logger
@@ -84,6 +114,8 @@ class AgentWrapper:
             name="claude_api",
             config=circuit_breaker_config or CircuitBreakerConfig.default(),
         )
+        # Registered so /health and health_check can report it
+        CircuitBreakerRegistry().register(self.circuit_breaker)
 
         # Import Claude Agent SDK with improved error handling
         self._import_sdk()
@@ -92,8 +124,22 @@ class AgentWrapper:
         if self.hooks is None and self.enable_safety_hooks:
             self._init_default_hooks()
 
+        self._init_executors()
+
+        # Conversation mode: persistent loop and client pool, created lazily
+        self.conversation_mode = conversation_mode
+        self.client_idle_timeout = client_idle_timeout
+        self._event_loop: BackgroundEventLoop | None = None
+        self._conversation_manager: ConversationManager | None = None
+        self._lazy_init_lock = threading.Lock()  # Concurrent sessions share the wrapper
+
+        # Note: The Claude Agent SDK will automatically use credentials from
+        # ~/.claude/.credentials.json if no ANTHROPIC_API_KEY is set
+
+    def _init_executors(self) -> None:
+        """Create the working-directory-bound message, query and phase executors."""
         # Initialize message processor (delegated for SRP)
-        self._message_processor = MessageProcessor(logger=self.logger)
+        self._message_processor = MessageProcessor(logger=self.logger, working_dir=self.working_dir)
 
         # Initialize query executor (delegated for SRP)
         self._query_executor = AgentQueryExecutor(
@@ -105,6 +151,7 @@ class AgentWrapper:
             circuit_breaker=self.circuit_breaker,
             hooks=self.hooks,
             logger=self.logger,
+            rate_limiter=self.rate_limiter,
         )
 
         # Initialize phase executor (delegated for SRP)
@@ -117,9 +164,6 @@ class AgentWrapper:
             process_message_func=self._message_processor.process_message,
         )
 
-        # Note: The Claude Agent SDK will automatically use credentials from
-        # ~/.claude/.credentials.json if no ANTHROPIC_API_KEY is set
-
     def _init_default_hooks(self) -> None:
         """Initialize default safety and audit hooks.
 
@@ -203,10 +247,27 @@ class AgentWrapper:
             pr_group_info: Optional dict with PR group context (name, completed_tasks, etc).
 
         Returns:
-            Dict with 'output', 'success', and 'model_used' keys.
+            Dict with 'output', 'success', and 'model_used' keys. In
+            conversation mode also 'connection_setup_seconds' and
+            'client_reused'.
 
-        Delegates to AgentPhaseExecutor for implementation.
+        In conversation mode, sessions whose ``pr_group_info`` has a
+        'group_id' continue that group's conversation; everything else
+        delegates to AgentPhaseExecutor.
         """
+        if self.conversation_mode and pr_group_info and pr_group_info.get("group_id"):
+            return self._run_conversation_work_session(
+                group_id=pr_group_info["group_id"],
+                prompt=build_work_prompt(
+                    task_description=task_description,
+                    context=context if context else None,
+                    pr_comments=pr_comments,
+                    required_branch=required_branch,
+                    create_pr=create_pr,
+                    pr_group_info=pr_group_info,
+                ),
+                model_override=model_override,
+            )
         return self._phase_executor.run_work_session(
             task_description=task_description,
             context=context,
@@ -217,6 +278,146 @@ class AgentWrapper:
             pr_group_info=pr_group_info,
         )
 
+    # -------------------------------------------------------------------------
+    # Concurrent Work Sessions (independent PR groups in one process)
+    # -------------------------------------------------------------------------
+
+    def for_working_dir(self, working_dir: str) -> "AgentWrapper":
+        """Get a wrapper with the same settings bound to another directory.
+
+        The sibling shares this wrapper's circuit breaker, hooks and logger.
+        Returns self if the directory is unchanged.
+
+        Args:
+            working_dir: Working directory for the sibling's queries.
+
+        Returns:
+            An AgentWrapper for working_dir.
+        """
+        if working_dir == self.working_dir:
+            return self
+        sibling = copy.copy(self)  # Shares the imported SDK and settings
+        sibling.working_dir = working_dir
+        sibling._event_loop = None
+        sibling._conversation_manager = None
+        sibling._lazy_init_lock = threading.Lock()
+        sibling._init_executors()
+        return sibling
+
+    def run_concurrent_work_sessions(
+        self,
+        sessions: list[GroupWorkSession],
+        config: ParallelExecutorConfig | None = None,
+    ) -> dict[str, TaskResult[dict[str, Any]]]:
+        """Run work sessions for independent PR groups concurrently.
+
+        Delegates to ``agent_concurrency.run_group_sessions``.
+
+        Args:
+            sessions: One session per PR group, each in its own checkout.
+            config: Optional ParallelExecutor configuration.
+
+        Returns:
+            Dict mapping group ID to the TaskResult of its work session.
+        """
+        return run_group_sessions(self, sessions, config)
+
+    # -------------------------------------------------------------------------
+    # Conversation Mode (persistent event loop + SDK client pool)
+    # -------------------------------------------------------------------------
+
+    @property
+    def event_loop(self) -> BackgroundEventLoop:
+        """Get the wrapper's background event loop, starting it if needed."""
+        with self._lazy_init_lock:
+            if self._event_loop is None:
+                self._event_loop = BackgroundEventLoop()
+            return self._event_loop
+
+    @property
+    def conversation_manager(self) -> ConversationManager:
+        """Get the pooled ConversationManager (created on first use)."""
+        with self._lazy_init_lock:
+            if self._conversation_manager is None:
+                self._conversation_manager = ConversationManager(
+                    working_dir=self.working_dir,
+                    model=self.model.value,
+                    hooks=self.hooks,
+                    logger=self.logger,
+                    rate_limit_config=self.rate_limit_config,
+                    client_pool=SDKClientPool(idle_timeout=self.client_idle_timeout),
+                )
+            return self._conversation_manager
+
+    def run_async(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the persistent event loop (sync facade).
+
+        Anything bound to that loop, such as pooled SDK clients, stays
+        usable across calls.
+
+        Args:
+            coro: The coroutine to run.
+
+        Returns:
+            The coroutine's result.
+        """
+        return self.event_loop.run(coro)
+
+    def _run_conversation_work_session(
+        self,
+        group_id: str,
+        prompt: str,
+        model_override: ModelType | None = None,
+    ) -> dict[str, Any]:
+        """Run a work prompt in the group's pooled conversation."""
+        model = model_override or self.model
+        output, setup = self.run_async(
+            self._query_executor.run_conversation_query(
+                self.conversation_manager,
+                group_id,
+                prompt,
+                self.get_tools_for_phase("working"),
+                model_override=model,
+                get_model_name_func=self._get_model_name,
+                process_message_func=self._message_processor.process_message,
+            )
+        )
+        return {
+            "output": output,
+            "success": True,  # For MVP, assume success
+            "model_used": model.value,
+            "connection_setup_seconds": setup.seconds if setup else None,
+            "client_reused": setup.reused if setup else False,
+        }
+
+    def get_connection_stats(self) -> dict[str, Any]:
+        """Get SDK client pool counters (connects, reuses, time saved).
+
+        Returns:
+            Pool statistics, or an empty dict outside conversation mode.
+        """
+        if self._conversation_manager is None or self._conversation_manager.client_pool is None:
+            return {}
+        return self._conversation_manager.client_pool.stats.to_dict()
+
+    def close(self) -> None:
+        """Disconnect pooled SDK clients and stop the background event loop.
+
+        Safe to call more than once, and a no-op if conversation mode was
+        never used.
+        """
+        with self._lazy_init_lock:
+            event_loop, self._event_loop = self._event_loop, None
+            manager, self._conversation_manager = self._conversation_manager, None
+        if event_loop is None:
+            return
+        if manager is not None:
+            try:
+                event_loop.run(manager.close_all())
+            except Exception:
+                pass  # Best-effort disconnect on shutdown
+        event_loop.stop()
+
     def verify_success_criteria(self, criteria: str, context: str = "") -> dict[str, Any]:
         """Verify if success criteria are met.
 
@@ -0,0 +1,151 @@
+"""Concurrent Work Sessions - Run independent PR groups side by side.
+
+The query path never changes the process working directory (each query
+passes ``cwd=`` to the SDK instead), so work sessions for different PR
+groups can share one process. This module runs one work session per group
+through ``ParallelExecutor``:
+
+    results = agent.run_concurrent_work_sessions([
+        GroupWorkSession(group_id="pr_1", task_description="...", working_dir="wt/pr_1"),
+        GroupWorkSession(group_id="pr_2", task_description="...", working_dir="wt/pr_2"),
+    ])
+
+Every session needs its own checkout, e.g. a ``git worktree``: sessions in
+the same directory would switch branches and edit files under each other,
+so a missing or shared ``working_dir`` is rejected.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .parallel import ParallelExecutor, ParallelExecutorConfig, ParallelTask, TaskResult
+
+if TYPE_CHECKING:
+    from .agent import AgentWrapper
+    from .agent_models import ModelType
+
+# Circuit breaker group for concurrent work sessions
+WORK_SESSION_TASK_TYPE = "work_session"
+
+
+@dataclass
+class GroupWorkSession:
+    """A work session for one PR group.
+
+    Attributes:
+        group_id: PR group ID; must be unique within one run.
+        task_description: Description of the task to complete.
+        working_dir: Checkout to work in; required, and different for every
+            session in a run.
+        context: Additional context for the task.
+        pr_comments: PR review comments to address (if any).
+        model_override: Optional model to use instead of the agent's.
+        required_branch: Optional branch the agent should be on.
+        create_pr: If True, instruct the agent to create a PR.
+        pr_group_info: Extra PR group context (name, completed_tasks, etc).
+    """
+
+    group_id: str
+    task_description: str
+    working_dir: str | None = None
+    context: str = ""
+    pr_comments: str | None = None
+    model_override: ModelType | None = None
+    required_branch: str | None = None
+    create_pr: bool = True
+    pr_group_info: dict[str, Any] = field(default_factory=dict)
+
+
+def run_group_sessions(
+    agent: AgentWrapper,
+    sessions: list[GroupWorkSession],
+    config: ParallelExecutorConfig | None = None,
+) -> dict[str, TaskResult[dict[str, Any]]]:
+    """Run work sessions for independent PR groups concurrently.
+
+    Each session runs on a wrapper bound to its own working directory (the
+    agent itself when the directory matches). Sibling wrappers share the
+    agent's circuit breaker, hooks and logger and are closed when the run ends.
+
+    Args:
+        agent: The agent whose settings the sessions use.
+        sessions: One session per PR group.
+        config: Executor configuration. Defaults to one worker per session
+            (capped at ``ParallelExecutorConfig.max_workers``) and no
+            executor-level retries, since queries already retry.
+
+    Returns:
+        Dict mapping group ID to the TaskResult of its work session.
+
+    Raises:
+        ValueError: If a session has no working_dir, or two sessions share a
+            working_dir or a group ID.
+    """
+    working_dirs = _working_dirs(sessions)
+    if config is None:
+        defaults = ParallelExecutorConfig()
+        config = ParallelExecutorConfig(
+            max_workers=max(1, min(len(sessions), defaults.max_workers)),
+            max_retries=0,
+        )
+
+    wrappers: list[AgentWrapper] = []
+    executor = ParallelExecutor(config)
+    for session, working_dir in zip(sessions, working_dirs, strict=True):
+        wrapper = agent.for_working_dir(working_dir)
+        wrappers.append(wrapper)
+        executor.add_task(
+            ParallelTask(
+                task_id=session.group_id,
+                func=_session_runner(wrapper, session),
+                task_type=WORK_SESSION_TASK_TYPE,
+            )
+        )
+
+    try:
+        return executor.execute_all()
+    finally:
+        for wrapper in wrappers:
+            if wrapper is not agent:
+                wrapper.close()
+
+
+def _working_dirs(sessions: list[GroupWorkSession]) -> list[str]:
+    """Get each session's working directory, requiring them to be distinct."""
+    owners: dict[str, str] = {}
+    working_dirs = []
+    for session in sessions:
+        if not session.working_dir:
+            raise ValueError(f"Work session {session.group_id!r} has no working_dir")
+        key = os.path.realpath(session.working_dir)
+        if key in owners:
+            raise ValueError(
+                f"Work sessions {owners[key]!r} and {session.group_id!r} share "
+                f"working_dir {session.working_dir!r}"
+            )
+        owners[key] = session.group_id
+        working_dirs.append(session.working_dir)
+    return working_dirs
+
+
+def _session_runner(
+    wrapper: AgentWrapper, session: GroupWorkSession
+) -> Callable[[], dict[str, Any]]:
+    """Bind a session to the wrapper that runs it."""
+
+    def run() -> dict[str, Any]:
+        return wrapper.run_work_session(
+            task_description=session.task_description,
+            context=session.context,
+            pr_comments=session.pr_comments,
+            model_override=session.model_override,
+            required_branch=session.required_branch,
+            create_pr=session.create_pr,
+            pr_group_info={**session.pr_group_info, "group_id": session.group_id},
+        )
+
+    return run
@@ -0,0 +1,162 @@
+"""Background Event Loop - A long-lived asyncio loop on a dedicated thread.
+
+``run_async_with_cleanup`` creates and closes a new event loop for every
+phase, so nothing bound to a loop (notably connected ``ClaudeSDKClient``
+instances) survives from one task to the next. ``BackgroundEventLoop`` keeps
+one loop running on a daemon thread for the lifetime of its owner and offers
+a synchronous facade for submitting coroutines to it:
+
+    loop = BackgroundEventLoop()
+    result = loop.run(some_coroutine())  # Blocks until done
+    loop.stop()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Seconds to wait for a cancelled coroutine to unwind after Ctrl+C
+CANCEL_GRACE_PERIOD = 5.0
+
+
+class BackgroundEventLoop:
+    """An asyncio event loop running on its own daemon thread.
+
+    The loop is started lazily on first use and runs until ``stop()``.
+    Coroutines submitted from other threads run on the loop, so objects
+    created there (SDK clients, pools) can be reused across calls.
+    """
+
+    def __init__(self, name: str = "claudetm-event-loop"):
+        """Initialize the background loop (not started yet).
+
+        Args:
+            name: Name of the loop thread.
+        """
+        self.name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the loop thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop, starting the thread if needed."""
+        return self.start()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread if it isn't running.
+
+        Returns:
+            The running event loop.
+        """
+        with self._lock:
+            if self._loop is not None and self.is_running:
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            thread = threading.Thread(
+                target=self._run_loop, args=(loop, ready), name=self.name, daemon=True
+            )
+            thread.start()
+            ready.wait()
+            self._loop = loop
+            self._thread = thread
+            return loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        """Thread target: run the loop until stopped, then clean it up."""
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            except Exception:
+                pass  # Best-effort cleanup
+            loop.close()
+
+    def _in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """Schedule a coroutine on the loop without waiting for it.
+
+        Args:
+            coro: The coroutine to run.
+
+        Returns:
+            A concurrent Future for the coroutine's result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.start())
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Run a coroutine on the loop and block until it finishes.
+
+        On Ctrl+C the coroutine is cancelled and given a moment to clean up
+        before KeyboardInterrupt is re-raised, like ``run_async_with_cleanup``.
+
+        Args:
+            coro: The coroutine to run.
+            timeout: Optional seconds to wait before cancelling it.
+
+        Returns:
+            The coroutine's result.
+
+        Raises:
+            RuntimeError: If called from the loop thread (would deadlock).
+            TimeoutError: If the timeout expires.
+            KeyboardInterrupt: Re-raised after cancelling the coroutine.
+        """
+        if self._in_loop_thread():
+            coro.close()
+            raise RuntimeError("BackgroundEventLoop.run() called from the loop thread")
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Coroutine did not finish within {timeout}s") from None
+        except KeyboardInterrupt:
+            future.cancel()
+            try:
+                future.result(CANCEL_GRACE_PERIOD)
+            except BaseException:
+                pass  # Cancelled or failed while unwinding
+            raise
+
+    def stop(self, timeout: float = CANCEL_GRACE_PERIOD) -> None:
+        """Stop the loop, cancel remaining tasks and join the thread.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None:
+            return
+        if thread.is_alive():
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not threading.current_thread():
+                thread.join(timeout)
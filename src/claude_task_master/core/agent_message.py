@@ -23,13 +23,16 @@ class MessageProcessor:
     and accumulating result text from the query stream.
     """
 
-    def __init__(self, logger: "TaskLogger | None" = None):
+    def __init__(self, logger: "TaskLogger | None" = None, working_dir: str | None = None):
         """Initialize the message processor.
 
         Args:
             logger: Optional TaskLogger for capturing tool usage and responses.
+            working_dir: Directory tool paths are shown relative to. Defaults
+                to the process working directory.
         """
         self.logger = logger
+        self.working_dir = working_dir
 
     def process_message(self, message: Any, result_text: str) -> str:
         """Process a message from the query stream.
@@ -87,19 +90,20 @@ class MessageProcessor:
         return result_text
 
     @staticmethod
-    def _relative_path(path: str) -> str:
+    def _relative_path(path: str, base: str | None = None) -> str:
         """Convert an absolute path to a relative path if possible.
 
         Args:
             path: The path to convert.
+            base: Directory to make the path relative to (default: cwd).
 
         Returns:
-            Relative path if under cwd, otherwise the original path.
+            Relative path if under base, otherwise the original path.
         """
         if not path:
             return path
         try:
-            cwd = os.getcwd()
+            cwd = os.path.abspath(base) if base else os.getcwd()
             if os.path.isabs(path) and path.startswith(cwd):
                 rel = os.path.relpath(path, cwd)
                 return rel if rel else path
@@ -131,21 +135,21 @@ class MessageProcessor:
                 cmd = cmd[:247] + "..."
             return f"→ {cmd}"
         elif tool_name == "Read":
-            path = self._relative_path(tool_input.get("file_path", ""))
+            path = self._relative_path(tool_input.get("file_path", ""), self.working_dir)
             return f"→ {path}"
         elif tool_name == "Write":
-            path = self._relative_path(tool_input.get("file_path", ""))
+            path = self._relative_path(tool_input.get("file_path", ""), self.working_dir)
             return f"→ {path}"
         elif tool_name == "Edit":
-            path = self._relative_path(tool_input.get("file_path", ""))
+            path = self._relative_path(tool_input.get("file_path", ""), self.working_dir)
             return f"→ {path}"
         elif tool_name == "Glob":
             pattern = tool_input.get("pattern", "")
-            path = self._relative_path(tool_input.get("path", "."))
+            path = self._relative_path(tool_input.get("path", "."), self.working_dir)
             return f"→ {pattern} in {path}"
         elif tool_name == "Grep":
             pattern = tool_input.get("pattern", "")
-            path = self._relative_path(tool_input.get("path", "."))
+            path = self._relative_path(tool_input.get("path", "."), self.working_dir)
             return f"→ '{pattern}' in {path}"
         elif tool_name == "WebSearch":
             query = tool_input.get("query", "")
@@ -2,15 +2,19 @@
 
 This module contains the query execution logic extracted from AgentWrapper,
 following the Single Responsibility Principle (SRP). It handles:
-- Query execution with retries
+- Query execution with retries (jittered backoff per error class, honouring
+  server Retry-After hints, see ``core.retry``), for one-shot queries and
+  pooled conversation queries alike
+- Shared token-bucket rate limiting across concurrent sessions
 - Circuit breaker integration
-- Working directory management
+- Working directory validation (queries run in ``cwd=``, never ``os.chdir``)
 - API error classification
 """
 
 import asyncio
 import os
 import time
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
 from . import console
@@ -34,21 +38,34 @@ from .circuit_breaker import (
     CircuitState,
 )
 from .config_loader import get_config
+from .retry import (
+    ErrorKind,
+    RetryPolicies,
+    TokenBucket,
+    classify_error,
+    classify_status,
+    retry_after_from_error,
+    status_code_from_error,
+)
 
 if TYPE_CHECKING:
     from .agent_models import ModelType
     from .circuit_breaker import CircuitBreaker
+    from .client_pool import ConnectionSetup
+    from .conversation import ConversationManager
     from .hooks import HookMatcher
     from .logger import TaskLogger
     from .rate_limit import RateLimitConfig
+    from .retry import Backoff
 
 
 class AgentQueryExecutor:
     """Handles query execution with retry logic and circuit breaker.
 
     This class is responsible for executing queries against the Claude Agent SDK,
-    handling transient errors with exponential backoff, and managing the circuit
-    breaker for fault tolerance.
+    handling transient errors with jittered backoff, and managing the circuit
+    breaker for fault tolerance. Executors for concurrent sessions should
+    share one ``rate_limiter`` so a 429 pauses all of them.
     """
 
     def __init__(
@@ -61,6 +78,7 @@ class AgentQueryExecutor:
         circuit_breaker: "CircuitBreaker",
         hooks: dict[str, list["HookMatcher"]] | None = None,
         logger: "TaskLogger | None" = None,
+        rate_limiter: TokenBucket | None = None,
     ):
         """Initialize the query executor.
 
@@ -73,6 +91,7 @@ class AgentQueryExecutor:
             circuit_breaker: Circuit breaker instance for fault tolerance.
             hooks: Optional hooks dictionary for ClaudeAgentOptions.
             logger: Optional TaskLogger for capturing tool usage.
+            rate_limiter: Optional token bucket shared with other sessions.
         """
         self.query = query_func
         self.options_class = options_class
@@ -82,6 +101,8 @@ class AgentQueryExecutor:
         self.circuit_breaker = circuit_breaker
         self.hooks = hooks
         self.logger = logger
+        self.retry_policies = RetryPolicies.from_rate_limit_config(rate_limit_config)
+        self.rate_limiter = rate_limiter
 
         # Track consecutive failures within a time window
         self._consecutive_failures = 0
@@ -177,9 +198,12 @@ class AgentQueryExecutor:
     ) -> str:
         """Execute query with retry logic for transient errors.
 
-        Uses a fixed 5-second delay between retries. If 3 consecutive errors
-        occur within a 1-minute window, raises ConsecutiveFailuresError to
-        signal the orchestrator to exit with blocked status.
+        Waits between retries with decorrelated-jitter backoff chosen by error
+        class (see ``core.retry``), never shorter than a server Retry-After.
+        A rate limit also pauses the shared rate limiter, so concurrent
+        sessions back off together. If 3 consecutive errors occur within a
+        1-minute window, raises ConsecutiveFailuresError to signal the
+        orchestrator to exit with blocked status.
 
         Args:
             prompt: The prompt to send to the model.
@@ -197,6 +221,91 @@ class AgentQueryExecutor:
             ConsecutiveFailuresError: If 3 consecutive API errors occur within 1 minute.
             CircuitBreakerError: If circuit breaker is open.
         """
+        return await self._run_with_retry(
+            lambda: self._execute_query(
+                prompt,
+                tools,
+                model_override,
+                get_model_name_func,
+                get_agents_func,
+                process_message_func,
+            )
+        )
+
+    async def run_conversation_query(
+        self,
+        manager: "ConversationManager",
+        group_id: str,
+        prompt: str,
+        tools: list[str],
+        model_override: "ModelType | None" = None,
+        get_model_name_func: Any = None,
+        process_message_func: Any = None,
+    ) -> "tuple[str, ConnectionSetup | None]":
+        """Send a prompt in a group's pooled conversation, with retries.
+
+        Gets the same rate limiting, circuit breaker, retry backoff, failure
+        tracking and error classification as run_query. A failed attempt
+        disconnects its client, so a retry starts on a fresh connection.
+
+        Args:
+            manager: ConversationManager holding the client pool.
+            group_id: The PR group whose conversation continues.
+            prompt: The prompt to send.
+            tools: List of tools to enable.
+            model_override: Optional model to use instead of default.
+            get_model_name_func: Function to convert ModelType to API model name.
+            process_message_func: Function to process messages from the response.
+
+        Returns:
+            Tuple of (result text, ConnectionSetup of the successful attempt).
+
+        Raises:
+            WorkingDirectoryError: If working directory cannot be accessed.
+            ConsecutiveFailuresError: If 3 consecutive API errors occur within 1 minute.
+            CircuitBreakerError: If circuit breaker is open.
+        """
+        effective_model = model_override or self.model
+        model_name = (
+            get_model_name_func(effective_model)
+            if get_model_name_func
+            else self._default_get_model_name(effective_model)
+        )
+        setup: ConnectionSetup | None = None
+
+        async def attempt() -> str:
+            nonlocal setup
+            self._check_working_dir()
+            try:
+                async with manager.conversation(
+                    group_id, tools=tools or None, model_name=model_name
+                ) as session:
+                    setup = session.connection_setup
+                    return await session.query_task(
+                        prompt, process_message_func=process_message_func
+                    )
+            except AgentError:
+                raise
+            except Exception as e:
+                # Classify the SDK error rather than the conversation's wrapper
+                raise self._classify_api_error(getattr(e, "original_error", None) or e) from e
+
+        result = await self._run_with_retry(attempt)
+        return result, setup
+
+    async def _run_with_retry(self, attempt: Callable[[], Awaitable[str]]) -> str:
+        """Run query attempts until one succeeds or the error isn't retryable.
+
+        Args:
+            attempt: Coroutine factory making one query attempt.
+
+        Returns:
+            The result text of the successful attempt.
+
+        Raises:
+            ConsecutiveFailuresError: If 3 consecutive API errors occur within 1 minute.
+            CircuitBreakerError: If circuit breaker is open.
+        """
         # Check circuit breaker state first
         if self.circuit_breaker.is_open:
             time_until_retry = self.circuit_breaker.time_until_retry
@@ -209,23 +318,19 @@ class AgentQueryExecutor:
                 time_until_retry,
             )
 
-        retry_delay = 5.0  # seconds
+        backoff = self.retry_policies.backoff()
 
         while True:
+            if self.rate_limiter is not None:
+                waited = await self.rate_limiter.acquire()
+                if waited >= 1:
+                    console.detail(f"Rate limited locally, waited {waited:.0f}s", flush=True)
             try:
                 # Execute through circuit breaker
-                with self.circuit_breaker:
-                    result = await self._execute_query(
-                        prompt,
-                        tools,
-                        model_override,
-                        get_model_name_func,
-                        get_agents_func,
-                        process_message_func,
-                    )
-                    # Success - reset failure counter
-                    self._reset_failures()
-                    return result
+                result = await self._call_through_breaker(attempt)
+                # Success - reset failure counter
+                self._reset_failures()
+                return result
             except CircuitBreakerError:
                 # Circuit breaker tripped - don't retry
                 console.warning("Circuit breaker opened due to repeated failures")
@@ -240,8 +345,7 @@ class AgentQueryExecutor:
                     f"API error ({self._consecutive_failures}/3 in window): {e.message}",
                     flush=True,
                 )
-                console.detail(f"Retrying in {retry_delay:.0f} seconds...", flush=True)
-                await asyncio.sleep(retry_delay)
+                await self._wait_before_retry(backoff, classify_error(e), retry_after_from_error(e))
             except (
                 APIAuthenticationError,
                 ContentFilterError,
@@ -263,8 +367,45 @@ class AgentQueryExecutor:
                     f"Unexpected error ({self._consecutive_failures}/3 in window): {type(e).__name__}: {e}",
                     flush=True,
                 )
-                console.detail(f"Retrying in {retry_delay:.0f} seconds...", flush=True)
-                await asyncio.sleep(retry_delay)
+                await self._wait_before_retry(backoff, ErrorKind.OTHER)
+
+    async def _call_through_breaker(self, attempt: Callable[[], Awaitable[str]]) -> str:
+        """Make one attempt through the circuit breaker, timing it here.
+
+        Concurrent queries interleave on one event loop thread, so the
+        duration is measured per call rather than by the breaker.
+
+        Raises:
+            CircuitBreakerError: If circuit is open.
+        """
+        self.circuit_breaker.acquire()
+        start = time.monotonic()
+        try:
+            result = await attempt()
+        except BaseException:
+            self.circuit_breaker.record_outcome(success=False, duration=time.monotonic() - start)
+            raise
+        self.circuit_breaker.record_outcome(success=True, duration=time.monotonic() - start)
+        return result
+
+    async def _wait_before_retry(
+        self,
+        backoff: "Backoff",
+        kind: ErrorKind,
+        retry_after: float | None = None,
+    ) -> None:
+        """Sleep before the next attempt.
+
+        Args:
+            backoff: The delay sequence of this query's retries.
+            kind: The class of the error that failed the last attempt.
+            retry_after: Server-requested wait, in seconds.
+        """
+        delay = backoff.next_delay(kind, retry_after)
+        if kind is ErrorKind.RATE_LIMIT and self.rate_limiter is not None:
+            self.rate_limiter.pause(delay)
+        console.detail(f"Retrying in {delay:.0f} seconds...", flush=True)
+        await asyncio.sleep(delay)
 
     async def _execute_query(
         self,
@@ -298,7 +439,6 @@ class AgentQueryExecutor:
             QueryExecutionError: For other query errors.
         """
         result_text = ""
-        original_dir = os.getcwd()
 
         # Determine which model to use
         effective_model = model_override or self.model
@@ -316,58 +456,62 @@ class AgentQueryExecutor:
             flush=True,
         )
 
-        try:
-            # Change to working directory
-            try:
-                os.chdir(self.working_dir)
-            except FileNotFoundError as e:
-                raise WorkingDirectoryError(self.working_dir, "change to", e) from e
-            except PermissionError as e:
-                raise WorkingDirectoryError(self.working_dir, "access", e) from e
-            except OSError as e:
-                raise WorkingDirectoryError(self.working_dir, "change to", e) from e
-
-            # Load subagents from .claude/agents/ directory
-            if get_agents_func:
-                agents = get_agents_func(self.working_dir)
-            else:
-                agents = None
-
-            # Create options with model specification and subagents
-            try:
-                options = self.options_class(
-                    allowed_tools=tools,
-                    permission_mode="bypassPermissions",  # For MVP, bypass permissions
-                    model=model_name,  # Specify the model to use
-                    cwd=str(self.working_dir),  # Project directory for CLAUDE.md
-                    setting_sources=["user", "local", "project"],  # Load all settings/skills
-                    hooks=self.hooks,  # Compatible HookMatcher
-                    agents=agents if agents else None,  # Programmatic subagents
-                )
-            except Exception as e:
-                raise SDKInitializationError("ClaudeAgentOptions", e) from e
+        # The SDK runs in options.cwd; the process cwd is never changed, so
+        # concurrent sessions for different directories don't interfere
+        self._check_working_dir()
 
-            # Execute query
-            try:
-                async for message in self.query(prompt=prompt, options=options):
-                    if process_message_func:
-                        result_text = process_message_func(message, result_text)
-                    else:
-                        result_text = self._default_process_message(message, result_text)
-            except Exception as e:
-                # Classify the error
-                raise self._classify_api_error(e) from e
+        # Load subagents from .claude/agents/ directory
+        if get_agents_func:
+            agents = get_agents_func(self.working_dir)
+        else:
+            agents = None
 
-        finally:
-            # Always restore original directory
-            try:
-                os.chdir(original_dir)
-            except OSError:
-                # Best effort to restore directory - don't mask original error
-                pass
+        # Create options with model specification and subagents
+        try:
+            options = self.options_class(
+                allowed_tools=tools,
+                permission_mode="bypassPermissions",  # For MVP, bypass permissions
+                model=model_name,  # Specify the model to use
+                cwd=str(self.working_dir),  # Project directory for CLAUDE.md
+                setting_sources=["user", "local", "project"],  # Load all settings/skills
+                hooks=self.hooks,  # Compatible HookMatcher
+                agents=agents if agents else None,  # Programmatic subagents
+            )
+        except Exception as e:
+            raise SDKInitializationError("ClaudeAgentOptions", e) from e
+
+        # Execute query
+        try:
+            async for message in self.query(prompt=prompt, options=options):
+                if process_message_func:
+                    result_text = process_message_func(message, result_text)
+                else:
+                    result_text = self._default_process_message(message, result_text)
+        except Exception as e:
+            # Classify the error
+            raise self._classify_api_error(e) from e
 
         return result_text
 
+    def _check_working_dir(self) -> None:
+        """Check that the working directory exists and is accessible.
+
+        Raises:
+            WorkingDirectoryError: If the directory is missing, not a
+                directory, or not readable/searchable.
+        """
+        try:
+            if not os.path.exists(self.working_dir):
+                raise FileNotFoundError(f"No such directory: {self.working_dir}")
+            if not os.path.isdir(self.working_dir):
+                raise NotADirectoryError(f"Not a directory: {self.working_dir}")
+            if not os.access(self.working_dir, os.R_OK | os.X_OK):
+                raise PermissionError(f"Permission denied: {self.working_dir}")
+        except PermissionError as e:
+            raise WorkingDirectoryError(self.working_dir, "access", e) from e
+        except OSError as e:
+            raise WorkingDirectoryError(self.working_dir, "find", e) from e
+
     def _default_get_model_name(self, model: "ModelType") -> str:
         """Default model name mapping using global config.
 
@@ -426,18 +570,24 @@ class AgentQueryExecutor:
         """
         error_str = str(error).lower()
         error_type = type(error).__name__
+        status_code = status_code_from_error(error)
 
         # Check for content filtering errors (not retryable)
         if "content filtering" in error_str or "output blocked" in error_str:
             return ContentFilterError(error)
 
-        # Check for rate limiting
-        if "rate" in error_str and "limit" in error_str:
-            # Try to extract retry-after if present
-            retry_after = None
-            if hasattr(error, "retry_after"):
-                retry_after = error.retry_after
-            return APIRateLimitError(retry_after, error)
+        # Check for rate limiting (HTTP 429, the SDK's error type or the message)
+        if (
+            status_code == 429
+            or error_type == "RateLimitError"
+            or ("rate" in error_str and "limit" in error_str)
+        ):
+            # Keep the server's retry-after hint (attribute or response headers)
+            return APIRateLimitError(retry_after_from_error(error), error)
+
+        # Check for server errors reported with a status code
+        if status_code is not None and classify_status(status_code) is ErrorKind.SERVER:
+            return APIServerError(status_code, error)
 
         # Check for authentication errors
         if any(kw in error_str for kw in ["auth", "unauthorized", "403", "401"]):
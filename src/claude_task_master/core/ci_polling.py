@@ -0,0 +1,153 @@
+"""Adaptive CI polling schedule.
+
+``CIPollScheduler`` decides how long to wait between CI status checks of a
+PR head commit instead of a fixed interval:
+
+- While nothing changes (or checks are still queued) the interval grows
+  geometrically from ``min_interval`` up to ``max_interval``.
+- Any observed change resets it to ``min_interval``.
+- Once CI durations from previous runs are known, it wakes up right at the
+  expected completion time and polls at ``min_interval`` around it.
+
+Completed CI durations are kept in ``ci_timings.json`` in the state
+directory, so later runs (and later PRs) start with a good estimate.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+TIMINGS_FILE = "ci_timings.json"
+MAX_TIMINGS = 20  # Completed CI durations remembered
+COMPLETION_WINDOW = 0.25  # Fraction of the expected duration polled tightly
+
+
+class CIPollScheduler:
+    """Compute the wait before the next CI status poll of a PR head.
+
+    Example:
+        >>> scheduler = CIPollScheduler(history_path=state_dir / "ci_timings.json")
+        >>> scheduler.start(42, head_sha)
+        >>> delay = scheduler.next_interval(changed=False, queued=True)
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 10.0,
+        max_interval: float = 120.0,
+        backoff: float = 1.5,
+        history_path: Path | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            min_interval: Shortest wait between polls (seconds).
+            max_interval: Longest wait between polls (seconds).
+            backoff: Growth factor of the wait while nothing changes.
+            history_path: JSON file of completed CI durations (optional).
+            clock: Monotonic clock, for tests.
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.history_path = history_path
+        self._clock = clock
+        self._key: tuple[int, str] | None = None
+        self._started_at = 0.0
+        self._interval = min_interval
+        self._waited = False  # Whether the current head was ever seen pending
+        self._durations: list[float] = self._load_history()
+
+    def _load_history(self) -> list[float]:
+        if self.history_path is None or not self.history_path.exists():
+            return []
+        try:
+            data = json.loads(self.history_path.read_text())
+            return [float(d) for d in data.get("durations", [])][-MAX_TIMINGS:]
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.debug("Ignoring unreadable CI timings %s: %s", self.history_path, e)
+            return []
+
+    def _save_history(self) -> None:
+        if self.history_path is None:
+            return
+        try:
+            self.history_path.write_text(json.dumps({"durations": self._durations}))
+        except OSError as e:
+            logger.debug("Could not save CI timings %s: %s", self.history_path, e)
+
+    @property
+    def expected_duration(self) -> float | None:
+        """Median duration of previously completed CI runs, if any."""
+        return statistics.median(self._durations) if self._durations else None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since polling of the current head started."""
+        return self._clock() - self._started_at
+
+    def start(self, pr_number: int, head_sha: str) -> None:
+        """Begin (or continue) polling a PR head commit.
+
+        A new PR or head commit restarts the clock and the backoff.
+        """
+        key = (pr_number, head_sha)
+        if key != self._key:
+            self._key = key
+            self._started_at = self._clock()
+            self._interval = self.min_interval
+            self._waited = False
+
+    def next_interval(self, changed: bool, queued: bool = False) -> float:
+        """Get the wait before the next poll.
+
+        Args:
+            changed: Whether the last poll saw any change.
+            queued: Whether checks are still queued or not yet reported.
+
+        Returns:
+            Seconds to wait.
+        """
+        self._waited = True
+        if changed and not queued:
+            self._interval = self.min_interval
+        else:
+            self._interval = min(self._interval * self.backoff, self.max_interval)
+        interval = self._interval
+
+        expected = self.expected_duration
+        if expected is not None:
+            remaining = expected - self.elapsed
+            window = expected * COMPLETION_WINDOW
+            if remaining > 0:
+                # Wake up at the expected completion time, not past it
+                interval = min(interval, max(self.min_interval, remaining))
+            elif remaining > -window:
+                interval = self.min_interval
+        return max(self.min_interval, interval)
+
+    def record_completion(self) -> float | None:
+        """Remember how long CI of the current head took.
+
+        Only heads that were seen pending count; a head whose CI had already
+        finished at the first poll says nothing about CI duration.
+
+        Returns:
+            The recorded duration, or None if nothing was recorded.
+        """
+        if self._key is None or not self._waited:
+            self._key = None
+            return None
+        duration = self.elapsed
+        self._durations = [*self._durations, duration][-MAX_TIMINGS:]
+        self._save_history()
+        self._key = None
+        return duration
@@ -2,19 +2,58 @@
 
 Implements the circuit breaker pattern to prevent cascading failures
 and allow graceful degradation when services are unhealthy.
+
+Trip modes (``CircuitBreakerConfig``):
+- Consecutive (default): opens after ``failure_threshold`` failures in a row.
+- Sliding window (``sliding_window_seconds > 0``): opens when the failure
+  rate or the slow-call rate over the last N seconds reaches its threshold,
+  once at least ``minimum_calls`` calls were made in the window. Counts are
+  kept in a fixed-size ring of time buckets.
+
+Every breaker also keeps a latency histogram and a timeline of its recent
+state transitions; ``snapshot()`` and ``CircuitBreakerRegistry.snapshot_all()``
+export them. The breakers live in the runner process, so the runner publishes
+the snapshots to the state directory (``CircuitBreakerSnapshotFile``), where
+REST ``/health`` and MCP ``health_check`` read them.
 """
 
 from __future__ import annotations
 
+import bisect
+import json
+import os
+import tempfile
 import threading
 import time
+from collections import deque
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
 from enum import Enum
-from typing import TypeVar
+from pathlib import Path
+from typing import Any, TypeVar
 
 T = TypeVar("T")
 
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    10,
+    50,
+    100,
+    250,
+    500,
+    1_000,
+    2_500,
+    5_000,
+    10_000,
+    30_000,
+    60_000,
+    120_000,
+    300_000,
+)
+MAX_TRANSITIONS = 50  # State transitions kept per breaker
+BREAKER_SNAPSHOT_FILE = "circuit-breakers.json"  # In the state directory
+
 
 class CircuitState(Enum):
     """Circuit breaker states."""
@@ -32,6 +71,18 @@ class CircuitBreakerConfig:
     success_threshold: int = 2  # Successes in half-open before closing
     timeout_seconds: float = 60.0  # Time before attempting recovery
     half_open_max_calls: int = 3  # Max concurrent calls in half-open state
+    # Sliding-window mode (disabled when sliding_window_seconds is 0)
+    sliding_window_seconds: float = 0.0  # Window length; 0 = consecutive mode
+    window_buckets: int = 10  # Ring buffer size (bucket width = window / buckets)
+    minimum_calls: int = 10  # Calls in window before rates can trip the circuit
+    failure_rate_threshold: float = 50.0  # Percent of failed calls that trips
+    slow_call_duration: float = 0.0  # Seconds; successful calls this slow count as slow
+    slow_call_rate_threshold: float = 100.0  # Percent of slow calls that trips
+
+    @property
+    def sliding_window(self) -> bool:
+        """Check whether the sliding-window trip mode is enabled."""
+        return self.sliding_window_seconds > 0
 
     @classmethod
     def default(cls) -> CircuitBreakerConfig:
@@ -58,6 +109,24 @@ class CircuitBreakerConfig:
             half_open_max_calls=5,
         )
 
+    @classmethod
+    def windowed(
+        cls,
+        window_seconds: float = 60.0,
+        failure_rate_threshold: float = 50.0,
+        slow_call_duration: float = 0.0,
+        slow_call_rate_threshold: float = 100.0,
+        minimum_calls: int = 10,
+    ) -> CircuitBreakerConfig:
+        """Sliding-window configuration - trips on rates over recent calls."""
+        return cls(
+            sliding_window_seconds=window_seconds,
+            failure_rate_threshold=failure_rate_threshold,
+            slow_call_duration=slow_call_duration,
+            slow_call_rate_threshold=slow_call_rate_threshold,
+            minimum_calls=minimum_calls,
+        )
+
 
 class CircuitBreakerError(Exception):
     """Raised when circuit breaker prevents execution."""
@@ -77,6 +146,7 @@ class CircuitBreakerMetrics:
     successful_calls: int = 0
     failed_calls: int = 0
     rejected_calls: int = 0  # Calls rejected due to open circuit
+    slow_calls: int = 0  # Successful calls slower than slow_call_duration
     state_transitions: int = 0
     last_failure_time: float | None = None
     last_success_time: float | None = None
@@ -103,6 +173,10 @@ class CircuitBreakerMetrics:
         """Record a rejected call."""
         self.rejected_calls += 1
 
+    def record_slow_call(self) -> None:
+        """Record a successful call that exceeded slow_call_duration."""
+        self.slow_calls += 1
+
     def record_state_transition(self) -> None:
         """Record a state transition."""
         self.state_transitions += 1
@@ -119,6 +193,166 @@ class CircuitBreakerMetrics:
         self.consecutive_failures = 0
         self.consecutive_successes = 0
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert metrics to a dictionary (with failure_rate)."""
+        data = asdict(self)
+        data["failure_rate"] = self.failure_rate
+        return data
+
+
+# =============================================================================
+# Sliding Window and Latency Histogram
+# =============================================================================
+
+
+class SlidingWindow:
+    """Call, failure and slow-call counts over the last N seconds.
+
+    Counts live in a fixed-size ring of time buckets; a bucket is reused
+    (and zeroed) when time moves past it, so memory doesn't grow with
+    traffic. Not thread-safe: the owning breaker holds its lock.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        buckets: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty window.
+
+        Args:
+            window_seconds: Length of the window.
+            buckets: Number of ring buckets (resolution of the window).
+            clock: Monotonic clock, for tests.
+        """
+        self.window_seconds = window_seconds
+        self.size = max(1, buckets)
+        self._width = window_seconds / self.size
+        self._clock = clock
+        self._epochs = [-1] * self.size  # Bucket number held by each slot
+        self._calls = [0] * self.size
+        self._failures = [0] * self.size
+        self._slow = [0] * self.size
+
+    def _slot(self, now: float) -> int:
+        epoch = int(now // self._width)
+        slot = epoch % self.size
+        if self._epochs[slot] != epoch:
+            self._epochs[slot] = epoch
+            self._calls[slot] = self._failures[slot] = self._slow[slot] = 0
+        return slot
+
+    def record(self, failed: bool, slow: bool = False) -> None:
+        """Count one call in the current bucket."""
+        slot = self._slot(self._clock())
+        self._calls[slot] += 1
+        if failed:
+            self._failures[slot] += 1
+        if slow:
+            self._slow[slot] += 1
+
+    def totals(self) -> tuple[int, int, int]:
+        """Get (calls, failures, slow calls) within the window."""
+        current = int(self._clock() // self._width)
+        calls = failures = slow = 0
+        for slot in range(self.size):
+            if current - self._epochs[slot] < self.size:
+                calls += self._calls[slot]
+                failures += self._failures[slot]
+                slow += self._slow[slot]
+        return calls, failures, slow
+
+    def clear(self) -> None:
+        """Forget all counts."""
+        self._epochs = [-1] * self.size
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get window totals and rates (percent)."""
+        calls, failures, slow = self.totals()
+        return {
+            "seconds": self.window_seconds,
+            "calls": calls,
+            "failures": failures,
+            "slow_calls": slow,
+            "failure_rate": failures / calls * 100 if calls else 0.0,
+            "slow_call_rate": slow / calls * 100 if calls else 0.0,
+        }
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of call durations (not thread-safe)."""
+
+    def __init__(self, bounds_ms: tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            bounds_ms: Sorted bucket upper bounds in milliseconds.
+        """
+        self.bounds_ms = bounds_ms
+        self.counts = [0] * (len(bounds_ms) + 1)  # Last bucket: above all bounds
+        self.count = 0
+        self.sum_ms = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one call duration."""
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.bounds_ms, ms)] += 1
+        self.count += 1
+        self.sum_ms += ms
+
+    def percentile(self, pct: float) -> float | None:
+        """Estimate a percentile as the upper bound of its bucket (ms).
+
+        Returns:
+            The bucket bound, the largest bound for the open bucket, or None
+            if nothing was observed.
+        """
+        if self.count == 0:
+            return None
+        rank = pct / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return self.bounds_ms[min(index, len(self.bounds_ms) - 1)]
+        return self.bounds_ms[-1]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the bucket counts and summary statistics."""
+        buckets: list[dict[str, Any]] = [
+            {"le_ms": bound, "count": count}
+            for bound, count in zip(self.bounds_ms, self.counts, strict=False)
+        ]
+        buckets.append({"le_ms": None, "count": self.counts[-1]})
+        return {
+            "count": self.count,
+            "mean_ms": self.sum_ms / self.count if self.count else None,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "buckets": buckets,
+        }
+
+
+@dataclass(frozen=True)
+class StateTransition:
+    """One entry of a breaker's state-transition timeline."""
+
+    at: float  # Unix time
+    from_state: CircuitState
+    to_state: CircuitState
+    reason: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-friendly dictionary."""
+        return {
+            "at": datetime.fromtimestamp(self.at).isoformat(),
+            "from_state": self.from_state.value,
+            "to_state": self.to_state.value,
+            "reason": self.reason,
+        }
+
 
 @dataclass
 class CircuitBreaker:
@@ -152,6 +386,21 @@ class CircuitBreaker:
     _lock: threading.RLock = field(default_factory=threading.RLock, init=False)
     _last_state_change: float = field(default_factory=time.time, init=False)
     _half_open_calls: int = field(default=0, init=False)
+    _window: SlidingWindow | None = field(default=None, init=False)
+    _latency: LatencyHistogram = field(default_factory=LatencyHistogram, init=False)
+    _transitions: deque[StateTransition] = field(
+        default_factory=lambda: deque(maxlen=MAX_TRANSITIONS), init=False
+    )
+    _listeners: list[Callable[[CircuitBreaker, bool], None]] = field(
+        default_factory=list, init=False
+    )
+
+    def __post_init__(self) -> None:
+        """Create the sliding window if the config enables it."""
+        if self.config.sliding_window:
+            self._window = SlidingWindow(
+                self.config.sliding_window_seconds, self.config.window_buckets
+            )
 
     @property
     def state(self) -> CircuitState:
@@ -189,17 +438,20 @@ class CircuitBreaker:
         if self._state == CircuitState.OPEN:
             elapsed = time.time() - self._last_state_change
             if elapsed >= self.config.timeout_seconds:
-                self._transition_to(CircuitState.HALF_OPEN)
+                self._transition_to(CircuitState.HALF_OPEN, "recovery timeout elapsed")
 
-    def _transition_to(self, new_state: CircuitState) -> None:
+    def _transition_to(self, new_state: CircuitState, reason: str = "") -> None:
         """Transition to a new state."""
         if self._state != new_state:
+            self._transitions.append(StateTransition(time.time(), self._state, new_state, reason))
             self._state = new_state
             self._last_state_change = time.time()
             self._metrics.record_state_transition()
             self._metrics.reset_consecutive_counts()
             if new_state == CircuitState.HALF_OPEN:
                 self._half_open_calls = 0
+            elif new_state == CircuitState.CLOSED and self._window is not None:
+                self._window.clear()  # Don't re-trip on failures from before recovery
 
     def _can_execute(self) -> bool:
         """Check if a call can be executed in current state."""
@@ -212,24 +464,60 @@ class CircuitBreaker:
         else:  # HALF_OPEN
             return self._half_open_calls < self.config.half_open_max_calls
 
-    def _record_success(self) -> None:
+    def _record_success(self, duration: float | None = None) -> None:
         """Record a successful execution."""
         self._metrics.record_success()
+        slow = (
+            duration is not None
+            and self.config.slow_call_duration > 0
+            and duration >= self.config.slow_call_duration
+        )
+        if slow:
+            self._metrics.record_slow_call()
+        if self._window is not None:
+            self._window.record(failed=False, slow=slow)
 
         if self._state == CircuitState.HALF_OPEN:
             if self._metrics.consecutive_successes >= self.config.success_threshold:
-                self._transition_to(CircuitState.CLOSED)
+                self._transition_to(
+                    CircuitState.CLOSED, f"{self.config.success_threshold} successes in half-open"
+                )
+        elif self._state == CircuitState.CLOSED and slow:
+            self._check_window()
 
     def _record_failure(self) -> None:
         """Record a failed execution."""
         self._metrics.record_failure()
+        if self._window is not None:
+            self._window.record(failed=True)
 
         if self._state == CircuitState.CLOSED:
-            if self._metrics.consecutive_failures >= self.config.failure_threshold:
-                self._transition_to(CircuitState.OPEN)
+            if self._window is not None:
+                self._check_window()
+            elif self._metrics.consecutive_failures >= self.config.failure_threshold:
+                self._transition_to(
+                    CircuitState.OPEN, f"{self.config.failure_threshold} consecutive failures"
+                )
         elif self._state == CircuitState.HALF_OPEN:
             # Single failure in half-open triggers immediate open
-            self._transition_to(CircuitState.OPEN)
+            self._transition_to(CircuitState.OPEN, "failure in half-open")
+
+    def _check_window(self) -> None:
+        """Open the circuit if a sliding-window rate reached its threshold."""
+        if self._window is None:
+            return
+        calls, failures, slow = self._window.totals()
+        if calls < self.config.minimum_calls:
+            return
+        failure_rate = failures / calls * 100
+        slow_rate = slow / calls * 100
+        window = f"{calls} calls in {self.config.sliding_window_seconds:g}s"
+        if failure_rate >= self.config.failure_rate_threshold:
+            self._transition_to(CircuitState.OPEN, f"failure rate {failure_rate:.0f}% ({window})")
+        elif (
+            self.config.slow_call_duration > 0 and slow_rate >= self.config.slow_call_rate_threshold
+        ):
+            self._transition_to(CircuitState.OPEN, f"slow-call rate {slow_rate:.0f}% ({window})")
 
     def call(self, func: Callable[[], T]) -> T:
         """Execute a function through the circuit breaker.
@@ -244,6 +532,25 @@ class CircuitBreaker:
             CircuitBreakerError: If circuit is open.
             Exception: Any exception from the function.
         """
+        self.acquire()
+        start = time.monotonic()
+        try:
+            result = func()
+        except Exception:
+            self.record_outcome(success=False, duration=time.monotonic() - start)
+            raise
+        self.record_outcome(success=True, duration=time.monotonic() - start)
+        return result
+
+    def acquire(self) -> None:
+        """Reserve permission for a call made outside ``call()``.
+
+        Use with ``record_outcome()`` when the protected work runs somewhere
+        the breaker can't wrap directly, such as another process.
+
+        Raises:
+            CircuitBreakerError: If circuit is open.
+        """
         with self._lock:
             if not self._can_execute():
                 self._metrics.record_rejection()
@@ -252,19 +559,47 @@ class CircuitBreaker:
                     self._state,
                     self.time_until_retry,
                 )
-
             if self._state == CircuitState.HALF_OPEN:
                 self._half_open_calls += 1
 
-        try:
-            result = func()
-            with self._lock:
-                self._record_success()
-            return result
-        except Exception:
-            with self._lock:
+    def record_outcome(self, success: bool, duration: float | None = None) -> None:
+        """Record the result of a call reserved with ``acquire()``.
+
+        Args:
+            success: Whether the call succeeded.
+            duration: Call duration in seconds, for the latency histogram and
+                slow-call detection (optional).
+        """
+        with self._lock:
+            transitions = self._metrics.state_transitions
+            if duration is not None:
+                self._latency.observe(duration)
+            if success:
+                self._record_success(duration)
+            else:
                 self._record_failure()
-            raise
+            transitioned = self._metrics.state_transitions != transitions
+        self._notify(transitioned)
+
+    def add_listener(self, callback: Callable[[CircuitBreaker, bool], None]) -> None:
+        """Call ``callback(breaker, transitioned)`` after each recorded outcome.
+
+        ``transitioned`` is True when the outcome (or a forced open/close)
+        changed the circuit state. Callbacks run outside the breaker's lock;
+        their exceptions are swallowed.
+        """
+        with self._lock:
+            self._listeners.append(callback)
+
+    def _notify(self, transitioned: bool) -> None:
+        """Run the listeners registered with ``add_listener``."""
+        with self._lock:
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback(self, transitioned)
+            except Exception:
+                pass  # Reporting must never fail the protected call
 
     def protect(self, func: Callable[..., T]) -> Callable[..., T]:
         """Decorator to protect a function with this circuit breaker.
@@ -284,16 +619,7 @@ class CircuitBreaker:
 
     def __enter__(self) -> CircuitBreaker:
         """Context manager entry - check if call is allowed."""
-        with self._lock:
-            if not self._can_execute():
-                self._metrics.record_rejection()
-                raise CircuitBreakerError(
-                    f"Circuit '{self.name}' is {self._state.value}",
-                    self._state,
-                    self.time_until_retry,
-                )
-            if self._state == CircuitState.HALF_OPEN:
-                self._half_open_calls += 1
+        self.acquire()
         return self
 
     def __exit__(
@@ -302,12 +628,12 @@ class CircuitBreaker:
         exc_val: BaseException | None,
         exc_tb: object,
     ) -> None:
-        """Context manager exit - record success or failure."""
-        with self._lock:
-            if exc_type is None:
-                self._record_success()
-            else:
-                self._record_failure()
+        """Context manager exit - record success or failure.
+
+        The block isn't timed; callers that want latency tracking use
+        ``call()`` or pair ``acquire()`` with ``record_outcome(duration=...)``.
+        """
+        self.record_outcome(success=exc_type is None)
 
     def reset(self) -> None:
         """Reset the circuit breaker to initial state."""
@@ -316,16 +642,41 @@ class CircuitBreaker:
             self._last_state_change = time.time()
             self._half_open_calls = 0
             self._metrics = CircuitBreakerMetrics()
+            self._latency = LatencyHistogram()
+            self._transitions.clear()
+            if self._window is not None:
+                self._window.clear()
 
     def force_open(self) -> None:
         """Force the circuit to open state (for testing or manual intervention)."""
         with self._lock:
-            self._transition_to(CircuitState.OPEN)
+            self._transition_to(CircuitState.OPEN, "forced open")
+        self._notify(True)
 
     def force_close(self) -> None:
         """Force the circuit to closed state (for testing or manual intervention)."""
         with self._lock:
-            self._transition_to(CircuitState.CLOSED)
+            self._transition_to(CircuitState.CLOSED, "forced closed")
+        self._notify(True)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Export state, metrics, window rates, latency and transitions.
+
+        Returns:
+            JSON-friendly dictionary describing the breaker.
+        """
+        with self._lock:
+            self._check_state_timeout()
+            return {
+                "name": self.name,
+                "state": self._state.value,
+                "mode": "sliding_window" if self._window is not None else "consecutive",
+                "time_until_retry": self.time_until_retry,
+                "metrics": self._metrics.to_dict(),
+                "window": self._window.to_dict() if self._window is not None else None,
+                "latency": self._latency.to_dict(),
+                "transitions": [t.to_dict() for t in self._transitions],
+            }
 
 
 class CircuitBreakerRegistry:
@@ -377,11 +728,22 @@ class CircuitBreakerRegistry:
         with self._registry_lock:
             return self._breakers.get(name)
 
+    def register(self, breaker: CircuitBreaker) -> None:
+        """Add a breaker created elsewhere, replacing one with the same name."""
+        with self._registry_lock:
+            self._breakers[breaker.name] = breaker
+
     def all_metrics(self) -> dict[str, CircuitBreakerMetrics]:
         """Get metrics for all circuit breakers."""
         with self._registry_lock:
             return {name: cb.metrics for name, cb in self._breakers.items()}
 
+    def snapshot_all(self) -> dict[str, dict[str, Any]]:
+        """Get ``snapshot()`` of every circuit breaker, by name."""
+        with self._registry_lock:
+            breakers = list(self._breakers.values())
+        return {cb.name: cb.snapshot() for cb in breakers}
+
     def reset_all(self) -> None:
         """Reset all circuit breakers."""
         with self._registry_lock:
@@ -394,6 +756,108 @@ class CircuitBreakerRegistry:
             self._breakers.clear()
 
 
+class CircuitBreakerSnapshotFile:
+    """Publishes ``snapshot_all()`` to a JSON file for other processes.
+
+    Breakers are registered by the runner (``start``/``resume``/``fix-pr``),
+    while ``/health`` and ``health_check`` are served by the API/MCP server
+    process, whose registry is empty. The runner attaches its breakers here;
+    state transitions are written immediately, other outcomes at most every
+    ``min_interval`` seconds.
+
+    Usage:
+        snapshots = CircuitBreakerSnapshotFile.for_state_dir(state_dir)
+        snapshots.attach(breaker)
+        ...
+        CircuitBreakerSnapshotFile.read_state_dir(state_dir)  # other process
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        min_interval: float = 5.0,
+        registry: CircuitBreakerRegistry | None = None,
+    ) -> None:
+        """Initialize the snapshot file.
+
+        Args:
+            path: JSON file to write.
+            min_interval: Minimum seconds between writes not caused by a
+                state transition.
+            registry: Registry to snapshot (default: the global registry).
+        """
+        self.path = path
+        self.min_interval = min_interval
+        self.registry = registry or CircuitBreakerRegistry()
+        self._lock = threading.Lock()
+        self._last_write: float | None = None
+
+    @classmethod
+    def for_state_dir(cls, state_dir: Path, **kwargs: Any) -> CircuitBreakerSnapshotFile:
+        """Create the snapshot file inside a state directory."""
+        return cls(state_dir / BREAKER_SNAPSHOT_FILE, **kwargs)
+
+    def attach(self, breaker: CircuitBreaker) -> None:
+        """Rewrite the file when ``breaker`` records outcomes or transitions."""
+        breaker.add_listener(self._on_change)
+
+    def _on_change(self, breaker: CircuitBreaker, transitioned: bool) -> None:
+        """Listener for attached breakers."""
+        self.write(force=transitioned)
+
+    def write(self, force: bool = True) -> bool:
+        """Write the registry's snapshots, atomically.
+
+        Args:
+            force: Write even if the last write was under ``min_interval``
+                seconds ago.
+
+        Returns:
+            True if the file was written.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self._last_write is not None
+                and now - self._last_write < self.min_interval
+            ):
+                return False
+            self._last_write = now
+            data = {
+                "updated_at": datetime.now().isoformat(),
+                "breakers": self.registry.snapshot_all(),
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w") as f:
+                        json.dump(data, f)
+                    os.replace(tmp, self.path)
+                except BaseException:
+                    os.unlink(tmp)
+                    raise
+            except OSError:
+                return False
+            return True
+
+    @staticmethod
+    def read(path: Path) -> dict[str, dict[str, Any]]:
+        """Read published snapshots, by name ({} if missing or unreadable)."""
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return {}
+        breakers = data.get("breakers") if isinstance(data, dict) else None
+        return breakers if isinstance(breakers, dict) else {}
+
+    @classmethod
+    def read_state_dir(cls, state_dir: Path) -> dict[str, dict[str, Any]]:
+        """Read the snapshots published in a state directory."""
+        return cls.read(state_dir / BREAKER_SNAPSHOT_FILE)
+
+
 # Convenience function
 def get_circuit_breaker(
     name: str,
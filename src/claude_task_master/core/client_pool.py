@@ -0,0 +1,274 @@
+"""SDK Client Pool - Reuse connected ClaudeSDKClient instances.
+
+Connecting a ``ClaudeSDKClient`` spawns and handshakes with the Claude Code
+CLI, and a fresh client starts with an empty conversation. The pool keeps
+clients connected between tasks, keyed by ``(group_id, model, tools)``, so
+consecutive tasks in the same PR group continue the same conversation
+without reconnecting.
+
+Clients are bound to the event loop they were connected on, so a pool must
+only be used from one long-lived loop (see ``agent_loop.BackgroundEventLoop``).
+Idle clients are disconnected after ``idle_timeout`` seconds by a reaper task
+and whenever the pool is accessed; clients whose lease ended with an error
+are discarded rather than reused.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+from typing import Any
+
+from . import console
+
+# Pool key: (group_id, model name, sorted tool names)
+PoolKey = tuple[str, str, tuple[str, ...]]
+
+# Default seconds an idle client stays connected
+DEFAULT_IDLE_TIMEOUT = 300.0
+
+# Default maximum number of idle clients kept across all keys
+DEFAULT_MAX_IDLE = 4
+
+
+@dataclass
+class ConnectionSetup:
+    """Connection setup cost of one lease.
+
+    Attributes:
+        key: The pool key the client was leased for.
+        seconds: Time spent obtaining a connected client.
+        reused: True if an idle client was reused (no handshake).
+    """
+
+    key: PoolKey
+    seconds: float
+    reused: bool
+
+
+@dataclass
+class _PooledClient:
+    """A connected client and its usage bookkeeping."""
+
+    client: Any
+    key: PoolKey
+    last_used: float
+    uses: int = 0
+
+
+@dataclass
+class ClientPoolStats:
+    """Counters for an SDKClientPool."""
+
+    connects: int = 0
+    reuses: int = 0
+    evictions: int = 0
+    discards: int = 0
+    connect_seconds: float = 0.0
+    setups: list[ConnectionSetup] = field(default_factory=list)
+
+    @property
+    def average_connect_seconds(self) -> float:
+        """Mean time of a fresh connect."""
+        return self.connect_seconds / self.connects if self.connects else 0.0
+
+    @property
+    def estimated_seconds_saved(self) -> float:
+        """Connect time avoided by reusing clients (reuses x average connect)."""
+        return self.reuses * self.average_connect_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "connects": self.connects,
+            "reuses": self.reuses,
+            "evictions": self.evictions,
+            "discards": self.discards,
+            "average_connect_seconds": round(self.average_connect_seconds, 3),
+            "estimated_seconds_saved": round(self.estimated_seconds_saved, 3),
+        }
+
+
+class SDKClientPool:
+    """Keyed pool of connected SDK clients with idle eviction.
+
+    Usage:
+        pool = SDKClientPool(idle_timeout=300)
+        key = pool.make_key("pr_1", "claude-sonnet-4-5", tools)
+        async with pool.lease(key, connect) as (client, setup):
+            await client.query(prompt)
+        await pool.close()
+    """
+
+    # Maximum setup records kept in stats
+    MAX_SETUP_RECORDS = 256
+
+    def __init__(
+        self,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        max_idle: int = DEFAULT_MAX_IDLE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the pool.
+
+        Args:
+            idle_timeout: Seconds an idle client stays connected.
+            max_idle: Maximum idle clients kept; the least recently used
+                are disconnected beyond this.
+            clock: Monotonic clock (injectable for tests).
+        """
+        self.idle_timeout = idle_timeout
+        self.max_idle = max_idle
+        self._clock = clock
+        self._idle: list[_PooledClient] = []  # Least recently used first
+        self._in_use = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._reaper: asyncio.Task[None] | None = None
+        self._closed = False
+        self.stats = ClientPoolStats()
+
+    @staticmethod
+    def make_key(group_id: str, model: str, tools: Sequence[str]) -> PoolKey:
+        """Build a pool key. Tool order does not matter."""
+        return group_id, model, tuple(sorted(tools))
+
+    @property
+    def idle_count(self) -> int:
+        """Number of idle connected clients."""
+        return len(self._idle)
+
+    @property
+    def in_use_count(self) -> int:
+        """Number of clients currently leased."""
+        return self._in_use
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop is not loop:
+            raise RuntimeError("SDKClientPool is bound to a different event loop")
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        key: PoolKey,
+        connect: Callable[[], Awaitable[Any]],
+    ) -> AsyncIterator[tuple[Any, ConnectionSetup]]:
+        """Lease a connected client for a key, connecting one if none is idle.
+
+        The client is returned to the pool when the block exits normally and
+        disconnected if it raises.
+
+        Args:
+            key: Pool key from ``make_key``.
+            connect: Coroutine factory returning a new connected client.
+
+        Yields:
+            Tuple of (client, ConnectionSetup for this lease).
+
+        Raises:
+            RuntimeError: If the pool is closed or used from another loop.
+        """
+        if self._closed:
+            raise RuntimeError("SDKClientPool is closed")
+        self._bind_loop()
+        await self.evict_idle()
+        self._ensure_reaper()
+
+        start = time.perf_counter()
+        pooled = self._take_idle(key)
+        if pooled is None:
+            client = await connect()
+            pooled = _PooledClient(client=client, key=key, last_used=self._clock())
+            setup = ConnectionSetup(key=key, seconds=time.perf_counter() - start, reused=False)
+            self.stats.connects += 1
+            self.stats.connect_seconds += setup.seconds
+        else:
+            setup = ConnectionSetup(key=key, seconds=time.perf_counter() - start, reused=True)
+            self.stats.reuses += 1
+        self._record_setup(setup)
+
+        self._in_use += 1
+        released = False
+        try:
+            yield pooled.client, setup
+            released = True
+        finally:
+            self._in_use -= 1
+            pooled.uses += 1
+            pooled.last_used = self._clock()
+            if released and not self._closed:
+                self._idle.append(pooled)
+                await self._trim_idle()
+            else:
+                self.stats.discards += 1
+                await self._disconnect(pooled)
+
+    def _take_idle(self, key: PoolKey) -> _PooledClient | None:
+        """Remove and return the most recently used idle client for a key."""
+        for i in range(len(self._idle) - 1, -1, -1):
+            if self._idle[i].key == key:
+                return self._idle.pop(i)
+        return None
+
+    def _record_setup(self, setup: ConnectionSetup) -> None:
+        self.stats.setups.append(setup)
+        if len(self.stats.setups) > self.MAX_SETUP_RECORDS:
+            del self.stats.setups[0]
+
+    async def _trim_idle(self) -> None:
+        """Disconnect least recently used idle clients beyond max_idle."""
+        while len(self._idle) > self.max_idle:
+            self.stats.evictions += 1
+            await self._disconnect(self._idle.pop(0))
+
+    async def evict_idle(self) -> int:
+        """Disconnect clients idle for longer than idle_timeout.
+
+        Returns:
+            Number of clients evicted.
+        """
+        now = self._clock()
+        expired = [p for p in self._idle if now - p.last_used >= self.idle_timeout]
+        for pooled in expired:
+            self._idle.remove(pooled)
+            self.stats.evictions += 1
+            await self._disconnect(pooled)
+        return len(expired)
+
+    def _ensure_reaper(self) -> None:
+        """Start the periodic idle eviction task on the current loop."""
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.get_running_loop().create_task(self._reap())
+
+    async def _reap(self) -> None:
+        interval = max(self.idle_timeout / 2, 0.01)
+        while not self._closed:
+            await asyncio.sleep(interval)
+            await self.evict_idle()
+
+    @staticmethod
+    async def _disconnect(pooled: _PooledClient) -> None:
+        try:
+            await pooled.client.disconnect()
+        except Exception as e:
+            console.warning(f"Error disconnecting: {e}")
+
+    async def close(self) -> None:
+        """Disconnect all idle clients and stop the reaper.
+
+        Clients still leased are disconnected when their lease ends.
+        """
+        self._closed = True
+        reaper, self._reaper = self._reaper, None
+        if reaper is not None and reaper is not asyncio.current_task():
+            reaper.cancel()
+            with suppress(asyncio.CancelledError):
+                await reaper
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            await self._disconnect(pooled)
@@ -10,21 +10,24 @@ Configuration is loaded from `.claude-task-master/config.json` in the project di
 Environment variables can override specific settings.
 
 Environment Variable Mapping:
-| Config Key               | Environment Variable      |
-|--------------------------|---------------------------|
-| api.anthropic_api_key    | ANTHROPIC_API_KEY         |
-| api.anthropic_base_url   | ANTHROPIC_BASE_URL        |
-| api.openrouter_api_key   | OPENROUTER_API_KEY        |
-| api.openrouter_base_url  | OPENROUTER_BASE_URL       |
-| models.sonnet            | CLAUDETM_MODEL_SONNET     |
-| models.opus              | CLAUDETM_MODEL_OPUS       |
-| models.haiku             | CLAUDETM_MODEL_HAIKU      |
-| git.target_branch        | CLAUDETM_TARGET_BRANCH    |
+| Config Key              | Environment Variable       |
+|-------------------------|----------------------------|
+| api.anthropic_api_key   | ANTHROPIC_API_KEY          |
+| api.anthropic_base_url  | ANTHROPIC_BASE_URL         |
+| api.openrouter_api_key  | OPENROUTER_API_KEY         |
+| api.openrouter_base_url | OPENROUTER_BASE_URL        |
+| models.sonnet           | CLAUDETM_MODEL_SONNET      |
+| models.opus             | CLAUDETM_MODEL_OPUS        |
+| models.haiku            | CLAUDETM_MODEL_HAIKU       |
+| git.target_branch       | CLAUDETM_TARGET_BRANCH     |
+| state.format            | CLAUDETM_STATE_FORMAT      |
+| github.transport        | CLAUDETM_GITHUB_TRANSPORT  |
+| agent.conversation_mode | CLAUDETM_CONVERSATION_MODE |
 """
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -97,6 +100,104 @@ class GitConfig(BaseModel):
     )
 
 
+class GitHubConfig(BaseModel):
+    """GitHub client settings.
+
+    ``gh`` is always used for authentication and for commands like
+    ``gh pr create``; the transport only decides how ``gh api`` calls run.
+    """
+
+    transport: Literal["gh", "http"] = Field(
+        default="gh",
+        description="How GitHub API calls are made: 'gh' (a gh process per call) or 'http' "
+        "(in-process HTTPS with the token from gh, no process startup). "
+        "Overridden by CLAUDETM_GITHUB_TRANSPORT.",
+    )
+    api_url: str = Field(
+        default="https://api.github.com",
+        description="GitHub API root used by the 'http' transport (GitHub Enterprise: "
+        "https://HOST/api/v3).",
+    )
+
+
+class StateConfig(BaseModel):
+    """State persistence settings.
+
+    Controls how `.claude-task-master/state.json` is written. Existing files
+    in any format are read transparently.
+    """
+
+    format: Literal["json", "compact"] = Field(
+        default="json",
+        description="Encoding of state.json: 'json' (pretty-printed) or 'compact' "
+        "(single-line, uses orjson if installed). Overridden by CLAUDETM_STATE_FORMAT.",
+    )
+
+
+class WebhookQueueConfig(BaseModel):
+    """Background webhook delivery settings.
+
+    Orchestrator webhook events are queued and delivered by a background
+    worker so slow or unreachable receivers never block the work loop.
+    With ``durable`` (the default) events are first written to the on-disk
+    outbox and retried until delivered; otherwise an in-memory queue bounded
+    by ``max_size`` and ``overflow`` is used.
+    """
+
+    durable: bool = Field(
+        default=True,
+        description="Write events to .claude-task-master/webhooks/outbox/ before delivery "
+        "and retry them until the receiver accepts them, across runs.",
+    )
+    max_backoff: float = Field(
+        default=300.0,
+        gt=0,
+        description="Maximum seconds between retries to a failing endpoint (durable mode).",
+    )
+
+    max_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum deliveries waiting in the queue across all endpoints.",
+    )
+    endpoint_concurrency: int = Field(
+        default=2,
+        ge=1,
+        description="Concurrent deliveries per webhook endpoint.",
+    )
+    overflow: Literal["drop_oldest", "drop_newest", "spill"] = Field(
+        default="spill",
+        description="When the queue is full: drop the oldest or the new delivery, or "
+        "'spill' the new one to .claude-task-master/webhook-spill.jsonl.",
+    )
+    flush_timeout: float = Field(
+        default=10.0,
+        ge=0,
+        description="Seconds to wait for queued deliveries when the run ends.",
+    )
+
+
+class AgentConfig(BaseModel):
+    """Agent session settings.
+
+    In conversation mode, work sessions for a PR group continue one
+    multi-turn conversation, reusing a connected SDK client between the
+    group's tasks instead of starting a fresh query each time.
+    """
+
+    conversation_mode: bool = Field(
+        default=False,
+        description="Run a PR group's work sessions as one pooled conversation. "
+        "Overridden by CLAUDETM_CONVERSATION_MODE.",
+    )
+    client_idle_timeout: float = Field(
+        default=300.0,
+        gt=0,
+        description="Seconds a pooled SDK client stays connected while idle "
+        "(conversation mode only).",
+    )
+
+
 class ToolsConfig(BaseModel):
     """Tool configurations per execution phase.
 
@@ -155,6 +256,25 @@ class ClaudeTaskMasterConfig(BaseModel):
         "planning": ["Read", "Glob", "Grep", "Bash"],
         "verification": ["Read", "Glob", "Grep", "Bash"],
         "working": []
+      },
+      "state": {
+        "format": "json"
+      },
+      "github": {
+        "transport": "gh",
+        "api_url": "https://api.github.com"
+      },
+      "webhook_queue": {
+        "durable": true,
+        "max_backoff": 300.0,
+        "max_size": 1000,
+        "endpoint_concurrency": 2,
+        "overflow": "spill",
+        "flush_timeout": 10.0
+      },
+      "agent": {
+        "conversation_mode": false,
+        "client_idle_timeout": 300.0
       }
     }
     ```
@@ -180,6 +300,22 @@ class ClaudeTaskMasterConfig(BaseModel):
         default_factory=ToolsConfig,
         description="Tool configurations per phase.",
     )
+    state: StateConfig = Field(
+        default_factory=StateConfig,
+        description="State persistence settings (state.json encoding).",
+    )
+    github: GitHubConfig = Field(
+        default_factory=GitHubConfig,
+        description="GitHub client settings (API transport).",
+    )
+    webhook_queue: WebhookQueueConfig = Field(
+        default_factory=WebhookQueueConfig,
+        description="Background webhook delivery queue settings.",
+    )
+    agent: AgentConfig = Field(
+        default_factory=AgentConfig,
+        description="Agent session settings (conversation mode).",
+    )
 
 
 # =============================================================================
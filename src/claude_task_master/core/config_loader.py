@@ -27,6 +27,9 @@ Environment Variable Overrides:
 - CLAUDETM_MODEL_OPUS -> config.models.opus
 - CLAUDETM_MODEL_HAIKU -> config.models.haiku
 - CLAUDETM_TARGET_BRANCH -> config.git.target_branch
+- CLAUDETM_STATE_FORMAT -> config.state.format
+- CLAUDETM_GITHUB_TRANSPORT -> config.github.transport
+- CLAUDETM_CONVERSATION_MODE -> config.agent.conversation_mode
 """
 
 from __future__ import annotations
@@ -62,6 +65,9 @@ ENV_VAR_MAPPINGS: list[tuple[str, tuple[str, ...]]] = [
     ("CLAUDETM_MODEL_OPUS", ("models", "opus")),
     ("CLAUDETM_MODEL_HAIKU", ("models", "haiku")),
     ("CLAUDETM_TARGET_BRANCH", ("git", "target_branch")),
+    ("CLAUDETM_STATE_FORMAT", ("state", "format")),
+    ("CLAUDETM_GITHUB_TRANSPORT", ("github", "transport")),
+    ("CLAUDETM_CONVERSATION_MODE", ("agent", "conversation_mode")),
 ]
 
 
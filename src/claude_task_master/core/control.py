@@ -341,7 +341,7 @@ class ControlManager:
             - pause_on_pr: bool - Whether to pause on PR creation
             - enable_checkpointing: bool - Whether to enable checkpointing
             - log_level: str - Log level (quiet, normal, verbose)
-            - log_format: str - Log format (text, json)
+            - log_format: str - Log format (text, json, jsonl)
             - pr_per_task: bool - Whether to create PR per task
 
         Args:
@@ -2,17 +2,25 @@
 
 Manages conversation sessions for task groups, allowing Claude to maintain
 context across multiple tasks within the same group.
+
+By default each ``conversation()`` connects a fresh client and disconnects it
+on exit. When given an ``SDKClientPool`` (and driven from one long-lived
+event loop, see ``agent_loop.BackgroundEventLoop``), connected clients are
+kept per ``(group_id, model, tools)`` and reused by the next task in the
+same group.
 """
 
 from __future__ import annotations
 
-import os
-from collections.abc import AsyncIterator
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any
 
 from . import console
 from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+from .client_pool import ConnectionSetup, SDKClientPool
 from .config_loader import get_config
 from .rate_limit import RateLimitConfig
 from .subagents import get_agents_for_working_dir
@@ -95,9 +103,13 @@ class ConversationManager:
             result2 = await conv.query_task(task2, context)  # Remembers task1
 
     When moving to a new group, the previous conversation is closed and a new
-    one is started.
+    one is started. With a ``client_pool``, the client is returned to the pool
+    instead and reused when the same group, model and tools come back.
     """
 
+    # Maximum connection setup records kept
+    MAX_SETUP_RECORDS = 256
+
     def __init__(
         self,
         working_dir: str,
@@ -107,6 +119,7 @@ class ConversationManager:
         rate_limit_config: RateLimitConfig | None = None,
         circuit_breaker_config: CircuitBreakerConfig | None = None,
         verbose: bool = False,
+        client_pool: SDKClientPool | None = None,
     ):
         """Initialize conversation manager.
 
@@ -118,6 +131,8 @@ class ConversationManager:
             rate_limit_config: Rate limiting configuration.
             circuit_breaker_config: Circuit breaker configuration.
             verbose: Show detailed tool output (default: False).
+            client_pool: Optional pool for reusing connected clients. Must
+                only be used from a single long-lived event loop.
         """
         self.working_dir = working_dir
         self.model = model
@@ -134,9 +149,13 @@ class ConversationManager:
         self._sdk_client_class: type | None = None
         self._options_class: type | None = None
 
-        # Track current group for logging (can't reuse clients across event loops)
+        # Track current group for logging
         self._active_group: str | None = None
 
+        # Client reuse and per-conversation connection setup timing
+        self.client_pool = client_pool
+        self.connection_setups: deque[ConnectionSetup] = deque(maxlen=self.MAX_SETUP_RECORDS)
+
     def _ensure_sdk_imported(self) -> None:
         """Ensure the Claude Agent SDK is imported."""
         if self._sdk_client_class is not None:
@@ -181,10 +200,11 @@ class ConversationManager:
         self,
         tools: list[str],
         model_override: str | None = None,
+        model_name: str | None = None,
     ) -> Any:
         """Create ClaudeAgentOptions for a conversation."""
         self._ensure_sdk_imported()
-        model_name = self._get_model_name(model_override)
+        model_name = model_name or self._get_model_name(model_override)
 
         if self._options_class is None:
             raise ConversationError("SDK not initialized")
@@ -208,16 +228,21 @@ class ConversationManager:
         group_id: str,
         tools: list[str] | None = None,
         model_override: str | None = None,
+        model_name: str | None = None,
     ) -> AsyncIterator[ConversationSession]:
         """Context manager for a conversation session.
 
-        If the group_id matches the active conversation, reuses it.
-        Otherwise, closes the previous conversation and starts a new one.
+        With a client pool, reuses an idle connected client for the same
+        group, model and tools (keeping the conversation going) and returns
+        it to the pool afterwards. Otherwise connects a new client and
+        disconnects it on exit.
 
         Args:
             group_id: Unique identifier for the task group.
             tools: List of tools to enable (defaults to working tools).
             model_override: Optional model override for this conversation.
+            model_name: Optional API model name, used as is (takes precedence
+                over model_override).
 
         Yields:
             ConversationSession for sending queries.
@@ -226,29 +251,38 @@ class ConversationManager:
 
         effective_tools = tools or DEFAULT_TOOLS
 
-        # NOTE: We cannot reuse clients across asyncio.run() calls because each
-        # asyncio.run() creates a new event loop. The client from a previous
-        # event loop cannot be used in a new one. For true conversation reuse,
-        # we'd need a persistent event loop architecture.
-        #
-        # For now, create a fresh client each time but track the group for logging.
         if self._active_group == group_id:
             console.detail(f"Continuing work in group: {group_id}")
         else:
             console.info(f"Starting conversation for group: {group_id}")
-        options = self._create_options(effective_tools, model_override)
+        model_name = model_name or self._get_model_name(model_override)
+        options = self._create_options(effective_tools, model_name=model_name)
 
         if self._sdk_client_class is None:
             raise ConversationError("SDK not initialized")
 
-        # Change to working directory
-        original_dir = os.getcwd()
+        key = SDKClientPool.make_key(group_id, model_name, effective_tools)
+        if self.client_pool is not None:
+            async with self.client_pool.lease(key, lambda: self._connect(options)) as (
+                client,
+                setup,
+            ):
+                self._record_setup(setup)
+                self._active_group = group_id
+                yield ConversationSession(
+                    client=client,
+                    manager=self,
+                    group_id=group_id,
+                    connection_setup=setup,
+                )
+            return
+
         client = None
         try:
-            os.chdir(self.working_dir)
-
-            client = self._sdk_client_class(options=options)
-            await client.connect()
+            start = time.perf_counter()
+            client = await self._connect(options)
+            setup = ConnectionSetup(key=key, seconds=time.perf_counter() - start, reused=False)
+            self._record_setup(setup)
 
             self._active_group = group_id
 
@@ -256,23 +290,49 @@ class ConversationManager:
                 client=client,
                 manager=self,
                 group_id=group_id,
+                connection_setup=setup,
             )
         finally:
-            os.chdir(original_dir)
-            # Always disconnect - can't reuse across event loops
+            # Without a pool the client can't outlive this event loop
             if client is not None:
                 try:
                     await client.disconnect()
                 except Exception as e:
                     console.warning(f"Error disconnecting: {e}")
 
+    async def _connect(self, options: Any) -> Any:
+        """Create and connect a new SDK client.
+
+        The client runs in ``options.cwd``; the process working directory is
+        never changed, so conversations for different projects can share a
+        process.
+
+        Args:
+            options: ClaudeAgentOptions for the client.
+
+        Returns:
+            The connected client.
+        """
+        if self._sdk_client_class is None:
+            raise ConversationError("SDK not initialized")
+
+        client = self._sdk_client_class(options=options)
+        await client.connect()
+        return client
+
+    def _record_setup(self, setup: ConnectionSetup) -> None:
+        """Record and report the connection setup time of a conversation."""
+        self.connection_setups.append(setup)
+        how = "reused client" if setup.reused else "new connection"
+        console.detail(f"Connection setup: {setup.seconds:.2f}s ({how})")
+
     async def close_all(self) -> None:
-        """Close any active conversation.
+        """Close any active conversation and disconnect pooled clients.
 
-        Note: With the current architecture using asyncio.run() per task,
-        connections are closed after each task. This method is kept for
-        API compatibility and future persistent event loop support.
+        Must be awaited on the event loop the pool is used from.
         """
+        if self.client_pool is not None:
+            await self.client_pool.close()
         self._active_group = None
 
     @property
@@ -298,6 +358,7 @@ class ConversationSession:
         client: Any,  # ClaudeSDKClient
         manager: ConversationManager,
         group_id: str,
+        connection_setup: ConnectionSetup | None = None,
     ):
         """Initialize conversation session.
 
@@ -305,10 +366,13 @@ class ConversationSession:
             client: The ClaudeSDKClient instance.
             manager: Parent ConversationManager.
             group_id: The group this session belongs to.
+            connection_setup: How long obtaining the client took, and
+                whether it was reused from the pool.
         """
         self.client = client
         self.manager = manager
         self.group_id = group_id
+        self.connection_setup = connection_setup
         self._query_count = 0
 
     @property
@@ -320,6 +384,7 @@ class ConversationSession:
         self,
         prompt: str,
         model_override: str | None = None,
+        process_message_func: Callable[[Any, str], str] | None = None,
     ) -> str:
         """Send a task query within this conversation.
 
@@ -330,6 +395,8 @@ class ConversationSession:
             prompt: The task prompt to send.
             model_override: Optional model override (note: may not take effect
                            mid-conversation depending on SDK behavior).
+            process_message_func: Optional function processing each response
+                message (defaults to this session's console/logger output).
 
         Returns:
             The result text from the query.
@@ -344,8 +411,9 @@ class ConversationSession:
             await self.client.query(prompt)
 
             # Process response
+            process = process_message_func or self._process_message
             async for message in self.client.receive_response():
-                result_text = self._process_message(message, result_text)
+                result_text = process(message, result_text)
 
         except Exception as e:
             console.error(f"Query failed: {e}")
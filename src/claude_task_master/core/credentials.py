@@ -1,12 +1,37 @@
-"""Credential Manager - OAuth credential loading, validation, and refresh."""
-
+"""Credential Manager - OAuth credential loading, validation, and refresh.
+
+Refresh coordination:
+- ``get_valid_token()`` refreshes ``refresh_skew`` seconds *before* expiry,
+  and a failed early refresh falls back to the still-valid token.
+- Refreshes are single-flight: one thread per process (a lock) and one
+  process per host (``flock`` on ``.credentials.json.lock``). Whoever waits
+  re-reads the file afterwards and uses the token the winner wrote.
+- ``CredentialRefresher`` renews in a background thread so long runs never
+  hit an expired token.
+- Parsed credentials are cached by file path and (mtime, size, inode), so
+  repeated loads don't re-read and re-validate the JSON.
+"""
+
+import fcntl
 import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
 import httpx
 from pydantic import BaseModel, ValidationError
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_SKEW = 300.0  # Refresh this many seconds before expiry
+REFRESH_LOCK_TIMEOUT = 45.0  # Longer than a refresh request can take
+REFRESH_RETRY_INTERVAL = 60.0  # Background retry delay after a failed refresh
+
 # =============================================================================
 # Custom Exception Classes
 # =============================================================================
@@ -109,6 +134,18 @@ class TokenRefreshHTTPError(TokenRefreshError):
         super().__init__(f"Token refresh failed: {message}", details, status_code)
 
 
+class RefreshLockTimeoutError(TokenRefreshError):
+    """Raised when another process holds the refresh lock for too long."""
+
+    def __init__(self, path: Path, timeout: float):
+        self.path = path
+        self.timeout = timeout
+        super().__init__(
+            f"Timed out waiting for the credential refresh lock at {path}",
+            f"Another process has been refreshing for over {timeout} seconds.",
+        )
+
+
 class InvalidTokenResponseError(TokenRefreshError):
     """Raised when the token refresh response is invalid or malformed."""
 
@@ -132,6 +169,60 @@ class Credentials(BaseModel):
     tokenType: str = "Bearer"
 
 
+# =============================================================================
+# Parsed Credentials Cache and Refresh Lock
+# =============================================================================
+
+# path -> ((st_mtime_ns, st_size, st_ino), credentials); shared by all managers
+_parsed_cache: dict[Path, tuple[tuple[int, int, int], Credentials]] = {}
+_cache_lock = threading.Lock()
+# In-process half of the single-flight refresh (flock covers other processes)
+_refresh_lock = threading.Lock()
+
+
+def _file_signature(path: Path) -> tuple[int, int, int]:
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def clear_credentials_cache() -> None:
+    """Forget all parsed credentials (the next load re-reads the file)."""
+    with _cache_lock:
+        _parsed_cache.clear()
+
+
+@contextmanager
+def _refresh_file_lock(lock_path: Path, timeout: float) -> Generator[None, None, None]:
+    """Hold an exclusive flock on lock_path, polling up to timeout seconds.
+
+    If the lock file can't be created (e.g. a read-only mount), the refresh
+    proceeds without cross-process coordination.
+
+    Raises:
+        RefreshLockTimeoutError: If the lock isn't acquired in time.
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        lock_file = open(lock_path, "a")
+    except OSError as e:
+        logger.debug("Cannot create refresh lock %s: %s", lock_path, e)
+        yield
+        return
+    with lock_file:
+        while True:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise RefreshLockTimeoutError(lock_path, timeout) from None
+                time.sleep(0.1)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
 # =============================================================================
 # Credential Manager
 # =============================================================================
@@ -144,6 +235,19 @@ class CredentialManager:
     OAUTH_TOKEN_URL = "https://api.anthropic.com/v1/oauth/token"
     DEFAULT_TIMEOUT = 30.0
 
+    def __init__(self, refresh_skew: float = DEFAULT_REFRESH_SKEW):
+        """Initialize the manager.
+
+        Args:
+            refresh_skew: Seconds before expiry at which tokens are refreshed.
+        """
+        self.refresh_skew = refresh_skew
+
+    @property
+    def lock_path(self) -> Path:
+        """Path of the lock file that serializes refreshes across processes."""
+        return self.CREDENTIALS_PATH.with_name(self.CREDENTIALS_PATH.name + ".lock")
+
     def load_credentials(self) -> Credentials:
         """Load credentials from file.
 
@@ -155,9 +259,28 @@ class CredentialManager:
             InvalidCredentialsError: If the credentials file is malformed or invalid.
             CredentialPermissionError: If there are permission issues reading the file.
         """
-        if not self.CREDENTIALS_PATH.exists():
-            raise CredentialNotFoundError(self.CREDENTIALS_PATH)
+        path = self.CREDENTIALS_PATH
+        if not path.exists():
+            raise CredentialNotFoundError(path)
 
+        try:
+            signature = _file_signature(path)
+        except FileNotFoundError as e:
+            raise CredentialNotFoundError(path) from e
+        except PermissionError as e:
+            raise CredentialPermissionError(path, "reading", e) from e
+        with _cache_lock:
+            cached = _parsed_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        credentials = self._parse_credentials_file()
+        with _cache_lock:
+            _parsed_cache[path] = (signature, credentials)
+        return credentials
+
+    def _parse_credentials_file(self) -> Credentials:
+        """Read and validate the credentials file (uncached)."""
         try:
             with open(self.CREDENTIALS_PATH) as f:
                 try:
@@ -205,19 +328,48 @@ class CredentialManager:
                 " | ".join(details_parts) if details_parts else str(e),
             ) from e
 
-    def is_expired(self, credentials: Credentials) -> bool:
+    def is_expired(self, credentials: Credentials, skew: float = 0.0) -> bool:
         """Check if access token is expired.
 
         Args:
             credentials: The credentials to check.
+            skew: Treat the token as expired this many seconds early.
 
         Returns:
             bool: True if the token is expired, False otherwise.
         """
         # expiresAt is in milliseconds, convert to seconds
-        expires_at = datetime.fromtimestamp(credentials.expiresAt / 1000)
+        expires_at = datetime.fromtimestamp(credentials.expiresAt / 1000 - skew)
         return datetime.now() >= expires_at
 
+    def needs_refresh(self, credentials: Credentials) -> bool:
+        """Check if the token is expired or within refresh_skew of expiring."""
+        return self.is_expired(credentials, self.refresh_skew)
+
+    def seconds_until_refresh(self, credentials: Credentials) -> float:
+        """Get the seconds until the token enters its refresh window (>= 0)."""
+        return max(0.0, credentials.expiresAt / 1000 - self.refresh_skew - time.time())
+
+    def refresh_if_needed(self) -> Credentials:
+        """Refresh the token unless another thread or process just did.
+
+        Takes the in-process and cross-process refresh locks, re-reads the
+        credentials file and refreshes only if the token still needs it, so
+        concurrent callers share one refresh request.
+
+        Returns:
+            Credentials: Fresh credentials.
+
+        Raises:
+            RefreshLockTimeoutError: If another process holds the lock too long.
+            TokenRefreshError: If the refresh fails (and its subclasses).
+        """
+        with _refresh_lock, _refresh_file_lock(self.lock_path, REFRESH_LOCK_TIMEOUT):
+            credentials = self.load_credentials()
+            if self.needs_refresh(credentials):
+                credentials = self.refresh_access_token(credentials)
+            return credentials
+
     def refresh_access_token(self, credentials: Credentials) -> Credentials:
         """Refresh access token using refresh token.
 
@@ -314,15 +466,26 @@ class CredentialManager:
         """
         # Preserve nested structure
         data = {"claudeAiOauth": credentials.model_dump()}
+        path = self.CREDENTIALS_PATH
+        # Write a temp file and rename it, so readers never see a partial file
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
         try:
-            with open(self.CREDENTIALS_PATH, "w") as f:
+            with open(tmp_path, "w") as f:
                 json.dump(data, f, indent=2)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, path)
         except PermissionError as e:
-            raise CredentialPermissionError(self.CREDENTIALS_PATH, "writing", e) from e
+            tmp_path.unlink(missing_ok=True)
+            raise CredentialPermissionError(path, "writing", e) from e
+        with _cache_lock:
+            _parsed_cache[path] = (_file_signature(path), credentials)
 
     def get_valid_token(self) -> str:
         """Get a valid access token, refreshing if necessary.
 
+        Tokens within ``refresh_skew`` of expiry are refreshed early. If an
+        early refresh fails, the current (still valid) token is returned.
+
         Returns:
             str: A valid access token.
 
@@ -334,7 +497,102 @@ class CredentialManager:
         """
         credentials = self.load_credentials()
 
-        if self.is_expired(credentials):
-            credentials = self.refresh_access_token(credentials)
+        if self.needs_refresh(credentials):
+            try:
+                credentials = self.refresh_if_needed()
+            except CredentialError as e:
+                if self.is_expired(credentials):
+                    raise
+                logger.warning("Early token refresh failed, using current token: %s", e)
 
         return credentials.accessToken
+
+    def start_background_refresh(self) -> "CredentialRefresher":
+        """Start a ``CredentialRefresher`` for this manager.
+
+        Returns:
+            The running refresher; call ``stop()`` when done.
+        """
+        refresher = CredentialRefresher(self)
+        refresher.start()
+        return refresher
+
+
+# =============================================================================
+# Background Refresher
+# =============================================================================
+
+
+class CredentialRefresher:
+    """Daemon thread that refreshes credentials before they expire.
+
+    Sleeps until the token enters its refresh window, then calls
+    ``refresh_if_needed()`` (a no-op if another process already refreshed).
+    Failed refreshes are retried every ``retry_interval`` seconds.
+
+    Example:
+        >>> refresher = CredentialRefresher(CredentialManager())
+        >>> refresher.start()
+        >>> ...  # long-running work
+        >>> refresher.stop()
+    """
+
+    def __init__(
+        self,
+        manager: CredentialManager,
+        retry_interval: float = REFRESH_RETRY_INTERVAL,
+    ):
+        """Initialize the refresher.
+
+        Args:
+            manager: Manager whose credentials are kept fresh.
+            retry_interval: Seconds to wait after a failed refresh.
+        """
+        self.manager = manager
+        self.retry_interval = retry_interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """Check whether the refresher thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the refresher thread (no-op if already running)."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="credential-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the refresher thread and wait for it to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _next_delay(self) -> float:
+        """Refresh if due and return the seconds to sleep before checking again."""
+        try:
+            credentials = self.manager.load_credentials()
+            if not self.manager.needs_refresh(credentials):
+                return self.manager.seconds_until_refresh(credentials)
+            credentials = self.manager.refresh_if_needed()
+            # Stay awake if the server handed back an already-due token
+            return max(self.manager.seconds_until_refresh(credentials), self.retry_interval)
+        except CredentialError as e:
+            logger.warning("Background credential refresh failed: %s", e)
+            return self.retry_interval
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._stop.wait(self._next_delay())
+
+    def __enter__(self) -> "CredentialRefresher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
@@ -0,0 +1,228 @@
+"""Log Reader - Tail run logs without loading the whole file.
+
+Log files for long runs can grow to hundreds of megabytes, so readers seek
+backwards from the end of the file in fixed-size blocks and stop as soon as
+enough lines have been collected. Cost is proportional to the size of the
+tail, not the size of the log.
+
+Incremental polling uses byte offsets as cursors: every read reports the
+offset just past the data it returned, and ``read_since`` resumes from there.
+Cursors always land on a line boundary so clients never see partial lines.
+Each read also reports a ``file_id`` (device and inode); passing it back lets
+``read_since`` notice a rotated log even when the new file has already grown
+past the old offset.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+# Block size for backwards reads
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+# Maximum bytes returned by a single incremental read
+DEFAULT_MAX_CHUNK_BYTES = 1024 * 1024
+
+
+@dataclass
+class LogChunk:
+    """A contiguous slice of a log file.
+
+    Attributes:
+        content: Decoded log text (complete lines only).
+        start_offset: Byte offset where ``content`` starts.
+        next_offset: Byte offset to pass as the cursor for the next read.
+        reset: True if the requested cursor was past the end of the file or
+            the file was replaced (e.g. the log was rotated or truncated) and
+            reading restarted at 0.
+        file_id: Identity of the file that was read, to pass back to
+            ``read_since`` together with ``next_offset``.
+    """
+
+    content: str
+    start_offset: int
+    next_offset: int
+    reset: bool = False
+    file_id: str | None = None
+
+    @property
+    def lines(self) -> list[str]:
+        """Content split on newlines, with trailing newlines preserved."""
+        return _split_lines(self.content)
+
+
+def file_id_of(st: os.stat_result) -> str:
+    """Identify a file by device and inode, which survive appends but not rotation."""
+    return f"{st.st_dev}:{st.st_ino}"
+
+
+def _split_lines(text: str) -> list[str]:
+    """Split text on ``\\n`` only, keeping line endings.
+
+    ``str.splitlines`` also breaks on characters such as ``\\x0c`` and
+    ``\\u2028``, which would not match how the log was written.
+    """
+    parts = text.split("\n")
+    lines = [part + "\n" for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines
+
+
+def read_tail(
+    log_file: Path,
+    count: int,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    include_partial: bool = False,
+) -> LogChunk:
+    """Read the last ``count`` lines of a file by seeking backwards.
+
+    An unterminated last line (still being written) is left out unless
+    ``include_partial`` is set, so the cursor stays on a line boundary.
+
+    Args:
+        log_file: Path to the log file.
+        count: Number of lines to return.
+        block_size: Size of each backwards read in bytes.
+        include_partial: Also return an unterminated last line.
+
+    Returns:
+        LogChunk whose ``next_offset`` is just past the last complete line
+        (the file size with ``include_partial``), so it can be used directly
+        as the cursor for ``read_since``.
+    """
+    with open(log_file, "rb") as f:
+        current_id = file_id_of(os.fstat(f.fileno()))
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        if count <= 0:
+            return LogChunk(content="", start_offset=end, next_offset=end, file_id=current_id)
+
+        position = end
+        data = b""
+        # count + 1 newlines guarantees `count` complete lines (the last line
+        # usually ends with a newline, which doesn't start a new line)
+        while position > 0 and data.count(b"\n") <= count:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+
+    # Drop everything before the first of the lines we keep
+    parts = data.split(b"\n")
+    raw_lines = [part + b"\n" for part in parts[:-1]]
+    partial = parts[-1]
+    if include_partial:
+        if partial:
+            raw_lines.append(partial)
+        next_offset = end
+    else:
+        next_offset = end - len(partial)
+    kept = b"".join(raw_lines[-count:])
+    return LogChunk(
+        content=kept.decode("utf-8", errors="replace"),
+        start_offset=next_offset - len(kept),
+        next_offset=next_offset,
+        file_id=current_id,
+    )
+
+
+def read_since(
+    log_file: Path,
+    offset: int,
+    max_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+    file_id: str | None = None,
+) -> LogChunk:
+    """Read complete lines appended after a byte offset.
+
+    Only whole lines are returned; a trailing partial line (still being
+    written) is left for the next call. If more than ``max_bytes`` are
+    available, the chunk stops at the last line boundary within the limit.
+
+    Reading restarts at 0 when the offset is past the end of the file, or
+    when ``file_id`` is given and the path now refers to a different file.
+
+    Args:
+        log_file: Path to the log file.
+        offset: Cursor from a previous read (``LogChunk.next_offset``).
+        max_bytes: Maximum number of bytes to return.
+        file_id: ``LogChunk.file_id`` from the read that produced ``offset``.
+
+    Returns:
+        LogChunk with the new lines and the cursor for the next call.
+    """
+    offset = max(offset, 0)
+    with open(log_file, "rb") as f:
+        current_id = file_id_of(os.fstat(f.fileno()))
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        reset = offset > size or (file_id is not None and file_id != current_id)
+        if reset:
+            offset = 0
+        f.seek(offset)
+        data = f.read(min(max_bytes, size - offset))
+
+    cut = data.rfind(b"\n") + 1
+    if cut == 0 and len(data) >= max_bytes:
+        # A single line longer than max_bytes - return it truncated rather
+        # than stalling the cursor forever
+        cut = len(data)
+    data = data[:cut]
+    return LogChunk(
+        content=data.decode("utf-8", errors="replace"),
+        start_offset=offset,
+        next_offset=offset + len(data),
+        reset=reset,
+        file_id=current_id,
+    )
+
+
+def tail_lines(log_file: Path, count: int, block_size: int = DEFAULT_BLOCK_SIZE) -> list[str]:
+    """Return the last ``count`` lines of a file.
+
+    Lines are returned with their trailing newline preserved (the final line
+    may lack one), so ``"".join(tail_lines(...))`` reproduces the file tail.
+
+    Args:
+        log_file: Path to the log file.
+        count: Number of lines to return.
+        block_size: Size of each backwards read in bytes.
+
+    Returns:
+        List of the last ``count`` lines, oldest first.
+    """
+    return read_tail(log_file, count, block_size=block_size, include_partial=True).lines
+
+
+def tail_jsonl(
+    log_file: Path, count: int, block_size: int = DEFAULT_BLOCK_SIZE
+) -> list[dict[str, Any]]:
+    """Return the last ``count`` entries of a JSON lines log.
+
+    Only the tail of the file is read and parsed. Blank or malformed lines
+    (e.g. a partially written final line) are skipped.
+
+    Args:
+        log_file: Path to the JSONL log file.
+        count: Number of entries to return.
+        block_size: Size of each backwards read in bytes.
+
+    Returns:
+        List of parsed entries, oldest first.
+    """
+    entries: list[dict[str, Any]] = []
+    for line in tail_lines(log_file, count, block_size=block_size):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries
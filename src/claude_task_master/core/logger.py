@@ -1,14 +1,20 @@
 """Logger - Single consolidated log file per run with compact output."""
 
 import json
+import os
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 # Default max line length for truncation
 DEFAULT_MAX_LINE_LENGTH = 200
 
+# JSONL streaming defaults
+DEFAULT_FSYNC_INTERVAL = 50  # fsync after this many entries (0 = only on flush/close)
+DEFAULT_MAX_LOG_BYTES = 50 * 1024 * 1024  # rotate when the active file exceeds 50MB
+DEFAULT_LOG_BACKUP_COUNT = 3  # number of rotated segments to keep
+
 
 class LogLevel(Enum):
     """Logging verbosity levels.
@@ -28,10 +34,132 @@ class LogFormat(Enum):
 
     - TEXT: Human-readable text format (default)
     - JSON: Structured JSON format for machine processing
+    - JSONL: Append-only JSON lines, one entry per line (streaming-friendly)
     """
 
     TEXT = "text"
     JSON = "json"
+    JSONL = "jsonl"
+
+
+# File suffix used for each log format
+LOG_FILE_SUFFIXES: dict[LogFormat, str] = {
+    LogFormat.TEXT: ".txt",
+    LogFormat.JSON: ".json",
+    LogFormat.JSONL: ".jsonl",
+}
+
+
+def get_log_file_for_format(log_file: Path, log_format: LogFormat | str) -> Path:
+    """Get the log file path for a given format.
+
+    Args:
+        log_file: Base log file path (typically from StateManager.get_log_file).
+        log_format: Log format enum or its string value.
+
+    Returns:
+        Path with the suffix matching the format. Unknown formats fall back to text.
+    """
+    try:
+        fmt = LogFormat(log_format)
+    except ValueError:
+        fmt = LogFormat.TEXT
+    return log_file.with_suffix(LOG_FILE_SUFFIXES[fmt])
+
+
+class JsonlLogWriter:
+    """Append-only JSON lines writer with a single buffered handle per run.
+
+    Each entry is serialized once and appended as a single line, so a flush
+    costs O(new entries) instead of O(total log size). The file is fsynced
+    every ``fsync_interval`` entries and rotated to ``<name>.1``, ``<name>.2``,
+    ... once it grows beyond ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        log_file: Path,
+        fsync_interval: int = DEFAULT_FSYNC_INTERVAL,
+        max_bytes: int = DEFAULT_MAX_LOG_BYTES,
+        backup_count: int = DEFAULT_LOG_BACKUP_COUNT,
+    ):
+        """Initialize the writer.
+
+        Args:
+            log_file: Path to the active JSONL file.
+            fsync_interval: Entries between fsyncs (0 disables periodic fsync).
+            max_bytes: Rotate when the active file exceeds this size (0 disables).
+            backup_count: Number of rotated segments to keep.
+        """
+        self.log_file = log_file
+        self.fsync_interval = fsync_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._handle: IO[str] | None = None
+        self._size = 0
+        self._unsynced = 0
+
+    def _open(self) -> IO[str]:
+        """Open the active file for appending, creating it if needed."""
+        if self._handle is None:
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = open(self.log_file, "a", encoding="utf-8")
+            self._size = self._handle.tell()
+        return self._handle
+
+    def write(self, entry: dict[str, Any]) -> None:
+        """Append a single entry as one JSON line."""
+        line = json.dumps(entry, separators=(",", ":"), default=str) + "\n"
+        line_bytes = len(line.encode("utf-8"))
+        handle = self._open()
+        if self.max_bytes and self._size > 0 and self._size + line_bytes > self.max_bytes:
+            self._rotate()
+            handle = self._open()
+
+        handle.write(line)
+        self._size += line_bytes
+        self._unsynced += 1
+
+        if self.fsync_interval and self._unsynced >= self.fsync_interval:
+            self.sync()
+
+    def flush(self) -> None:
+        """Flush buffered entries to the OS (no fsync)."""
+        if self._handle is not None:
+            self._handle.flush()
+
+    def sync(self) -> None:
+        """Flush and fsync buffered entries to disk."""
+        if self._handle is None:
+            return
+        self._handle.flush()
+        try:
+            os.fsync(self._handle.fileno())
+        except OSError:
+            pass  # Some filesystems don't support fsync; data is still flushed
+        self._unsynced = 0
+
+    def close(self) -> None:
+        """Sync and close the handle. The writer reopens on the next write."""
+        if self._handle is None:
+            return
+        self.sync()
+        self._handle.close()
+        self._handle = None
+
+    def _rotate(self) -> None:
+        """Rotate the active file into numbered backups."""
+        self.close()
+        if self.backup_count <= 0:
+            self.log_file.unlink(missing_ok=True)
+            return
+
+        for i in range(self.backup_count - 1, 0, -1):
+            src = self.log_file.with_name(f"{self.log_file.name}.{i}")
+            if src.exists():
+                src.replace(self.log_file.with_name(f"{self.log_file.name}.{i + 1}"))
+        if self.log_file.exists():
+            self.log_file.replace(self.log_file.with_name(f"{self.log_file.name}.1"))
 
 
 class TaskLogger:
@@ -43,6 +171,9 @@ class TaskLogger:
         max_line_length: int = DEFAULT_MAX_LINE_LENGTH,
         level: LogLevel = LogLevel.NORMAL,
         log_format: LogFormat = LogFormat.TEXT,
+        fsync_interval: int = DEFAULT_FSYNC_INTERVAL,
+        max_bytes: int = DEFAULT_MAX_LOG_BYTES,
+        backup_count: int = DEFAULT_LOG_BACKUP_COUNT,
     ):
         """Initialize logger.
 
@@ -51,6 +182,9 @@ class TaskLogger:
             max_line_length: Maximum line length before truncation (default 200).
             level: Logging verbosity level (default NORMAL).
             log_format: Output format (default TEXT).
+            fsync_interval: JSONL only - entries between fsyncs (default 50).
+            max_bytes: JSONL only - rotate the file beyond this size (default 50MB).
+            backup_count: JSONL only - rotated segments to keep (default 3).
         """
         self.log_file = log_file
         self.max_line_length = max_line_length
@@ -59,6 +193,19 @@ class TaskLogger:
         self.current_session: int | None = None
         self.session_start: datetime | None = None
         self._json_entries: list[dict[str, Any]] = []  # Buffer for JSON format
+        self._jsonl_writer: JsonlLogWriter | None = None
+        if log_format == LogFormat.JSONL:
+            self._jsonl_writer = JsonlLogWriter(
+                log_file,
+                fsync_interval=fsync_interval,
+                max_bytes=max_bytes,
+                backup_count=backup_count,
+            )
+
+    @property
+    def _structured(self) -> bool:
+        """Whether entries are logged as structured JSON (JSON or JSONL)."""
+        return self.log_format in (LogFormat.JSON, LogFormat.JSONL)
 
     def _truncate(self, text: str) -> str:
         """Truncate text to max line length per line."""
@@ -87,7 +234,7 @@ class TaskLogger:
         self.current_session = session_number
         self.session_start = datetime.now()
 
-        if self.log_format == LogFormat.JSON:
+        if self._structured:
             self._log_json_entry(
                 "session_start",
                 session=session_number,
@@ -107,7 +254,7 @@ class TaskLogger:
         if self.level == LogLevel.QUIET:
             return
 
-        if self.log_format == LogFormat.JSON:
+        if self._structured:
             self._log_json_entry("prompt", content=prompt)
         else:
             self._write_raw("[PROMPT]")
@@ -121,7 +268,7 @@ class TaskLogger:
         if self.level == LogLevel.QUIET:
             return
 
-        if self.log_format == LogFormat.JSON:
+        if self._structured:
             self._log_json_entry("response", content=response)
         else:
             self._write_raw("[RESPONSE]")
@@ -135,7 +282,7 @@ class TaskLogger:
         if self.level != LogLevel.VERBOSE:
             return
 
-        if self.log_format == LogFormat.JSON:
+        if self._structured:
             self._log_json_entry("tool_use", tool=tool_name, parameters=parameters)
         else:
             params_str = self._truncate(self._format_params(parameters))
@@ -149,7 +296,7 @@ class TaskLogger:
         if self.level != LogLevel.VERBOSE:
             return
 
-        if self.log_format == LogFormat.JSON:
+        if self._structured:
             self._log_json_entry("tool_result", tool=tool_name, result=str(result))
         else:
             result_str = self._truncate(str(result))
@@ -165,7 +312,7 @@ class TaskLogger:
             duration = datetime.now() - self.session_start
             duration_seconds = duration.total_seconds()
 
-        if self.log_format == LogFormat.JSON:
+        if self._structured:
             self._log_json_entry(
                 "session_end",
                 outcome=outcome,
@@ -173,6 +320,8 @@ class TaskLogger:
             )
             # Flush JSON entries to file
             self._flush_json()
+            if self._jsonl_writer is not None:
+                self._jsonl_writer.flush()
         else:
             if duration_seconds is not None:
                 self._write_raw(f"=== END | {outcome} | {duration_seconds:.1f}s ===")
@@ -185,7 +334,7 @@ class TaskLogger:
 
         Errors are always logged regardless of level.
         """
-        if self.log_format == LogFormat.JSON:
+        if self._structured:
             self._log_json_entry("error", message=error)
         else:
             self._write_raw(f"[ERROR] {self._truncate(error)}")
@@ -198,7 +347,16 @@ class TaskLogger:
             "session": self.current_session,
         }
         entry.update(kwargs)
-        self._json_entries.append(entry)
+        if self._jsonl_writer is not None:
+            self._jsonl_writer.write(entry)
+        else:
+            self._json_entries.append(entry)
+
+    def close(self) -> None:
+        """Flush any pending entries and release open file handles."""
+        self._flush_json()
+        if self._jsonl_writer is not None:
+            self._jsonl_writer.close()
 
     def _flush_json(self) -> None:
         """Flush JSON entries to file."""
@@ -235,7 +393,7 @@ class TaskLogger:
         Deprecated: Use _write_raw for text format or _log_json_entry for JSON.
         This method is kept for backwards compatibility.
         """
-        if self.log_format == LogFormat.JSON:
+        if self._structured:
             # For backwards compatibility, treat raw writes as generic entries
             self._log_json_entry("raw", content=message)
         else:
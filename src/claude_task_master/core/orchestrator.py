@@ -21,6 +21,7 @@ from .key_listener import (
 )
 from .planner import Planner
 from .pr_context import PRContextManager
+from .pr_snapshot import PRSnapshotCache
 from .progress_tracker import ExecutionTracker, TrackerConfig
 from .shutdown import interruptible_sleep, register_handlers, reset_shutdown, unregister_handlers
 from .state import StateError, StateManager, TaskState
@@ -35,7 +36,10 @@ from .workflow_stages import WorkflowStageHandler
 if TYPE_CHECKING:
     from ..github import GitHubClient
     from ..webhooks import WebhookClient
+    from ..webhooks.dispatch import WebhookDispatchQueue
     from ..webhooks.events import EventType
+    from ..webhooks.fanout import WebhookFanout
+    from ..webhooks.outbox import OutboxSender
     from .logger import TaskLogger
 
 logger = logging.getLogger(__name__)
@@ -103,29 +107,45 @@ __all__ = [
 class WebhookEmitter:
     """Helper class to emit webhook events from the orchestrator.
 
-    Handles webhook emission with error handling and logging. Events are sent
-    asynchronously in a fire-and-forget manner - failures don't block the
-    orchestrator workflow.
+    Handles webhook emission with error handling and logging. With a
+    dispatcher, events are queued and delivered by a background worker, so
+    slow receivers never block the orchestrator. Without one (or once it is
+    closed), events are sent synchronously. With a WebhookFanout, events
+    are also sent to every subscribed endpoint in webhooks.json. Failures
+    are logged, not raised.
 
     Attributes:
         client: The webhook client for sending events.
         run_id: The current orchestrator run ID for correlation.
+        dispatcher: Optional background delivery queue or outbox sender.
+        fanout: Optional fan-out to the endpoints in webhooks.json.
     """
 
-    def __init__(self, client: WebhookClient | None, run_id: str | None = None) -> None:
+    def __init__(
+        self,
+        client: WebhookClient | None,
+        run_id: str | None = None,
+        dispatcher: WebhookDispatchQueue | OutboxSender | None = None,
+        fanout: WebhookFanout | None = None,
+    ) -> None:
         """Initialize the webhook emitter.
 
         Args:
             client: Optional webhook client. If None, all emit calls are no-ops.
             run_id: Optional run ID for event correlation.
+            dispatcher: Optional queue to deliver events in the background.
+            fanout: Optional fan-out that sends events to all subscribed
+                endpoints in webhooks.json.
         """
         self._client = client
         self._run_id = run_id
+        self._dispatcher = dispatcher
+        self._fanout = fanout
 
     @property
     def enabled(self) -> bool:
         """Check if webhook emission is enabled."""
-        return self._client is not None
+        return self._client is not None or self._fanout is not None
 
     def emit(
         self,
@@ -141,7 +161,7 @@ class WebhookEmitter:
             event_type: The type of event to emit.
             **event_data: Event-specific data fields.
         """
-        if not self._client:
+        if not self.enabled:
             return
 
         try:
@@ -155,7 +175,27 @@ class WebhookEmitter:
             # Create the event
             event = create_event(event_type, **event_data)
 
-            # Send synchronously (fire-and-forget)
+            # Fan out to webhooks.json endpoints (returns immediately)
+            if self._fanout is not None:
+                self._fanout.submit(
+                    event.to_dict(), event_type=str(event.event_type), delivery_id=event.event_id
+                )
+            if self._client is None:
+                return
+
+            # Queue for background delivery (returns immediately)
+            if self._dispatcher is not None and self._dispatcher.submit(
+                self._client,
+                data=event.to_dict(),
+                event_type=str(event.event_type),
+                delivery_id=event.event_id,
+            ):
+                logger.debug(
+                    "Webhook queued: %s (delivery_id=%s)", event.event_type, event.event_id
+                )
+                return
+
+            # Send synchronously
             result = self._client.send_sync(
                 data=event.to_dict(),
                 event_type=str(event.event_type),
@@ -198,6 +238,8 @@ class WorkLoopOrchestrator:
         logger: TaskLogger | None = None,
         tracker_config: TrackerConfig | None = None,
         webhook_client: WebhookClient | None = None,
+        webhook_dispatcher: WebhookDispatchQueue | OutboxSender | None = None,
+        webhook_fanout: WebhookFanout | None = None,
     ):
         """Initialize orchestrator.
 
@@ -209,6 +251,10 @@ class WorkLoopOrchestrator:
             logger: Optional logger for recording session activity.
             tracker_config: Optional config for execution tracker.
             webhook_client: Optional webhook client for emitting lifecycle events.
+            webhook_dispatcher: Optional queue for delivering webhook events in
+                the background instead of blocking the work loop.
+            webhook_fanout: Optional fan-out that also sends events to the
+                endpoints configured in webhooks.json.
         """
         self.agent = agent
         self.state_manager = state_manager
@@ -217,11 +263,14 @@ class WorkLoopOrchestrator:
         self.logger = logger
         self.tracker = ExecutionTracker(config=tracker_config or TrackerConfig.default())
         self._webhook_client = webhook_client
+        self._webhook_dispatcher = webhook_dispatcher
+        self._webhook_fanout = webhook_fanout
 
         # Initialize component managers (lazy)
         self._task_runner: TaskRunner | None = None
         self._stage_handler: WorkflowStageHandler | None = None
         self._pr_context: PRContextManager | None = None
+        self._pr_snapshots: PRSnapshotCache | None = None
         self._webhook_emitter: WebhookEmitter | None = None
 
     @property
@@ -250,6 +299,13 @@ class WorkLoopOrchestrator:
             )
         return self._task_runner
 
+    @property
+    def pr_snapshots(self) -> PRSnapshotCache:
+        """Get or lazily initialize the per-cycle PR snapshot cache."""
+        if self._pr_snapshots is None:
+            self._pr_snapshots = PRSnapshotCache(self.github_client)
+        return self._pr_snapshots
+
     @property
     def pr_context(self) -> PRContextManager:
         """Get or lazily initialize PR context manager."""
@@ -257,6 +313,7 @@ class WorkLoopOrchestrator:
             self._pr_context = PRContextManager(
                 state_manager=self.state_manager,
                 github_client=self.github_client,
+                snapshots=self.pr_snapshots,
             )
         return self._pr_context
 
@@ -269,6 +326,8 @@ class WorkLoopOrchestrator:
                 state_manager=self.state_manager,
                 github_client=self.github_client,
                 pr_context=self.pr_context,
+                tracker=self.tracker,
+                snapshots=self.pr_snapshots,
             )
         return self._stage_handler
 
@@ -284,7 +343,12 @@ class WorkLoopOrchestrator:
                     run_id = state.run_id
             except Exception:
                 pass  # Use None if state can't be loaded
-            self._webhook_emitter = WebhookEmitter(self._webhook_client, run_id)
+            self._webhook_emitter = WebhookEmitter(
+                self._webhook_client,
+                run_id,
+                dispatcher=self._webhook_dispatcher,
+                fanout=self._webhook_fanout,
+            )
         return self._webhook_emitter
 
     def _get_total_tasks(self, state: TaskState) -> int:
@@ -297,10 +361,7 @@ class WorkLoopOrchestrator:
             Total number of tasks, or 0 if plan can't be loaded.
         """
         try:
-            plan = self.state_manager.load_plan()
-            if plan:
-                tasks = self.state_manager._parse_plan_tasks(plan)
-                return len(tasks)
+            return self.state_manager.load_plan_index().total
         except Exception:
             pass
         return 0
@@ -315,13 +376,8 @@ class WorkLoopOrchestrator:
             Number of completed tasks.
         """
         try:
-            plan = self.state_manager.load_plan()
-            if plan:
-                # Count tasks marked as [x]
-                import re
-
-                completed = len(re.findall(r"^- \[x\]", plan, re.MULTILINE))
-                return completed
+            if self.state_manager.load_plan():
+                return self.state_manager.load_plan_index().completed_count
         except Exception:
             pass
         return state.current_task_index
@@ -606,7 +662,24 @@ class WorkLoopOrchestrator:
             self.state_manager.save_state(state)
 
         stage = state.workflow_stage
+        # PR data is fetched fresh once per cycle and shared by all its steps
+        if self._pr_snapshots is not None:
+            self._pr_snapshots.begin_cycle()
+        calls_before = self._github_api_calls()
+        try:
+            return self._run_workflow_stage(state, stage)
+        finally:
+            calls = self._github_api_calls()
+            if stage != "working" and calls is not None:
+                self.tracker.record_github_cycle(stage, calls - (calls_before or 0))
+
+    def _github_api_calls(self) -> int | None:
+        """GitHub calls made so far, or None if no GitHub client is set up yet."""
+        calls = getattr(self._github_client, "api_calls", None)
+        return calls if isinstance(calls, int) else None
 
+    def _run_workflow_stage(self, state: TaskState, stage: str) -> int | None:
+        """Run the handler of a workflow stage."""
         try:
             if stage == "working":
                 return self._handle_working_stage(state)
@@ -2,23 +2,135 @@
 
 Enables running multiple independent tasks in parallel using
 asyncio and thread pools for improved throughput.
+
+Execution backends (``ParallelExecutorConfig.backend``):
+- thread: Thread pool (default). Best for I/O-bound work.
+- process: Process pool. Sidesteps the GIL for CPU-bound work; task
+  functions, their results and errors must be picklable.
+- asyncio: Event loop in a background thread. Coroutine functions are
+  awaited directly and can be cancelled on timeout; plain functions run in
+  the loop's default thread pool.
+
+Scheduling, retries, timeouts and circuit breakers always run in the
+calling process, so breaker state is shared by every backend.
 """
 
 from __future__ import annotations
 
 import asyncio
+import heapq
+import inspect
+import itertools
+import pickle
 import threading
 import time
-from collections.abc import Callable
-from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+)
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Generic, TypeVar
 
-from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig, get_circuit_breaker
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerError,
+    get_circuit_breaker,
+)
+from .retry import Backoff, RetryPolicies, classify_error, retry_after_from_error
 
 T = TypeVar("T")
 
+# Keyword argument through which a task function receives its CancellationToken
+CANCEL_TOKEN_PARAM = "cancel_token"
+
+
+class TaskCancelledError(Exception):
+    """Raised inside a task when its CancellationToken has been cancelled."""
+
+    def __init__(self, reason: str = "cancelled"):
+        self.reason = reason
+        super().__init__(f"Task {reason}")
+
+
+class CancellationToken:
+    """Cooperative cancellation signal passed to long-running task functions.
+
+    A task opts in by declaring a ``cancel_token`` keyword argument. The
+    executor cancels the token when the task's timeout expires or when
+    ``ParallelExecutor.cancel()`` is called; the task should check it between
+    units of work and return or raise promptly so its worker is released.
+
+    Usage:
+        def work(cancel_token: CancellationToken) -> None:
+            for item in items:
+                cancel_token.raise_if_cancelled()
+                process(item)
+    """
+
+    def __init__(self, deadline: float | None = None):
+        """Initialize token.
+
+        Args:
+            deadline: Optional absolute time (time.time()) the task must finish by.
+        """
+        self.deadline = deadline
+        self.reason: str | None = None
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation has been requested."""
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Request cancellation."""
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def remaining(self) -> float | None:
+        """Seconds until the deadline, or None if there is no deadline."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.time())
+
+    def raise_if_cancelled(self) -> None:
+        """Raise TaskCancelledError if cancellation has been requested."""
+        if self._event.is_set():
+            raise TaskCancelledError(self.reason or "cancelled")
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Sleep up to ``timeout`` seconds, waking early on cancellation.
+
+        Returns:
+            True if the token was cancelled.
+        """
+        return self._event.wait(timeout)
+
+
+def _accepts_cancel_token(func: Callable[..., Any]) -> bool:
+    """Check whether a task function declares a ``cancel_token`` parameter."""
+    try:
+        return CANCEL_TOKEN_PARAM in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
 
 class TaskStatus(Enum):
     """Status of a parallel task."""
@@ -55,15 +167,28 @@ class TaskResult(Generic[T]):
         return self.status == TaskStatus.COMPLETED and self.error is None
 
 
+class ExecutorBackend(Enum):
+    """Where ParallelExecutor runs task functions."""
+
+    THREAD = "thread"
+    PROCESS = "process"
+    ASYNCIO = "asyncio"
+
+
 @dataclass
 class ParallelExecutorConfig:
     """Configuration for parallel executor."""
 
     max_workers: int = 4  # Max concurrent tasks
+    backend: ExecutorBackend = ExecutorBackend.THREAD  # See module docstring
     task_timeout: float = 300.0  # Task timeout in seconds
     max_retries: int = 2  # Max retries per task
     use_circuit_breaker: bool = True  # Enable circuit breaker per task type
-    batch_size: int = 10  # Max tasks to process in one batch
+    # Backoff between retries, per error kind (see core.retry)
+    retry_policies: RetryPolicies = field(default_factory=RetryPolicies.uniform)
+    # Deprecated: tasks are now scheduled as soon as their dependencies finish,
+    # bounded only by max_workers. Kept for backwards compatibility.
+    batch_size: int = 10
 
     @classmethod
     def default(cls) -> ParallelExecutorConfig:
@@ -83,26 +208,169 @@ class ParallelExecutorConfig:
 
 @dataclass
 class ParallelTask(Generic[T]):
-    """A task to be executed in parallel."""
+    """A task to be executed in parallel.
+
+    ``func`` is called with no arguments, or with ``cancel_token=`` if it
+    declares that parameter (see CancellationToken). On the process backend
+    the token lives in the worker process: it carries the deadline, but
+    ``cancel()`` and timeouts can't signal it.
+    """
 
     task_id: str
-    func: Callable[[], T]
+    func: Callable[..., T]
     task_type: str = "default"  # For circuit breaker grouping
     priority: int = 0  # Higher = higher priority
     timeout: float | None = None  # Override default timeout
     dependencies: list[str] = field(default_factory=list)  # Task IDs this depends on
 
 
+@dataclass
+class _AttemptOutcome:
+    """Outcome of a single task attempt, returned by the backend."""
+
+    start: float
+    end: float
+    value: Any = None
+    error: Exception | None = None
+
+
+@dataclass
+class _RunningAttempt:
+    """Scheduler bookkeeping for an attempt that has been submitted."""
+
+    task_id: str
+    future: Future[_AttemptOutcome]
+    token: CancellationToken
+    timeout: float
+    started: float
+    deadline: float
+    circuit_breaker: CircuitBreaker | None = None  # Set if the breaker admitted the call
+
+
+# =============================================================================
+# Execution Backends
+# =============================================================================
+
+
+def _run_task_func(func: Callable[..., Any], token: CancellationToken) -> _AttemptOutcome:
+    """Call a task function once and capture its outcome."""
+    start = time.time()
+    try:
+        if _accepts_cancel_token(func):
+            value = func(cancel_token=token)
+        else:
+            value = func()
+        return _AttemptOutcome(start=start, end=time.time(), value=value)
+    except Exception as e:
+        return _AttemptOutcome(start=start, end=time.time(), error=e)
+
+
+def _run_task_in_process(func: Callable[..., Any], deadline: float | None) -> _AttemptOutcome:
+    """Process-pool entry point; builds a local token carrying the deadline."""
+    outcome = _run_task_func(func, CancellationToken(deadline=deadline))
+    if outcome.error is not None:
+        try:
+            pickle.dumps(outcome.error)
+        except Exception:
+            outcome.error = RuntimeError(repr(outcome.error))
+    return outcome
+
+
+async def _run_task_async(func: Callable[..., Any], token: CancellationToken) -> _AttemptOutcome:
+    """Await a coroutine function, or run a plain function off the loop."""
+    if not inspect.iscoroutinefunction(func):
+        return await asyncio.to_thread(_run_task_func, func, token)
+
+    start = time.time()
+    try:
+        if _accepts_cancel_token(func):
+            value = await func(cancel_token=token)
+        else:
+            value = await func()
+        return _AttemptOutcome(start=start, end=time.time(), value=value)
+    except Exception as e:
+        return _AttemptOutcome(start=start, end=time.time(), error=e)
+
+
+class _PoolBackend:
+    """Runs attempts on a concurrent.futures thread or process pool."""
+
+    def __init__(self, pool: Executor, in_process: bool):
+        self._pool = pool
+        self._in_process = in_process
+
+    def submit(self, func: Callable[..., Any], token: CancellationToken) -> Future[_AttemptOutcome]:
+        if self._in_process:
+            return self._pool.submit(_run_task_in_process, func, token.deadline)
+        return self._pool.submit(_run_task_func, func, token)
+
+    def shutdown(self, wait: bool) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+class _AsyncioBackend:
+    """Runs attempts on an event loop owned by a background thread."""
+
+    def __init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="parallel-executor-loop", daemon=True
+        )
+        self._thread.start()
+
+    def _run_loop(self) -> None:
+        """Thread target: run the loop until stopped, then close it."""
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            # Attempts abandoned by shutdown(wait=False) may still be pending
+            pending = asyncio.all_tasks(self._loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self._loop.close()
+
+    def submit(self, func: Callable[..., Any], token: CancellationToken) -> Future[_AttemptOutcome]:
+        return asyncio.run_coroutine_threadsafe(_run_task_async(func, token), self._loop)
+
+    def shutdown(self, wait: bool) -> None:
+        if wait:
+            asyncio.run_coroutine_threadsafe(
+                self._loop.shutdown_default_executor(), self._loop
+            ).result()
+        # Stopping from the loop thread lets it close the loop on every path
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if wait:
+            self._thread.join()
+
+
+_Backend = _PoolBackend | _AsyncioBackend
+
+
+def _create_backend(config: ParallelExecutorConfig) -> _Backend:
+    """Create the execution backend selected by the config."""
+    backend = ExecutorBackend(config.backend)
+    if backend == ExecutorBackend.PROCESS:
+        return _PoolBackend(ProcessPoolExecutor(max_workers=config.max_workers), in_process=True)
+    if backend == ExecutorBackend.ASYNCIO:
+        return _AsyncioBackend()
+    return _PoolBackend(ThreadPoolExecutor(max_workers=config.max_workers), in_process=False)
+
+
 class ParallelExecutor:
     """Execute multiple tasks in parallel with fault tolerance.
 
     Features:
-    - Thread pool for concurrent execution
+    - Thread, process or asyncio execution backend
     - Circuit breaker per task type
-    - Timeout handling
-    - Retry logic
-    - Dependency resolution
-    - Progress tracking
+    - Timeout enforcement via cooperative CancellationTokens
+    - Retry logic with backoff held in a delay queue, not a sleeping worker
+    - Dependency-aware scheduling: a task is submitted the moment its
+      dependencies finish, highest priority first, so one slow task never
+      stalls unrelated ready tasks
+    - Progress tracking and critical-path timing
 
     Usage:
         executor = ParallelExecutor()
@@ -117,6 +385,10 @@ class ParallelExecutor:
         # Execute all tasks
         results = executor.execute_all()
 
+        # Or handle each result as soon as its task finishes
+        for result in executor.iter_results():
+            ...
+
         # Or execute with async
         results = await executor.execute_all_async()
     """
@@ -127,8 +399,15 @@ class ParallelExecutor:
         self._tasks: dict[str, ParallelTask] = {}
         self._results: dict[str, TaskResult] = {}
         self._lock = threading.RLock()
-        self._executor: ThreadPoolExecutor | None = None
+        self._backend: _Backend | None = None
         self._cancelled = threading.Event()
+        self._order: list[str] = []  # Topological order from the last run
+        self._run_start: float | None = None
+        self._run_end: float | None = None
+        self._tokens: dict[str, CancellationToken] = {}  # Tokens of running attempts
+        self._busy_seconds = 0.0  # Worker time spent running attempts
+        self._wasted_seconds = 0.0  # Worker time spent on failed/timed-out attempts
+        self._backoffs: dict[str, Backoff] = {}  # Retry delay sequence per task
 
     def add_task(self, task: ParallelTask) -> None:
         """Add a task to be executed.
@@ -137,8 +416,10 @@ class ParallelExecutor:
             task: The task to add.
 
         Raises:
-            ValueError: If task with same ID already exists.
+            ValueError: If task with same ID already exists, or its function
+                can't run on the configured backend.
         """
+        self._check_backend_compatible(task)
         with self._lock:
             if task.task_id in self._tasks:
                 raise ValueError(f"Task with ID '{task.task_id}' already exists")
@@ -154,12 +435,14 @@ class ParallelExecutor:
             self.add_task(task)
 
     def cancel(self) -> None:
-        """Cancel all pending tasks."""
+        """Cancel all pending tasks and signal running ones to stop."""
         self._cancelled.set()
         with self._lock:
             for _task_id, result in self._results.items():
                 if result.status == TaskStatus.PENDING:
                     result.status = TaskStatus.CANCELLED
+            for token in self._tokens.values():
+                token.cancel("cancelled")
 
     def _get_circuit_breaker(self, task_type: str) -> CircuitBreaker | None:
         """Get circuit breaker for a task type."""
@@ -170,146 +453,394 @@ class ParallelExecutor:
             CircuitBreakerConfig.default(),
         )
 
-    def _execute_task(self, task: ParallelTask) -> TaskResult:
-        """Execute a single task with retry and circuit breaker."""
-        result = self._results[task.task_id]
-        result.start_time = time.time()
-        result.status = TaskStatus.RUNNING
-
-        circuit_breaker = self._get_circuit_breaker(task.task_type)
-
-        for attempt in range(self.config.max_retries + 1):
-            if self._cancelled.is_set():
-                result.status = TaskStatus.CANCELLED
-                result.end_time = time.time()
-                return result
+    def _check_backend_compatible(self, task: ParallelTask) -> None:
+        """Reject task functions the configured backend can't run.
 
+        Raises:
+            ValueError: If the function is a coroutine function and the backend
+                isn't asyncio, or the backend is process and it isn't picklable.
+        """
+        backend = ExecutorBackend(self.config.backend)
+        if inspect.iscoroutinefunction(task.func) and backend != ExecutorBackend.ASYNCIO:
+            raise ValueError(
+                f"Task '{task.task_id}' is a coroutine function; use the asyncio backend"
+            )
+        if backend == ExecutorBackend.PROCESS:
             try:
-                # Execute with circuit breaker if enabled
-                if circuit_breaker:
-                    task_result = circuit_breaker.call(task.func)
-                else:
-                    task_result = task.func()
-
-                result.result = task_result
-                result.status = TaskStatus.COMPLETED
-                result.end_time = time.time()
-                result.retries = attempt
-                return result
-
+                pickle.dumps(task.func)
             except Exception as e:
-                result.error = e
-                result.retries = attempt
-
-                # Check if we should retry
-                if attempt < self.config.max_retries:
-                    # Exponential backoff
-                    backoff = min(2**attempt, 30)
-                    time.sleep(backoff)
-                    continue
+                raise ValueError(
+                    f"Task '{task.task_id}' can't run on the process backend: "
+                    f"function is not picklable ({e})"
+                ) from e
 
-                # Final failure
-                result.status = TaskStatus.FAILED
-                result.end_time = time.time()
-                return result
+    def _calculate_backoff(self, task_id: str, error: BaseException) -> float:
+        """Backoff before retrying a task after a failed attempt.
 
-        # Should not reach here
-        result.status = TaskStatus.FAILED
-        result.end_time = time.time()
-        return result
+        Uses the task's decorrelated-jitter sequence and the policy for the
+        error's kind, never shorter than a Retry-After hint the error carries.
+        """
+        backoff = self._backoffs.get(task_id)
+        if backoff is None:
+            backoff = self._backoffs[task_id] = self.config.retry_policies.backoff()
+        return backoff.next_delay(classify_error(error), retry_after_from_error(error))
+
+    def _build_dependency_graph(self) -> tuple[dict[str, list[str]], list[str]]:
+        """Validate dependencies and build the scheduling graph.
 
-    def _resolve_dependencies(self) -> list[list[ParallelTask]]:
-        """Resolve task dependencies and return execution batches.
+        Runs Kahn's algorithm once, so unknown dependencies and cycles are
+        detected up front in O(V+E) rather than after tasks have started.
 
         Returns:
-            List of batches, where each batch contains tasks
-            that can be executed in parallel.
+            Tuple of (dependents, order): for each task the IDs of tasks that
+            depend on it, and a topological order of all task IDs.
+
+        Raises:
+            ValueError: If a dependency is unknown or dependencies form a cycle.
         """
-        # Build dependency graph
-        remaining = set(self._tasks.keys())
-        completed: set[str] = set()
-        batches: list[list[ParallelTask]] = []
-
-        while remaining:
-            # Find tasks with all dependencies satisfied
-            ready = []
-            for task_id in remaining:
-                task = self._tasks[task_id]
-                if all(dep in completed for dep in task.dependencies):
-                    ready.append(task)
-
-            if not ready:
-                # Circular dependency or missing dependency
+        dependents: dict[str, list[str]] = {task_id: [] for task_id in self._tasks}
+        indegree: dict[str, int] = {}
+
+        for task_id, task in self._tasks.items():
+            deps = set(task.dependencies)
+            missing = deps - self._tasks.keys()
+            if missing:
                 raise ValueError(
-                    f"Cannot resolve dependencies. Remaining: {remaining}, Completed: {completed}"
+                    f"Cannot resolve dependencies. Task '{task_id}' depends on "
+                    f"unknown task(s): {sorted(missing)}"
                 )
-
-            # Sort by priority (higher first)
-            ready.sort(key=lambda t: t.priority, reverse=True)
-
-            # Create batch (respecting batch size)
-            batch = ready[: self.config.batch_size]
-            batches.append(batch)
-
-            # Mark as completed
-            for task in batch:
-                remaining.remove(task.task_id)
-                completed.add(task.task_id)
-
-        return batches
+            indegree[task_id] = len(deps)
+            for dep in deps:
+                dependents[dep].append(task_id)
+
+        remaining = dict(indegree)
+        queue = deque(task_id for task_id, count in indegree.items() if count == 0)
+        order: list[str] = []
+        while queue:
+            task_id = queue.popleft()
+            order.append(task_id)
+            for child in dependents[task_id]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    queue.append(child)
+
+        if len(order) != len(self._tasks):
+            cyclic = sorted(task_id for task_id, count in remaining.items() if count > 0)
+            raise ValueError(f"Cannot resolve dependencies. Circular dependency among: {cyclic}")
+
+        return dependents, order
 
     def execute_all(self) -> dict[str, TaskResult]:
         """Execute all tasks synchronously.
 
-        Tasks are executed in batches based on dependencies.
-        Tasks within a batch are executed in parallel.
+        Ready tasks wait in a priority heap and are submitted whenever a
+        worker slot is free; each completion immediately releases the tasks
+        that were only waiting on it. Dependents run once their dependencies
+        have finished, whether they succeeded or failed; dependents of a
+        cancelled task are cancelled with it.
+
+        Failed attempts are retried after a backoff held in a delay queue, so
+        no worker sleeps. When an attempt exceeds its timeout its token is
+        cancelled and the task fails with TimeoutError; a function that
+        ignores its token keeps occupying its worker until it returns, and
+        that time is counted as wasted.
 
         Returns:
             Dictionary mapping task IDs to results.
         """
+        for _ in self.iter_results():
+            pass
+        return self._results.copy()
+
+    def iter_results(self) -> Iterator[TaskResult]:
+        """Execute all tasks, yielding each result as soon as its task finishes.
+
+        Scheduling is the same as ``execute_all()``. Results stream back as
+        tasks complete, fail, time out or are cancelled, so callers can act on
+        early results without waiting for the whole run. No new attempts are
+        submitted while the caller is handling a result. Closing the iterator
+        early cancels the remaining tasks.
+
+        Yields:
+            The final TaskResult of each task, in completion order.
+        """
         self._cancelled.clear()
+        self._run_start = time.time()
+        self._run_end = None
+        self._busy_seconds = 0.0
+        self._wasted_seconds = 0.0
 
         try:
-            batches = self._resolve_dependencies()
+            dependents, self._order = self._build_dependency_graph()
         except ValueError as e:
             # Mark all tasks as failed
             for task_id in self._tasks:
                 self._results[task_id].status = TaskStatus.FAILED
                 self._results[task_id].error = e
-            return self._results.copy()
+            self._run_end = time.time()
+            yield from list(self._results.values())
+            return
+
+        waiting = {task_id: len(set(task.dependencies)) for task_id, task in self._tasks.items()}
+        attempts = dict.fromkeys(self._tasks, 0)
+        self._backoffs.clear()
+        ready: list[tuple[int, int, str]] = []
+        delayed: list[tuple[float, int, str]] = []  # (retry_at, seq, task_id)
+        sequence = itertools.count()  # FIFO tie-break within a priority
+        running: dict[Future[_AttemptOutcome], _RunningAttempt] = {}
+        abandoned: dict[Future[_AttemptOutcome], _RunningAttempt] = {}
+        skipped: set[str] = set()  # Dependents of cancelled tasks
+
+        def release(task_id: str) -> None:
+            heapq.heappush(ready, (-self._tasks[task_id].priority, next(sequence), task_id))
+
+        def finish(task_id: str) -> None:
+            for child in dependents[task_id]:
+                waiting[child] -= 1
+                if waiting[child] == 0:
+                    release(child)
+
+        def cancel_dependents(task_id: str) -> list[str]:
+            # A cancelled task never calls finish(), so its dependents can't
+            # have been released yet
+            cancelled: list[str] = []
+            stack = [(task_id, child) for child in dependents[task_id]]
+            while stack:
+                parent, child = stack.pop()
+                if child in skipped:
+                    continue
+                skipped.add(child)
+                result = self._results[child]
+                result.status = TaskStatus.CANCELLED
+                result.error = TaskCancelledError(f"dependency '{parent}' was cancelled")
+                result.end_time = time.time()
+                cancelled.append(child)
+                stack.extend((child, grandchild) for grandchild in dependents[child])
+            return cancelled
 
-        # Execute batches
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            self._executor = executor
+        for task_id in self._order:
+            if waiting[task_id] == 0:
+                release(task_id)
+
+        backend = _create_backend(self.config)
+        self._backend = backend
+        completed_run = False
+        try:
+            while ready or delayed or running:
+                now = time.time()
+                while delayed and delayed[0][0] <= now:
+                    _, _, task_id = heapq.heappop(delayed)
+                    release(task_id)
 
-            for batch in batches:
                 if self._cancelled.is_set():
-                    break
+                    for task_id in self._cancel_queued(ready, delayed):
+                        yield self._results[task_id]
+                        for child in cancel_dependents(task_id):
+                            yield self._results[child]
+
+                # Abandoned (timed out, still running) attempts hold real workers
+                while ready and len(running) + len(abandoned) < self.config.max_workers:
+                    _, _, task_id = heapq.heappop(ready)
+                    attempt = self._submit(backend, task_id)
+                    running[attempt.future] = attempt
+
+                if not running and not abandoned and not delayed:
+                    break  # Cancelled with tasks still queued
+
+                wake_at = [attempt.deadline for attempt in running.values()]
+                if delayed:
+                    wake_at.append(delayed[0][0])
+                timeout = max(0.0, min(wake_at) - time.time()) if wake_at else None
+                in_flight = [*running, *abandoned]
+                if in_flight:
+                    done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                else:
+                    self._cancelled.wait(timeout)
+                    done = set()
+
+                finished: list[str] = []
+                for future in done:
+                    if future in abandoned:
+                        attempt = abandoned.pop(future)
+                        outcome = self._collect(attempt)
+                        self._wasted_seconds += outcome.end - outcome.start
+                        self._busy_seconds += outcome.end - outcome.start
+                        continue
+
+                    attempt = running.pop(future)
+                    retry_at = self._apply_outcome(attempt, self._collect(attempt), attempts)
+                    if retry_at is not None:
+                        heapq.heappush(delayed, (retry_at, next(sequence), attempt.task_id))
+                    elif self._results[attempt.task_id].status == TaskStatus.CANCELLED:
+                        finished.append(attempt.task_id)
+                        finished.extend(cancel_dependents(attempt.task_id))
+                    else:
+                        finish(attempt.task_id)
+                        finished.append(attempt.task_id)
+
+                now = time.time()
+                for future, attempt in list(running.items()):
+                    if attempt.deadline <= now:
+                        attempt.token.cancel("timed out")
+                        future.cancel()  # Interrupts coroutines on the asyncio backend
+                        self._mark_timed_out(attempt)
+                        abandoned[future] = running.pop(future)
+                        finish(attempt.task_id)
+                        finished.append(attempt.task_id)
+
+                for task_id in finished:
+                    yield self._results[task_id]
+            completed_run = True
+        finally:
+            if not completed_run:
+                # Iterator closed early or the scheduler failed
+                self.cancel()
+                self._cancel_queued(ready, delayed)
+                for future, attempt in running.items():
+                    future.cancel()
+                    result = self._results[attempt.task_id]
+                    result.status = TaskStatus.CANCELLED
+                    result.end_time = time.time()
+                    abandoned[future] = attempt
+            # Don't block on workers that ignored their cancellation token
+            now = time.time()
+            for attempt in abandoned.values():
+                self._wasted_seconds += now - attempt.started
+                self._busy_seconds += now - attempt.started
+            backend.shutdown(wait=not abandoned)
+            self._backend = None
+            with self._lock:
+                self._tokens.clear()
+            self._run_end = time.time()
+
+    def _submit(self, backend: _Backend, task_id: str) -> _RunningAttempt:
+        """Submit one attempt of a task with a fresh cancellation token.
+
+        The circuit breaker is consulted here, in the scheduling process, so
+        its state is shared no matter where the attempt runs. A rejected
+        attempt completes immediately with CircuitBreakerError.
+        """
+        task = self._tasks[task_id]
+        timeout = task.timeout or self.config.task_timeout
+        now = time.time()
+        token = CancellationToken(deadline=now + timeout)
+        with self._lock:
+            self._tokens[task_id] = token
+            result = self._results[task_id]
+            result.status = TaskStatus.RUNNING
+            if result.start_time is None:
+                result.start_time = now
 
-                # Submit all tasks in batch
-                futures: dict[str, Future] = {}
-                for task in batch:
-                    if self._cancelled.is_set():
-                        break
-                    future = executor.submit(self._execute_task, task)
-                    futures[task.task_id] = future
+        circuit_breaker = self._get_circuit_breaker(task.task_type)
+        future: Future[_AttemptOutcome]
+        try:
+            if circuit_breaker:
+                circuit_breaker.acquire()
+        except CircuitBreakerError as e:
+            circuit_breaker = None
+            future = Future()
+            future.set_result(_AttemptOutcome(start=now, end=now, error=e))
+        else:
+            future = backend.submit(task.func, token)
+
+        return _RunningAttempt(
+            task_id=task_id,
+            future=future,
+            token=token,
+            timeout=timeout,
+            started=now,
+            deadline=now + timeout,
+            circuit_breaker=circuit_breaker,
+        )
 
-                # Wait for all tasks in batch to complete
-                for task_id, future in futures.items():
-                    try:
-                        timeout = self._tasks[task_id].timeout or self.config.task_timeout
-                        future.result(timeout=timeout + 10)  # Extra buffer for cleanup
-                    except Exception as e:
-                        # Handle timeout or other errors
-                        result = self._results[task_id]
-                        if result.status == TaskStatus.RUNNING:
-                            result.status = TaskStatus.FAILED
-                            result.error = e
-                            result.end_time = time.time()
+    def _collect(self, attempt: _RunningAttempt) -> _AttemptOutcome:
+        """Get the outcome of a finished attempt, including backend failures."""
+        future = attempt.future
+        if future.cancelled():
+            reason = attempt.token.reason or "cancelled"
+            return _AttemptOutcome(
+                start=attempt.started, end=time.time(), error=TaskCancelledError(reason)
+            )
+        try:
+            return future.result()
+        except Exception as e:
+            # E.g. an unpicklable result or a crashed worker process
+            return _AttemptOutcome(start=attempt.started, end=time.time(), error=e)
 
-            self._executor = None
+    def _apply_outcome(
+        self,
+        attempt: _RunningAttempt,
+        outcome: _AttemptOutcome,
+        attempts: dict[str, int],
+    ) -> float | None:
+        """Record an attempt's outcome.
 
-        return self._results.copy()
+        Returns:
+            The time to retry at, or None if the task is finished.
+        """
+        with self._lock:
+            self._tokens.pop(attempt.task_id, None)
+        if attempt.circuit_breaker:
+            attempt.circuit_breaker.record_outcome(
+                success=outcome.error is None, duration=outcome.end - outcome.start
+            )
+        result = self._results[attempt.task_id]
+        attempt_number = attempts[attempt.task_id]
+        duration = outcome.end - outcome.start
+        self._busy_seconds += duration
+        result.retries = attempt_number
+
+        if outcome.error is None:
+            result.result = outcome.value
+            result.error = None
+            result.status = TaskStatus.COMPLETED
+            result.end_time = outcome.end
+            return None
+
+        self._wasted_seconds += duration
+        result.error = outcome.error
+
+        if isinstance(outcome.error, TaskCancelledError) or self._cancelled.is_set():
+            result.status = TaskStatus.CANCELLED
+            result.end_time = outcome.end
+            return None
+
+        if attempt_number < self.config.max_retries:
+            attempts[attempt.task_id] = attempt_number + 1
+            return time.time() + self._calculate_backoff(attempt.task_id, outcome.error)
+
+        # Final failure
+        result.status = TaskStatus.FAILED
+        result.end_time = outcome.end
+        return None
+
+    def _mark_timed_out(self, attempt: _RunningAttempt) -> None:
+        """Mark a task whose attempt exceeded its deadline as failed."""
+        with self._lock:
+            self._tokens.pop(attempt.task_id, None)
+        if attempt.circuit_breaker:
+            attempt.circuit_breaker.record_outcome(success=False)
+        result = self._results[attempt.task_id]
+        result.status = TaskStatus.FAILED
+        result.error = TimeoutError(f"Task '{attempt.task_id}' timed out after {attempt.timeout}s")
+        result.end_time = time.time()
+
+    def _cancel_queued(
+        self, ready: list[tuple[int, int, str]], delayed: list[tuple[float, int, str]]
+    ) -> list[str]:
+        """Mark queued and retry-waiting tasks as cancelled and drop them.
+
+        Returns:
+            IDs of the tasks that were cancelled.
+        """
+        cancelled = [task_id for *_, task_id in [*ready, *delayed]]
+        for task_id in cancelled:
+            result = self._results[task_id]
+            result.status = TaskStatus.CANCELLED
+            result.end_time = time.time()
+        ready.clear()
+        delayed.clear()
+        return cancelled
 
     async def execute_all_async(self) -> dict[str, TaskResult]:
         """Execute all tasks asynchronously.
@@ -324,16 +855,81 @@ class ParallelExecutor:
         """Get current results."""
         return self._results.copy()
 
-    def get_progress(self) -> dict[str, int]:
+    def get_progress(self) -> dict[str, int | float]:
         """Get execution progress.
 
         Returns:
-            Dictionary with counts for each status.
+            Dictionary with counts for each status, plus worker utilisation
+            for the current or last run:
+            - busy_worker_seconds: Time workers spent running attempts
+            - wasted_worker_seconds: Part of that spent on failed, cancelled
+              or timed-out attempts
+            - idle_worker_seconds: Worker capacity (max_workers x wall time)
+              left unused
         """
-        counts = {status.value: 0 for status in TaskStatus}
+        progress: dict[str, int | float] = {status.value: 0 for status in TaskStatus}
         for result in self._results.values():
-            counts[result.status.value] += 1
-        return counts
+            progress[result.status.value] += 1
+
+        wall_time = 0.0
+        if self._run_start is not None:
+            wall_time = (self._run_end or time.time()) - self._run_start
+        capacity = wall_time * self.config.max_workers
+        progress["busy_worker_seconds"] = self._busy_seconds
+        progress["wasted_worker_seconds"] = self._wasted_seconds
+        progress["idle_worker_seconds"] = max(0.0, capacity - self._busy_seconds)
+        return progress
+
+    def get_critical_path(self) -> tuple[list[str], float]:
+        """Get the longest dependency chain of the last run.
+
+        Each task is weighted by its measured duration, so the result is the
+        chain that bounded the run's wall time regardless of max_workers.
+
+        Returns:
+            Tuple of (task IDs along the critical path, total seconds).
+        """
+        finish: dict[str, float] = {}
+        previous: dict[str, str | None] = {}
+        for task_id in self._order:
+            deps = [dep for dep in set(self._tasks[task_id].dependencies) if dep in finish]
+            best = max(deps, key=lambda dep: finish[dep], default=None)
+            duration = self._results[task_id].duration or 0.0
+            finish[task_id] = duration + (finish[best] if best else 0.0)
+            previous[task_id] = best
+
+        if not finish:
+            return [], 0.0
+
+        end: str | None = max(finish, key=lambda task_id: finish[task_id])
+        total = finish[end] if end else 0.0
+        path: list[str] = []
+        while end is not None:
+            path.append(end)
+            end = previous[end]
+        path.reverse()
+        return path, total
+
+    def get_timing(self) -> dict[str, Any]:
+        """Get timing statistics for the last run.
+
+        Returns:
+            Dictionary with wall_time, busy_time (sum of task durations),
+            parallelism (busy_time / wall_time), critical_path and
+            critical_path_time in seconds.
+        """
+        wall_time = 0.0
+        if self._run_start is not None:
+            wall_time = (self._run_end or time.time()) - self._run_start
+        busy_time = sum(result.duration or 0.0 for result in self._results.values())
+        critical_path, critical_path_time = self.get_critical_path()
+        return {
+            "wall_time": wall_time,
+            "busy_time": busy_time,
+            "parallelism": busy_time / wall_time if wall_time > 0 else 0.0,
+            "critical_path": critical_path,
+            "critical_path_time": critical_path_time,
+        }
 
     def clear(self) -> None:
         """Clear all tasks and results."""
@@ -341,6 +937,74 @@ class ParallelExecutor:
             self._tasks.clear()
             self._results.clear()
             self._cancelled.clear()
+            self._order = []
+            self._run_start = None
+            self._run_end = None
+            self._tokens.clear()
+            self._busy_seconds = 0.0
+            self._wasted_seconds = 0.0
+
+
+@dataclass
+class StreamMetrics:
+    """Throughput metrics for an AsyncParallelExecutor.imap() run."""
+
+    started: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    total_latency: float = 0.0  # Sum of per-item durations
+    start_time: float | None = None
+    end_time: float | None = None
+
+    @property
+    def finished(self) -> int:
+        """Items that reached a final state."""
+        return self.completed + self.failed + self.cancelled
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the run started (until it ended, if it has)."""
+        if self.start_time is None:
+            return 0.0
+        return (self.end_time or time.time()) - self.start_time
+
+    @property
+    def throughput(self) -> float:
+        """Finished items per second."""
+        elapsed = self.elapsed
+        return self.finished / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def average_latency(self) -> float:
+        """Mean per-item duration in seconds."""
+        return self.total_latency / self.finished if self.finished else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert metrics to a dictionary."""
+        return {
+            "started": self.started,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "average_latency": self.average_latency,
+        }
+
+
+async def _iterate(items: AsyncIterable[Any] | Iterable[Any]) -> AsyncGenerator[Any, None]:
+    """Iterate sync and async iterables alike."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
 
 
 class AsyncParallelExecutor:
@@ -349,6 +1013,10 @@ class AsyncParallelExecutor:
     Better for I/O-bound tasks like API calls where you want
     true async concurrency rather than thread pools.
 
+    For large or unbounded inputs use ``imap()``, which pulls work lazily,
+    keeps at most ``max_concurrent`` items in flight and yields results as
+    they complete.
+
     Usage:
         executor = AsyncParallelExecutor()
 
@@ -377,6 +1045,7 @@ class AsyncParallelExecutor:
         """
         self.max_concurrent = max_concurrent
         self.timeout = timeout
+        self.stream_metrics = StreamMetrics()  # Metrics of the current/last imap()
 
     async def gather(
         self,
@@ -454,3 +1123,109 @@ class AsyncParallelExecutor:
         """
         tasks = [(f"{task_id_prefix}_{i}", func(item)) for i, item in enumerate(items)]
         return await self.gather(tasks)
+
+    async def imap(
+        self,
+        func: Callable[[Any], Awaitable[T]],
+        items: AsyncIterable[Any] | Iterable[Any],
+        task_id_prefix: str = "task",
+        timeout: float | None = None,
+        cancel_on_error: bool = False,
+    ) -> AsyncIterator[TaskResult[T]]:
+        """Apply an async function to a stream of items, yielding as completed.
+
+        Items are pulled from ``items`` only when a slot is free, so at most
+        ``max_concurrent`` coroutines exist at once regardless of input size.
+        Progress is tracked in ``stream_metrics``.
+
+        Usage:
+            async for result in executor.imap(check_pr, pr_numbers):
+                if not result.is_success:
+                    ...
+
+        Args:
+            func: Async function to apply to each item.
+            items: Sync or async iterable of items; consumed lazily.
+            task_id_prefix: Prefix for generated task IDs (``<prefix>_<index>``).
+            timeout: Per-item timeout in seconds (default: the executor timeout).
+            cancel_on_error: If True, the first failure stops pulling items and
+                cancels everything still in flight.
+
+        Yields:
+            A TaskResult per item, in completion order. Items cancelled by
+            ``cancel_on_error`` are yielded with status CANCELLED.
+        """
+        item_timeout = self.timeout if timeout is None else timeout
+        metrics = StreamMetrics(start_time=time.time())
+        self.stream_metrics = metrics
+        source = _iterate(items)
+        pending: dict[asyncio.Task[Any], TaskResult[T]] = {}
+        exhausted = False
+        index = 0
+
+        def record(result: TaskResult[T]) -> TaskResult[T]:
+            result.end_time = time.time()
+            metrics.in_flight -= 1
+            metrics.total_latency += result.end_time - (result.start_time or result.end_time)
+            if result.status == TaskStatus.COMPLETED:
+                metrics.completed += 1
+            elif result.status == TaskStatus.CANCELLED:
+                metrics.cancelled += 1
+            else:
+                metrics.failed += 1
+            return result
+
+        try:
+            while True:
+                while not exhausted and len(pending) < self.max_concurrent:
+                    try:
+                        item = await source.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    result: TaskResult[T] = TaskResult(
+                        task_id=f"{task_id_prefix}_{index}",
+                        status=TaskStatus.RUNNING,
+                        start_time=time.time(),
+                    )
+                    index += 1
+                    task = asyncio.ensure_future(asyncio.wait_for(func(item), item_timeout))
+                    pending[task] = result
+                    metrics.started += 1
+                    metrics.in_flight += 1
+                    metrics.max_in_flight = max(metrics.max_in_flight, metrics.in_flight)
+
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                failed = False
+                for task in done:
+                    result = pending.pop(task)
+                    try:
+                        result.result = task.result()
+                        result.status = TaskStatus.COMPLETED
+                    except Exception as e:
+                        result.error = e
+                        result.status = TaskStatus.FAILED
+                        failed = True
+                    yield record(result)
+
+                if failed and cancel_on_error:
+                    exhausted = True
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    for result in pending.values():
+                        result.status = TaskStatus.CANCELLED
+                        yield record(result)
+                    pending.clear()
+        finally:
+            # Consumer stopped early: don't leave coroutines running
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            await source.aclose()
+            metrics.in_flight = 0
+            metrics.end_time = time.time()
@@ -0,0 +1,303 @@
+"""Plan Index - Structured, single-pass index of plan.md.
+
+Every consumer of the plan (task runner, orchestrator, API, MCP tools, event
+stream) used to re-scan the markdown with its own line parser. ``PlanIndex``
+parses a plan revision once and answers the common questions without
+touching the text again:
+
+- Task descriptions, complexity tags and PR/group membership
+- Completion bits with O(1) ``is_complete(i)`` and maintained counts
+- Group lookups (``tasks_in_group``, ``group_progress``)
+- Byte offsets of each checkbox mark, so toggling a task rewrites a single
+  byte in memory and on disk instead of re-serialising the whole plan
+
+Grammar (same as ``task_group.parse_tasks_with_groups``):
+- Tasks: ``- [ ] description`` / ``- [x] description`` (``X`` also counts),
+  leading indentation allowed
+- Groups: ``## PR 1: Name`` / ``### Group 2 - Name``
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+from claude_task_master.core.task_group import (
+    ParsedTask,
+    TaskComplexity,
+    TaskGroup,
+    parse_task_complexity,
+)
+
+# Pattern to match PR/Group headers: ### PR 1: Name, ### Group 1: Name, ## PR 1 - Name
+GROUP_HEADER_PATTERN = re.compile(
+    r"^#{2,3}\s+(?:PR|Group)\s*(\d+)(?::\s*|\s*[-–—]\s*)(.+)$", re.IGNORECASE
+)
+
+# Pattern to match tasks: - [ ] or - [x] followed by description
+TASK_PATTERN = re.compile(r"^-\s*\[([ xX])\]\s*(.+)$")
+
+_COMPLETE_MARK = ord("x")
+_INCOMPLETE_MARK = ord(" ")
+
+
+class PlanIndex:
+    """Parsed view of a plan revision with O(1) task lookups.
+
+    The plan is held as UTF-8 bytes; toggling a checkbox overwrites the
+    single mark byte, so offsets of all other tasks stay valid.
+
+    Usage:
+        index = PlanIndex.from_text(plan)
+        if not index.is_complete(3):
+            index.set_complete(3)
+            index.write_mark(plan_file, 3)  # Rewrites one byte on disk
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index. Use ``from_text`` to build one."""
+        self._data = bytearray()
+        self._mark_offsets: list[int] = []  # Byte offset of each task's mark
+        self._descriptions: list[str] = []
+        self._complexities: list[TaskComplexity] = []
+        self._group_ids: list[str] = []
+        self._group_names: list[str] = []
+        self._complete = bytearray()  # 1 if task i is complete
+        self._completed_count = 0
+        self._groups: list[TaskGroup] = []
+        self._groups_by_id: dict[str, TaskGroup] = {}
+
+    @classmethod
+    def from_text(cls, plan: str) -> PlanIndex:
+        """Build an index from plan markdown in a single pass.
+
+        Args:
+            plan: The plan markdown content.
+
+        Returns:
+            The populated PlanIndex.
+        """
+        index = cls()
+        index._data = bytearray(plan.encode("utf-8"))
+
+        current_group_id = "default"
+        current_group_name = "Default"
+        offset = 0  # Byte offset of the current line
+
+        for raw_line in plan.split("\n"):
+            line_bytes = len(raw_line.encode("utf-8"))
+            line = raw_line.strip()
+            if line.startswith("#"):
+                header = GROUP_HEADER_PATTERN.match(line)
+                if header:
+                    current_group_id = f"pr_{header.group(1)}"
+                    current_group_name = header.group(2).strip()
+                    index._ensure_group(current_group_id, current_group_name)
+            elif line.startswith("-"):
+                task = TASK_PATTERN.match(line)
+                if task:
+                    leading = len(raw_line) - len(raw_line.lstrip())
+                    prefix = raw_line[: leading + task.start(1)]
+                    index._add_task(
+                        mark_offset=offset + len(prefix.encode("utf-8")),
+                        description=task.group(2).strip(),
+                        complete=task.group(1).lower() == "x",
+                        group_id=current_group_id,
+                        group_name=current_group_name,
+                    )
+            offset += line_bytes + 1
+
+        return index
+
+    def _ensure_group(self, group_id: str, name: str) -> TaskGroup:
+        group = self._groups_by_id.get(group_id)
+        if group is None:
+            group = TaskGroup(id=group_id, name=name)
+            self._groups.append(group)
+            self._groups_by_id[group_id] = group
+        return group
+
+    def _add_task(
+        self,
+        mark_offset: int,
+        description: str,
+        complete: bool,
+        group_id: str,
+        group_name: str,
+    ) -> None:
+        task_index = len(self._descriptions)
+        self._mark_offsets.append(mark_offset)
+        self._descriptions.append(description)
+        self._complexities.append(parse_task_complexity(description)[0])
+        self._group_ids.append(group_id)
+        self._group_names.append(group_name)
+        self._complete.append(1 if complete else 0)
+        self._completed_count += complete
+        self._ensure_group(group_id, group_name).task_indices.append(task_index)
+
+    def copy(self) -> PlanIndex:
+        """Return an independent copy (cheaper than re-parsing)."""
+        clone = PlanIndex()
+        clone._data = bytearray(self._data)
+        clone._mark_offsets = self._mark_offsets  # Never mutated after build
+        clone._descriptions = self._descriptions
+        clone._complexities = self._complexities
+        clone._group_ids = self._group_ids
+        clone._group_names = self._group_names
+        clone._complete = bytearray(self._complete)
+        clone._completed_count = self._completed_count
+        clone._groups = self._groups
+        clone._groups_by_id = self._groups_by_id
+        return clone
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._descriptions)
+
+    @property
+    def text(self) -> str:
+        """Current plan markdown, including any toggles."""
+        return self._data.decode("utf-8")
+
+    @property
+    def total(self) -> int:
+        """Number of tasks in the plan."""
+        return len(self._descriptions)
+
+    @property
+    def completed_count(self) -> int:
+        """Number of tasks marked complete."""
+        return self._completed_count
+
+    @property
+    def pending_count(self) -> int:
+        """Number of tasks not yet marked complete."""
+        return len(self._descriptions) - self._completed_count
+
+    @property
+    def descriptions(self) -> list[str]:
+        """Task descriptions in plan order (including complexity tags)."""
+        return list(self._descriptions)
+
+    @property
+    def groups(self) -> list[TaskGroup]:
+        """PR/task groups in plan order.
+
+        Plans without group headers have a single "default" group.
+        """
+        return [
+            TaskGroup(id=group.id, name=group.name, task_indices=list(group.task_indices))
+            for group in self._groups
+        ]
+
+    def is_complete(self, task_index: int) -> bool:
+        """Check whether a task is marked complete. Out-of-range is False."""
+        if 0 <= task_index < len(self._complete):
+            return bool(self._complete[task_index])
+        return False
+
+    def description(self, task_index: int) -> str:
+        """Get a task's description."""
+        return self._descriptions[task_index]
+
+    def complexity(self, task_index: int) -> TaskComplexity:
+        """Get a task's complexity tag (CODING if untagged)."""
+        return self._complexities[task_index]
+
+    def group_id(self, task_index: int) -> str:
+        """Get the group/PR ID of a task, or "default" if out of range."""
+        if 0 <= task_index < len(self._group_ids):
+            return self._group_ids[task_index]
+        return "default"
+
+    def get_group(self, group_id: str) -> TaskGroup | None:
+        """Look up a group by ID."""
+        return self._groups_by_id.get(group_id)
+
+    def tasks_in_group(self, group_id: str) -> list[int]:
+        """Indices of the tasks in a group, in plan order."""
+        group = self._groups_by_id.get(group_id)
+        return list(group.task_indices) if group else []
+
+    def group_progress(self, group_id: str) -> tuple[int, int]:
+        """Get (completed, total) task counts for a group."""
+        indices = self.tasks_in_group(group_id)
+        return sum(self._complete[i] for i in indices), len(indices)
+
+    def items(self) -> list[tuple[str, bool]]:
+        """Get (description, completed) pairs in plan order."""
+        return [
+            (description, bool(done))
+            for description, done in zip(self._descriptions, self._complete, strict=True)
+        ]
+
+    def parsed_tasks(self) -> list[ParsedTask]:
+        """Get tasks as ParsedTask objects (task_group compatible)."""
+        return [
+            ParsedTask(
+                index=i,
+                description=self._descriptions[i],
+                group_id=self._group_ids[i],
+                group_name=self._group_names[i],
+                is_complete=bool(self._complete[i]),
+            )
+            for i in range(len(self._descriptions))
+        ]
+
+    # -------------------------------------------------------------------------
+    # Toggles
+    # -------------------------------------------------------------------------
+
+    def set_complete(self, task_index: int, complete: bool = True) -> bool:
+        """Set a task's checkbox in memory by overwriting its mark byte.
+
+        Args:
+            task_index: Index of the task.
+            complete: True to check the box, False to clear it.
+
+        Returns:
+            True if the task changed, False if it was already in that state.
+
+        Raises:
+            IndexError: If the task index is out of range.
+        """
+        if not 0 <= task_index < len(self._descriptions):
+            raise IndexError(f"Task index {task_index} out of range (0-{len(self) - 1})")
+        if bool(self._complete[task_index]) == complete:
+            return False
+        self._data[self._mark_offsets[task_index]] = (
+            _COMPLETE_MARK if complete else _INCOMPLETE_MARK
+        )
+        self._complete[task_index] = 1 if complete else 0
+        self._completed_count += 1 if complete else -1
+        return True
+
+    def write_mark(self, path: Path, task_index: int) -> None:
+        """Write a task's current mark byte to the plan file in place.
+
+        Only the single mark byte is rewritten. The file must be the revision
+        this index was built from.
+
+        Args:
+            path: Path to the plan file.
+            task_index: Index of the task whose mark to write.
+
+        Raises:
+            ValueError: If the file no longer matches this index.
+        """
+        offset = self._mark_offsets[task_index]
+        mark = self._data[offset : offset + 1]
+        fd = os.open(path, os.O_RDWR)
+        try:
+            if os.fstat(fd).st_size != len(self._data):
+                raise ValueError(f"{path} changed since the plan index was built")
+            current = os.pread(fd, 1, offset)
+            if current not in (b" ", b"x", b"X"):
+                raise ValueError(f"{path} changed since the plan index was built")
+            os.pwrite(fd, bytes(mark), offset)
+        finally:
+            os.close(fd)
@@ -4,15 +4,48 @@ from __future__ import annotations
 
 import json
 import shutil
-import subprocess
 from typing import TYPE_CHECKING
 
+from ..github.client_pr import COMMENTS_PER_THREAD
+from ..github.exceptions import GitHubError
 from . import console
 
 if TYPE_CHECKING:
     from ..github import GitHubClient
+    from .pr_snapshot import PRSnapshotCache
     from .state import StateManager
 
+# Review threads whose comments are fetched per request
+THREAD_FETCH_BATCH = 50
+
+THREAD_COMMENTS_FRAGMENT = f"""
+fragment ThreadComments on PullRequestReviewThread {{
+  comments(first: {COMMENTS_PER_THREAD}) {{
+    nodes {{
+      id
+      author {{ login }}
+      body
+      path
+      line
+    }}
+  }}
+}}
+"""
+
+# Aliased mutations per GraphQL request. GitHub's secondary rate limits count
+# content-creating mutations, so keep documents small enough to not trip them.
+MUTATION_BATCH_SIZE = 20
+
+
+def _is_current(stored: dict | None, thread: dict) -> bool:
+    """Check whether a stored thread still has the listed thread's comments."""
+    return (
+        stored is not None
+        and "comments" in stored
+        and stored.get("updated_at") == thread["updated_at"]
+        and stored.get("comment_count") == thread["comment_count"]
+    )
+
 
 class PRContextManager:
     """Manages PR context data: comments, CI logs, and resolution posting."""
@@ -21,15 +54,20 @@ class PRContextManager:
         self,
         state_manager: StateManager,
         github_client: GitHubClient,
+        snapshots: PRSnapshotCache | None = None,
     ):
         """Initialize PR context manager.
 
         Args:
             state_manager: State manager for file persistence.
             github_client: GitHub client for API calls.
+            snapshots: Per-cycle PR snapshots shared with the stage handler
+                (optional). Without it, status and review threads are
+                queried separately on every call.
         """
         self.state_manager = state_manager
         self.github_client = github_client
+        self.snapshots = snapshots
 
     def save_ci_failures(self, pr_number: int | None, *, _also_save_comments: bool = True) -> None:
         """Save CI failure logs to files for Claude to read.
@@ -55,23 +93,59 @@ class PRContextManager:
             pass  # Best effort cleanup
 
         try:
-            failed_logs = self.github_client.get_failed_run_logs(max_lines=50)
-        except Exception:
-            failed_logs = "Could not retrieve CI logs"
-
-        try:
-            pr_status = self.github_client.get_pr_status(pr_number)
-            for check in pr_status.check_details:
+            if self.snapshots is not None:
+                snapshot = self.snapshots.get(pr_number)
+                check_details, head_sha = snapshot.status.check_details, snapshot.head_sha
+            else:
+                check_details = self.github_client.get_pr_status(pr_number).check_details
+                head_sha = ""
+
+            latest_failed_logs: str | None = None
+            for check in check_details:
                 conclusion = (check.get("conclusion") or "").upper()
-                if conclusion in ("FAILURE", "ERROR"):
-                    self.state_manager.save_ci_failure(
-                        pr_number,
-                        check.get("name", "unknown"),
-                        failed_logs,
-                    )
+                if conclusion not in ("FAILURE", "ERROR"):
+                    continue
+                run_id = check.get("run_id")
+                if run_id:
+                    # The snapshot knows the check's run - no `gh run list` needed
+                    failed_logs = self._get_run_logs(head_sha, run_id)
+                else:
+                    if latest_failed_logs is None:
+                        latest_failed_logs = self._get_latest_failed_logs()
+                    failed_logs = latest_failed_logs
+                self.state_manager.save_ci_failure(
+                    pr_number,
+                    check.get("name", "unknown"),
+                    failed_logs,
+                )
         except Exception as e:
             console.warning(f"Could not save CI failures: {e}")
 
+    def _get_latest_failed_logs(self) -> str:
+        """Get failed-job logs of the latest failed workflow run."""
+        try:
+            return self.github_client.get_failed_run_logs(max_lines=50)
+        except Exception:
+            return "Could not retrieve CI logs"
+
+    def _get_run_logs(self, head_sha: str, run_id: int) -> str:
+        """Get failed-job logs of a workflow run, memoised per head SHA."""
+
+        def load() -> str:
+            logs = self.github_client.get_failed_run_logs(run_id=run_id, max_lines=50)
+            if logs.startswith("Error getting logs"):
+                raise RuntimeError(logs)  # Report it, but don't memoise it
+            return logs
+
+        try:
+            if self.snapshots is None:
+                return load()
+            return self.snapshots.run_logs(head_sha, run_id, load)
+        except RuntimeError as e:
+            return str(e)
+        except Exception:
+            return "Could not retrieve CI logs"
+
     def save_pr_comments(self, pr_number: int | None, *, _also_save_ci: bool = True) -> int:
         """Fetch and save PR comments to files for Claude to read.
 
@@ -89,94 +163,45 @@ class PRContextManager:
         if _also_save_ci:
             self.save_ci_failures(pr_number, _also_save_comments=False)
 
-        # Clear old comments to avoid stale data
-        try:
-            pr_dir = self.state_manager.get_pr_dir(pr_number)
-            comments_dir = pr_dir / "comments"
-            if comments_dir.exists():
-                shutil.rmtree(comments_dir)
-            # Also remove old summary file
-            summary_file = pr_dir / "comments_summary.txt"
-            if summary_file.exists():
-                summary_file.unlink()
-        except Exception:
-            pass  # Best effort cleanup
-
         try:
-            # Get repository info
-            result = subprocess.run(
-                ["gh", "repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner"],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            repo_info = result.stdout.strip()
-            owner, repo = repo_info.split("/")
-
-            # GraphQL query to get structured comments with thread IDs
-            query = """
-            query($owner: String!, $repo: String!, $pr: Int!) {
-              repository(owner: $owner, name: $repo) {
-                pullRequest(number: $pr) {
-                  reviewThreads(first: 100) {
-                    nodes {
-                      id
-                      isResolved
-                      comments(first: 10) {
-                        nodes {
-                          id
-                          author { login }
-                          body
-                          path
-                          line
-                        }
-                      }
-                    }
-                  }
-                }
-              }
-            }
-            """
-
-            result = subprocess.run(
-                [
-                    "gh",
-                    "api",
-                    "graphql",
-                    "-f",
-                    f"query={query}",
-                    "-F",
-                    f"owner={owner}",
-                    "-F",
-                    f"repo={repo}",
-                    "-F",
-                    f"pr={pr_number}",
-                ],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-
-            data = json.loads(result.stdout)
-            threads = data["data"]["repository"]["pullRequest"]["reviewThreads"]["nodes"]
+            threads = self._get_review_threads(pr_number)
 
             # Get already-addressed thread IDs to skip them
             addressed_threads = self.state_manager.get_addressed_threads(pr_number)
+            stored = self.state_manager.load_review_threads(pr_number)
 
-            # Convert to list of comment dicts - ONLY unresolved, actionable threads
-            comments = []
-            for thread in threads:
-                if thread["isResolved"]:
-                    continue  # Skip resolved threads
-                thread_id = thread.get("id")
+            # Only unresolved, unaddressed threads are shown; fetch the comments of
+            # those that are new or changed since the last sync
+            wanted = [
+                t for t in threads if not t["is_resolved"] and t["id"] not in addressed_threads
+            ]
+            stale = [t["id"] for t in wanted if not _is_current(stored.get(t["id"]), t)]
+            fetched = self._fetch_thread_comments(stale)
 
-                # Skip threads we've already addressed (replied to)
-                if thread_id in addressed_threads:
-                    continue
+            synced: dict[str, dict] = {}
+            for thread in threads:
+                entry = dict(thread)
+                del entry["id"]
+                previous = stored.get(thread["id"])
+                if thread["id"] in fetched:
+                    entry["comments"] = fetched[thread["id"]]
+                elif previous is not None and _is_current(previous, thread):
+                    entry["comments"] = previous["comments"]
+                synced[thread["id"]] = entry
+            self.state_manager.save_review_threads(pr_number, synced)
+            if stale:
+                console.detail(
+                    f"Fetched {len(fetched)} new or changed review threads "
+                    f"({len(wanted) - len(stale)} unchanged)"
+                )
 
-                for comment in thread["comments"]["nodes"]:
+            # Convert to list of comment dicts - ONLY unresolved, actionable threads
+            comments = []
+            for thread in wanted:
+                thread_id = thread["id"]
+                for comment in synced[thread_id].get("comments", []):
                     body = comment["body"]
-                    author = comment["author"]["login"] if comment.get("author") else "unknown"
+                    author = comment["author"]
 
                     # Skip non-actionable bot comments
                     if self._is_non_actionable_comment(author, body):
@@ -185,7 +210,7 @@ class PRContextManager:
                     comments.append(
                         {
                             "thread_id": thread_id,
-                            "comment_id": comment.get("id"),
+                            "comment_id": comment.get("comment_id"),
                             "author": author,
                             "body": body,
                             "path": comment.get("path"),
@@ -202,6 +227,70 @@ class PRContextManager:
             console.warning(f"Could not save PR comments: {e}")
             return 0
 
+    def _get_review_threads(self, pr_number: int) -> list[dict]:
+        """Get review-thread markers from this cycle's snapshot, or list them.
+
+        Args:
+            pr_number: The PR number.
+
+        Returns:
+            List of dicts with id, is_resolved, comment_count and updated_at.
+        """
+        if self.snapshots is not None:
+            return self.snapshots.get(pr_number).review_threads
+        return self.github_client.list_review_threads(pr_number)
+
+    def _fetch_thread_comments(self, thread_ids: list[str]) -> dict[str, list[dict]]:
+        """Fetch the comments of review threads by node ID.
+
+        Threads are fetched THREAD_FETCH_BATCH at a time as aliased ``node``
+        lookups. Threads deleted since they were listed are left out.
+
+        Args:
+            thread_ids: GraphQL thread IDs.
+
+        Returns:
+            Thread ID -> list of comment dicts (comment_id, author, body, path, line).
+        """
+        fetched: dict[str, list[dict]] = {}
+        for start in range(0, len(thread_ids), THREAD_FETCH_BATCH):
+            chunk = thread_ids[start : start + THREAD_FETCH_BATCH]
+            declarations = ", ".join(f"$id{i}: ID!" for i in range(len(chunk)))
+            fields = "\n".join(
+                f"  t{i}: node(id: $id{i}) {{ ...ThreadComments }}" for i in range(len(chunk))
+            )
+            query = f"query({declarations}) {{\n{fields}\n}}\n{THREAD_COMMENTS_FRAGMENT}"
+            args = [
+                arg for i, thread_id in enumerate(chunk) for arg in ("-f", f"id{i}={thread_id}")
+            ]
+            result = self.github_client.run_graphql(query, args, check=False)
+
+            # A thread deleted in the meantime comes back null with an error;
+            # anything without data is a real failure
+            payload = json.loads(result.stdout) if result.stdout.strip() else {}
+            data = payload.get("data")
+            if not data:
+                errors = payload.get("errors") or result.stderr.strip() or "no data"
+                raise RuntimeError(f"Could not fetch review threads: {errors}")
+
+            for i, thread_id in enumerate(chunk):
+                node = data.get(f"t{i}")
+                if not node:
+                    continue
+                fetched[thread_id] = [
+                    {
+                        "comment_id": comment.get("id"),
+                        "author": comment["author"]["login"]
+                        if comment.get("author")
+                        else "unknown",
+                        "body": comment["body"],
+                        "path": comment.get("path"),
+                        "line": comment.get("line"),
+                    }
+                    for comment in node["comments"]["nodes"]
+                ]
+        return fetched
+
     def post_comment_replies(self, pr_number: int | None) -> None:
         """Post replies to comments based on resolve-comments.json.
 
@@ -233,6 +322,8 @@ class PRContextManager:
 
             # Track successfully addressed thread IDs
             addressed_thread_ids: list[str] = []
+            replies: dict[str, str] = {}
+            to_resolve: set[str] = set()
 
             for resolution in resolutions:
                 thread_id = resolution.get("thread_id")
@@ -255,24 +346,29 @@ class PRContextManager:
                     "skipped": "⏭️",
                 }.get(action, "✅")
 
-                reply_body = f"{action_emoji} **{action.capitalize()}**: {message}"
-
-                try:
-                    self._post_thread_reply(thread_id, reply_body)
-                    console.detail(f"  Posted reply to thread {thread_id[:20]}...")
-
-                    # Mark this thread as addressed so we don't re-download it
-                    addressed_thread_ids.append(thread_id)
-
-                    # Resolve thread if action is "fixed"
-                    if action == "fixed":
-                        try:
-                            self.resolve_thread(thread_id)
-                            console.detail(f"  Resolved thread {thread_id[:20]}...")
-                        except Exception as resolve_err:
-                            console.warning(f"  Failed to resolve thread: {resolve_err}")
-                except Exception as e:
-                    console.warning(f"  Failed to post reply: {e}")
+                replies[thread_id] = f"{action_emoji} **{action.capitalize()}**: {message}"
+                # Resolve thread if action is "fixed"
+                if action == "fixed":
+                    to_resolve.add(thread_id)
+
+            # Post all replies, then resolve the threads whose reply went through
+            reply_errors = self._post_thread_replies(replies)
+            resolve_ids = []
+            for thread_id, error in reply_errors.items():
+                if error is not None:
+                    console.warning(f"  Failed to post reply: {error}")
+                    continue
+                console.detail(f"  Posted reply to thread {thread_id[:20]}...")
+                # Mark this thread as addressed so we don't re-download it
+                addressed_thread_ids.append(thread_id)
+                if thread_id in to_resolve:
+                    resolve_ids.append(thread_id)
+
+            for thread_id, error in self._resolve_threads(resolve_ids).items():
+                if error is not None:
+                    console.warning(f"  Failed to resolve thread: {error}")
+                else:
+                    console.detail(f"  Resolved thread {thread_id[:20]}...")
 
             # Persist addressed thread IDs to avoid re-downloading them
             if addressed_thread_ids:
@@ -290,71 +386,123 @@ class PRContextManager:
         except Exception as e:
             console.warning(f"Could not post comment replies: {e}")
 
-    def _post_thread_reply(self, thread_id: str, body: str) -> None:
-        """Post a reply to a review thread.
+    def _post_thread_replies(self, replies: dict[str, str]) -> dict[str, str | None]:
+        """Post replies to many review threads with batched GraphQL mutations.
 
         Args:
-            thread_id: The GraphQL thread ID.
-            body: The reply message body.
-        """
-        # Use GraphQL mutation to add a reply
-        mutation = """
-        mutation($threadId: ID!, $body: String!) {
-          addPullRequestReviewThreadReply(input: {pullRequestReviewThreadId: $threadId, body: $body}) {
-            comment {
-              id
-            }
-          }
-        }
-        """
+            replies: Reply body per GraphQL thread ID.
 
-        subprocess.run(
+        Returns:
+            Error message per thread ID (None if the reply was posted).
+        """
+        return self._run_batched_mutations(
+            "addPullRequestReviewThreadReply("
+            "input: {pullRequestReviewThreadId: $threadId, body: $body}) { comment { id } }",
+            {"threadId": "ID!", "body": "String!"},
             [
-                "gh",
-                "api",
-                "graphql",
-                "-f",
-                f"query={mutation}",
-                "-F",
-                f"threadId={thread_id}",
-                "-F",
-                f"body={body}",
+                (thread_id, {"threadId": thread_id, "body": body})
+                for thread_id, body in replies.items()
             ],
-            check=True,
-            capture_output=True,
-            text=True,
         )
 
-    def resolve_thread(self, thread_id: str) -> None:
-        """Resolve a review thread.
+    def _resolve_threads(self, thread_ids: list[str]) -> dict[str, str | None]:
+        """Resolve many review threads with batched GraphQL mutations.
 
         Args:
-            thread_id: The GraphQL thread ID to resolve.
+            thread_ids: GraphQL thread IDs to resolve.
+
+        Returns:
+            Error message per thread ID (None if the thread was resolved).
         """
-        mutation = """
-        mutation($threadId: ID!) {
-          resolveReviewThread(input: {threadId: $threadId}) {
-            thread {
-              isResolved
-            }
-          }
-        }
+        return self._run_batched_mutations(
+            "resolveReviewThread(input: {threadId: $threadId}) { thread { isResolved } }",
+            {"threadId": "ID!"},
+            [(thread_id, {"threadId": thread_id}) for thread_id in thread_ids],
+        )
+
+    def _run_batched_mutations(
+        self,
+        field: str,
+        variable_types: dict[str, str],
+        items: list[tuple[str, dict[str, str]]],
+    ) -> dict[str, str | None]:
+        """Run one mutation per item, packed into aliased GraphQL documents.
+
+        Each document holds up to MUTATION_BATCH_SIZE mutations ``m0``, ``m1``,
+        ... with their own variables (``$threadId0``, ...). GitHub runs every
+        aliased mutation even if another fails, and reports failures in
+        ``errors`` with the alias as the first ``path`` element, so each
+        failure maps back to its item.
+
+        Args:
+            field: Mutation field using the variables in variable_types.
+            variable_types: GraphQL type of each variable.
+            items: (thread ID, variable values) per mutation.
+
+        Returns:
+            Error message per thread ID (None on success).
         """
+        results: dict[str, str | None] = {}
+        for start in range(0, len(items), MUTATION_BATCH_SIZE):
+            chunk = items[start : start + MUTATION_BATCH_SIZE]
+            declarations: list[str] = []
+            fields: list[str] = []
+            args: list[str] = []
+            for index, (_, values) in enumerate(chunk):
+                aliased = field
+                for name, graphql_type in variable_types.items():
+                    aliased = aliased.replace(f"${name}", f"${name}{index}")
+                    declarations.append(f"${name}{index}: {graphql_type}")
+                    # -f passes values as raw strings (-F would expand @file)
+                    args += ["-f", f"{name}{index}={values[name]}"]
+                fields.append(f"m{index}: {aliased}")
+            document = f"mutation({', '.join(declarations)}) {{\n  " + "\n  ".join(fields) + "\n}"
+
+            errors = self._run_mutation_document(document, args, len(chunk))
+            for index, (thread_id, _) in enumerate(chunk):
+                results[thread_id] = errors[index]
+        return results
+
+    def _run_mutation_document(
+        self, document: str, args: list[str], count: int
+    ) -> list[str | None]:
+        """Run an aliased mutation document and map errors to its aliases.
 
-        subprocess.run(
-            [
-                "gh",
-                "api",
-                "graphql",
-                "-f",
-                f"query={mutation}",
-                "-F",
-                f"threadId={thread_id}",
-            ],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+        Args:
+            document: GraphQL document with aliases m0..m{count-1}.
+            args: Variable arguments for ``gh api graphql``.
+            count: Number of aliased mutations.
+
+        Returns:
+            Error message per alias index (None on success).
+        """
+        try:
+            result = self.github_client.run_graphql(document, args, check=False)
+        except (GitHubError, OSError) as e:
+            return [str(e)] * count
+
+        try:
+            payload = json.loads(result.stdout)
+        except ValueError:
+            payload = None
+        if not isinstance(payload, dict):
+            error = result.stderr.strip() or f"gh exited with status {result.returncode}"
+            return [error] * count
+
+        general_error: str | None = None
+        alias_errors: dict[str, str] = {}
+        for error in payload.get("errors") or []:
+            message = str(error.get("message", error))
+            path = error.get("path") or []
+            if path and isinstance(path[0], str):
+                alias_errors.setdefault(path[0], message)
+            else:
+                general_error = general_error or message
+        if general_error is None and not alias_errors and "data" not in payload:
+            # REST-style error body, e.g. {"message": "Bad credentials"}
+            general_error = str(payload.get("message") or result.stderr.strip() or payload)
+
+        return [alias_errors.get(f"m{index}", general_error) for index in range(count)]
 
     def _get_resolved_thread_ids(self, pr_number: int) -> set[str]:
         """Get IDs of threads that are already resolved on GitHub.
@@ -366,53 +514,8 @@ class PRContextManager:
             Set of thread IDs that are already resolved.
         """
         try:
-            result = subprocess.run(
-                ["gh", "repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner"],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            repo_info = result.stdout.strip()
-            owner, repo = repo_info.split("/")
-
-            query = """
-            query($owner: String!, $repo: String!, $pr: Int!) {
-              repository(owner: $owner, name: $repo) {
-                pullRequest(number: $pr) {
-                  reviewThreads(first: 100) {
-                    nodes {
-                      id
-                      isResolved
-                    }
-                  }
-                }
-              }
-            }
-            """
-
-            result = subprocess.run(
-                [
-                    "gh",
-                    "api",
-                    "graphql",
-                    "-f",
-                    f"query={query}",
-                    "-F",
-                    f"owner={owner}",
-                    "-F",
-                    f"repo={repo}",
-                    "-F",
-                    f"pr={pr_number}",
-                ],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-
-            data = json.loads(result.stdout)
-            threads = data["data"]["repository"]["pullRequest"]["reviewThreads"]["nodes"]
-
-            return {t["id"] for t in threads if t["isResolved"]}
+            threads = self._get_review_threads(pr_number)
+            return {t["id"] for t in threads if t["is_resolved"]}
 
         except Exception as e:
             console.warning(f"Could not fetch resolved threads: {e}")
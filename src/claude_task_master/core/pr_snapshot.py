@@ -0,0 +1,114 @@
+"""Per-cycle PR snapshots shared by the workflow stages.
+
+One pass of the PR workflow used to ask GitHub for the same PR several
+times: the stage handler's ``get_pr_status``, PRContextManager's review-thread
+listing (twice when addressing reviews) and ``gh run list`` to find the
+failed run. ``PRSnapshotCache`` fetches a ``PRSnapshot`` once per PR per
+cycle and hands the same object to every consumer.
+
+Failed CI logs only depend on the head commit, so they are memoised per head
+SHA across cycles and dropped once the PR's head moves.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..github import GitHubClient, PRSnapshot
+
+
+class PRSnapshotCache:
+    """Memoise PR snapshots for the current workflow cycle.
+
+    Example:
+        >>> snapshots = PRSnapshotCache(github_client)
+        >>> snapshots.begin_cycle()
+        >>> snapshot = snapshots.get(42)  # One GraphQL query
+        >>> snapshots.get(42) is snapshot  # Reused for the rest of the cycle
+        True
+    """
+
+    def __init__(self, github_client: GitHubClient) -> None:
+        """Initialize the cache.
+
+        Args:
+            github_client: GitHub client that fetches the snapshots.
+        """
+        self.github_client = github_client
+        self.fetches = 0
+        self.hits = 0
+        self._cycle = 0
+        self._snapshots: dict[int, tuple[PRSnapshot, int]] = {}  # PR -> (snapshot, cycle)
+        self._run_logs: dict[tuple[str, int], str] = {}  # (head SHA, run ID) -> logs
+        self._lock = threading.Lock()
+
+    def begin_cycle(self) -> None:
+        """Start a new workflow cycle; snapshots are refetched on next use."""
+        with self._lock:
+            self._cycle += 1
+
+    def get(self, pr_number: int) -> PRSnapshot:
+        """Get the PR's snapshot for this cycle, fetching it on first use.
+
+        Args:
+            pr_number: The PR number.
+
+        Returns:
+            The PR snapshot.
+
+        Raises:
+            GitHubError: If the query fails.
+            GitHubTimeoutError: If the query times out.
+        """
+        with self._lock:
+            cached = self._snapshots.get(pr_number)
+            if cached is not None and cached[1] == self._cycle:
+                self.hits += 1
+                return cached[0]
+
+        snapshot = self.github_client.get_pr_snapshot(pr_number)
+        with self._lock:
+            self.fetches += 1
+            previous = self._snapshots.get(pr_number)
+            if previous is not None and previous[0].head_sha != snapshot.head_sha:
+                self._forget_head(previous[0].head_sha)
+            self._snapshots[pr_number] = (snapshot, self._cycle)
+        return snapshot
+
+    def invalidate(self, pr_number: int) -> None:
+        """Refetch the PR on next use (e.g., after pushing to it)."""
+        with self._lock:
+            cached = self._snapshots.get(pr_number)
+            if cached is not None:
+                self._snapshots[pr_number] = (cached[0], -1)
+
+    def run_logs(self, head_sha: str, run_id: int, load: Callable[[], str]) -> str:
+        """Get failed-job logs of a workflow run, loading them once per head SHA.
+
+        Exceptions from ``load`` propagate and nothing is cached.
+
+        Args:
+            head_sha: Head commit the run belongs to.
+            run_id: Workflow run ID.
+            load: Fetches the logs on a miss.
+
+        Returns:
+            The run's failed-job logs.
+        """
+        if not head_sha:
+            return load()
+        key = (head_sha, run_id)
+        with self._lock:
+            if key in self._run_logs:
+                return self._run_logs[key]
+        logs = load()
+        with self._lock:
+            self._run_logs[key] = logs
+        return logs
+
+    def _forget_head(self, head_sha: str) -> None:
+        for key in [k for k in self._run_logs if k[0] == head_sha]:
+            del self._run_logs[key]
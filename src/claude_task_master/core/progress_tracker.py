@@ -1,7 +1,7 @@
 """Progress Tracker for stall/deadlock detection and cost tracking.
 
 Monitors task execution to detect stalls, infinite loops, and tracks
-resource usage (tokens, API costs) for observability.
+resource usage (tokens, API costs, GitHub polling) for observability.
 """
 
 from __future__ import annotations
@@ -58,6 +58,30 @@ class SessionMetrics:
         return input_cost + output_cost
 
 
+@dataclass
+class PRPollMetrics:
+    """GitHub polling metrics for a single PR."""
+
+    pr_number: int
+    polls: int = 0
+    unchanged_polls: int = 0  # Polls answered entirely from 304s
+    quota_points: int = 0  # GitHub API rate-limit points spent
+
+
+@dataclass
+class GitHubCycleMetrics:
+    """GitHub calls made by the workflow cycles of one stage."""
+
+    stage: str
+    cycles: int = 0
+    calls: int = 0
+
+    @property
+    def calls_per_cycle(self) -> float:
+        """Average GitHub calls per cycle."""
+        return self.calls / self.cycles if self.cycles else 0.0
+
+
 @dataclass
 class TrackerConfig:
     """Configuration for progress tracking."""
@@ -119,6 +143,9 @@ class ExecutionTracker:
     _task_attempts: dict[int, int] = field(default_factory=dict)
     _last_progress_time: float = field(default_factory=time.time)
     _last_task_index: int = field(default=-1, init=False)
+    _pr_polls: dict[int, PRPollMetrics] = field(default_factory=dict, init=False)
+    _rate_limit_remaining: int | None = field(default=None, init=False)
+    _github_cycles: dict[str, GitHubCycleMetrics] = field(default_factory=dict, init=False)
 
     def start_session(
         self,
@@ -203,6 +230,40 @@ class ExecutionTracker:
         if self._current_session:
             self._current_session.errors += 1
 
+    def record_pr_poll(
+        self,
+        pr_number: int,
+        unchanged: bool = False,
+        quota_points: int = 0,
+        rate_limit_remaining: int | None = None,
+    ) -> None:
+        """Record a GitHub status poll of a PR.
+
+        Args:
+            pr_number: The polled PR.
+            unchanged: Whether the poll found nothing new (all 304s).
+            quota_points: GitHub API rate-limit points the poll spent.
+            rate_limit_remaining: REST quota left, if the response reported it.
+        """
+        metrics = self._pr_polls.setdefault(pr_number, PRPollMetrics(pr_number=pr_number))
+        metrics.polls += 1
+        if unchanged:
+            metrics.unchanged_polls += 1
+        metrics.quota_points += quota_points
+        if rate_limit_remaining is not None:
+            self._rate_limit_remaining = rate_limit_remaining
+
+    def record_github_cycle(self, stage: str, calls: int) -> None:
+        """Record the GitHub calls made by one workflow cycle.
+
+        Args:
+            stage: Workflow stage the cycle ran.
+            calls: GitHub calls (gh processes or HTTP requests) it made.
+        """
+        metrics = self._github_cycles.setdefault(stage, GitHubCycleMetrics(stage=stage))
+        metrics.cycles += 1
+        metrics.calls += calls
+
     def record_task_progress(self, task_index: int) -> None:
         """Record progress to a new task.
 
@@ -280,8 +341,20 @@ class ExecutionTracker:
         Returns:
             Dictionary with summary statistics.
         """
+        pr_polls = {
+            pr: {
+                "polls": m.polls,
+                "unchanged_polls": m.unchanged_polls,
+                "quota_points": m.quota_points,
+            }
+            for pr, m in self._pr_polls.items()
+        }
+        github_cycles = {
+            stage: {"cycles": m.cycles, "calls": m.calls, "calls_per_cycle": m.calls_per_cycle}
+            for stage, m in self._github_cycles.items()
+        }
         if not self._sessions:
-            return {
+            summary: dict[str, Any] = {
                 "total_sessions": 0,
                 "total_duration": 0,
                 "total_tokens": 0,
@@ -289,6 +362,12 @@ class ExecutionTracker:
                 "avg_session_duration": 0,
                 "success_rate": 0,
             }
+            if pr_polls:
+                summary["pr_polls"] = pr_polls
+                summary["github_rate_limit_remaining"] = self._rate_limit_remaining
+            if github_cycles:
+                summary["github_cycles"] = github_cycles
+            return summary
 
         total_duration = sum(s.duration for s in self._sessions)
         total_tokens = sum(s.total_tokens for s in self._sessions)
@@ -305,6 +384,9 @@ class ExecutionTracker:
             "total_api_calls": sum(s.api_calls for s in self._sessions),
             "total_tool_calls": sum(s.tool_calls for s in self._sessions),
             "total_errors": sum(s.errors for s in self._sessions),
+            "pr_polls": pr_polls,
+            "github_rate_limit_remaining": self._rate_limit_remaining,
+            "github_cycles": github_cycles,
         }
 
     def should_abort(self) -> tuple[bool, str]:
@@ -352,6 +434,25 @@ class ExecutionTracker:
             f"Tool Calls: {summary.get('total_tool_calls', 0)}",
             f"Errors: {summary.get('total_errors', 0)}",
         ]
+        pr_polls = summary.get("pr_polls")
+        if pr_polls:
+            lines += ["", "=== GitHub Polling ==="]
+            for pr, polls in sorted(pr_polls.items()):
+                lines.append(
+                    f"PR #{pr}: {polls['polls']} polls ({polls['unchanged_polls']} unchanged), "
+                    f"{polls['quota_points']} API points"
+                )
+            remaining = summary.get("github_rate_limit_remaining")
+            if remaining is not None:
+                lines.append(f"REST Rate Limit Remaining: {remaining}")
+        github_cycles = summary.get("github_cycles")
+        if github_cycles:
+            lines += ["", "=== GitHub Calls per Cycle ==="]
+            for stage, cycles in github_cycles.items():
+                lines.append(
+                    f"{stage}: {cycles['calls_per_cycle']:.1f} calls/cycle "
+                    f"({cycles['calls']} calls in {cycles['cycles']} cycles)"
+                )
         return "\n".join(lines)
 
     def reset(self) -> None:
@@ -359,5 +460,8 @@ class ExecutionTracker:
         self._sessions.clear()
         self._current_session = None
         self._task_attempts.clear()
+        self._pr_polls.clear()
+        self._rate_limit_remaining = None
+        self._github_cycles.clear()
         self._last_progress_time = time.time()
         self._last_task_index = -1
@@ -1,4 +1,8 @@
-"""Rate Limiting Configuration - Configurable exponential backoff for API calls."""
+"""Rate Limiting Configuration - Configurable exponential backoff for API calls.
+
+The policies and the shared token bucket built from this configuration live
+in ``core.retry``.
+"""
 
 from typing import Any
 
@@ -16,6 +20,9 @@ class RateLimitConfig(BaseModel):
         initial_backoff: Initial backoff time in seconds before first retry.
         max_backoff: Maximum backoff time in seconds between retries.
         backoff_multiplier: Exponential multiplier for backoff time between retries.
+        requests_per_second: Sustained query rate shared by concurrent sessions.
+            None (the default) leaves queries unlimited.
+        burst: Queries that may start at once before requests_per_second applies.
     """
 
     max_retries: int = Field(
@@ -43,6 +50,19 @@ class RateLimitConfig(BaseModel):
         description="Exponential backoff multiplier (1-10)",
     )
 
+    requests_per_second: float | None = Field(
+        default=None,
+        gt=0,
+        le=100,
+        description="Sustained query rate shared by concurrent sessions (0-100/s, None: unlimited)",
+    )
+    burst: int = Field(
+        default=8,
+        ge=1,
+        le=100,
+        description="Queries that may start at once (1-100)",
+    )
+
     @field_validator("max_backoff")
     @classmethod
     def validate_max_backoff(cls, v: float, info: Any) -> float:
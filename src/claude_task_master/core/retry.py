@@ -0,0 +1,493 @@
+"""Retry Engine - Shared backoff policies and rate limiter for API calls.
+
+One retry engine is used for agent queries, ParallelExecutor tasks and
+webhook deliveries:
+
+- ``RetryPolicy``: decorrelated-jitter backoff (each delay is drawn between
+  ``base`` and ``multiplier`` times the previous delay, capped at ``cap``),
+  optionally floored by a server-sent ``Retry-After``.
+- ``RetryPolicies``: one policy per ``ErrorKind`` (rate limit, 5xx, timeout,
+  connection, other), built from ``RateLimitConfig``.
+- ``Backoff``: the delay sequence of one operation's retries.
+- ``TokenBucket``: thread-safe request limiter shared by concurrent sessions.
+  After a 429 the whole bucket is paused, so parallel sessions back off
+  together and then resume one at a time instead of stampeding the API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from .agent_exceptions import (
+    APIConnectionError,
+    APIRateLimitError,
+    APIServerError,
+    APITimeoutError,
+)
+
+if TYPE_CHECKING:
+    from .rate_limit import RateLimitConfig
+
+# Default configuration
+DEFAULT_BASE = 1.0  # seconds
+DEFAULT_CAP = 30.0  # seconds
+DEFAULT_MULTIPLIER = 3.0
+DEFAULT_MAX_RETRY_AFTER = 300.0  # Ignore longer server hints beyond this
+
+
+class ErrorKind(Enum):
+    """Classes of retryable errors, each with its own policy."""
+
+    RATE_LIMIT = "rate_limit"  # HTTP 429 / rate limit exceeded
+    SERVER = "server"  # HTTP 5xx
+    TIMEOUT = "timeout"  # Request timed out
+    CONNECTION = "connection"  # Connection refused/reset, DNS failure
+    OTHER = "other"  # Anything else that is retried
+
+
+# =============================================================================
+# Error Classification
+# =============================================================================
+
+
+def classify_error(error: BaseException) -> ErrorKind:
+    """Map an exception to the ErrorKind whose policy applies to it.
+
+    Args:
+        error: The exception raised by the failed attempt.
+
+    Returns:
+        The matching ErrorKind (OTHER if nothing more specific matches).
+    """
+    if isinstance(error, APIRateLimitError):
+        return ErrorKind.RATE_LIMIT
+    if isinstance(error, APIServerError):
+        return ErrorKind.SERVER
+    if isinstance(error, (APITimeoutError, TimeoutError)):
+        return ErrorKind.TIMEOUT
+    if isinstance(error, (APIConnectionError, ConnectionError)):
+        return ErrorKind.CONNECTION
+    return ErrorKind.OTHER
+
+
+def classify_status(status_code: int) -> ErrorKind | None:
+    """Map an HTTP status code to an ErrorKind.
+
+    Args:
+        status_code: HTTP response status code.
+
+    Returns:
+        RATE_LIMIT for 429, SERVER for 500/502/503/504, None otherwise
+        (not retryable).
+    """
+    if status_code == 429:
+        return ErrorKind.RATE_LIMIT
+    if status_code in (500, 502, 503, 504):
+        return ErrorKind.SERVER
+    return None
+
+
+def parse_retry_after(headers: Mapping[str, str], now: float | None = None) -> float | None:
+    """Get the seconds a server asked us to wait from response headers.
+
+    Understands ``retry-after-ms``, ``Retry-After`` (seconds or an HTTP date)
+    and ``X-RateLimit-Reset``/``RateLimit-Reset`` (seconds, a Unix timestamp
+    or an ISO 8601 time).
+
+    Args:
+        headers: Response headers (any case).
+        now: Current Unix time, for tests. Defaults to time.time().
+
+    Returns:
+        Seconds to wait (>= 0), or None if no usable header is present.
+    """
+    lowered = {k.lower(): v for k, v in headers.items()}
+    now = time.time() if now is None else now
+
+    value = lowered.get("retry-after-ms")
+    if value is not None:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+
+    value = lowered.get("retry-after")
+    if value is not None:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                when = None
+            if when is not None:
+                if when.tzinfo is None:
+                    when = when.replace(tzinfo=timezone.utc)
+                return max(0.0, when.timestamp() - now)
+
+    for name in ("x-ratelimit-reset", "ratelimit-reset"):
+        value = lowered.get(name)
+        if value is None:
+            continue
+        try:
+            reset = float(value)
+        except ValueError:
+            try:
+                reset = datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+            except ValueError:
+                continue
+        # Large values are Unix timestamps, small ones are seconds from now
+        return max(0.0, reset - now) if reset > 1e9 else max(0.0, reset)
+
+    return None
+
+
+def retry_after_from_error(error: BaseException) -> float | None:
+    """Get a server wait hint carried by an exception.
+
+    Checks a ``retry_after`` attribute, then the headers of an attached HTTP
+    ``response`` (SDK errors), on the error and its original error.
+
+    Args:
+        error: The exception raised by the failed attempt.
+
+    Returns:
+        Seconds to wait, or None if the error carries no hint.
+    """
+    for candidate in (error, getattr(error, "original_error", None)):
+        if candidate is None:
+            continue
+        retry_after = getattr(candidate, "retry_after", None)
+        if isinstance(retry_after, (int, float)):
+            return float(retry_after)
+        headers = getattr(getattr(candidate, "response", None), "headers", None)
+        if isinstance(headers, Mapping):
+            parsed = parse_retry_after(headers)
+            if parsed is not None:
+                return parsed
+    return None
+
+
+def status_code_from_error(error: BaseException) -> int | None:
+    """Get the HTTP status code carried by an exception.
+
+    Checks a ``status_code`` attribute, then the status of an attached HTTP
+    ``response`` (SDK errors), on the error and its original error.
+
+    Args:
+        error: The exception raised by the failed attempt.
+
+    Returns:
+        The status code, or None if the error carries none.
+    """
+    for candidate in (error, getattr(error, "original_error", None)):
+        if candidate is None:
+            continue
+        for status in (
+            getattr(candidate, "status_code", None),
+            getattr(getattr(candidate, "response", None), "status_code", None),
+        ):
+            if isinstance(status, int) and not isinstance(status, bool):
+                return status
+    return None
+
+
+# =============================================================================
+# Policies
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Decorrelated-jitter backoff for one class of errors.
+
+    Attributes:
+        base: Minimum delay in seconds.
+        cap: Maximum jittered delay in seconds.
+        multiplier: Each delay is drawn from [base, previous * multiplier].
+        respect_retry_after: Whether a server Retry-After hint sets a floor.
+        max_retry_after: Longest Retry-After hint that is honoured.
+    """
+
+    base: float = DEFAULT_BASE
+    cap: float = DEFAULT_CAP
+    multiplier: float = DEFAULT_MULTIPLIER
+    respect_retry_after: bool = True
+    max_retry_after: float = DEFAULT_MAX_RETRY_AFTER
+
+    def next_delay(
+        self,
+        previous: float | None = None,
+        retry_after: float | None = None,
+        rng: random.Random | None = None,
+    ) -> float:
+        """Compute the delay before the next retry.
+
+        Args:
+            previous: The previous delay in this sequence (None for the first).
+            retry_after: Server-requested wait, in seconds.
+            rng: Random source, for tests.
+
+        Returns:
+            Delay in seconds.
+        """
+        upper = max(self.base, (previous or self.base) * self.multiplier)
+        delay = min(self.cap, (rng or random).uniform(self.base, upper))
+        if self.respect_retry_after and retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_retry_after))
+        return delay
+
+
+@dataclass(frozen=True)
+class RetryPolicies:
+    """One RetryPolicy per ErrorKind.
+
+    Example:
+        >>> policies = RetryPolicies.from_rate_limit_config(RateLimitConfig())
+        >>> backoff = policies.backoff()
+        >>> backoff.next_delay(ErrorKind.RATE_LIMIT, retry_after=20)
+        20.0
+    """
+
+    rate_limit: RetryPolicy = field(default_factory=RetryPolicy)
+    server: RetryPolicy = field(default_factory=RetryPolicy)
+    timeout: RetryPolicy = field(default_factory=RetryPolicy)
+    connection: RetryPolicy = field(default_factory=RetryPolicy)
+    other: RetryPolicy = field(default_factory=RetryPolicy)
+
+    @classmethod
+    def uniform(
+        cls,
+        base: float = DEFAULT_BASE,
+        cap: float = DEFAULT_CAP,
+        multiplier: float = DEFAULT_MULTIPLIER,
+        max_retry_after: float = DEFAULT_MAX_RETRY_AFTER,
+    ) -> RetryPolicies:
+        """Use the same backoff for every error kind (Retry-After still honoured)."""
+        policy = RetryPolicy(
+            base=base, cap=cap, multiplier=multiplier, max_retry_after=max_retry_after
+        )
+        return cls(policy, policy, policy, policy, policy)
+
+    @classmethod
+    def from_rate_limit_config(cls, config: RateLimitConfig) -> RetryPolicies:
+        """Build policies from a RateLimitConfig.
+
+        Rate limits start one multiplier step higher than other errors and
+        honour Retry-After; timeouts are capped at half of max_backoff since
+        the attempt itself already waited.
+
+        Args:
+            config: Rate limiting configuration.
+
+        Returns:
+            RetryPolicies for agent queries.
+        """
+        base = config.initial_backoff
+        cap = config.max_backoff
+        multiplier = config.backoff_multiplier
+        default = RetryPolicy(base=base, cap=cap, multiplier=multiplier)
+        return cls(
+            rate_limit=RetryPolicy(
+                base=min(base * multiplier, cap), cap=cap, multiplier=multiplier
+            ),
+            server=default,
+            timeout=RetryPolicy(base=base, cap=max(base, cap / 2), multiplier=multiplier),
+            connection=default,
+            other=default,
+        )
+
+    def policy_for(self, kind: ErrorKind) -> RetryPolicy:
+        """Get the policy for an error kind."""
+        return getattr(self, kind.value)  # type: ignore[no-any-return]
+
+    def backoff(self, rng: random.Random | None = None) -> Backoff:
+        """Start a new delay sequence for one operation's retries."""
+        return Backoff(self, rng=rng)
+
+
+class Backoff:
+    """The delays between one operation's retries.
+
+    Attributes:
+        attempts: Number of delays handed out so far.
+        previous: The last delay handed out, in seconds.
+    """
+
+    def __init__(self, policies: RetryPolicies, rng: random.Random | None = None) -> None:
+        """Initialize the sequence.
+
+        Args:
+            policies: Policies per error kind.
+            rng: Random source, for tests.
+        """
+        self.policies = policies
+        self.attempts = 0
+        self.previous: float | None = None
+        self._rng = rng
+
+    def next_delay(self, kind: ErrorKind, retry_after: float | None = None) -> float:
+        """Compute the delay before the next retry.
+
+        Args:
+            kind: The class of the error that failed the last attempt.
+            retry_after: Server-requested wait, in seconds.
+
+        Returns:
+            Delay in seconds.
+        """
+        delay = self.policies.policy_for(kind).next_delay(self.previous, retry_after, self._rng)
+        self.previous = delay
+        self.attempts += 1
+        return delay
+
+    async def wait(self, kind: ErrorKind, retry_after: float | None = None) -> float:
+        """Sleep for the next delay and return it."""
+        delay = self.next_delay(kind, retry_after)
+        await asyncio.sleep(delay)
+        return delay
+
+    def wait_sync(self, kind: ErrorKind, retry_after: float | None = None) -> float:
+        """Sleep for the next delay (blocking) and return it."""
+        delay = self.next_delay(kind, retry_after)
+        time.sleep(delay)
+        return delay
+
+
+# =============================================================================
+# Token Bucket
+# =============================================================================
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by concurrent callers.
+
+    Requests reserve a token and wait until it is available, so callers are
+    served in reservation order at ``rate`` per second after an initial burst
+    of ``capacity``. ``pause()`` empties the bucket and stops refills until
+    the pause ends, so every caller waits out a server rate limit together.
+    With ``rate=math.inf`` the bucket never throttles; callers only wait out
+    pauses.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the bucket (full).
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of tokens (burst size).
+            clock: Monotonic clock, for tests.
+
+        Raises:
+            ValueError: If rate or capacity is not positive.
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()  # Refills resume from here (may be in the future)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_rate_limit_config(cls, config: RateLimitConfig) -> TokenBucket:
+        """Create a bucket from RateLimitConfig.requests_per_second and burst.
+
+        Without a configured rate the bucket is unthrottled (``rate=inf``):
+        queries aren't limited, but a 429 still pauses every caller sharing it.
+        """
+        rate = config.requests_per_second
+        return cls(rate=math.inf if rate is None else rate, capacity=config.burst)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens, going into debt if needed.
+
+        Args:
+            tokens: Number of tokens to take.
+
+        Returns:
+            Seconds the caller must wait before using them.
+        """
+        with self._lock:
+            now = self._clock()
+            if math.isinf(self.rate):
+                return max(0.0, self._updated - now)  # Only pauses apply
+            if now > self._updated:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            self._tokens -= tokens
+            debt = max(0.0, -self._tokens) / self.rate
+            return max(0.0, self._updated - now) + debt
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for a while (e.g. after a 429).
+
+        Args:
+            seconds: How long to pause, from now. Shorter pauses than one
+                already in effect are ignored.
+        """
+        with self._lock:
+            until = self._clock() + seconds
+            if until > self._updated:
+                self._updated = until
+                self._tokens = min(self._tokens, 0.0)
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds until refills resume (0.0 if not paused)."""
+        with self._lock:
+            return max(0.0, self._updated - self._clock())
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """Wait (asynchronously) until tokens are available.
+
+        Returns:
+            Seconds waited.
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def acquire_sync(self, tokens: float = 1.0) -> float:
+        """Wait (blocking) until tokens are available.
+
+        Returns:
+            Seconds waited.
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def stats(self) -> dict[str, Any]:
+        """Get the current fill level and pause."""
+        with self._lock:
+            now = self._clock()
+            tokens = self._tokens
+            if math.isinf(self.rate):
+                tokens = self.capacity if now >= self._updated else 0.0
+            elif now > self._updated:
+                tokens = min(self.capacity, tokens + (now - self._updated) * self.rate)
+            return {
+                "tokens": tokens,
+                "capacity": self.capacity,
+                "rate": self.rate,
+                "paused_for": max(0.0, self._updated - now),
+            }
@@ -16,6 +16,18 @@ from pydantic import BaseModel, ValidationError
 # Import backup/recovery mixin
 from claude_task_master.core.state_backup import BackupRecoveryMixin
 
+# Import process-wide read cache
+from claude_task_master.core.state_cache import get_state_read_cache
+
+# Import state.json encoding and schema versioning
+from claude_task_master.core.state_codec import (
+    StateFormat,
+    StateSchemaError,
+    decode_state,
+    encode_state,
+    export_state_json,
+)
+
 # Import exceptions and state constants from dedicated module
 from claude_task_master.core.state_exceptions import (
     RESUMABLE_STATUSES,
@@ -81,7 +93,7 @@ class TaskOptions(BaseModel):
     pause_on_pr: bool = False
     enable_checkpointing: bool = False
     log_level: str = "normal"  # quiet, normal, verbose
-    log_format: str = "text"  # text, json
+    log_format: str = "text"  # text, json, jsonl
     pr_per_task: bool = False  # If True, create PR per task; if False, PR per group
     webhook_url: str | None = None  # URL to receive webhook notifications
     webhook_secret: str | None = None  # HMAC secret for signing webhook payloads
@@ -186,12 +198,23 @@ class StateManager(PRContextMixin, FileOperationsMixin, BackupRecoveryMixin):
     STATE_DIR = Path(".claude-task-master")
     LOCK_TIMEOUT = 5.0  # seconds
 
-    def __init__(self, state_dir: Path | None = None):
-        """Initialize state manager."""
+    def __init__(
+        self,
+        state_dir: Path | None = None,
+        state_format: StateFormat | str | None = None,
+    ):
+        """Initialize state manager.
+
+        Args:
+            state_dir: State directory (default: .claude-task-master).
+            state_format: Encoding for state.json writes. If None, uses
+                ``state.format`` from config. Reads accept every format.
+        """
         self.state_dir = state_dir or self.STATE_DIR
         self.logs_dir = self.state_dir / "logs"
         self._lock_file = self.state_dir / ".state.lock"
         self._pid_file = self.state_dir / ".pid"
+        self._state_format = StateFormat(state_format) if state_format is not None else None
 
     @property
     def state_file(self) -> Path:
@@ -203,6 +226,15 @@ class StateManager(PRContextMixin, FileOperationsMixin, BackupRecoveryMixin):
         """Get the path to the backup directory."""
         return self.state_dir / "backups"
 
+    @property
+    def state_format(self) -> StateFormat:
+        """Get the encoding used when writing state.json."""
+        if self._state_format is None:
+            from claude_task_master.core.config_loader import get_config
+
+            self._state_format = StateFormat(get_config().state.format)
+        return self._state_format
+
     def acquire_session_lock(self) -> bool:
         """Acquire session lock by writing PID file.
 
@@ -322,7 +354,9 @@ class StateManager(PRContextMixin, FileOperationsMixin, BackupRecoveryMixin):
         # Validate state transition if there's an existing state
         if validate_transition and self.state_file.exists():
             try:
-                current_state = self._load_state_internal()
+                current_state = get_state_read_cache().get(
+                    self.state_file, "state", self._load_state_internal
+                )
                 self._validate_transition(current_state.status, state.status)
             except (StateNotFoundError, StateCorruptedError):
                 # If we can't load current state, allow the save
@@ -340,6 +374,9 @@ class StateManager(PRContextMixin, FileOperationsMixin, BackupRecoveryMixin):
     def load_state(self) -> TaskState:
         """Load state from state.json with error recovery.
 
+        Parsed state is cached process-wide and reused while state.json is
+        unchanged; each call returns an independent copy.
+
         Returns:
             TaskState: The loaded task state.
 
@@ -350,8 +387,18 @@ class StateManager(PRContextMixin, FileOperationsMixin, BackupRecoveryMixin):
             StatePermissionError: If the file cannot be read.
             StateLockError: If the file lock cannot be acquired.
         """
-        with file_lock(self._lock_file, timeout=self.LOCK_TIMEOUT, exclusive=False):
-            return self._load_state_internal()
+
+        def load() -> TaskState:
+            with file_lock(self._lock_file, timeout=self.LOCK_TIMEOUT, exclusive=False):
+                return self._load_state_internal()
+
+        state: TaskState = get_state_read_cache().get(self.state_file, "state", load)
+        return state.model_copy(deep=True)
+
+    @staticmethod
+    def get_cache_stats() -> dict[str, int | float]:
+        """Get hit/miss counters of the process-wide state read cache."""
+        return get_state_read_cache().stats()
 
     def _load_state_internal(self) -> TaskState:
         """Internal method to load state without locking.
@@ -362,22 +409,26 @@ class StateManager(PRContextMixin, FileOperationsMixin, BackupRecoveryMixin):
             raise StateNotFoundError(self.state_file)
 
         try:
-            with open(self.state_file) as f:
-                try:
-                    data = json.load(f)
-                except json.JSONDecodeError as e:
-                    # Attempt recovery from backup
-                    recovered_state: TaskState | None = self._attempt_recovery(e)
-                    if recovered_state:
-                        return recovered_state
-                    raise StateCorruptedError(
-                        self.state_file,
-                        f"JSON parse error at line {e.lineno}, column {e.colno}: {e.msg}",
-                        recoverable=False,
-                    ) from e
+            raw = self.state_file.read_bytes()
         except PermissionError as e:
             raise StatePermissionError(self.state_file, "reading", e) from e
 
+        try:
+            # Accepts pretty and compact JSON; migrates older schema versions
+            data = decode_state(raw)
+        except json.JSONDecodeError as e:
+            # Attempt recovery from backup
+            recovered_state: TaskState | None = self._attempt_recovery(e)
+            if recovered_state:
+                return recovered_state
+            raise StateCorruptedError(
+                self.state_file,
+                f"JSON parse error at line {e.lineno}, column {e.colno}: {e.msg}",
+                recoverable=False,
+            ) from e
+        except StateSchemaError as e:
+            raise StateError("Unsupported state file schema", str(e)) from e
+
         # Handle empty JSON
         if not data:
             recovered_state_empty: TaskState | None = self._attempt_recovery(
@@ -430,21 +481,25 @@ class StateManager(PRContextMixin, FileOperationsMixin, BackupRecoveryMixin):
             raise InvalidStateTransitionError(current_status, new_status)
 
     def _atomic_write_json(self, path: Path, data: dict) -> None:
-        """Atomically write JSON data to a file using a temp file.
+        """Atomically write state data to a file using a temp file.
+
+        The data is encoded in ``state_format`` with a schema version header.
 
         Args:
             path: The target file path.
-            data: The data to write as JSON.
+            data: The state data to write.
         """
         path.parent.mkdir(parents=True, exist_ok=True)
+        encoded = encode_state(data, self.state_format)
 
         # Write to a temp file in the same directory, then rename
         fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp_", suffix=".json")
         try:
-            with open(fd, "w") as f:
-                json.dump(data, f, indent=2)
+            with open(fd, "wb") as f:
+                f.write(encoded)
             # Atomic rename
             shutil.move(temp_path, path)
+            get_state_read_cache().invalidate(path)
         except Exception:
             # Clean up temp file on error
             try:
@@ -464,6 +519,17 @@ class StateManager(PRContextMixin, FileOperationsMixin, BackupRecoveryMixin):
         """Get path to log file for run."""
         return self.logs_dir / f"run-{run_id}.txt"
 
+    def export_state(self) -> str:
+        """Export state.json as pretty-printed JSON, whatever its on-disk format.
+
+        Returns:
+            Indented JSON text of the current state.
+
+        Raises:
+            StateNotFoundError: If the state file does not exist.
+        """
+        return export_state_json(self.load_state().model_dump())
+
     def exists(self) -> bool:
         """Check if state directory exists."""
         return self.state_dir.exists() and (self.state_dir / "state.json").exists()
@@ -570,6 +636,8 @@ class StateManager(PRContextMixin, FileOperationsMixin, BackupRecoveryMixin):
     # PR Context Methods are inherited from PRContextMixin:
     # - get_pr_dir(pr_number: int) -> Path
     # - save_pr_comments(pr_number: int, comments: list[dict]) -> None
+    # - load_review_threads(pr_number: int) -> dict[str, dict]
+    # - save_review_threads(pr_number: int, threads: dict[str, dict]) -> None
     # - save_ci_failure(pr_number: int, check_name: str, logs: str) -> None
     # - load_pr_context(pr_number: int) -> str
     # - clear_pr_context(pr_number: int) -> None
@@ -585,6 +653,9 @@ class StateManager(PRContextMixin, FileOperationsMixin, BackupRecoveryMixin):
     # - load_progress() -> str | None
     # - save_context(context: str) -> None
     # - load_context() -> str
+    # - load_plan_index() -> PlanIndex
+    # - load_plan_tasks() -> list[str]
+    # - set_task_complete(task_index: int, complete: bool = True) -> bool
     # - _parse_plan_tasks(plan: str) -> list[str]
 
     # Backup/Recovery Methods are inherited from BackupRecoveryMixin:
@@ -609,7 +680,7 @@ class StateManager(PRContextMixin, FileOperationsMixin, BackupRecoveryMixin):
             - pause_on_pr: bool - Whether to pause on PR creation
             - enable_checkpointing: bool - Whether to enable checkpointing
             - log_level: str - Log level (quiet, normal, verbose)
-            - log_format: str - Log format (text, json)
+            - log_format: str - Log format (text, json, jsonl)
             - pr_per_task: bool - Whether to create PR per task
             - webhook_url: str | None - Webhook endpoint URL
             - webhook_secret: str | None - HMAC secret for signing webhook payloads
@@ -16,6 +16,9 @@ from typing import Any
 
 from pydantic import ValidationError
 
+from claude_task_master.core.state_cache import get_state_read_cache
+from claude_task_master.core.state_codec import StateSchemaError, decode_state
+
 
 class BackupRecoveryMixin:
     """Mixin providing backup and recovery methods for StateManager.
@@ -78,13 +81,12 @@ class BackupRecoveryMixin:
             )
             for backup_file in backups:
                 try:
-                    with open(backup_file) as f:
-                        data = json.load(f)
+                    data = decode_state(backup_file.read_bytes())
                     state = TaskState(**data)
                     # Restore from backup
                     self._atomic_write_json(self.state_file, data)
                     return state
-                except (json.JSONDecodeError, ValidationError):
+                except (json.JSONDecodeError, StateSchemaError, ValidationError):
                     continue
 
         return None
@@ -139,6 +141,8 @@ class BackupRecoveryMixin:
         # Keep only the last 10 log files
         self._cleanup_old_logs(max_logs=10)
 
+        get_state_read_cache().invalidate_dir(self.state_dir)
+
     def _cleanup_old_logs(self, max_logs: int = 10) -> None:
         """Keep only the most recent log files.
 
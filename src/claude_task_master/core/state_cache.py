@@ -0,0 +1,172 @@
+"""Read Cache for State Manager.
+
+This module provides a process-wide cache of parsed state files (state.json,
+plan.md, goal.txt, context.md, ...). Entries are keyed on the file path and a
+parse kind, and validated against ``(st_mtime_ns, st_size)`` on every lookup,
+so a hit costs one ``stat`` instead of a read and parse.
+
+Files modified within the last ``racy_window`` seconds are never served from
+the cache: filesystem timestamps can be coarser than the time between two
+writes, and a same-size rewrite inside one timestamp tick would otherwise go
+unnoticed. Writes through StateManager also invalidate entries explicitly.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Maximum cached entries across all state directories
+DEFAULT_MAX_ENTRIES = 256
+
+# Files modified more recently than this are re-read on every lookup
+DEFAULT_RACY_WINDOW = 1.0
+
+
+@dataclass
+class _CacheEntry:
+    """A parsed value and the file signature it was parsed from."""
+
+    signature: tuple[int, int]  # (st_mtime_ns, st_size)
+    value: Any
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """Get ``(st_mtime_ns, st_size)`` for a file, or None if it doesn't exist."""
+    try:
+        stat = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class StateReadCache:
+    """Thread-safe LRU cache of parsed file contents validated by mtime and size.
+
+    Usage:
+        cache = get_state_read_cache()
+        plan = cache.get(plan_file, "text", plan_file.read_text)
+        cache.invalidate(plan_file)  # after writing plan_file
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        racy_window: float = DEFAULT_RACY_WINDOW,
+    ):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached entries.
+            racy_window: Seconds after a modification during which a file is
+                not cached.
+        """
+        self.max_entries = max_entries
+        self.racy_window = racy_window
+        self._entries: OrderedDict[tuple[str, str], _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(path: Path, kind: str) -> tuple[str, str]:
+        return os.path.abspath(path), kind
+
+    def get(self, path: Path, kind: str, loader: Callable[[], T]) -> T:
+        """Return the cached value for a file, loading it if the file changed.
+
+        Missing files are never cached; ``loader`` is called and decides how
+        to handle them (raise or return a default).
+
+        Args:
+            path: File the value is derived from.
+            kind: Name of the parsed form (e.g. "text", "state", "plan_tasks"),
+                so one file can cache several representations.
+            loader: Reads and parses the file.
+
+        Returns:
+            The cached or freshly loaded value. Callers must not mutate it.
+        """
+        key = self._key(path, kind)
+        signature = _file_signature(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and signature is not None and entry.signature == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value  # type: ignore[no-any-return]
+            self.misses += 1
+
+        value = loader()
+
+        # Only cache if the file is settled and didn't change while loading
+        if signature is None or time.time_ns() - signature[0] < self.racy_window * 1e9:
+            return value
+        if _file_signature(path) != signature:
+            return value
+        with self._lock:
+            self._entries[key] = _CacheEntry(signature=signature, value=value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, path: Path) -> None:
+        """Drop every cached form of a file."""
+        abs_path = os.path.abspath(path)
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == abs_path]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += 1
+
+    def invalidate_dir(self, directory: Path) -> None:
+        """Drop cached entries for every file under a directory."""
+        prefix = os.path.join(os.path.abspath(directory), "")
+        with self._lock:
+            stale = [key for key in self._entries if key[0].startswith(prefix)]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.invalidations = 0
+
+    def stats(self) -> dict[str, int | float]:
+        """Get cache counters.
+
+        Returns:
+            Dictionary with hits, misses, invalidations, entries and hit_rate
+            (percentage of lookups served from the cache).
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "hit_rate": (self.hits / lookups * 100) if lookups else 0.0,
+            }
+
+
+_read_cache = StateReadCache()
+
+
+def get_state_read_cache() -> StateReadCache:
+    """Get the process-wide state read cache shared by all StateManagers."""
+    return _read_cache
@@ -0,0 +1,125 @@
+"""State Codec - Encoding and schema versioning for state.json.
+
+state.json is rewritten on every ``save_state``. Two encodings are supported:
+
+- ``json``: Pretty-printed JSON (indent=2). The default, easy to read and diff.
+- ``compact``: Single-line JSON without indentation. Uses ``orjson`` when it
+  is installed (``pip install claude-task-master[fast]``) and falls back to
+  the standard library otherwise.
+
+Both encodings are plain JSON, so the file can be read by any JSON consumer
+(the events stream, backups, external tooling) regardless of the format it
+was written in. Every file written by this module carries a
+``schema_version`` header as its first key; files without one are treated as
+version 1 (the original pretty-printed layout) and migrated transparently on
+load. Use ``claudetm export-state`` to get a pretty-printed copy of a compact
+state file.
+"""
+
+from __future__ import annotations
+
+import json
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on installed extras
+    ORJSON_AVAILABLE = False
+
+# Current on-disk schema version of state.json
+STATE_SCHEMA_VERSION = 2
+
+# Header key holding the schema version (stripped before validation)
+SCHEMA_VERSION_KEY = "schema_version"
+
+
+class StateFormat(str, Enum):
+    """On-disk encoding of state.json."""
+
+    JSON = "json"
+    COMPACT = "compact"
+
+
+class StateSchemaError(ValueError):
+    """Raised when a state file has an unsupported schema version."""
+
+
+def encode_state(data: dict[str, Any], fmt: StateFormat = StateFormat.JSON) -> bytes:
+    """Encode state data with a schema version header.
+
+    Args:
+        data: The state data (e.g. ``TaskState.model_dump()``).
+        fmt: The encoding to use.
+
+    Returns:
+        UTF-8 encoded JSON bytes.
+    """
+    payload = {SCHEMA_VERSION_KEY: STATE_SCHEMA_VERSION, **data}
+    if fmt == StateFormat.COMPACT:
+        if ORJSON_AVAILABLE:
+            encoded: bytes = orjson.dumps(payload)
+            return encoded
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def decode_state(raw: bytes | str) -> dict[str, Any]:
+    """Decode state data written in any supported format or schema version.
+
+    Args:
+        raw: The file contents.
+
+    Returns:
+        The state data without the schema header, migrated to the current
+        schema version.
+
+    Raises:
+        json.JSONDecodeError: If the contents are not valid JSON.
+        StateSchemaError: If the file was written by a newer schema version.
+    """
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError (same lineno/colno)
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+    if not isinstance(data, dict):
+        raise json.JSONDecodeError("State file must contain a JSON object", "", 0)
+    version = data.pop(SCHEMA_VERSION_KEY, 1)
+    return migrate_state(data, version)
+
+
+def migrate_state(data: dict[str, Any], version: int) -> dict[str, Any]:
+    """Migrate state data from an older schema version to the current one.
+
+    Args:
+        data: State data without the schema header.
+        version: Schema version the data was written with.
+
+    Returns:
+        State data in the current schema.
+
+    Raises:
+        StateSchemaError: If the version is unknown or newer than supported.
+    """
+    if not isinstance(version, int) or version < 1:
+        raise StateSchemaError(f"Invalid state schema version: {version!r}")
+    if version > STATE_SCHEMA_VERSION:
+        raise StateSchemaError(
+            f"State file uses schema version {version}, but this version of "
+            f"claudetm only supports up to {STATE_SCHEMA_VERSION}. Upgrade claudetm."
+        )
+    # Version 1 -> 2 only added the header; the fields are unchanged.
+    return data
+
+
+def export_state_json(data: dict[str, Any]) -> str:
+    """Render state data as pretty-printed JSON for humans.
+
+    Args:
+        data: State data (as returned by ``decode_state``).
+
+    Returns:
+        Indented JSON text without the schema header.
+    """
+    return json.dumps(data, indent=2)
@@ -4,6 +4,9 @@ This module provides methods for managing file-based state data,
 including goal, criteria, plan, progress, context files and plan parsing.
 
 These methods are mixed into the StateManager class via the FileOperationsMixin.
+
+Reads go through the process-wide StateReadCache, so repeated loads of an
+unchanged file cost a ``stat`` rather than a read; saves invalidate it.
 """
 
 from __future__ import annotations
@@ -11,6 +14,9 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from claude_task_master.core.plan_index import PlanIndex
+from claude_task_master.core.state_cache import get_state_read_cache
+
 if TYPE_CHECKING:
     pass
 
@@ -28,6 +34,23 @@ class FileOperationsMixin:
     # This will be set by StateManager
     state_dir: Path
 
+    def _write_text_file(self, path: Path, content: str) -> None:
+        """Write a state text file and invalidate its cached reads."""
+        path.write_text(content)
+        get_state_read_cache().invalidate(path)
+
+    def _read_text_file(self, path: Path) -> str | None:
+        """Read a state text file through the read cache.
+
+        Returns:
+            The file content, or None if the file doesn't exist.
+        """
+
+        def load() -> str | None:
+            return path.read_text() if path.exists() else None
+
+        return get_state_read_cache().get(path, "text", load)
+
     def save_goal(self, goal: str) -> None:
         """Save goal to goal.txt.
 
@@ -35,7 +58,7 @@ class FileOperationsMixin:
             goal: The task goal description.
         """
         goal_file = self.state_dir / "goal.txt"
-        goal_file.write_text(goal)
+        self._write_text_file(goal_file, goal)
 
     def load_goal(self) -> str:
         """Load goal from goal.txt.
@@ -44,7 +67,10 @@ class FileOperationsMixin:
             The task goal description.
         """
         goal_file = self.state_dir / "goal.txt"
-        return goal_file.read_text()
+        goal = self._read_text_file(goal_file)
+        if goal is None:
+            raise FileNotFoundError(goal_file)
+        return goal
 
     def save_criteria(self, criteria: str) -> None:
         """Save success criteria to criteria.txt.
@@ -53,7 +79,7 @@ class FileOperationsMixin:
             criteria: The success criteria text.
         """
         criteria_file = self.state_dir / "criteria.txt"
-        criteria_file.write_text(criteria)
+        self._write_text_file(criteria_file, criteria)
 
     def load_criteria(self) -> str | None:
         """Load success criteria from criteria.txt.
@@ -62,9 +88,7 @@ class FileOperationsMixin:
             The success criteria text, or None if not found.
         """
         criteria_file = self.state_dir / "criteria.txt"
-        if criteria_file.exists():
-            return criteria_file.read_text()
-        return None
+        return self._read_text_file(criteria_file)
 
     def save_plan(self, plan: str) -> None:
         """Save task plan to plan.md.
@@ -73,7 +97,7 @@ class FileOperationsMixin:
             plan: The task plan in markdown format.
         """
         plan_file = self.state_dir / "plan.md"
-        plan_file.write_text(plan)
+        self._write_text_file(plan_file, plan)
 
     def load_plan(self) -> str | None:
         """Load task plan from plan.md.
@@ -82,9 +106,7 @@ class FileOperationsMixin:
             The task plan content, or None if not found.
         """
         plan_file = self.state_dir / "plan.md"
-        if plan_file.exists():
-            return plan_file.read_text()
-        return None
+        return self._read_text_file(plan_file)
 
     def save_progress(self, progress: str) -> None:
         """Save progress summary to progress.md.
@@ -93,7 +115,7 @@ class FileOperationsMixin:
             progress: The progress summary in markdown format.
         """
         progress_file = self.state_dir / "progress.md"
-        progress_file.write_text(progress)
+        self._write_text_file(progress_file, progress)
 
     def load_progress(self) -> str | None:
         """Load progress summary from progress.md.
@@ -102,9 +124,7 @@ class FileOperationsMixin:
             The progress summary content, or None if not found.
         """
         progress_file = self.state_dir / "progress.md"
-        if progress_file.exists():
-            return progress_file.read_text()
-        return None
+        return self._read_text_file(progress_file)
 
     def save_context(self, context: str) -> None:
         """Save accumulated context to context.md.
@@ -113,7 +133,7 @@ class FileOperationsMixin:
             context: The accumulated context in markdown format.
         """
         context_file = self.state_dir / "context.md"
-        context_file.write_text(context)
+        self._write_text_file(context_file, context)
 
     def load_context(self) -> str:
         """Load accumulated context from context.md.
@@ -122,9 +142,58 @@ class FileOperationsMixin:
             The accumulated context, or empty string if not found.
         """
         context_file = self.state_dir / "context.md"
-        if context_file.exists():
-            return context_file.read_text()
-        return ""
+        return self._read_text_file(context_file) or ""
+
+    def load_plan_index(self) -> PlanIndex:
+        """Load the PlanIndex for plan.md, built once per plan revision.
+
+        Returns:
+            An independent copy of the cached index (empty if there is no plan).
+        """
+        plan_file = self.state_dir / "plan.md"
+
+        def load() -> PlanIndex:
+            return PlanIndex.from_text(self._read_text_file(plan_file) or "")
+
+        index: PlanIndex = get_state_read_cache().get(plan_file, "plan_index", load)
+        return index.copy()
+
+    def load_plan_tasks(self) -> list[str]:
+        """Load the task descriptions from plan.md.
+
+        Returns:
+            List of task descriptions, or an empty list if there is no plan.
+        """
+        return self.load_plan_index().descriptions
+
+    def set_task_complete(self, task_index: int, complete: bool = True) -> bool:
+        """Check or clear a task's checkbox in plan.md in place.
+
+        Only the checkbox mark byte is rewritten on disk.
+
+        Args:
+            task_index: Index of the task.
+            complete: True to check the box, False to clear it.
+
+        Returns:
+            True if plan.md changed, False if the task was already in that state.
+
+        Raises:
+            IndexError: If the task index is out of range.
+        """
+        plan_file = self.state_dir / "plan.md"
+        index = self.load_plan_index()
+        if not index.set_complete(task_index, complete):
+            return False
+        try:
+            index.write_mark(plan_file, task_index)
+        except ValueError:
+            # Plan changed underneath the cached index - rewrite it whole
+            index = PlanIndex.from_text(plan_file.read_text())
+            index.set_complete(task_index, complete)
+            plan_file.write_text(index.text)
+        get_state_read_cache().invalidate(plan_file)
+        return True
 
     def _parse_plan_tasks(self, plan: str) -> list[str]:
         """Parse tasks from plan markdown.
@@ -137,12 +206,4 @@ class FileOperationsMixin:
         Returns:
             List of task descriptions extracted from the plan.
         """
-        tasks = []
-        for line in plan.split("\n"):
-            # Look for markdown checkbox lines
-            stripped = line.strip()
-            if stripped.startswith("- [ ]") or stripped.startswith("- [x]"):
-                task = stripped[5:].strip()  # Remove "- [ ]" or "- [x]"
-                if task:
-                    tasks.append(task)
-        return tasks
+        return PlanIndex.from_text(plan).descriptions
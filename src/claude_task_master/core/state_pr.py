@@ -8,6 +8,7 @@ These methods are mixed into the StateManager class via the PRContextMixin.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import shutil
 from pathlib import Path
@@ -17,6 +18,16 @@ if TYPE_CHECKING:
     pass
 
 
+def _write_if_changed(path: Path, content: str) -> None:
+    """Write a file unless it already has this content."""
+    try:
+        if path.read_text() == content:
+            return
+    except OSError:
+        pass
+    path.write_text(content)
+
+
 class PRContextMixin:
     """Mixin providing PR context management methods for StateManager.
 
@@ -48,7 +59,9 @@ class PRContextMixin:
     def save_pr_comments(self, pr_number: int, comments: list[dict]) -> None:
         """Save PR comments to files for Claude to read.
 
-        Each comment is saved to a separate file for easy reading.
+        Each comment is saved to a separate file for easy reading. File names
+        are stable per comment, and only new or changed files are written, so
+        the comments directory diffs cleanly between review cycles.
 
         Args:
             pr_number: The PR number.
@@ -58,11 +71,7 @@ class PRContextMixin:
         comments_dir = pr_dir / "comments"
         comments_dir.mkdir(exist_ok=True)
 
-        # Clear old comments
-        for old_file in comments_dir.glob("*.txt"):
-            old_file.unlink()
-
-        # Save each comment to a separate file
+        files: dict[str, str] = {}
         for i, comment in enumerate(comments, 1):
             thread_id = comment.get("thread_id", "")
             comment_id = comment.get("comment_id", "")
@@ -76,9 +85,12 @@ class PRContextMixin:
             safe_path = path.replace("/", "_").replace("\\", "_") if path else "general"
             # Sanitize line number (could be "N/A" or None)
             safe_line = str(line).replace("/", "_").replace("\\", "_") if line else "0"
-            filename = f"{i:03d}_{safe_path}_L{safe_line}.txt"
+            # Stable suffix so a comment keeps its file across syncs
+            key = comment_id or f"{thread_id}:{i}:{path}:{line}"
+            digest = hashlib.sha1(str(key).encode()).hexdigest()[:8]
+            filename = f"{safe_path}_L{safe_line}_{digest}.txt"
 
-            content = f"""Thread ID: {thread_id}
+            files[filename] = f"""Thread ID: {thread_id}
 Comment ID: {comment_id}
 File: {path}
 Line: {line}
@@ -87,7 +99,13 @@ Status: {"Resolved" if is_resolved else "Unresolved"}
 
 {body}
 """
-            (comments_dir / filename).write_text(content)
+
+        # Drop comments that are gone, write only new or changed ones
+        for old_file in comments_dir.glob("*.txt"):
+            if old_file.name not in files:
+                old_file.unlink()
+        for filename, content in files.items():
+            _write_if_changed(comments_dir / filename, content)
 
         # Also save a summary file
         summary_file = pr_dir / "comments_summary.txt"
@@ -101,7 +119,45 @@ Status: {"Resolved" if is_resolved else "Unresolved"}
         for p in sorted(paths):
             summary_lines.append(f"  - {p}")
 
-        summary_file.write_text("\n".join(summary_lines))
+        _write_if_changed(summary_file, "\n".join(summary_lines))
+
+    def load_review_threads(self, pr_number: int) -> dict[str, dict]:
+        """Load the local review-thread index of a PR.
+
+        The index maps thread ID to the thread's last seen ``updated_at``,
+        ``comment_count``, ``is_resolved`` and (when fetched) ``comments``.
+
+        Args:
+            pr_number: The PR number.
+
+        Returns:
+            Thread ID -> stored thread (empty if there is no index yet).
+        """
+        threads_file = self.get_pr_dir(pr_number) / "review_threads.json"
+        if not threads_file.exists():
+            return {}
+
+        try:
+            with open(threads_file) as f:
+                threads = json.load(f).get("threads", {})
+                return threads if isinstance(threads, dict) else {}
+        except (json.JSONDecodeError, OSError, AttributeError):
+            return {}
+
+    def save_review_threads(self, pr_number: int, threads: dict[str, dict]) -> None:
+        """Save the local review-thread index of a PR.
+
+        Args:
+            pr_number: The PR number.
+            threads: Thread ID -> stored thread.
+        """
+        threads_file = self.get_pr_dir(pr_number) / "review_threads.json"
+        try:
+            _write_if_changed(
+                threads_file, json.dumps({"threads": threads}, indent=2, sort_keys=True)
+            )
+        except OSError:
+            pass  # Best effort - the next sync refetches what it needs
 
     def save_ci_failure(self, pr_number: int, check_name: str, logs: str) -> None:
         """Save CI failure logs for Claude to read.
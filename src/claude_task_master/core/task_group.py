@@ -185,78 +185,19 @@ def parse_tasks_with_groups(plan: str) -> tuple[list[ParsedTask], list[TaskGroup
     - [ ] Task 2
     ```
 
+    Parsing is done by PlanIndex; use it directly when you need repeated
+    lookups or checkbox toggles.
+
     Args:
         plan: The plan markdown content.
 
     Returns:
         Tuple of (list of ParsedTask, list of TaskGroup/PR).
     """
-    tasks: list[ParsedTask] = []
-    groups: list[TaskGroup] = []
-
-    # Pattern to match PR/Group headers:
-    # ### PR 1: Name, ### Group 1: Name, ## PR 1 - Name, etc.
-    pr_pattern = re.compile(
-        r"^#{2,3}\s+(?:PR|Group)\s*(\d+)(?::\s*|\s*[-–—]\s*)(.+)$", re.IGNORECASE
-    )
-    # Pattern to match tasks: - [ ] or - [x] followed by description
-    task_pattern = re.compile(r"^-\s*\[([ xX])\]\s*(.+)$")
-
-    current_group_id = "default"
-    current_group_name = "Default"
-    task_index = 0
-
-    for line in plan.split("\n"):
-        line = line.strip()
-
-        # Check for PR/Group header
-        pr_match = pr_pattern.match(line)
-        if pr_match:
-            pr_num = pr_match.group(1)
-            pr_name = pr_match.group(2).strip()
-            current_group_id = f"pr_{pr_num}"
-            current_group_name = pr_name
-
-            # Create new group if not exists
-            if not any(g.id == current_group_id for g in groups):
-                groups.append(TaskGroup(id=current_group_id, name=pr_name))
-            continue
-
-        # Check for task
-        task_match = task_pattern.match(line)
-        if task_match:
-            is_complete = task_match.group(1).lower() == "x"
-            description = task_match.group(2).strip()
-
-            task = ParsedTask(
-                index=task_index,
-                description=description,
-                group_id=current_group_id,
-                group_name=current_group_name,
-                is_complete=is_complete,
-            )
-            tasks.append(task)
-
-            # Add task index to its group
-            group = next((g for g in groups if g.id == current_group_id), None)
-            if group is None:
-                group = TaskGroup(id=current_group_id, name=current_group_name)
-                groups.append(group)
-            group.task_indices.append(task_index)
-
-            task_index += 1
-
-    # If no explicit groups, ensure default group exists
-    if not groups and tasks:
-        groups.append(
-            TaskGroup(
-                id="default",
-                name="Default",
-                task_indices=list(range(len(tasks))),
-            )
-        )
-
-    return tasks, groups
+    from claude_task_master.core.plan_index import PlanIndex
+
+    index = PlanIndex.from_text(plan)
+    return index.parsed_tasks(), index.groups
 
 
 # Alias for PR-centric code
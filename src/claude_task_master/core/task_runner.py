@@ -16,6 +16,7 @@ from . import console
 from .agent import ModelType
 from .agent_exceptions import AgentError
 from .console import clear_task_context, set_task_context
+from .plan_index import PlanIndex
 from .task_group import (
     ParsedTask,
     TaskComplexity,
@@ -131,11 +132,29 @@ class TaskRunner:
         self.state_manager = state_manager
         self.logger = logger
 
-        # Cache for parsed tasks with group info
+        # Cache of the plan index (and task objects built from it) per plan revision
+        self._plan_index: PlanIndex | None = None
         self._parsed_tasks_cache: list[ParsedTask] | None = None
         self._parsed_groups_cache: list[TaskGroup] | None = None
         self._plan_hash: int | None = None
 
+    def _get_plan_index(self, plan: str) -> PlanIndex:
+        """Get the PlanIndex for a plan, built once per plan revision.
+
+        Args:
+            plan: The plan markdown content.
+
+        Returns:
+            The cached PlanIndex. Callers must not toggle it.
+        """
+        plan_hash = hash(plan)
+        if self._plan_hash != plan_hash or self._plan_index is None:
+            self._plan_index = PlanIndex.from_text(plan)
+            self._parsed_tasks_cache = None
+            self._parsed_groups_cache = None
+            self._plan_hash = plan_hash
+        return self._plan_index
+
     def _get_parsed_tasks(self, plan: str) -> tuple[list[ParsedTask], list[TaskGroup]]:
         """Get parsed tasks and groups, with caching.
 
@@ -145,14 +164,15 @@ class TaskRunner:
         Returns:
             Tuple of (parsed tasks, groups).
         """
-        plan_hash = hash(plan)
-        if self._plan_hash != plan_hash or self._parsed_tasks_cache is None:
-            self._parsed_tasks_cache, self._parsed_groups_cache = parse_tasks_with_groups(plan)
-            self._plan_hash = plan_hash
+        index = self._get_plan_index(plan)
+        if self._parsed_tasks_cache is None:
+            self._parsed_tasks_cache = index.parsed_tasks()
+            self._parsed_groups_cache = index.groups
         return self._parsed_tasks_cache, self._parsed_groups_cache or []
 
     def _invalidate_cache(self) -> None:
         """Invalidate the parsed tasks cache."""
+        self._plan_index = None
         self._parsed_tasks_cache = None
         self._parsed_groups_cache = None
         self._plan_hash = None
@@ -260,6 +280,7 @@ Please complete this task."""
         # Build PR group info for agent context (always provide for better task execution)
         pr_group_info = {
             "name": pr_name,
+            "group_id": pr_group_id,
             "branch": current_branch,
             "completed_tasks": completed_in_group,
             "remaining_tasks": remaining_in_group,
@@ -301,6 +322,12 @@ Please complete this task."""
             # Clear task context after work session completes
             clear_task_context()
 
+        # Report SDK connection setup cost (conversation mode only)
+        setup_seconds = result.get("connection_setup_seconds")
+        if isinstance(setup_seconds, float):
+            how = "reused" if result.get("client_reused") else "new connection"
+            console.detail(f"Connection setup for task: {setup_seconds:.2f}s ({how})")
+
         # Log the response
         if self.logger and result.get("output"):
             self.logger.log_response(result.get("output", ""))
@@ -403,13 +430,7 @@ Please complete this task."""
         Returns:
             List of task descriptions.
         """
-        tasks = []
-        for line in plan.split("\n"):
-            if line.strip().startswith("- [ ]") or line.strip().startswith("- [x]"):
-                task = line.strip()[5:].strip()  # Remove "- [ ]" or "- [x]"
-                if task:
-                    tasks.append(task)
-        return tasks
+        return self._get_plan_index(plan).descriptions
 
     def is_task_complete(self, plan: str, task_index: int) -> bool:
         """Check if a task is already marked as complete.
@@ -421,36 +442,27 @@ Please complete this task."""
         Returns:
             True if task is complete, False otherwise.
         """
-        lines = plan.split("\n")
-        task_count = -1
-
-        for line in lines:
-            if line.strip().startswith("- [ ]") or line.strip().startswith("- [x]"):
-                task_count += 1
-                if task_count == task_index:
-                    return line.strip().startswith("- [x]")
-
-        return False
+        return self._get_plan_index(plan).is_complete(task_index)
 
     def mark_task_complete(self, plan: str, task_index: int) -> None:
         """Mark a task as complete in the plan.
 
+        When ``plan`` is the current plan.md, only the checkbox byte is
+        rewritten on disk; otherwise the updated plan is saved whole.
+
         Args:
             plan: The plan markdown content.
             task_index: Index of the task to mark complete.
         """
-        lines = plan.split("\n")
-        task_count = -1
-
-        for i, line in enumerate(lines):
-            if line.strip().startswith("- [ ]") or line.strip().startswith("- [x]"):
-                task_count += 1
-                if task_count == task_index:
-                    lines[i] = line.replace("- [ ]", "- [x]", 1)
-                    break
+        if not 0 <= task_index < self._get_plan_index(plan).total:
+            return
 
-        updated_plan = "\n".join(lines)
-        self.state_manager.save_plan(updated_plan)
+        if self.state_manager.load_plan() == plan:
+            self.state_manager.set_task_complete(task_index)
+        else:
+            index = self._get_plan_index(plan).copy()
+            index.set_complete(task_index)
+            self.state_manager.save_plan(index.text)
 
     def is_all_complete(self, state: TaskState) -> bool:
         """Check if all tasks are complete.
@@ -465,8 +477,7 @@ Please complete this task."""
         if not plan:
             return True
 
-        tasks = self.parse_tasks(plan)
-        return state.current_task_index >= len(tasks)
+        return state.current_task_index >= self._get_plan_index(plan).total
 
     def is_last_task_in_group(self, state: TaskState) -> bool:
         """Check if the current task is the last in its PR group.
@@ -484,15 +495,9 @@ Please complete this task."""
         if not plan:
             return True
 
-        parsed_tasks, _ = self._get_parsed_tasks(plan)
-        if state.current_task_index >= len(parsed_tasks):
+        index = self._get_plan_index(plan)
+        if state.current_task_index >= index.total:
             return True
 
-        current_group_id = parsed_tasks[state.current_task_index].group_id
-        tasks_in_group = [t for t in parsed_tasks if t.group_id == current_group_id]
-        current_task_in_group_idx = next(
-            (i for i, t in enumerate(tasks_in_group) if t.index == state.current_task_index),
-            0,
-        )
-        remaining_in_group = len(tasks_in_group) - current_task_in_group_idx - 1
-        return remaining_in_group == 0
+        tasks_in_group = index.tasks_in_group(index.group_id(state.current_task_index))
+        return tasks_in_group[-1] == state.current_task_index
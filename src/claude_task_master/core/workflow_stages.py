@@ -4,17 +4,21 @@ from __future__ import annotations
 
 import os
 import subprocess
+import time
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from . import console
 from .agent import ModelType
+from .ci_polling import TIMINGS_FILE, CIPollScheduler
 from .shutdown import interruptible_sleep
 
 if TYPE_CHECKING:
-    from ..github import GitHubClient
+    from ..github import GitHubClient, PRChangeProbe, PRStatus
     from .agent import AgentWrapper
     from .pr_context import PRContextManager
+    from .pr_snapshot import PRSnapshotCache
+    from .progress_tracker import ExecutionTracker
     from .state import StateManager, TaskState
 
 
@@ -33,7 +37,10 @@ class WorkflowStageHandler:
     """
 
     # CI polling configuration
-    CI_POLL_INTERVAL = 10  # seconds between CI status checks
+    CI_POLL_INTERVAL = 10  # seconds between CI status checks (minimum when adaptive)
+    CI_POLL_MAX_INTERVAL = 120  # longest adaptive wait between CI checks
+    CI_POLL_BACKOFF = 1.5  # growth of the wait while CI shows no change
+    CI_FULL_REFRESH_INTERVAL = 300  # re-query full status at least this often (seconds)
     REVIEW_DELAY = 5  # seconds to wait after CI passes before checking reviews
 
     @staticmethod
@@ -132,6 +139,8 @@ class WorkflowStageHandler:
         state_manager: StateManager,
         github_client: GitHubClient,
         pr_context: PRContextManager,
+        tracker: ExecutionTracker | None = None,
+        snapshots: PRSnapshotCache | None = None,
     ):
         """Initialize stage handler.
 
@@ -140,11 +149,93 @@ class WorkflowStageHandler:
             state_manager: The state manager for persistence.
             github_client: GitHub client for PR operations.
             pr_context: PR context manager for comments/CI logs.
+            tracker: Execution tracker that records polls per PR (optional).
+            snapshots: Per-cycle PR snapshots shared with pr_context (optional).
+                Without it, every status check is a separate query.
         """
         self.agent = agent
         self.state_manager = state_manager
         self.github_client = github_client
         self.pr_context = pr_context
+        self.tracker = tracker
+        self.snapshots = snapshots
+        self.ci_scheduler = CIPollScheduler(
+            min_interval=self.CI_POLL_INTERVAL,
+            max_interval=self.CI_POLL_MAX_INTERVAL,
+            backoff=self.CI_POLL_BACKOFF,
+            history_path=state_manager.state_dir / TIMINGS_FILE,
+        )
+        # Last full status per PR and when it was fetched (monotonic)
+        self._pr_status_cache: dict[int, tuple[PRStatus, float]] = {}
+
+    def _get_pr_status(self, pr_number: int) -> PRStatus:
+        """Get PR status from this cycle's snapshot, or query it without one."""
+        if self.snapshots is not None:
+            return self.snapshots.get(pr_number).status
+        return self.github_client.get_pr_status(pr_number)
+
+    def _pr_updated(self, pr_number: int | None) -> None:
+        """Forget this cycle's snapshot of a PR the agent may have pushed to."""
+        if self.snapshots is not None and pr_number is not None:
+            self.snapshots.invalidate(pr_number)
+
+    def _poll_pr_status(self, pr_number: int) -> tuple[PRStatus, bool]:
+        """Get PR status, skipping the GraphQL query when nothing changed.
+
+        With the HTTP transport, polls after a full status query first probe
+        the PR and its head commit's checks with conditional (ETag) requests.
+        If all answer 304, the previous status is reused. A full query still
+        runs at least every CI_FULL_REFRESH_INTERVAL seconds. Under the gh
+        transport the probe would spawn three processes to save one, so every
+        poll is a full query. After a full query, the status counts as changed
+        only if its state, head commit or checks differ from the previous one.
+
+        Returns:
+            Tuple of (status, whether it changed since the last poll).
+        """
+        probe = None
+        cached = self._pr_status_cache.get(pr_number)
+        if cached is not None and self.github_client.uses_http_transport:
+            status, fetched_at = cached
+            if status.head_sha and time.monotonic() - fetched_at < self.CI_FULL_REFRESH_INTERVAL:
+                try:
+                    probe = self.github_client.probe_pr_changes(pr_number, status.head_sha)
+                except Exception as e:
+                    console.detail(f"Change probe failed ({e}), fetching full status")
+                if probe is not None and not probe.changed:
+                    self._record_poll(pr_number, True, int(probe.quota_points), probe)
+                    return status, False
+
+        status = self._get_pr_status(pr_number)
+        self._pr_status_cache[pr_number] = (status, time.monotonic())
+        # One GraphQL query, plus whatever the probe that led here spent
+        points = 1 + (int(probe.quota_points) if probe is not None else 0)
+        self._record_poll(pr_number, False, points, probe)
+        previous = cached[0] if cached is not None else None
+        changed = previous is None or (
+            (previous.state, previous.head_sha, previous.check_details)
+            != (status.state, status.head_sha, status.check_details)
+        )
+        return status, changed
+
+    def _finish_ci_polling(self, pr_number: int) -> None:
+        """Learn the CI duration of a finished head and drop its cached status."""
+        self.ci_scheduler.record_completion()
+        self._pr_status_cache.pop(pr_number, None)
+
+    def _record_poll(
+        self, pr_number: int, unchanged: bool, quota_points: int, probe: PRChangeProbe | None
+    ) -> None:
+        """Record a status poll in the execution tracker, if any."""
+        if self.tracker is None:
+            return
+        remaining = probe.rate_limit_remaining if probe is not None else None
+        self.tracker.record_pr_poll(
+            pr_number,
+            unchanged=unchanged,
+            quota_points=quota_points,
+            rate_limit_remaining=remaining if isinstance(remaining, int) else None,
+        )
 
     def handle_pr_created_stage(self, state: TaskState) -> int | None:
         """Handle PR creation - detect PR from current branch.
@@ -188,7 +279,11 @@ class WorkflowStageHandler:
         return None
 
     def handle_waiting_ci_stage(self, state: TaskState) -> int | None:
-        """Handle waiting for CI - poll CI status."""
+        """Handle waiting for CI - poll CI status.
+
+        Polls adaptively (see CIPollScheduler) and, between full status
+        queries, only probes for changes with conditional requests.
+        """
         if state.current_pr is None:
             state.workflow_stage = "waiting_reviews"
             self.state_manager.save_state(state)
@@ -197,13 +292,15 @@ class WorkflowStageHandler:
         console.info(f"Checking CI status for PR #{state.current_pr}...")
 
         try:
-            pr_status = self.github_client.get_pr_status(state.current_pr)
+            pr_status, changed = self._poll_pr_status(state.current_pr)
+            self.ci_scheduler.start(state.current_pr, pr_status.head_sha)
 
             # Check if PR was already merged (e.g., manually)
             if pr_status.state == "MERGED":
                 console.success(
                     f"PR #{state.current_pr} was already merged - skipping to next task"
                 )
+                self._pr_status_cache.pop(state.current_pr, None)
                 state.workflow_stage = "merged"
                 self.state_manager.save_state(state)
                 return None
@@ -211,11 +308,12 @@ class WorkflowStageHandler:
             # Check if PR was closed without merging
             if pr_status.state == "CLOSED":
                 console.warning(f"PR #{state.current_pr} was closed without merging")
+                self._pr_status_cache.pop(state.current_pr, None)
                 state.status = "blocked"
                 self.state_manager.save_state(state)
                 return 1
 
-            # Get required checks from branch protection
+            # Get required checks from branch protection (cached per process)
             required_checks = set(
                 self.github_client.get_required_status_checks(pr_status.base_branch)
             )
@@ -230,8 +328,9 @@ class WorkflowStageHandler:
             # If required checks haven't reported yet, keep waiting
             if missing_required:
                 console.info(f"Waiting for required checks: {', '.join(missing_required)}")
-                console.detail(f"Next check in {self.CI_POLL_INTERVAL}s...")
-                if not interruptible_sleep(self.CI_POLL_INTERVAL):
+                interval = self.ci_scheduler.next_interval(changed, queued=True)
+                console.detail(f"Next check in {interval:.0f}s...")
+                if not interruptible_sleep(interval):
                     return None
                 return None
 
@@ -247,6 +346,7 @@ class WorkflowStageHandler:
                     f"CI passed! ({pr_status.checks_passed} passed, "
                     f"{pr_status.checks_skipped} skipped)"
                 )
+                self._finish_ci_polling(state.current_pr)
                 # Wait for GitHub to publish reviews before checking
                 console.detail(f"Waiting {self.REVIEW_DELAY}s for reviews to be published...")
                 if not interruptible_sleep(self.REVIEW_DELAY):
@@ -261,7 +361,7 @@ class WorkflowStageHandler:
                         f"CI has failures but {pr_status.checks_pending} checks still pending..."
                     )
                     console.detail("Waiting for all checks to complete...")
-                    if not interruptible_sleep(self.CI_POLL_INTERVAL):
+                    if not interruptible_sleep(self.ci_scheduler.next_interval(changed)):
                         return None
                     return None  # Retry on next cycle
 
@@ -273,6 +373,7 @@ class WorkflowStageHandler:
                     if conclusion in ("FAILURE", "ERROR"):
                         check_name = self._get_check_name(check)
                         console.detail(f"  ✗ {check_name}: {conclusion}")
+                self._finish_ci_polling(state.current_pr)
                 state.workflow_stage = "ci_failed"
                 self.state_manager.save_state(state)
                 return None
@@ -282,6 +383,7 @@ class WorkflowStageHandler:
                     f"{pr_status.checks_passed} passed)"
                 )
                 # Show individual check statuses if available
+                queued = not pr_status.check_details
                 for check in pr_status.check_details:
                     status = (check.get("status") or "").upper()
                     check_name = self._get_check_name(check)
@@ -289,8 +391,10 @@ class WorkflowStageHandler:
                         console.detail(f"  ⏳ {check_name}: running")
                     elif status == "QUEUED":
                         console.detail(f"  ⏸ {check_name}: queued")
-                console.detail(f"Next check in {self.CI_POLL_INTERVAL}s...")
-                if not interruptible_sleep(self.CI_POLL_INTERVAL):
+                        queued = True
+                interval = self.ci_scheduler.next_interval(changed, queued=queued)
+                console.detail(f"Next check in {interval:.0f}s...")
+                if not interruptible_sleep(interval):
                     return None  # Let main loop handle cancellation
                 return None
 
@@ -344,6 +448,7 @@ After fixing, end with: TASK COMPLETE"""
             model_override=ModelType.OPUS,
             required_branch=current_branch,
         )
+        self._pr_updated(state.current_pr)
 
         # Wait for CI to start after push
         console.info("Waiting 30s for CI to start...")
@@ -365,7 +470,7 @@ After fixing, end with: TASK COMPLETE"""
         console.info(f"Checking reviews for PR #{state.current_pr}...")
 
         try:
-            pr_status = self.github_client.get_pr_status(state.current_pr)
+            pr_status = self._get_pr_status(state.current_pr)
 
             # Check if PR was already merged (e.g., manually)
             if pr_status.state == "MERGED":
@@ -511,6 +616,7 @@ After addressing ALL comments and creating the resolution file, end with: TASK C
             model_override=ModelType.OPUS,
             required_branch=current_branch,
         )
+        self._pr_updated(state.current_pr)
 
         # Post replies to comments using resolution file
         self.pr_context.post_comment_replies(state.current_pr)
@@ -534,7 +640,7 @@ After addressing ALL comments and creating the resolution file, end with: TASK C
 
         # Check PR status before attempting merge
         try:
-            pr_status = self.github_client.get_pr_status(state.current_pr)
+            pr_status = self._get_pr_status(state.current_pr)
 
             # Check if PR was already merged (e.g., manually)
             if pr_status.state == "MERGED":
@@ -609,7 +715,7 @@ After addressing ALL comments and creating the resolution file, end with: TASK C
             base_branch = "main"
             try:
                 # Get base branch from PR before clearing
-                pr_status = self.github_client.get_pr_status(state.current_pr)
+                pr_status = self._get_pr_status(state.current_pr)
                 base_branch = pr_status.base_branch
             except Exception:
                 pass  # Use default main
@@ -7,10 +7,21 @@ Module structure:
 - client.py: Main GitHubClient with initialization, merge, and mixin delegation
 - client_pr.py: PR operations mixin (create, status, comments)
 - client_ci.py: CI operations mixin (workflows, status, logs)
+- conditional.py: ETag cache for conditional REST requests
+- log_capture.py: Bounded, streaming capture of failed CI logs
+- repo_cache.py: Process-wide repository metadata cache
+- transport.py: In-process HTTPS transport for gh api calls
 - exceptions.py: All GitHub-related exception classes
 """
 
-from .client import DEFAULT_GH_TIMEOUT, GitHubClient, PRStatus, WorkflowRun
+from .client import (
+    DEFAULT_GH_TIMEOUT,
+    GitHubClient,
+    PRChangeProbe,
+    PRSnapshot,
+    PRStatus,
+    WorkflowRun,
+)
 from .exceptions import (
     GitHubAuthError,
     GitHubError,
@@ -18,15 +29,23 @@ from .exceptions import (
     GitHubNotFoundError,
     GitHubTimeoutError,
 )
+from .log_capture import FailedLogCapture
+from .repo_cache import clear_repo_cache
+from .transport import HttpTransport
 
 __all__ = [
     "DEFAULT_GH_TIMEOUT",
+    "FailedLogCapture",
     "GitHubAuthError",
     "GitHubClient",
     "GitHubError",
     "GitHubMergeError",
     "GitHubNotFoundError",
     "GitHubTimeoutError",
+    "HttpTransport",
+    "PRChangeProbe",
+    "PRSnapshot",
     "PRStatus",
     "WorkflowRun",
+    "clear_repo_cache",
 ]
@@ -4,6 +4,9 @@ This module provides the main GitHubClient class that:
 - Handles gh CLI initialization and authentication
 - Provides core command execution infrastructure
 - Implements merge operations
+- Makes conditional (ETag) REST requests for cheap polling
+- Caches repository metadata for the life of the process
+- Optionally runs ``gh api`` calls in-process over HTTPS (HttpTransport)
 - Delegates PR and CI operations to specialized mixins
 
 The client uses composition via mixins:
@@ -12,9 +15,13 @@ The client uses composition via mixins:
 """
 
 import subprocess
+import threading
+from collections.abc import Callable
+from typing import Literal
 
 from .client_ci import CIOperationsMixin, WorkflowRun
-from .client_pr import PROperationsMixin, PRStatus
+from .client_pr import PRChangeProbe, PROperationsMixin, PRSnapshot, PRStatus
+from .conditional import ConditionalResponse, ETagCache, parse_http_response, parse_json_body
 from .exceptions import (
     GitHubAuthError,
     GitHubError,
@@ -22,6 +29,9 @@ from .exceptions import (
     GitHubNotFoundError,
     GitHubTimeoutError,
 )
+from .log_capture import stream_command
+from .repo_cache import repo_metadata_cache
+from .transport import HttpTransport
 
 # Default timeout for gh CLI commands (30 seconds)
 DEFAULT_GH_TIMEOUT = 30
@@ -35,6 +45,8 @@ __all__ = [
     "GitHubAuthError",
     "GitHubNotFoundError",
     "GitHubMergeError",
+    "PRChangeProbe",
+    "PRSnapshot",
     "PRStatus",
     "WorkflowRun",
 ]
@@ -46,17 +58,61 @@ class GitHubClient(PROperationsMixin, CIOperationsMixin):
     This class provides:
     - gh CLI initialization and authentication checking
     - Core command execution with timeout handling
-    - Repository information retrieval
+    - Repository information retrieval (cached per process)
     - PR merge operations
 
     PR and CI operations are provided via mixins:
-    - PROperationsMixin: create_pr, get_pr_status, get_pr_for_current_branch, get_pr_comments
+    - PROperationsMixin: create_pr, get_pr_status, run_graphql, get_pr_snapshot,
+      probe_pr_changes, get_pr_for_current_branch, get_pr_comments
     - CIOperationsMixin: get_workflow_runs, get_workflow_run_status, get_failed_run_logs, wait_for_ci
     """
 
-    def __init__(self) -> None:
-        """Initialize GitHub client and verify gh CLI is available and authenticated."""
+    def __init__(
+        self,
+        transport: Literal["gh", "http"] | None = None,
+        api_url: str | None = None,
+    ) -> None:
+        """Initialize GitHub client and verify gh CLI is available and authenticated.
+
+        Args:
+            transport: "gh" to run API calls through gh, "http" to make them
+                in-process. Defaults to ``github.transport`` from the config.
+            api_url: API root for the "http" transport. Defaults to
+                ``github.api_url`` from the config.
+        """
         self._check_gh_cli()
+        self._etag_cache = ETagCache()
+        self._api_calls = 0
+        self._api_calls_lock = threading.Lock()
+
+        if transport is None or (transport == "http" and api_url is None):
+            from ..core.config_loader import get_config
+
+            github_config = get_config().github
+            transport = transport or github_config.transport
+            api_url = api_url or github_config.api_url
+        self._http: HttpTransport | None = (
+            HttpTransport(api_url=api_url) if transport == "http" and api_url else None
+        )
+
+    @property
+    def uses_http_transport(self) -> bool:
+        """Whether API calls are made in-process rather than by spawning gh."""
+        return self._http is not None
+
+    @property
+    def api_calls(self) -> int:
+        """GitHub calls made so far (gh processes spawned or HTTP requests)."""
+        return self._api_calls
+
+    def record_api_calls(self, count: int = 1) -> None:
+        """Count GitHub calls made outside _run_gh_command (e.g., direct gh runs).
+
+        Args:
+            count: Number of calls to add.
+        """
+        with self._api_calls_lock:
+            self._api_calls += count
 
     def _run_gh_command(
         self,
@@ -69,6 +125,8 @@ class GitHubClient(PROperationsMixin, CIOperationsMixin):
         """Run a gh CLI command with proper timeout and error handling.
 
         This is the core command execution method used by all GitHub operations.
+        With the "http" transport, supported ``gh api`` calls are answered
+        in-process instead of spawning gh.
 
         Args:
             cmd: Command and arguments to run (e.g., ["gh", "pr", "list"]).
@@ -84,15 +142,18 @@ class GitHubClient(PROperationsMixin, CIOperationsMixin):
             GitHubTimeoutError: If command times out.
             GitHubError: If command fails and check=True.
         """
+        self.record_api_calls()
         try:
-            result = subprocess.run(
-                cmd,
-                timeout=timeout,
-                check=False,  # We'll handle errors ourselves
-                capture_output=capture_output,
-                text=True,
-                cwd=cwd,
-            )
+            result = self._http.run(cmd, timeout) if self._http is not None else None
+            if result is None:
+                result = subprocess.run(
+                    cmd,
+                    timeout=timeout,
+                    check=False,  # We'll handle errors ourselves
+                    capture_output=capture_output,
+                    text=True,
+                    cwd=cwd,
+                )
 
             if check and result.returncode != 0:
                 error_msg = (
@@ -110,6 +171,89 @@ class GitHubClient(PROperationsMixin, CIOperationsMixin):
                 command=cmd,
             ) from e
 
+    def _stream_gh_command(
+        self,
+        cmd: list[str],
+        on_line: Callable[[str], None],
+        idle_timeout: int = DEFAULT_GH_TIMEOUT,
+        total_timeout: int | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        """Run a gh CLI command, handing its stdout to ``on_line`` line by line.
+
+        For commands with output too large to buffer (e.g., CI logs). Always
+        spawns gh, whatever the transport, and never raises on a non-zero
+        exit code.
+
+        Args:
+            cmd: Command and arguments to run.
+            on_line: Called with each stdout line as it is read.
+            idle_timeout: Seconds without output before the command is killed.
+            total_timeout: Seconds before the command is killed regardless.
+
+        Returns:
+            CompletedProcess with the exit code and stderr (stdout is empty).
+
+        Raises:
+            GitHubTimeoutError: If command times out.
+        """
+        self.record_api_calls()
+        try:
+            return stream_command(cmd, on_line, idle_timeout, total_timeout)
+        except subprocess.TimeoutExpired as e:
+            raise GitHubTimeoutError(
+                f"Command timed out after {e.timeout}s: {' '.join(cmd)}",
+                command=cmd,
+            ) from e
+
+    def _api_get_conditional(self, endpoint: str, timeout: int = 15) -> ConditionalResponse:
+        """GET a REST endpoint with If-None-Match, reusing the cached body on 304.
+
+        Args:
+            endpoint: REST path (e.g., "repos/owner/repo/pulls/1").
+            timeout: Timeout in seconds.
+
+        Returns:
+            ConditionalResponse; ``not_modified`` is True (and ``data`` is the
+            cached body) when the resource didn't change.
+
+        Raises:
+            GitHubError: If the request fails.
+            GitHubTimeoutError: If command times out.
+        """
+        cached = self._etag_cache.get(endpoint)
+        cmd = ["gh", "api", "--include", endpoint]
+        if cached:
+            cmd += ["-H", f"If-None-Match: {cached[0]}"]
+        result = self._run_gh_command(cmd, timeout=timeout, check=False)
+
+        status, headers, body = parse_http_response(result.stdout or "")
+        remaining = headers.get("x-ratelimit-remaining")
+        rate_limit_remaining = int(remaining) if remaining and remaining.isdigit() else None
+
+        if status == 304 and cached:
+            return ConditionalResponse(
+                status=304,
+                data=cached[1],
+                etag=cached[0],
+                not_modified=True,
+                rate_limit_remaining=rate_limit_remaining,
+            )
+        if status is None or status >= 400:
+            error_msg = (
+                result.stderr.strip()
+                if result.stderr
+                else f"GET {endpoint} failed with status {status}"
+            )
+            raise GitHubError(error_msg, command=cmd, exit_code=result.returncode)
+
+        data = parse_json_body(body)
+        etag = headers.get("etag")
+        if etag:
+            self._etag_cache.put(endpoint, etag, data)
+        return ConditionalResponse(
+            status=status, data=data, etag=etag, rate_limit_remaining=rate_limit_remaining
+        )
+
     def _check_gh_cli(self) -> None:
         """Check if gh CLI is installed and authenticated.
 
@@ -146,8 +290,8 @@ class GitHubClient(PROperationsMixin, CIOperationsMixin):
                 command=["gh", "auth", "status"],
             ) from e
 
-    def _get_repo_info(self) -> str:
-        """Get current repository owner/name.
+    def get_repo_name(self) -> str:
+        """Get current repository owner/name, cached per working directory.
 
         Returns:
             Repository in owner/name format (e.g., "owner/repo").
@@ -156,11 +300,45 @@ class GitHubClient(PROperationsMixin, CIOperationsMixin):
             GitHubError: If command fails.
             GitHubTimeoutError: If command times out.
         """
-        result = self._run_gh_command(
-            ["gh", "repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner"],
-            timeout=15,
+        return repo_metadata_cache.get_repo_name(
+            lambda: self._run_gh_command(
+                ["gh", "repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner"],
+                timeout=15,
+            ).stdout.strip(),
+        )
+
+    def _get_repo_info(self) -> str:
+        """Get current repository owner/name (cached, see get_repo_name)."""
+        return self.get_repo_name()
+
+    def get_default_branch(self) -> str:
+        """Get the repository's default branch, cached for the life of the process.
+
+        Returns:
+            Default branch name (e.g., "main").
+
+        Raises:
+            GitHubError: If command fails.
+            GitHubTimeoutError: If command times out.
+        """
+        repo = self.get_repo_name()
+        return repo_metadata_cache.get_or_load(
+            repo,
+            "default_branch",
+            lambda: self._run_gh_command(
+                [
+                    "gh",
+                    "repo",
+                    "view",
+                    repo,
+                    "--json",
+                    "defaultBranchRef",
+                    "-q",
+                    ".defaultBranchRef.name",
+                ],
+                timeout=15,
+            ).stdout.strip(),
         )
-        return result.stdout.strip()
 
     def merge_pr(self, pr_number: int, use_auto: bool = True) -> None:
         """Merge a pull request using squash strategy.
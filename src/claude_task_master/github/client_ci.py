@@ -3,10 +3,18 @@
 import json
 import subprocess
 import time
+from collections.abc import Callable
 from typing import Protocol
 
 from pydantic import BaseModel
 
+from .log_capture import FailedLogCapture
+
+# `gh run view --log-failed` is killed after this long without output, or
+# after the overall limit while it is still streaming
+LOG_IDLE_TIMEOUT = 60
+LOG_TOTAL_TIMEOUT = 600
+
 
 class WorkflowRun(BaseModel):
     """GitHub Actions workflow run information."""
@@ -34,6 +42,16 @@ class GitHubClientProtocol(Protocol):
         """Run a gh CLI command."""
         raise NotImplementedError("Protocol method must be implemented")
 
+    def _stream_gh_command(
+        self,
+        cmd: list[str],
+        on_line: Callable[[str], None],
+        idle_timeout: int = 30,
+        total_timeout: int | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        """Run a gh CLI command, streaming its stdout."""
+        raise NotImplementedError("Protocol method must be implemented")
+
     def get_workflow_runs(self, limit: int = 5, branch: str | None = None) -> list["WorkflowRun"]:
         """Get workflow runs."""
         raise NotImplementedError("Protocol method must be implemented")
@@ -131,9 +149,13 @@ class CIOperationsMixin:
     ) -> str:
         """Get logs from failed workflow run jobs.
 
+        The log is streamed rather than buffered: each job keeps its last
+        ``max_lines`` lines plus up to ``max_lines`` lines around its first
+        errors and tracebacks (see FailedLogCapture).
+
         Args:
             run_id: Specific run ID. If None, gets the latest failed run.
-            max_lines: Maximum lines of logs to return per job.
+            max_lines: Maximum tail lines of logs to return per job.
 
         Returns:
             Formatted log output.
@@ -150,15 +172,22 @@ class CIOperationsMixin:
                 return "No workflow runs found"
 
         cmd = ["gh", "run", "view", str(run_id), "--log-failed"]
+        capture = FailedLogCapture(max_lines)
         try:
-            result = self._run_gh_command(cmd, timeout=60, check=False)  # Logs can be large
+            # Logs can be huge - only the bounded capture is kept in memory
+            result = self._stream_gh_command(
+                cmd,
+                capture.feed,
+                idle_timeout=LOG_IDLE_TIMEOUT,
+                total_timeout=LOG_TOTAL_TIMEOUT,
+            )
         except GitHubTimeoutError:
             return "Error getting logs: Command timed out"
 
         if result.returncode != 0:
             return f"Error getting logs: {result.stderr}"
 
-        return _truncate_log_output(result.stdout.strip(), max_lines)
+        return capture.render()
 
     def wait_for_ci(
         self: GitHubClientProtocol, pr_number: int | None = None, timeout: int = 300
@@ -251,22 +280,6 @@ def _find_failed_run_id(client: GitHubClientProtocol) -> int | None:
     return None
 
 
-def _truncate_log_output(output: str, max_lines: int) -> str:
-    """Truncate log output if too long.
-
-    Args:
-        output: The log output string.
-        max_lines: Maximum number of lines to keep.
-
-    Returns:
-        Truncated output with indicator if truncated.
-    """
-    lines = output.split("\n")
-    if len(lines) > max_lines:
-        return "\n".join(lines[:max_lines]) + f"\n\n... ({len(lines) - max_lines} more lines)"
-    return output
-
-
 def _check_pr_ci_status(client: GitHubClientProtocol, pr_number: int) -> tuple[bool, str, bool]:
     """Check CI status for a PR.
 
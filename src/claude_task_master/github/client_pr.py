@@ -6,6 +6,13 @@ from typing import Any, Protocol
 
 from pydantic import BaseModel
 
+from .conditional import ConditionalResponse
+from .repo_cache import repo_metadata_cache
+
+# Review threads listed per page, and comments read per thread
+THREAD_PAGE_SIZE = 100
+COMMENTS_PER_THREAD = 100
+
 
 class PRStatus(BaseModel):
     """PR status information."""
@@ -27,6 +34,34 @@ class PRStatus(BaseModel):
         "UNKNOWN"  # BLOCKED, BEHIND, CLEAN, DIRTY, HAS_HOOKS, UNKNOWN, UNSTABLE
     )
     base_branch: str = "main"
+    head_sha: str = ""
+
+
+class PRChangeProbe(BaseModel):
+    """Result of probing a PR for changes with conditional requests."""
+
+    changed: bool
+    requests: int = 0
+    not_modified: int = 0  # 304 responses (free against the rate limit)
+    rate_limit_remaining: int | None = None
+
+    @property
+    def quota_points(self) -> int:
+        """REST rate-limit points the probe consumed."""
+        return self.requests - self.not_modified
+
+
+class PRSnapshot(BaseModel):
+    """A PR's status, checks and review threads from a single GraphQL query."""
+
+    status: PRStatus
+    # id, is_resolved, comment_count and updated_at (latest comment) per thread
+    review_threads: list[dict[str, Any]] = []
+
+    @property
+    def head_sha(self) -> str:
+        """Head commit of the PR."""
+        return self.status.head_sha
 
 
 class GitHubClientProtocol(Protocol):
@@ -47,6 +82,14 @@ class GitHubClientProtocol(Protocol):
         """Get repository info."""
         raise NotImplementedError("Protocol method must be implemented")
 
+    def _api_get_conditional(self, endpoint: str, timeout: int = 15) -> ConditionalResponse:
+        """GET a REST endpoint with If-None-Match."""
+        raise NotImplementedError("Protocol method must be implemented")
+
+    def list_review_threads(self, pr_number: int, after: str | None = None) -> list[dict[str, Any]]:
+        """List review-thread change markers."""
+        raise NotImplementedError("Protocol method must be implemented")
+
 
 class PROperationsMixin:
     """Mixin class providing PR operations for GitHubClient.
@@ -124,11 +167,171 @@ class PROperationsMixin:
 
         return _parse_pr_status_response(pr_number, pr_data)
 
+    def run_graphql(
+        self: GitHubClientProtocol,
+        query: str,
+        args: list[str] | None = None,
+        check: bool = True,
+    ) -> subprocess.CompletedProcess[str]:
+        """Run a GraphQL query or mutation with ``gh api graphql``.
+
+        Args:
+            query: The GraphQL document.
+            args: Variable arguments (``-f name=value`` / ``-F name=value``).
+            check: Whether to raise on a non-zero exit code. GraphQL errors
+                make gh exit non-zero even when part of the data came back.
+
+        Returns:
+            CompletedProcess with the JSON response on stdout.
+
+        Raises:
+            GitHubError: If the request fails and check=True.
+            GitHubTimeoutError: If command times out.
+        """
+        return self._run_gh_command(
+            ["gh", "api", "graphql", "-f", f"query={query}", *(args or [])],
+            timeout=30,
+            check=check,
+        )
+
+    def get_pr_snapshot(self: GitHubClientProtocol, pr_number: int) -> PRSnapshot:
+        """Get PR status, checks and review-thread markers in one GraphQL query.
+
+        Combines what get_pr_status, the review-thread listing and the
+        workflow-run lookup for failed checks otherwise fetch separately.
+        PRs with more than one page of review threads list the rest with
+        list_review_threads, without refetching the checks.
+
+        Args:
+            pr_number: The PR number.
+
+        Returns:
+            PRSnapshot of the PR.
+
+        Raises:
+            GitHubError: If GraphQL query fails.
+            GitHubTimeoutError: If command times out.
+        """
+        owner, repo = self._get_repo_info().split("/")
+        query = _build_pr_status_query(snapshot=True)
+
+        result = self._run_gh_command(
+            [
+                "gh",
+                "api",
+                "graphql",
+                "-f",
+                f"query={query}",
+                "-F",
+                f"owner={owner}",
+                "-F",
+                f"repo={repo}",
+                "-F",
+                f"pr={pr_number}",
+            ],
+            timeout=30,
+        )
+        pr_data = json.loads(result.stdout)["data"]["repository"]["pullRequest"]
+        connection = pr_data["reviewThreads"]
+        threads = _parse_review_thread_markers(connection["nodes"])
+        page_info = connection.get("pageInfo") or {}
+        if page_info.get("hasNextPage") and page_info.get("endCursor"):
+            threads += self.list_review_threads(pr_number, after=page_info["endCursor"])
+
+        # Thread counts in the status cover every page
+        all_nodes = [{"isResolved": t["is_resolved"]} for t in threads]
+        pr_data = {**pr_data, "reviewThreads": {"nodes": all_nodes}}
+        return PRSnapshot(
+            status=_parse_pr_status_response(pr_number, pr_data),
+            review_threads=threads,
+        )
+
+    def list_review_threads(
+        self: GitHubClientProtocol, pr_number: int, after: str | None = None
+    ) -> list[dict[str, Any]]:
+        """List a PR's review threads with their change markers.
+
+        Pages through ``reviewThreads`` by cursor, fetching only what tells
+        whether a thread changed: its resolution, comment count and the
+        latest comment ``updatedAt``.
+
+        Args:
+            pr_number: The PR number.
+            after: Cursor to continue after (None lists from the start).
+
+        Returns:
+            List of dicts with id, is_resolved, comment_count and updated_at.
+
+        Raises:
+            GitHubError: If GraphQL query fails.
+            GitHubTimeoutError: If command times out.
+        """
+        owner, repo = self._get_repo_info().split("/")
+        query = _build_review_threads_query()
+
+        threads: list[dict[str, Any]] = []
+        cursor = after
+        while True:
+            args = ["-F", f"owner={owner}", "-F", f"repo={repo}", "-F", f"pr={pr_number}"]
+            if cursor:
+                args += ["-f", f"cursor={cursor}"]
+            result = self._run_gh_command(
+                ["gh", "api", "graphql", "-f", f"query={query}", *args], timeout=30
+            )
+            data = json.loads(result.stdout)
+            connection = data["data"]["repository"]["pullRequest"]["reviewThreads"]
+            threads += _parse_review_thread_markers(connection["nodes"])
+            page_info = connection.get("pageInfo") or {}
+            cursor = page_info.get("endCursor")
+            if not page_info.get("hasNextPage") or not cursor:
+                return threads
+
+    def probe_pr_changes(
+        self: GitHubClientProtocol, pr_number: int, head_sha: str
+    ) -> PRChangeProbe:
+        """Check whether a PR or its head commit's checks changed since the last probe.
+
+        Uses conditional REST requests for the PR, its check runs and its
+        commit statuses; unchanged resources answer 304 and cost no rate
+        limit. The first probe of a resource always reports a change.
+
+        Args:
+            pr_number: The PR number.
+            head_sha: Head commit whose checks are watched.
+
+        Returns:
+            PRChangeProbe with whether anything changed and the request counts.
+
+        Raises:
+            GitHubError: If a request fails.
+            GitHubTimeoutError: If command times out.
+        """
+        repo_info = self._get_repo_info()
+        endpoints = [
+            f"repos/{repo_info}/pulls/{pr_number}",
+            f"repos/{repo_info}/commits/{head_sha}/check-runs?per_page=100",
+            f"repos/{repo_info}/commits/{head_sha}/status",
+        ]
+        probe = PRChangeProbe(changed=False)
+        for endpoint in endpoints:
+            response = self._api_get_conditional(endpoint)
+            probe.requests += 1
+            if response.not_modified:
+                probe.not_modified += 1
+            else:
+                probe.changed = True
+            if response.rate_limit_remaining is not None:
+                probe.rate_limit_remaining = response.rate_limit_remaining
+        return probe
+
     def get_required_status_checks(
         self: GitHubClientProtocol, base_branch: str = "main"
     ) -> list[str]:
         """Get required status checks from branch protection rules.
 
+        Results are cached for the life of the process; transient failures
+        return an empty list without being cached.
+
         Args:
             base_branch: The base branch to check protection for.
 
@@ -138,20 +341,32 @@ class PROperationsMixin:
         from .exceptions import GitHubError, GitHubTimeoutError
 
         repo_info = self._get_repo_info()
-        try:
-            result = self._run_gh_command(
-                [
-                    "gh",
-                    "api",
-                    f"repos/{repo_info}/branches/{base_branch}/protection/required_status_checks",
-                    "--jq",
-                    ".contexts",
-                ],
-                timeout=15,
-            )
+
+        def load() -> list[str]:
+            try:
+                result = self._run_gh_command(
+                    [
+                        "gh",
+                        "api",
+                        f"repos/{repo_info}/branches/{base_branch}/protection/required_status_checks",
+                        "--jq",
+                        ".contexts",
+                    ],
+                    timeout=15,
+                )
+            except GitHubError as e:
+                if "HTTP 404" in str(e):
+                    return []  # Branch not protected - that won't change mid-run
+                raise
             # Parse JSON array of context names
             contexts = json.loads(result.stdout)
             return contexts if isinstance(contexts, list) else []
+
+        try:
+            # Protection rules are cached for the life of the process
+            return list(
+                repo_metadata_cache.get_or_load(repo_info, f"required_checks:{base_branch}", load)
+            )
         except (GitHubError, GitHubTimeoutError):
             # No branch protection or no required checks
             return []
@@ -246,60 +461,133 @@ class PROperationsMixin:
         return _format_pr_comments(threads, only_unresolved)
 
 
-def _build_pr_status_query() -> str:
-    """Build GraphQL query for PR status."""
-    return """
-    query($owner: String!, $repo: String!, $pr: Int!) {
-      repository(owner: $owner, name: $repo) {
-        pullRequest(number: $pr) {
+# Review-thread fields telling whether a thread changed, one page at a time
+REVIEW_THREAD_MARKERS = f"""
+            pageInfo {{
+              hasNextPage
+              endCursor
+            }}
+            nodes {{
+              id
+              isResolved
+              comments(first: {COMMENTS_PER_THREAD}) {{
+                totalCount
+                nodes {{
+                  updatedAt
+                }}
+              }}
+            }}"""
+
+
+def _build_pr_status_query(snapshot: bool = False) -> str:
+    """Build GraphQL query for PR status.
+
+    Args:
+        snapshot: Build the PRSnapshot query instead, which also reads each
+            check's workflow run and the first page of review-thread change
+            markers (instead of the first comments of each thread).
+    """
+    if snapshot:
+        contexts = 100
+        workflow_run = "\n                        checkSuite { workflowRun { databaseId } }"
+        threads = (
+            f"reviewThreads(first: {THREAD_PAGE_SIZE}) {{{REVIEW_THREAD_MARKERS}\n          }}"
+        )
+    else:
+        contexts = 50
+        workflow_run = ""
+        threads = """reviewThreads(first: 100) {
+            nodes {
+              isResolved
+              comments(first: 10) {
+                nodes {
+                  author { login }
+                  body
+                  path
+                  line
+                }
+              }
+            }
+          }"""
+    return f"""
+    query($owner: String!, $repo: String!, $pr: Int!) {{
+      repository(owner: $owner, name: $repo) {{
+        pullRequest(number: $pr) {{
           state
           mergeable
           mergeStateStatus
           baseRefName
-          commits(last: 1) {
-            nodes {
-              commit {
-                statusCheckRollup {
+          headRefOid
+          commits(last: 1) {{
+            nodes {{
+              commit {{
+                statusCheckRollup {{
                   state
-                  contexts(first: 50) {
-                    nodes {
+                  contexts(first: {contexts}) {{
+                    nodes {{
                       __typename
-                      ... on CheckRun {
+                      ... on CheckRun {{
                         name
                         status
                         conclusion
-                        detailsUrl
-                      }
-                      ... on StatusContext {
+                        detailsUrl{workflow_run}
+                      }}
+                      ... on StatusContext {{
                         context
                         state
                         targetUrl
-                      }
-                    }
-                  }
-                }
-              }
-            }
-          }
-          reviewThreads(first: 100) {
-            nodes {
-              isResolved
-              comments(first: 10) {
-                nodes {
-                  author { login }
-                  body
-                  path
-                  line
-                }
-              }
-            }
-          }
-        }
-      }
-    }
+                      }}
+                    }}
+                  }}
+                }}
+              }}
+            }}
+          }}
+          {threads}
+        }}
+      }}
+    }}
     """
 
 
+def _build_review_threads_query() -> str:
+    """Build GraphQL query for one page of review-thread change markers."""
+    return f"""
+    query($owner: String!, $repo: String!, $pr: Int!, $cursor: String) {{
+      repository(owner: $owner, name: $repo) {{
+        pullRequest(number: $pr) {{
+          reviewThreads(first: {THREAD_PAGE_SIZE}, after: $cursor) {{{REVIEW_THREAD_MARKERS}
+          }}
+        }}
+      }}
+    }}
+    """
+
+
+def _parse_review_thread_markers(nodes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Reduce review thread nodes to what tells whether a thread changed.
+
+    Args:
+        nodes: reviewThreads nodes with id, isResolved and comment updatedAt.
+
+    Returns:
+        List of dicts with id, is_resolved, comment_count and updated_at.
+    """
+    threads = []
+    for node in nodes:
+        comments = node.get("comments") or {}
+        updated = [c.get("updatedAt") or "" for c in comments.get("nodes", [])]
+        threads.append(
+            {
+                "id": node["id"],
+                "is_resolved": node["isResolved"],
+                "comment_count": comments.get("totalCount", len(updated)),
+                "updated_at": max(updated, default=""),
+            }
+        )
+    return threads
+
+
 def _parse_pr_status_response(pr_number: int, pr_data: dict[str, Any]) -> PRStatus:
     """Parse GraphQL response into PRStatus object.
 
@@ -346,6 +634,7 @@ def _parse_pr_status_response(pr_number: int, pr_data: dict[str, Any]) -> PRStat
     mergeable = pr_data.get("mergeable", "UNKNOWN")
     merge_state_status = pr_data.get("mergeStateStatus", "UNKNOWN")
     base_branch = pr_data.get("baseRefName", "main")
+    head_sha = pr_data.get("headRefOid") or ""
 
     return PRStatus(
         number=pr_number,
@@ -362,6 +651,7 @@ def _parse_pr_status_response(pr_number: int, pr_data: dict[str, Any]) -> PRStat
         mergeable=mergeable,
         merge_state_status=merge_state_status,
         base_branch=base_branch,
+        head_sha=head_sha,
     )
 
 
@@ -386,6 +676,10 @@ def _parse_check_contexts(contexts: list[dict[str, Any]]) -> list[dict[str, Any]
                     "url": ctx.get("detailsUrl"),
                 }
             )
+            # Workflow run of the check (only requested by the snapshot query)
+            run = (ctx.get("checkSuite") or {}).get("workflowRun") or {}
+            if run.get("databaseId"):
+                check_details[-1]["run_id"] = run["databaseId"]
         elif ctx.get("__typename") == "StatusContext":
             # StatusContext uses 'context' for name and 'state' for status
             check_details.append(
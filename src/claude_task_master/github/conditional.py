@@ -0,0 +1,89 @@
+"""Conditional REST requests - ETag caching for gh api calls.
+
+GitHub answers a request carrying ``If-None-Match: <etag>`` with
+``304 Not Modified`` when the resource is unchanged, and 304s don't count
+against the REST rate limit. ``ETagCache`` remembers the ETag and parsed body
+per endpoint so pollers can re-request for free until something changes.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class ConditionalResponse(BaseModel):
+    """Result of a conditional GET."""
+
+    status: int
+    data: Any = None
+    etag: str | None = None
+    not_modified: bool = False  # 304 - data is the cached body
+    rate_limit_remaining: int | None = None
+
+
+class ETagCache:
+    """Thread-safe endpoint -> (ETag, parsed body) cache."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before the oldest are dropped.
+        """
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> tuple[str, Any] | None:
+        """Get the cached (etag, data) for an endpoint."""
+        with self._lock:
+            return self._entries.get(endpoint)
+
+    def put(self, endpoint: str, etag: str, data: Any) -> None:
+        """Remember the ETag and body of an endpoint."""
+        with self._lock:
+            self._entries.pop(endpoint, None)
+            self._entries[endpoint] = (etag, data)
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+
+    def clear(self) -> None:
+        """Forget all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def parse_http_response(output: str) -> tuple[int | None, dict[str, str], str]:
+    """Split ``gh api --include`` output into status, headers and body.
+
+    Args:
+        output: stdout of ``gh api -i``.
+
+    Returns:
+        Tuple of (status code or None if unparseable, lowercase headers, body).
+    """
+    text = output.replace("\r\n", "\n")
+    head, _, body = text.partition("\n\n")
+    lines = head.split("\n")
+    status: int | None = None
+    parts = lines[0].split()
+    if len(parts) >= 2 and parts[0].startswith("HTTP/") and parts[1].isdigit():
+        status = int(parts[1])
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return status, headers, body
+
+
+def parse_json_body(body: str) -> Any:
+    """Parse a JSON response body (empty body -> None)."""
+    return json.loads(body) if body.strip() else None
@@ -0,0 +1,191 @@
+"""Failed CI log capture - bounded, streaming extraction of failure output.
+
+``gh run view --log-failed`` prints every line of every failed job, which for
+a large test suite can be hundreds of megabytes. ``FailedLogCapture`` is fed
+the output one line at a time and keeps, per job, only the last ``max_lines``
+lines plus the regions around error and traceback lines, so memory stays
+bounded no matter how long the log is. ``stream_command`` pipes a
+subprocess's stdout into such a consumer line by line.
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+
+# Lines that start an error region worth keeping even when far from the end
+ERROR_PATTERN = re.compile(
+    r"Traceback \(most recent call last\)"
+    r"|##\[error\]"
+    r"|\b(?:ERROR|FAILED|FAIL|FATAL|panic)\b"
+    r"|\b\w*(?:Error|Exception)\b"
+    r"|\berror(?:\[\w+\])?:"
+)
+
+# Lines kept before and after each error line
+CONTEXT_BEFORE = 3
+CONTEXT_AFTER = 15
+
+
+class _JobCapture:
+    """Bounded capture of one job's log lines, numbered from 0."""
+
+    def __init__(self, max_lines: int) -> None:
+        self.max_lines = max_lines
+        self.total = 0
+        self.tail: deque[tuple[int, str]] = deque(maxlen=max_lines)
+        self.regions: list[tuple[int, str]] = []  # First error regions, capped
+        self._before: deque[tuple[int, str]] = deque(maxlen=CONTEXT_BEFORE)
+        self._after = 0  # Lines still to keep after the last error line
+
+    def feed(self, line: str) -> None:
+        numbered = (self.total, line)
+        self.total += 1
+        if len(self.regions) < self.max_lines:
+            if ERROR_PATTERN.search(line):
+                self.regions.extend(self._before)
+                self._before.clear()
+                self.regions.append(numbered)
+                self._after = CONTEXT_AFTER
+            elif self._after:
+                self.regions.append(numbered)
+                self._after -= 1
+            else:
+                self._before.append(numbered)
+            del self.regions[self.max_lines :]
+        self.tail.append(numbered)
+
+    def lines(self) -> Iterator[str]:
+        # Region and tail lines are both in order; merge them, marking gaps
+        kept = dict(self.regions)
+        kept.update(self.tail)
+        expected = 0
+        for number in sorted(kept):
+            if number > expected:
+                yield f"... ({number - expected} lines omitted)"
+            yield kept[number]
+            expected = number + 1
+        if self.total > expected:
+            yield f"... ({self.total - expected} lines omitted)"
+
+
+class FailedLogCapture:
+    """Keep the last lines and error regions of each failed job's log.
+
+    Lines of ``gh run view --log-failed`` are prefixed with the job name and
+    a tab; lines without a tab are grouped under one unnamed job. Each job
+    keeps at most ``max_lines`` tail lines plus ``max_lines`` lines of its
+    first error regions, and omitted stretches are replaced by a marker.
+
+    Example:
+        >>> capture = FailedLogCapture(max_lines=50)
+        >>> for line in log_lines:
+        ...     capture.feed(line)
+        >>> print(capture.render())
+    """
+
+    def __init__(self, max_lines: int = 100) -> None:
+        """Initialize the capture.
+
+        Args:
+            max_lines: Tail lines (and error-region lines) kept per job.
+        """
+        self.max_lines = max(1, max_lines)
+        self.total_lines = 0
+        self._jobs: dict[str, _JobCapture] = {}
+
+    def feed(self, line: str) -> None:
+        """Add one line of log output.
+
+        Args:
+            line: The line, with or without its trailing newline.
+        """
+        line = line.rstrip("\r\n")
+        job_name = line.split("\t", 1)[0] if "\t" in line else ""
+        job = self._jobs.get(job_name)
+        if job is None:
+            job = self._jobs[job_name] = _JobCapture(self.max_lines)
+        job.feed(line)
+        self.total_lines += 1
+
+    @property
+    def jobs(self) -> list[str]:
+        """Job names in the order they first appeared."""
+        return list(self._jobs)
+
+    def lines(self) -> Iterator[str]:
+        """Yield the kept lines of every job, in first-seen job order."""
+        for job in self._jobs.values():
+            yield from job.lines()
+
+    def render(self) -> str:
+        """Get the kept lines as one string."""
+        return "\n".join(self.lines()).strip()
+
+
+def stream_command(
+    cmd: list[str],
+    on_line: Callable[[str], None],
+    idle_timeout: float,
+    total_timeout: float | None = None,
+) -> subprocess.CompletedProcess[str]:
+    """Run a command, passing each stdout line to ``on_line`` as it arrives.
+
+    Stdout is never buffered as a whole; stderr goes to a temporary file so
+    a chatty stderr can't block the process while stdout is being read.
+
+    Args:
+        cmd: Command and arguments to run.
+        on_line: Called with each stdout line (including its newline).
+        idle_timeout: Kill the process after this many seconds without output.
+        total_timeout: Kill the process after this many seconds overall.
+
+    Returns:
+        CompletedProcess with the return code and stderr; stdout is empty.
+
+    Raises:
+        subprocess.TimeoutExpired: If a timeout killed the process.
+    """
+    with tempfile.TemporaryFile(mode="w+") as stderr:
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=stderr, text=True, errors="replace"
+        )
+        start = time.monotonic()
+        last_output = start
+        timed_out = threading.Event()
+        done = threading.Event()
+
+        def watchdog() -> None:
+            while not done.wait(min(1.0, idle_timeout)):
+                now = time.monotonic()
+                if now - last_output > idle_timeout or (
+                    total_timeout is not None and now - start > total_timeout
+                ):
+                    timed_out.set()
+                    process.kill()
+                    return
+
+        watcher = threading.Thread(target=watchdog, daemon=True)
+        watcher.start()
+        try:
+            for line in process.stdout or ():
+                last_output = time.monotonic()
+                on_line(line)
+            returncode = process.wait()
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            done.set()
+            watcher.join()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, total_timeout or idle_timeout)
+        stderr.seek(0)
+        return subprocess.CompletedProcess(cmd, returncode, stdout="", stderr=stderr.read())
@@ -0,0 +1,79 @@
+"""Process-wide cache of repository metadata.
+
+The repository name, its default branch and branch-protection required
+checks don't change during a run, but used to be looked up with a fresh
+``gh`` process on every call. ``RepoMetadataCache`` keeps each value for the
+life of the process. The repository name is resolved once per working
+directory, because that is where ``gh`` reads it from; everything else is
+keyed on the resolved owner/name, so worktrees and subdirectories of one
+repository share it.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Key of the repository name within a working directory's entries
+NAME_KEY = "name_with_owner"
+
+
+class RepoMetadataCache:
+    """Thread-safe (repository, key) -> value cache."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._values: dict[tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, repo: str, key: str, load: Callable[[], T]) -> T:
+        """Get a cached value of a repository, loading it on first use.
+
+        Exceptions from ``load`` propagate and nothing is cached, so a
+        failed lookup is retried on the next call.
+
+        Args:
+            repo: Repository the value belongs to, in owner/name format.
+            key: Cache key within the repository.
+            load: Loads the value on a miss.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        return self._get_or_load((repo, key), load)
+
+    def get_repo_name(self, load: Callable[[], str]) -> str:
+        """Get the owner/name of the current working directory's repository.
+
+        Args:
+            load: Resolves the repository name on a miss.
+
+        Returns:
+            The cached or freshly resolved repository name.
+        """
+        return self._get_or_load((os.getcwd(), NAME_KEY), load)
+
+    def _get_or_load(self, cache_key: tuple[str, str], load: Callable[[], T]) -> T:
+        with self._lock:
+            if cache_key in self._values:
+                return self._values[cache_key]  # type: ignore[no-any-return]
+        value = load()
+        with self._lock:
+            return self._values.setdefault(cache_key, value)  # type: ignore[no-any-return]
+
+    def clear(self) -> None:
+        """Forget all cached values."""
+        with self._lock:
+            self._values.clear()
+
+
+repo_metadata_cache = RepoMetadataCache()
+
+
+def clear_repo_cache() -> None:
+    """Forget cached repository metadata (e.g., after changing repositories)."""
+    repo_metadata_cache.clear()
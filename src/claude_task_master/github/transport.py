@@ -0,0 +1,252 @@
+"""Native HTTP transport for ``gh api`` calls.
+
+``HttpTransport`` answers the ``gh api`` invocations GitHubClient makes
+(GraphQL queries and REST GETs) directly over HTTPS with httpx, saving the
+``gh`` process startup on every call in polling loops. Results are returned
+as ``CompletedProcess`` objects shaped like gh's output, so callers can't
+tell the difference. Invocations it doesn't understand (other ``gh``
+subcommands, REST writes, ``--paginate``, non-trivial ``--jq``) return None
+and run through ``gh`` as before.
+
+The token comes from ``GH_TOKEN``/``GITHUB_TOKEN`` or ``gh auth token`` and is
+read once per process.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import threading
+from typing import Any
+
+import httpx
+
+from .exceptions import GitHubError
+
+DEFAULT_API_URL = "https://api.github.com"
+
+# `--jq` expressions we can evaluate ourselves: "." or ".a.b"
+_SIMPLE_JQ = re.compile(r"^\.$|^(\.[A-Za-z_][A-Za-z0-9_]*)+$")
+
+_token: str | None = None
+_token_lock = threading.Lock()
+
+
+def read_gh_token() -> str:
+    """Get the GitHub token, reading it once per process.
+
+    Returns:
+        The token from GH_TOKEN, GITHUB_TOKEN or ``gh auth token``.
+
+    Raises:
+        GitHubError: If no token is available.
+    """
+    global _token
+    with _token_lock:
+        if _token is None:
+            token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+            if not token:
+                try:
+                    result = subprocess.run(
+                        ["gh", "auth", "token"],
+                        timeout=10,
+                        check=False,
+                        capture_output=True,
+                        text=True,
+                    )
+                except (OSError, subprocess.TimeoutExpired) as e:
+                    raise GitHubError(f"Could not read GitHub token: {e}") from e
+                token = result.stdout.strip() if result.returncode == 0 else ""
+            if not token:
+                raise GitHubError("No GitHub token (set GH_TOKEN or run 'gh auth login')")
+            _token = token
+        return _token
+
+
+def clear_token_cache() -> None:
+    """Forget the cached token (e.g., after re-authenticating)."""
+    global _token
+    with _token_lock:
+        _token = None
+
+
+class _ApiCall:
+    """A parsed ``gh api`` invocation."""
+
+    def __init__(self) -> None:
+        self.endpoint: str | None = None
+        self.method = "GET"
+        self.fields: dict[str, Any] = {}
+        self.headers: dict[str, str] = {}
+        self.include = False
+        self.jq: str | None = None
+
+
+def _typed_field(value: str) -> Any:
+    """Convert a ``-F`` value the way gh does (minus ``@file``)."""
+    if value in ("true", "false"):
+        return value == "true"
+    if value == "null":
+        return None
+    if re.fullmatch(r"-?\d+", value):
+        return int(value)
+    return value
+
+
+def _parse_gh_api(cmd: list[str]) -> _ApiCall | None:
+    """Parse a ``gh api`` command line, or None if it's not supported."""
+    if cmd[:2] != ["gh", "api"]:
+        return None
+    call = _ApiCall()
+    args = iter(cmd[2:])
+    for arg in args:
+        if arg in ("-f", "--raw-field", "-F", "--field"):
+            name, sep, value = next(args, "").partition("=")
+            if not sep:
+                return None
+            if arg in ("-F", "--field"):
+                if value.startswith("@"):
+                    return None  # File contents - leave it to gh
+                call.fields[name] = _typed_field(value)
+            else:
+                call.fields[name] = value
+        elif arg in ("-H", "--header"):
+            name, sep, value = next(args, "").partition(":")
+            if not sep:
+                return None
+            call.headers[name.strip()] = value.strip()
+        elif arg in ("-i", "--include"):
+            call.include = True
+        elif arg in ("-q", "--jq"):
+            call.jq = next(args, "")
+            if not _SIMPLE_JQ.match(call.jq):
+                return None
+        elif arg in ("-X", "--method"):
+            call.method = next(args, "GET").upper()
+        elif arg.startswith("-") or call.endpoint is not None or "{" in arg:
+            return None  # --paginate, placeholders, ...
+        else:
+            call.endpoint = arg
+    if call.endpoint is None:
+        return None
+    if call.endpoint == "graphql":
+        call.method = "POST"
+    elif call.method != "GET" or call.fields:
+        return None  # REST writes go through gh
+    return call
+
+
+def _apply_jq(expression: str, body: str) -> str:
+    """Evaluate a simple ``.a.b`` jq path, printing like ``gh --jq``."""
+    value: Any = json.loads(body) if body.strip() else None
+    for part in expression.strip(".").split("."):
+        if part:
+            value = value.get(part) if isinstance(value, dict) else None
+    if isinstance(value, str):
+        return value + "\n"
+    return json.dumps(value) + "\n"
+
+
+class HttpTransport:
+    """Run supported ``gh api`` calls over HTTPS instead of spawning gh.
+
+    Example:
+        >>> transport = HttpTransport()
+        >>> result = transport.run(["gh", "api", "repos/o/r/pulls/1"], timeout=15)
+    """
+
+    def __init__(
+        self,
+        api_url: str = DEFAULT_API_URL,
+        token: str | None = None,
+        client: httpx.Client | None = None,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            api_url: GitHub REST API root (GraphQL is at ``{api_url}/graphql``).
+            token: Token to use instead of read_gh_token().
+            client: Preconfigured httpx client (optional).
+        """
+        self.api_url = api_url.rstrip("/")
+        self._token = token
+        self._client = client or httpx.Client()
+
+    def close(self) -> None:
+        """Close the underlying HTTP client."""
+        self._client.close()
+
+    def run(self, cmd: list[str], timeout: float) -> subprocess.CompletedProcess[str] | None:
+        """Run a ``gh api`` command over HTTP.
+
+        Args:
+            cmd: The gh command line.
+            timeout: Timeout in seconds.
+
+        Returns:
+            A CompletedProcess shaped like gh's, or None if the command isn't
+            supported and should run through gh.
+
+        Raises:
+            subprocess.TimeoutExpired: If the request times out.
+            GitHubError: If no token is available.
+        """
+        call = _parse_gh_api(cmd)
+        if call is None or call.endpoint is None:
+            return None
+
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {self._token or read_gh_token()}",
+            "X-GitHub-Api-Version": "2022-11-28",
+            **call.headers,
+        }
+        url = f"{self.api_url}/{call.endpoint.lstrip('/')}"
+        try:
+            if call.endpoint == "graphql":
+                query = call.fields.pop("query", "")
+                payload = {"query": query, "variables": call.fields}
+                response = self._client.post(url, json=payload, headers=headers, timeout=timeout)
+            else:
+                response = self._client.get(url, headers=headers, timeout=timeout)
+        except httpx.TimeoutException as e:
+            raise subprocess.TimeoutExpired(cmd, timeout) from e
+        except httpx.HTTPError as e:
+            return subprocess.CompletedProcess(cmd, 1, stdout="", stderr=f"gh: {e}")
+
+        return self._to_completed_process(cmd, call, response)
+
+    def _to_completed_process(
+        self, cmd: list[str], call: _ApiCall, response: httpx.Response
+    ) -> subprocess.CompletedProcess[str]:
+        """Render an HTTP response the way ``gh api`` prints it."""
+        body = response.text
+        error = ""
+        if response.status_code >= 400:
+            try:
+                message = response.json().get("message", response.reason_phrase)
+            except (ValueError, AttributeError):
+                message = response.reason_phrase
+            error = f"gh: {message} (HTTP {response.status_code})"
+        elif call.endpoint == "graphql":
+            try:
+                errors = response.json().get("errors")
+            except (ValueError, AttributeError):
+                errors = None
+            if errors:
+                error = "gh: " + "\n".join(str(e.get("message", e)) for e in errors)
+
+        stdout = body
+        if call.jq is not None and not error:
+            try:
+                stdout = _apply_jq(call.jq, body)
+            except ValueError as e:
+                error = f"gh: failed to parse JSON: {e}"
+        if call.include:
+            status_line = f"{response.http_version} {response.status_code} {response.reason_phrase}"
+            header_lines = [f"{name}: {value}" for name, value in response.headers.items()]
+            stdout = "\r\n".join([status_line, *header_lines]) + "\r\n\r\n" + stdout
+
+        return subprocess.CompletedProcess(cmd, 1 if error else 0, stdout=stdout, stderr=error)
@@ -137,17 +137,23 @@ def create_server(
     def get_logs(
         tail: int = 100,
         state_dir: str | None = None,
+        since_offset: int | None = None,
+        since_file_id: str | None = None,
     ) -> dict[str, Any]:
         """Get logs from the current task run.
 
         Args:
             tail: Number of lines to return from the end of the log.
             state_dir: Optional custom state directory path.
+            since_offset: Byte offset from a previous result's next_offset;
+                returns only lines appended since then.
+            since_file_id: file_id from the same previous result; a rotated
+                log restarts at offset 0.
 
         Returns:
-            Dictionary containing log content or error.
+            Dictionary containing log content, next_offset cursor, or error.
         """
-        return tools.get_logs(work_dir, tail, state_dir)
+        return tools.get_logs(work_dir, tail, state_dir, since_offset, since_file_id)
 
     @mcp.tool()
     def get_progress(state_dir: str | None = None) -> dict[str, Any]:
@@ -329,7 +335,7 @@ def create_server(
             pause_on_pr: Whether to pause after creating PR for manual review.
             enable_checkpointing: Whether to enable state checkpointing.
             log_level: Log level (quiet, normal, verbose).
-            log_format: Log format (text, json).
+            log_format: Log format (text, json, jsonl).
             pr_per_task: Whether to create PR per task vs per group.
             state_dir: Optional custom state directory path.
 
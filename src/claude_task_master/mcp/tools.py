@@ -12,11 +12,17 @@ from typing import Any
 
 from pydantic import BaseModel
 
+from claude_task_master.core.circuit_breaker import (
+    CircuitBreakerRegistry,
+    CircuitBreakerSnapshotFile,
+)
 from claude_task_master.core.control import (
     ControlManager,
     ControlOperationNotAllowedError,
     NoActiveTaskError,
 )
+from claude_task_master.core.log_reader import read_since, read_tail
+from claude_task_master.core.logger import get_log_file_for_format
 from claude_task_master.core.state import (
     StateManager,
     TaskOptions,
@@ -64,6 +70,9 @@ class LogsResult(BaseModel):
     success: bool
     log_content: str | None = None
     log_file: str | None = None
+    next_offset: int | None = None
+    file_id: str | None = None
+    reset: bool = False
     error: str | None = None
 
 
@@ -75,6 +84,7 @@ class HealthCheckResult(BaseModel):
     server_name: str
     uptime_seconds: float | None = None
     active_tasks: int = 0
+    circuit_breakers: dict[str, dict[str, Any]] = {}
 
 
 class PauseTaskResult(BaseModel):
@@ -212,6 +222,8 @@ def get_logs(
     work_dir: Path,
     tail: int = 100,
     state_dir: str | None = None,
+    since_offset: int | None = None,
+    since_file_id: str | None = None,
 ) -> dict[str, Any]:
     """Get logs from the current task run.
 
@@ -219,6 +231,10 @@ def get_logs(
         work_dir: Working directory for the server.
         tail: Number of lines to return from the end of the log.
         state_dir: Optional custom state directory path.
+        since_offset: Byte offset from a previous result's next_offset. When
+            given, only lines appended since then are returned and tail is ignored.
+        since_file_id: file_id from the same previous result; if the log file
+            was replaced since then, reading restarts at offset 0.
 
     Returns:
         Dictionary containing log content or error.
@@ -234,7 +250,9 @@ def get_logs(
 
     try:
         state = state_manager.load_state()
-        log_file = state_manager.get_log_file(state.run_id)
+        log_file = get_log_file_for_format(
+            state_manager.get_log_file(state.run_id), state.options.log_format
+        )
 
         if not log_file.exists():
             return LogsResult(
@@ -242,15 +260,18 @@ def get_logs(
                 error="No log file found",
             ).model_dump()
 
-        with open(log_file) as f:
-            lines = f.readlines()
-
-        log_content = "".join(lines[-tail:])
+        if since_offset is not None:
+            chunk = read_since(log_file, since_offset, file_id=since_file_id)
+        else:
+            chunk = read_tail(log_file, tail)
 
         return LogsResult(
             success=True,
-            log_content=log_content,
+            log_content=chunk.content,
             log_file=str(log_file),
+            next_offset=chunk.next_offset,
+            file_id=chunk.file_id,
+            reset=chunk.reset,
         ).model_dump()
     except Exception as e:
         return LogsResult(
@@ -475,31 +496,19 @@ def list_tasks(
                 "error": "No plan found",
             }
 
-        tasks = []
-        for line in plan.split("\n"):
-            stripped = line.strip()
-            if stripped.startswith("- [ ]"):
-                tasks.append(
-                    {
-                        "task": stripped[5:].strip(),
-                        "completed": False,
-                    }
-                )
-            elif stripped.startswith("- [x]"):
-                tasks.append(
-                    {
-                        "task": stripped[5:].strip(),
-                        "completed": True,
-                    }
-                )
+        plan_index = state_manager.load_plan_index()
+        tasks = [
+            {"task": description, "completed": completed}
+            for description, completed in plan_index.items()
+        ]
 
         state = state_manager.load_state()
 
         return {
             "success": True,
             "tasks": tasks,
-            "total": len(tasks),
-            "completed": sum(1 for t in tasks if t["completed"]),
+            "total": plan_index.total,
+            "completed": plan_index.completed_count,
             "current_index": state.current_task_index,
         }
     except Exception as e:
@@ -522,7 +531,8 @@ def health_check(
         start_time: Server start time (timestamp) for uptime calculation.
 
     Returns:
-        Dictionary containing health status information.
+        Dictionary containing health status information, including a
+        snapshot of each circuit breaker the runner published.
     """
     import time
 
@@ -550,6 +560,11 @@ def health_check(
         server_name=server_name,
         uptime_seconds=uptime,
         active_tasks=active_tasks,
+        # Published by the runner process; local breakers take precedence
+        circuit_breakers={
+            **CircuitBreakerSnapshotFile.read_state_dir(state_dir),
+            **CircuitBreakerRegistry().snapshot_all(),
+        },
     ).model_dump()
 
 
@@ -725,7 +740,7 @@ def update_config(
         pause_on_pr: Whether to pause after creating PR for manual review.
         enable_checkpointing: Whether to enable state checkpointing.
         log_level: Log level (quiet, normal, verbose).
-        log_format: Log format (text, json).
+        log_format: Log format (text, json, jsonl).
         pr_per_task: Whether to create PR per task vs per group.
         state_dir: Optional custom state directory path.
 
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Debug script to verify CLAUDE.md detection when changing directories for queries.
+"""Debug script to verify CLAUDE.md detection for queries run in another directory.
 
 This script performs a simple query in a specified directory and asks Claude
 to report what code style instructions it can see, which would come from CLAUDE.md.
@@ -13,7 +13,6 @@ Usage:
 """
 
 import asyncio
-import os
 import sys
 from pathlib import Path
 
@@ -71,13 +70,10 @@ async def debug_claude_md_detection(working_dir: str | None = None) -> bool:
     console.print("\n[bold]Running test query...[/bold]")
     console.print("Asking Claude: 'What code style instructions do you see?'\n")
 
-    # Store original directory
-    original_dir = os.getcwd()
-
     try:
-        # Change to target directory (simulating what agent_query.py does)
-        os.chdir(target_dir)
-        console.print(f"[dim]Changed to: {os.getcwd()}[/dim]")
+        # Point the query at the target directory via cwd, like agent_query.py
+        # does; the process working directory is left unchanged
+        console.print(f"[dim]Query cwd: {target_dir}[/dim]")
 
         # Create options with cwd and setting_sources
         options = claude_agent_sdk.ClaudeAgentOptions(
@@ -122,10 +118,6 @@ If you don't see any project context, just say "No CLAUDE.md context detected."
     except Exception as e:
         console.print(f"\n[red]✗[/red] Query failed: {type(e).__name__}: {e}")
         return False
-    finally:
-        # Always restore original directory
-        os.chdir(original_dir)
-        console.print(f"[dim]Restored to: {os.getcwd()}[/dim]")
 
     # Analyze result
     console.print("\n[bold]Analysis:[/bold]")
@@ -4,6 +4,9 @@ This module provides webhook support for notifying external systems about
 task events. It includes:
 
 - WebhookClient: HTTP client for sending webhook payloads with HMAC signatures
+- WebhookDispatchQueue: Bounded background delivery queue with pooled connections
+- WebhookOutbox / OutboxSender: Durable on-disk outbox drained in the background
+- WebhookFanout: Fan-out to the endpoints in webhooks.json over pooled clients
 - WebhookManager: High-level manager for webhook configuration and delivery
 - Event types: Structured event classes for different webhook events
 
@@ -35,6 +38,11 @@ from claude_task_master.webhooks.config import (
     WebhookConfig,
     WebhooksConfig,
 )
+from claude_task_master.webhooks.dispatch import (
+    DispatchStats,
+    OverflowPolicy,
+    WebhookDispatchQueue,
+)
 from claude_task_master.webhooks.events import (
     EventType,
     PRCreatedEvent,
@@ -48,6 +56,17 @@ from claude_task_master.webhooks.events import (
     create_event,
     get_event_class,
 )
+from claude_task_master.webhooks.fanout import (
+    EndpointStats,
+    WebhookFanout,
+)
+from claude_task_master.webhooks.outbox import (
+    OutboxError,
+    OutboxRecord,
+    OutboxSender,
+    OutboxStats,
+    WebhookOutbox,
+)
 
 __all__ = [
     # Client
@@ -55,6 +74,19 @@ __all__ = [
     "WebhookDeliveryError",
     "WebhookDeliveryResult",
     "WebhookTimeoutError",
+    # Background dispatch
+    "WebhookDispatchQueue",
+    "OverflowPolicy",
+    "DispatchStats",
+    # Durable outbox
+    "WebhookOutbox",
+    "OutboxSender",
+    "OutboxStats",
+    "OutboxRecord",
+    "OutboxError",
+    # Fan-out
+    "WebhookFanout",
+    "EndpointStats",
     # Config
     "WebhookConfig",
     "WebhooksConfig",
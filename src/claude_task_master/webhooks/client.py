@@ -3,7 +3,8 @@
 This module provides the WebhookClient class that handles secure webhook delivery
 with:
 - HMAC-SHA256 signature generation for payload verification
-- Configurable timeouts and retry logic
+- Configurable timeouts and retry logic (jittered backoff that honours
+  Retry-After on 429/503, see ``core.retry``)
 - Both synchronous and asynchronous interfaces
 - Detailed delivery result tracking
 
@@ -26,17 +27,29 @@ import hmac
 import json
 import logging
 import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
 
+from claude_task_master.core.retry import (
+    Backoff,
+    ErrorKind,
+    RetryPolicies,
+    classify_status,
+    parse_retry_after,
+)
+
 logger = logging.getLogger(__name__)
 
 # Default configuration
 DEFAULT_TIMEOUT = 30.0  # 30 seconds
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1.0  # 1 second base delay
+MAX_RETRY_DELAY = 30.0  # Cap on jittered delays between attempts
+MAX_RETRY_AFTER = 60.0  # Longest server Retry-After that is honoured
 
 # Header names
 HEADER_SIGNATURE = "X-Webhook-Signature"
@@ -274,6 +287,65 @@ def verify_signature(payload: bytes, secret: str, signature: str) -> bool:
     return hmac.compare_digest(provided_sig, expected_sig)
 
 
+def serialize_payload(data: dict[str, Any]) -> bytes:
+    """Serialize a webhook payload to compact JSON with sorted keys.
+
+    Args:
+        data: The payload to serialize.
+
+    Returns:
+        UTF-8 encoded JSON bytes, identical for equal payloads.
+    """
+    return json.dumps(data, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def sign_payload(payload: bytes, secret: str, timestamp: str) -> dict[str, str]:
+    """Generate the signature headers for a serialized payload.
+
+    Args:
+        payload: The serialized payload bytes.
+        secret: The shared secret key.
+        timestamp: The X-Webhook-Timestamp value sent with the payload.
+
+    Returns:
+        Dict with X-Webhook-Signature-256 (signs timestamp + payload, for
+        replay protection) and X-Webhook-Signature (payload only, for
+        backward compatibility).
+    """
+    signed_payload = f"{timestamp}.".encode() + payload
+    return {
+        HEADER_SIGNATURE_256: generate_signature(signed_payload, secret),
+        HEADER_SIGNATURE: generate_signature(payload, secret),
+    }
+
+
+# =============================================================================
+# HTTP Client Helpers
+# =============================================================================
+
+
+@asynccontextmanager
+async def _async_http_client(
+    shared: httpx.AsyncClient | None, verify_ssl: bool
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield a shared AsyncClient, or a new one closed on exit."""
+    if shared is not None:
+        yield shared
+        return
+    async with httpx.AsyncClient(verify=verify_ssl) as client:
+        yield client
+
+
+@contextmanager
+def _sync_http_client(shared: httpx.Client | None, verify_ssl: bool) -> Iterator[httpx.Client]:
+    """Yield a shared Client, or a new one closed on exit."""
+    if shared is not None:
+        yield shared
+        return
+    with httpx.Client(verify=verify_ssl) as client:
+        yield client
+
+
 # =============================================================================
 # WebhookClient
 # =============================================================================
@@ -337,6 +409,9 @@ class WebhookClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.retry_policies = RetryPolicies.uniform(
+            base=retry_delay, cap=max(retry_delay, MAX_RETRY_DELAY), max_retry_after=MAX_RETRY_AFTER
+        )
         self.verify_ssl = verify_ssl
         self.headers = headers or {}
 
@@ -381,8 +456,34 @@ class WebhookClient:
             Tuple of (payload_bytes, headers, signature).
         """
         # Serialize payload to JSON
-        payload = json.dumps(data, separators=(",", ":"), sort_keys=True).encode("utf-8")
+        payload = serialize_payload(data)
+        headers, signature = self.prepare_headers(
+            payload, str(int(time.time())), event_type, delivery_id
+        )
+        return payload, headers, signature
+
+    def prepare_headers(
+        self,
+        payload: bytes,
+        timestamp: str,
+        event_type: str | None = None,
+        delivery_id: str | None = None,
+        signatures: dict[str, dict[str, str]] | None = None,
+    ) -> tuple[dict[str, str], str | None]:
+        """Build the request headers for a serialized payload.
+
+        Args:
+            payload: The serialized payload bytes.
+            timestamp: Unix timestamp for the X-Webhook-Timestamp header.
+            event_type: Optional event type for the X-Webhook-Event header.
+            delivery_id: Optional delivery ID.
+            signatures: Optional cache of signature headers keyed by secret,
+                shared by clients sending the same payload and timestamp so
+                each distinct secret is only signed once.
 
+        Returns:
+            Tuple of (headers, signature).
+        """
         # Build headers
         headers = {
             "Content-Type": "application/json",
@@ -390,7 +491,6 @@ class WebhookClient:
         }
 
         # Add timestamp
-        timestamp = str(int(time.time()))
         headers[HEADER_TIMESTAMP] = timestamp
 
         # Add event type if provided
@@ -404,20 +504,24 @@ class WebhookClient:
         # Generate signature if secret is configured
         signature = None
         if self.secret:
-            # Sign timestamp + payload for replay protection
-            signed_payload = f"{timestamp}.".encode() + payload
-            signature = generate_signature(signed_payload, self.secret)
-            headers[HEADER_SIGNATURE_256] = signature
-            # Also include the simpler signature for backward compatibility
-            headers[HEADER_SIGNATURE] = generate_signature(payload, self.secret)
+            if signatures is None:
+                signature_headers = sign_payload(payload, self.secret, timestamp)
+            else:
+                if self.secret not in signatures:
+                    signatures[self.secret] = sign_payload(payload, self.secret, timestamp)
+                signature_headers = signatures[self.secret]
+            signature = signature_headers[HEADER_SIGNATURE_256]
+            headers.update(signature_headers)
 
-        return payload, headers, signature
+        return headers, signature
 
     async def send(
         self,
         data: dict[str, Any],
         event_type: str | None = None,
         delivery_id: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        max_attempts: int | None = None,
     ) -> WebhookDeliveryResult:
         """Send webhook payload asynchronously.
 
@@ -428,6 +532,10 @@ class WebhookClient:
             data: Dictionary to send as JSON payload.
             event_type: Optional event type (included in X-Webhook-Event header).
             delivery_id: Optional unique delivery identifier.
+            http_client: Optional pooled AsyncClient to send with. A new
+                client is created (and closed) per call if None.
+            max_attempts: Attempts for this delivery (default: max_retries).
+                Callers with their own retry schedule pass 1.
 
         Returns:
             WebhookDeliveryResult with delivery status and details.
@@ -438,13 +546,43 @@ class WebhookClient:
             WebhookDeliveryError: If delivery failed with a non-retryable error.
         """
         payload, headers, signature = self._prepare_payload(data, event_type, delivery_id)
+        return await self.send_payload(
+            payload, headers, signature, delivery_id, http_client, max_attempts
+        )
+
+    async def send_payload(
+        self,
+        payload: bytes,
+        headers: dict[str, str],
+        signature: str | None = None,
+        delivery_id: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        max_attempts: int | None = None,
+    ) -> WebhookDeliveryResult:
+        """Send an already serialized and signed payload asynchronously.
+
+        Used to fan one event out to many endpoints without serializing and
+        signing it once per endpoint. Retries like send().
+
+        Args:
+            payload: Serialized JSON payload bytes.
+            headers: Complete request headers, including any signatures.
+            signature: The X-Webhook-Signature-256 value, for the result.
+            delivery_id: Optional delivery ID, for the result.
+            http_client: Optional pooled AsyncClient to send with.
+            max_attempts: Attempts for this delivery (default: max_retries).
 
+        Returns:
+            WebhookDeliveryResult with delivery status and details.
+        """
         start_time = time.time()
         last_error: Exception | None = None
         attempt = 0
+        attempts = self.max_retries if max_attempts is None else max_attempts
+        backoff = self.retry_policies.backoff()
 
-        async with httpx.AsyncClient(verify=self.verify_ssl) as client:
-            while attempt < self.max_retries:
+        async with _async_http_client(http_client, self.verify_ssl) as client:
+            while attempt < attempts:
                 attempt += 1
                 try:
                     response = await client.post(
@@ -477,7 +615,8 @@ class WebhookClient:
                         )
 
                     # Retryable status codes: 429, 500, 502, 503, 504
-                    if response.status_code in (429, 500, 502, 503, 504):
+                    kind = classify_status(response.status_code)
+                    if kind is not None:
                         last_error = WebhookDeliveryError(
                             f"Webhook returned {response.status_code}",
                             url=self.url,
@@ -490,10 +629,12 @@ class WebhookClient:
                                 "url": self.url,
                                 "status": response.status_code,
                                 "attempt": attempt,
-                                "max_retries": self.max_retries,
+                                "max_retries": attempts,
                             },
                         )
-                        await self._wait_before_retry(attempt)
+                        await self._wait_before_retry(
+                            attempt, backoff, kind, parse_retry_after(response.headers), attempts
+                        )
                         continue
 
                     # Non-retryable error (4xx except 429)
@@ -519,7 +660,9 @@ class WebhookClient:
                             "attempt": attempt,
                         },
                     )
-                    await self._wait_before_retry(attempt)
+                    await self._wait_before_retry(
+                        attempt, backoff, ErrorKind.TIMEOUT, max_attempts=attempts
+                    )
 
                 except httpx.ConnectError as e:
                     last_error = WebhookConnectionError(self.url, e)
@@ -531,7 +674,9 @@ class WebhookClient:
                             "attempt": attempt,
                         },
                     )
-                    await self._wait_before_retry(attempt)
+                    await self._wait_before_retry(
+                        attempt, backoff, ErrorKind.CONNECTION, max_attempts=attempts
+                    )
 
                 except httpx.RequestError as e:
                     last_error = WebhookDeliveryError(
@@ -546,7 +691,9 @@ class WebhookClient:
                             "attempt": attempt,
                         },
                     )
-                    await self._wait_before_retry(attempt)
+                    await self._wait_before_retry(
+                        attempt, backoff, ErrorKind.CONNECTION, max_attempts=attempts
+                    )
 
         # All retries exhausted
         delivery_time_ms = (time.time() - start_time) * 1000
@@ -575,6 +722,7 @@ class WebhookClient:
         data: dict[str, Any],
         event_type: str | None = None,
         delivery_id: str | None = None,
+        http_client: httpx.Client | None = None,
     ) -> WebhookDeliveryResult:
         """Send webhook payload synchronously.
 
@@ -584,6 +732,7 @@ class WebhookClient:
             data: Dictionary to send as JSON payload.
             event_type: Optional event type (included in X-Webhook-Event header).
             delivery_id: Optional unique delivery identifier.
+            http_client: Optional pooled Client to send with.
 
         Returns:
             WebhookDeliveryResult with delivery status and details.
@@ -593,8 +742,9 @@ class WebhookClient:
         start_time = time.time()
         last_error: Exception | None = None
         attempt = 0
+        backoff = self.retry_policies.backoff()
 
-        with httpx.Client(verify=self.verify_ssl) as client:
+        with _sync_http_client(http_client, self.verify_ssl) as client:
             while attempt < self.max_retries:
                 attempt += 1
                 try:
@@ -620,14 +770,17 @@ class WebhookClient:
                         )
 
                     # Retryable status codes
-                    if response.status_code in (429, 500, 502, 503, 504):
+                    kind = classify_status(response.status_code)
+                    if kind is not None:
                         last_error = WebhookDeliveryError(
                             f"Webhook returned {response.status_code}",
                             url=self.url,
                             status_code=response.status_code,
                             response_body=response.text,
                         )
-                        self._wait_before_retry_sync(attempt)
+                        self._wait_before_retry_sync(
+                            attempt, backoff, kind, parse_retry_after(response.headers)
+                        )
                         continue
 
                     # Non-retryable error
@@ -645,15 +798,15 @@ class WebhookClient:
 
                 except httpx.TimeoutException:
                     last_error = WebhookTimeoutError(self.url, self.timeout)
-                    self._wait_before_retry_sync(attempt)
+                    self._wait_before_retry_sync(attempt, backoff, ErrorKind.TIMEOUT)
 
                 except httpx.ConnectError as e:
                     last_error = WebhookConnectionError(self.url, e)
-                    self._wait_before_retry_sync(attempt)
+                    self._wait_before_retry_sync(attempt, backoff, ErrorKind.CONNECTION)
 
                 except httpx.RequestError as e:
                     last_error = WebhookDeliveryError(f"Request failed: {e}", url=self.url)
-                    self._wait_before_retry_sync(attempt)
+                    self._wait_before_retry_sync(attempt, backoff, ErrorKind.CONNECTION)
 
         # All retries exhausted
         delivery_time_ms = (time.time() - start_time) * 1000
@@ -668,31 +821,43 @@ class WebhookClient:
             error=error_msg,
         )
 
-    async def _wait_before_retry(self, attempt: int) -> None:
-        """Wait before retrying with exponential backoff.
+    async def _wait_before_retry(
+        self,
+        attempt: int,
+        backoff: Backoff,
+        kind: ErrorKind,
+        retry_after: float | None = None,
+        max_attempts: int | None = None,
+    ) -> None:
+        """Wait before retrying, unless attempt was the last one.
 
         Args:
             attempt: Current attempt number (1-indexed).
+            backoff: The delay sequence of this delivery's retries.
+            kind: The class of the error that failed the attempt.
+            retry_after: Server-requested wait (Retry-After), in seconds.
+            max_attempts: Attempts allowed for this delivery (default: max_retries).
         """
-        import asyncio
+        if attempt < (self.max_retries if max_attempts is None else max_attempts):
+            await backoff.wait(kind, retry_after)
 
-        # Exponential backoff: delay * 2^(attempt-1)
-        delay = self.retry_delay * (2 ** (attempt - 1))
-        # Cap at 30 seconds
-        delay = min(delay, 30.0)
-        await asyncio.sleep(delay)
-
-    def _wait_before_retry_sync(self, attempt: int) -> None:
-        """Wait before retrying with exponential backoff (sync version).
+    def _wait_before_retry_sync(
+        self,
+        attempt: int,
+        backoff: Backoff,
+        kind: ErrorKind,
+        retry_after: float | None = None,
+    ) -> None:
+        """Wait before retrying, unless attempt was the last one (sync version).
 
         Args:
             attempt: Current attempt number (1-indexed).
+            backoff: The delay sequence of this delivery's retries.
+            kind: The class of the error that failed the attempt.
+            retry_after: Server-requested wait (Retry-After), in seconds.
         """
-        # Exponential backoff: delay * 2^(attempt-1)
-        delay = self.retry_delay * (2 ** (attempt - 1))
-        # Cap at 30 seconds
-        delay = min(delay, 30.0)
-        time.sleep(delay)
+        if attempt < self.max_retries:
+            backoff.wait_sync(kind, retry_after)
 
     def __repr__(self) -> str:
         """Return string representation of the client."""
@@ -27,7 +27,9 @@ Example:
 
 from __future__ import annotations
 
+import json
 from collections.abc import Iterator
+from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -524,6 +526,30 @@ class WebhooksConfig(BaseModel):
         """
         return cls(**data)
 
+    @classmethod
+    def from_file(cls, path: Path) -> WebhooksConfig:
+        """Load WebhooksConfig from a webhooks.json file.
+
+        Accepts both the REST API layout (``{"webhooks": {id: {...}}}``) and
+        the ``to_dict()`` layout (``{"webhooks": [{...}]}``).
+
+        Args:
+            path: Path to the JSON file.
+
+        Returns:
+            Configured WebhooksConfig instance.
+
+        Raises:
+            OSError: If the file can't be read.
+            ValueError: If the file is not valid JSON.
+            ValidationError: If a webhook configuration is invalid.
+        """
+        data = json.loads(path.read_text(encoding="utf-8"))
+        webhooks = data.get("webhooks", [])
+        if isinstance(webhooks, dict):
+            webhooks = list(webhooks.values())
+        return cls.from_dict({**data, "webhooks": webhooks})
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization.
 
@@ -0,0 +1,465 @@
+"""Asynchronous webhook dispatch queue.
+
+``WebhookClient.send_sync`` blocks its caller for the whole delivery,
+including retries and backoff sleeps. ``WebhookDispatchQueue`` takes
+deliveries off the caller's thread instead:
+
+- ``submit()`` is non-blocking: it hands the delivery to a background event
+  loop and returns immediately.
+- Deliveries are queued per endpoint URL and sent by a fixed number of
+  workers per endpoint, so a slow receiver can't starve the others.
+- All deliveries share pooled ``httpx.AsyncClient`` connections.
+- The queue is bounded. When full, the overflow policy decides whether the
+  oldest queued delivery, the new one, or nothing is dropped (``spill``
+  appends the new delivery to a JSON lines file instead).
+- Submit-to-completion latency is tracked (p50/p99) along with counters.
+- ``register_shutdown_hook()`` flushes the queue from ``ShutdownManager``.
+
+Example:
+    >>> queue = WebhookDispatchQueue(max_size=500)
+    >>> queue.submit(client, {"event": "task.completed"}, event_type="task.completed")
+    >>> queue.close()  # Flushes pending deliveries
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from claude_task_master.core.agent_loop import BackgroundEventLoop
+from claude_task_master.core.shutdown import get_shutdown_manager
+from claude_task_master.webhooks.client import WebhookClient, WebhookDeliveryResult
+
+logger = logging.getLogger(__name__)
+
+# Default configuration
+DEFAULT_MAX_QUEUE_SIZE = 1000
+DEFAULT_ENDPOINT_CONCURRENCY = 2
+DEFAULT_FLUSH_TIMEOUT = 10.0  # Seconds to wait for pending deliveries on close
+
+# Number of recent delivery latencies kept for percentiles
+LATENCY_SAMPLE_SIZE = 1024
+
+
+class OverflowPolicy(str, Enum):
+    """What to do with a delivery submitted to a full queue."""
+
+    DROP_OLDEST = "drop_oldest"  # Drop the oldest queued delivery
+    DROP_NEWEST = "drop_newest"  # Drop the delivery being submitted
+    SPILL = "spill"  # Append the new delivery to the spill file
+
+
+# =============================================================================
+# Data Classes
+# =============================================================================
+
+
+@dataclass
+class QueuedDelivery:
+    """A webhook delivery waiting in the dispatch queue.
+
+    Attributes:
+        client: The client (endpoint, secret, retries) to send with.
+        data: The JSON payload.
+        event_type: Optional event type for the X-Webhook-Event header.
+        delivery_id: Optional unique delivery identifier.
+        submitted_at: Monotonic time the delivery was submitted.
+    """
+
+    client: WebhookClient
+    data: dict[str, Any]
+    event_type: str | None = None
+    delivery_id: str | None = None
+    submitted_at: float = field(default_factory=time.monotonic)
+
+    def to_record(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable spill record (without the secret)."""
+        return {
+            "url": self.client.url,
+            "event_type": self.event_type,
+            "delivery_id": self.delivery_id,
+            "data": self.data,
+            "spilled_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+
+def latency_percentile(samples: Iterable[float], pct: float) -> float:
+    """Get a percentile of latency samples in milliseconds (0.0 if none)."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+@dataclass
+class DispatchStats:
+    """Counters and latency samples for a WebhookDispatchQueue.
+
+    Latencies are measured from ``submit()`` to the end of the delivery,
+    so they include time spent queued and retrying.
+    """
+
+    submitted: int = 0
+    delivered: int = 0
+    failed: int = 0
+    dropped: int = 0
+    spilled: int = 0
+    max_depth: int = 0
+    latencies_ms: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLE_SIZE))
+
+    def percentile(self, pct: float) -> float:
+        """Get a latency percentile in milliseconds (0.0 if no samples)."""
+        return latency_percentile(self.latencies_ms, pct)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "submitted": self.submitted,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "spilled": self.spilled,
+            "max_depth": self.max_depth,
+            "latency_p50_ms": round(self.percentile(50), 1),
+            "latency_p99_ms": round(self.percentile(99), 1),
+        }
+
+
+@dataclass
+class _Endpoint:
+    """Queued deliveries and workers for one endpoint URL (loop thread only)."""
+
+    pending: deque[QueuedDelivery] = field(default_factory=deque)
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    workers: list[asyncio.Task[None]] = field(default_factory=list)
+
+
+# =============================================================================
+# WebhookDispatchQueue
+# =============================================================================
+
+
+class WebhookDispatchQueue:
+    """Bounded, non-blocking webhook delivery queue with background workers.
+
+    Queue state lives on a background event loop and is only touched from
+    that loop's thread; ``submit()`` schedules work there with
+    ``call_soon_threadsafe`` and never waits on the network.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        endpoint_concurrency: int = DEFAULT_ENDPOINT_CONCURRENCY,
+        overflow: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+        spill_path: Path | None = None,
+        flush_timeout: float = DEFAULT_FLUSH_TIMEOUT,
+    ) -> None:
+        """Initialize the queue (the worker loop starts on first submit).
+
+        Args:
+            max_size: Maximum deliveries queued (not yet sending) across all
+                endpoints.
+            endpoint_concurrency: Concurrent deliveries per endpoint URL.
+            overflow: Policy when the queue is full.
+            spill_path: JSON lines file for the ``spill`` policy. Without it,
+                ``spill`` behaves like ``drop_newest``.
+            flush_timeout: Seconds ``close()`` waits for pending deliveries.
+
+        Raises:
+            ValueError: If max_size or endpoint_concurrency is below 1.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if endpoint_concurrency < 1:
+            raise ValueError("endpoint_concurrency must be at least 1")
+
+        self.max_size = max_size
+        self.endpoint_concurrency = endpoint_concurrency
+        self.overflow = OverflowPolicy(overflow)
+        self.spill_path = spill_path
+        self.flush_timeout = flush_timeout
+        self.stats = DispatchStats()
+
+        self._background = BackgroundEventLoop(name="claudetm-webhooks")
+        self._closed = False
+        self._close_lock = threading.Lock()  # Orders submit() against close()
+        self._shutdown_hook_registered = False
+
+        # Loop-thread state
+        self._endpoints: dict[str, _Endpoint] = {}
+        self._http_clients: dict[bool, httpx.AsyncClient] = {}  # Keyed by verify_ssl
+        self._queued = 0  # Waiting for a worker
+        self._unfinished = 0  # Queued or being delivered
+        self._drained: asyncio.Event | None = None
+
+    @property
+    def closed(self) -> bool:
+        """Check whether the queue has been closed."""
+        return self._closed
+
+    # -------------------------------------------------------------------------
+    # Producer API (any thread)
+    # -------------------------------------------------------------------------
+
+    def submit(
+        self,
+        client: WebhookClient,
+        data: dict[str, Any],
+        event_type: str | None = None,
+        delivery_id: str | None = None,
+    ) -> bool:
+        """Queue a delivery without waiting for it.
+
+        Args:
+            client: The webhook client to send with.
+            data: The JSON payload.
+            event_type: Optional event type for the X-Webhook-Event header.
+            delivery_id: Optional unique delivery identifier.
+
+        Returns:
+            False if the queue is closed, True otherwise. Overflow handling
+            happens on the worker loop and is reported in ``stats``.
+        """
+        delivery = QueuedDelivery(
+            client=client, data=data, event_type=event_type, delivery_id=delivery_id
+        )
+        with self._close_lock:
+            if self._closed:
+                return False
+            # Starts the loop on first use; close() can't stop it until this
+            # delivery is scheduled, so it is flushed like any other
+            self._background.start().call_soon_threadsafe(self._enqueue, delivery)
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every submitted delivery has finished.
+
+        Args:
+            timeout: Seconds to wait (default: ``flush_timeout``).
+
+        Returns:
+            True if the queue drained, False on timeout.
+        """
+        if not self._background.is_running:
+            return True
+        wait = self.flush_timeout if timeout is None else timeout
+        try:
+            self._background.run(self._wait_drained(), timeout=wait)
+        except TimeoutError:
+            return False
+        return True
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Flush pending deliveries, then stop the workers and the loop.
+
+        Deliveries still queued when the flush times out are written to the
+        spill file if one is configured, and dropped otherwise.
+
+        Args:
+            timeout: Seconds to wait for the flush (default: ``flush_timeout``).
+
+        Returns:
+            True if every delivery finished before shutdown.
+        """
+        with self._close_lock:
+            if self._closed:
+                return True
+            self._closed = True
+        self.unregister_shutdown_hook()
+        if not self._background.is_running:
+            return True
+
+        drained = self.flush(timeout)
+        try:
+            self._background.run(self._shutdown(), timeout=DEFAULT_FLUSH_TIMEOUT)
+        except Exception as e:
+            logger.warning("Error shutting down webhook dispatch queue: %s", e)
+        self._background.stop()
+        return drained
+
+    def register_shutdown_hook(self) -> None:
+        """Flush and close this queue when ShutdownManager callbacks run."""
+        if not self._shutdown_hook_registered:
+            get_shutdown_manager().add_callback(self._on_shutdown)
+            self._shutdown_hook_registered = True
+
+    def unregister_shutdown_hook(self) -> None:
+        """Remove the ShutdownManager callback, if registered."""
+        if self._shutdown_hook_registered:
+            get_shutdown_manager().remove_callback(self._on_shutdown)
+            self._shutdown_hook_registered = False
+
+    def _on_shutdown(self) -> None:
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Loop-thread internals
+    # -------------------------------------------------------------------------
+
+    def _enqueue(self, delivery: QueuedDelivery) -> None:
+        """Queue a delivery, applying the overflow policy if full."""
+        self.stats.submitted += 1
+        if self._queued >= self.max_size:
+            if self.overflow == OverflowPolicy.DROP_OLDEST:
+                self._drop(self._pop_oldest())
+            elif self.overflow == OverflowPolicy.SPILL and self.spill_path is not None:
+                self._spill(self.spill_path, [delivery])
+                return
+            else:
+                self._drop(delivery)
+                return
+
+        endpoint = self._endpoint(delivery.client.url)
+        endpoint.pending.append(delivery)
+        endpoint.wakeup.set()
+        self._queued += 1
+        self._unfinished += 1
+        self.stats.max_depth = max(self.stats.max_depth, self._queued)
+        if self._drained is not None:
+            self._drained.clear()
+
+    def _endpoint(self, url: str) -> _Endpoint:
+        """Get an endpoint's queue, starting its workers on first use."""
+        endpoint = self._endpoints.get(url)
+        if endpoint is None:
+            endpoint = _Endpoint()
+            loop = asyncio.get_running_loop()
+            endpoint.workers = [
+                loop.create_task(self._worker(endpoint)) for _ in range(self.endpoint_concurrency)
+            ]
+            self._endpoints[url] = endpoint
+        return endpoint
+
+    def _pop_oldest(self) -> QueuedDelivery | None:
+        """Remove and return the oldest queued delivery across endpoints."""
+        oldest: _Endpoint | None = None
+        for endpoint in self._endpoints.values():
+            if endpoint.pending and (
+                oldest is None or endpoint.pending[0].submitted_at < oldest.pending[0].submitted_at
+            ):
+                oldest = endpoint
+        if oldest is None:
+            return None
+        self._queued -= 1
+        self._finish()
+        return oldest.pending.popleft()
+
+    def _drop(self, delivery: QueuedDelivery | None) -> None:
+        if delivery is None:
+            return
+        self.stats.dropped += 1
+        logger.warning(
+            "Webhook queue full, dropped %s (delivery_id=%s)",
+            delivery.event_type,
+            delivery.delivery_id,
+        )
+
+    def _spill(self, path: Path, deliveries: list[QueuedDelivery]) -> None:
+        """Append deliveries to the spill file (dropping them if that fails)."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                for delivery in deliveries:
+                    f.write(json.dumps(delivery.to_record(), separators=(",", ":")) + "\n")
+            self.stats.spilled += len(deliveries)
+        except OSError as e:
+            logger.warning("Failed to spill webhook deliveries to %s: %s", path, e)
+            for delivery in deliveries:
+                self._drop(delivery)
+
+    def _finish(self) -> None:
+        """Mark one delivery as finished."""
+        self._unfinished -= 1
+        if self._unfinished == 0 and self._drained is not None:
+            self._drained.set()
+
+    async def _wait_drained(self) -> None:
+        if self._drained is None:
+            self._drained = asyncio.Event()
+        if self._unfinished == 0:
+            return
+        self._drained.clear()
+        await self._drained.wait()
+
+    async def _worker(self, endpoint: _Endpoint) -> None:
+        """Deliver an endpoint's queued webhooks one at a time."""
+        while True:
+            while not endpoint.pending:
+                endpoint.wakeup.clear()
+                await endpoint.wakeup.wait()
+            delivery = endpoint.pending.popleft()
+            self._queued -= 1
+            try:
+                await self._deliver(delivery)
+            finally:
+                self._finish()
+
+    def _http_client(self, verify_ssl: bool) -> httpx.AsyncClient:
+        client = self._http_clients.get(verify_ssl)
+        if client is None:
+            client = httpx.AsyncClient(verify=verify_ssl)
+            self._http_clients[verify_ssl] = client
+        return client
+
+    async def _deliver(self, delivery: QueuedDelivery) -> None:
+        """Send one delivery and record its outcome."""
+        try:
+            result = await delivery.client.send(
+                data=delivery.data,
+                event_type=delivery.event_type,
+                delivery_id=delivery.delivery_id,
+                http_client=self._http_client(delivery.client.verify_ssl),
+            )
+        except Exception as e:
+            result = WebhookDeliveryResult(
+                success=False, delivery_id=delivery.delivery_id, error=str(e)
+            )
+
+        self.stats.latencies_ms.append((time.monotonic() - delivery.submitted_at) * 1000)
+        if result.success:
+            self.stats.delivered += 1
+            logger.debug(
+                "Webhook delivered: %s (delivery_id=%s)",
+                delivery.event_type,
+                delivery.delivery_id,
+            )
+        else:
+            self.stats.failed += 1
+            logger.warning("Webhook delivery failed: %s - %s", delivery.event_type, result.error)
+
+    async def _shutdown(self) -> None:
+        """Spill or drop leftovers, stop workers and close HTTP clients."""
+        leftovers: list[QueuedDelivery] = []
+        for endpoint in self._endpoints.values():
+            leftovers.extend(endpoint.pending)
+            endpoint.pending.clear()
+        if leftovers:
+            if self.spill_path is not None:
+                self._spill(self.spill_path, leftovers)
+            else:
+                for delivery in leftovers:
+                    self._drop(delivery)
+
+        workers = [w for endpoint in self._endpoints.values() for w in endpoint.workers]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._endpoints.clear()
+
+        for client in self._http_clients.values():
+            await client.aclose()
+        self._http_clients.clear()
@@ -0,0 +1,458 @@
+"""Multi-endpoint webhook fan-out from webhooks.json.
+
+``WebhookFanout`` sends each event to every enabled endpoint in
+``.claude-task-master/webhooks.json`` that subscribes to it (the file
+managed by the ``/webhooks`` REST API):
+
+    fanout = WebhookFanout.for_state_dir(state_dir)
+    fanout.submit(event.to_dict(), event_type="task.completed", delivery_id=event.event_id)
+
+- The file is loaded once and reloaded when its mtime or size changes,
+  checked at most once per ``reload_interval``.
+- Each event is serialized once, signed once per distinct secret, and sent
+  to all subscribed endpoints concurrently on a background event loop.
+- Endpoints share one pooled ``httpx.AsyncClient`` per host, so repeated
+  deliveries reuse connections instead of opening a new TLS session each
+  time. Pools negotiate HTTP/2 when the ``h2`` package is installed
+  (``pip install claude-task-master[http2]``).
+- Delivery latency is tracked per endpoint (``latency_stats()``).
+- URLs in ``exclude_urls`` (e.g. the ``--webhook-url`` endpoint, which has
+  its own delivery path) are skipped, so no endpoint gets an event twice.
+
+Not to be confused with ``WebhookDispatchQueue``, which queues deliveries
+for a single ``--webhook-url`` client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from claude_task_master.core.agent_loop import BackgroundEventLoop
+from claude_task_master.core.shutdown import get_shutdown_manager
+from claude_task_master.webhooks.client import (
+    WebhookClient,
+    WebhookDeliveryResult,
+    serialize_payload,
+)
+from claude_task_master.webhooks.config import WebhooksConfig
+from claude_task_master.webhooks.dispatch import (
+    DEFAULT_FLUSH_TIMEOUT,
+    LATENCY_SAMPLE_SIZE,
+    latency_percentile,
+)
+from claude_task_master.webhooks.events import EventType
+
+logger = logging.getLogger(__name__)
+
+# Webhooks configuration file name (inside the state directory)
+WEBHOOKS_FILE = "webhooks.json"
+
+# Whether httpx can negotiate HTTP/2 (needs the optional h2 package)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Default configuration
+DEFAULT_RELOAD_INTERVAL = 1.0  # seconds between webhooks.json stat checks
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 10
+
+
+@dataclass
+class EndpointStats:
+    """Delivery counters and latency samples for one endpoint."""
+
+    delivered: int = 0
+    failed: int = 0
+    latencies_ms: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLE_SIZE))
+
+    def record(self, result: WebhookDeliveryResult, latency_ms: float) -> None:
+        """Record one delivery (including its retries)."""
+        if result.success:
+            self.delivered += 1
+        else:
+            self.failed += 1
+        self.latencies_ms.append(latency_ms)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        samples = list(self.latencies_ms)
+        return {
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "latency_p50_ms": round(latency_percentile(samples, 50), 2),
+            "latency_p99_ms": round(latency_percentile(samples, 99), 2),
+        }
+
+
+class WebhookFanout:
+    """Fan events out to the endpoints configured in webhooks.json.
+
+    ``submit()`` is non-blocking and safe to call from any thread;
+    deliveries run on a background event loop that starts with the first
+    event that has a subscriber.
+    """
+
+    def __init__(
+        self,
+        webhooks_file: Path,
+        reload_interval: float = DEFAULT_RELOAD_INTERVAL,
+        http2: bool | None = None,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        flush_timeout: float = DEFAULT_FLUSH_TIMEOUT,
+        exclude_urls: Iterable[str] = (),
+    ) -> None:
+        """Initialize the fan-out and load webhooks_file.
+
+        Args:
+            webhooks_file: Path to webhooks.json (may not exist yet).
+            reload_interval: Minimum seconds between checks for file changes.
+            http2: Negotiate HTTP/2 (default: when ``h2`` is installed).
+            max_connections_per_host: Connection pool size per host.
+            flush_timeout: Seconds ``close()`` waits for in-flight deliveries.
+            exclude_urls: Endpoint URLs delivered to elsewhere; skipped even
+                if webhooks.json lists them.
+
+        Raises:
+            ValueError: If http2 is requested but ``h2`` is not installed.
+        """
+        if http2 and not HTTP2_AVAILABLE:
+            raise ValueError(
+                "HTTP/2 requires the 'h2' package (pip install claude-task-master[http2])"
+            )
+        self.webhooks_file = webhooks_file
+        self.reload_interval = reload_interval
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self.max_connections_per_host = max_connections_per_host
+        self.flush_timeout = flush_timeout
+        self.exclude_urls = frozenset(exclude_urls)
+
+        self._background = BackgroundEventLoop(name="claudetm-webhook-fanout")
+        self._lock = threading.Lock()
+        self._closed = False
+        self._shutdown_hook_registered = False
+
+        self._config = WebhooksConfig()
+        self._clients: dict[str, WebhookClient] = {}
+        self._file_signature: tuple[int, int] | None = None
+        self._checked_at = 0.0
+        self._stats: dict[str, EndpointStats] = {}
+
+        # Loop-thread state
+        self._http_clients: dict[tuple[str, str, int | None, bool], httpx.AsyncClient] = {}
+        self._in_flight: set[asyncio.Task[dict[str, WebhookDeliveryResult]]] = set()
+
+        self.reload(force=True)
+
+    @classmethod
+    def for_state_dir(cls, state_dir: Path, **kwargs: Any) -> WebhookFanout:
+        """Create a fan-out for the webhooks.json in a state directory."""
+        return cls(state_dir / WEBHOOKS_FILE, **kwargs)
+
+    @property
+    def closed(self) -> bool:
+        """Check whether the fan-out has been closed."""
+        return self._closed
+
+    @property
+    def config(self) -> WebhooksConfig:
+        """Get the current webhooks configuration, reloading it if changed."""
+        self._maybe_reload()
+        return self._config
+
+    # -------------------------------------------------------------------------
+    # Configuration
+    # -------------------------------------------------------------------------
+
+    def reload(self, force: bool = False) -> bool:
+        """Reload webhooks.json if it changed since the last load.
+
+        A file that fails to parse is logged and the previous configuration
+        is kept. A deleted file means no endpoints.
+
+        Args:
+            force: Reload even if the file looks unchanged.
+
+        Returns:
+            True if a new configuration was loaded.
+        """
+        try:
+            stat = self.webhooks_file.stat()
+            signature: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            signature = None
+
+        with self._lock:
+            self._checked_at = time.monotonic()
+            if not force and signature == self._file_signature:
+                return False
+            self._file_signature = signature
+            if signature is None:
+                config = WebhooksConfig()
+            else:
+                try:
+                    config = WebhooksConfig.from_file(self.webhooks_file)
+                except (OSError, ValueError) as e:
+                    logger.warning("Ignoring invalid %s: %s", self.webhooks_file, e)
+                    return False
+            config.apply_global_settings()
+            self._config = config
+            self._clients = {
+                webhook.url: WebhookClient(
+                    url=webhook.url,
+                    secret=webhook.secret,
+                    timeout=webhook.timeout,
+                    max_retries=webhook.max_retries,
+                    retry_delay=webhook.retry_delay,
+                    verify_ssl=webhook.verify_ssl,
+                    headers=webhook.headers,
+                )
+                for webhook in config.get_enabled_webhooks()
+            }
+        logger.debug(
+            "Loaded %d webhook endpoint(s) from %s", len(self._clients), self.webhooks_file
+        )
+        return True
+
+    def _maybe_reload(self) -> None:
+        if time.monotonic() - self._checked_at >= self.reload_interval:
+            self.reload()
+
+    def endpoints_for(self, event_type: EventType | str) -> list[WebhookClient]:
+        """Get clients for the enabled endpoints subscribed to an event type."""
+        config = self.config
+        with self._lock:
+            clients = self._clients
+        urls = dict.fromkeys(w.url for w in config.get_webhooks_for_event(event_type))
+        return [clients[url] for url in urls if url in clients and url not in self.exclude_urls]
+
+    # -------------------------------------------------------------------------
+    # Producer API (any thread)
+    # -------------------------------------------------------------------------
+
+    def submit(
+        self,
+        data: dict[str, Any],
+        event_type: str | None = None,
+        delivery_id: str | None = None,
+    ) -> bool:
+        """Send an event to all subscribed endpoints in the background.
+
+        Args:
+            data: The JSON payload.
+            event_type: Event type used for filtering and the X-Webhook-Event
+                header (default: ``data["event_type"]``).
+            delivery_id: Optional delivery ID (e.g. the event ID).
+
+        Returns:
+            False if the fan-out is closed, True otherwise.
+        """
+        if self._closed:
+            return False
+        event_type = event_type or data.get("event_type")
+        targets = self.endpoints_for(event_type) if event_type else []
+        if not targets:
+            return True
+        with self._lock:
+            if self._closed:
+                return False
+            # Starts the loop on first use; close() can't stop it until this
+            # event is scheduled, so it is flushed like any other
+            self._background.start().call_soon_threadsafe(
+                self._start, targets, data, event_type, delivery_id
+            )
+        return True
+
+    def send_sync(
+        self,
+        data: dict[str, Any],
+        event_type: str | None = None,
+        delivery_id: str | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, WebhookDeliveryResult]:
+        """Send an event to all subscribed endpoints and wait for the results.
+
+        Args:
+            data: The JSON payload.
+            event_type: Event type (default: ``data["event_type"]``).
+            delivery_id: Optional delivery ID.
+            timeout: Optional seconds to wait.
+
+        Returns:
+            Dict mapping endpoint URL to its delivery result.
+
+        Raises:
+            RuntimeError: If the fan-out is closed.
+            TimeoutError: If the timeout expires.
+        """
+        if self._closed:
+            raise RuntimeError("WebhookFanout is closed")
+        event_type = event_type or data.get("event_type")
+        targets = self.endpoints_for(event_type) if event_type else []
+        if not targets:
+            return {}
+        return self._background.run(
+            self._fan_out(targets, data, event_type, delivery_id), timeout=timeout
+        )
+
+    def latency_stats(self) -> dict[str, dict[str, Any]]:
+        """Get delivery counts and p50/p99 latency per endpoint URL."""
+        return {url: stats.to_dict() for url, stats in list(self._stats.items())}
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait for all in-flight deliveries to finish.
+
+        Args:
+            timeout: Seconds to wait (default: ``flush_timeout``).
+
+        Returns:
+            True if everything finished, False on timeout.
+        """
+        if not self._background.is_running:
+            return True
+        wait = self.flush_timeout if timeout is None else timeout
+        try:
+            self._background.run(self._wait_in_flight(), timeout=wait)
+        except TimeoutError:
+            return False
+        return True
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Flush in-flight deliveries, then close the pools and the loop.
+
+        Args:
+            timeout: Seconds to wait for the flush (default: ``flush_timeout``).
+
+        Returns:
+            True if every delivery finished before shutdown.
+        """
+        with self._lock:
+            if self._closed:
+                return True
+            self._closed = True
+        self.unregister_shutdown_hook()
+        if not self._background.is_running:
+            return True
+
+        flushed = self.flush(timeout)
+        try:
+            self._background.run(self._shutdown(), timeout=DEFAULT_FLUSH_TIMEOUT)
+        except Exception as e:
+            logger.warning("Error shutting down webhook fan-out: %s", e)
+        self._background.stop()
+        return flushed
+
+    def register_shutdown_hook(self) -> None:
+        """Flush and close this fan-out when ShutdownManager callbacks run."""
+        if not self._shutdown_hook_registered:
+            get_shutdown_manager().add_callback(self._on_shutdown)
+            self._shutdown_hook_registered = True
+
+    def unregister_shutdown_hook(self) -> None:
+        """Remove the ShutdownManager callback, if registered."""
+        if self._shutdown_hook_registered:
+            get_shutdown_manager().remove_callback(self._on_shutdown)
+            self._shutdown_hook_registered = False
+
+    def _on_shutdown(self) -> None:
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Loop-thread internals
+    # -------------------------------------------------------------------------
+
+    def _start(
+        self,
+        targets: list[WebhookClient],
+        data: dict[str, Any],
+        event_type: str | None,
+        delivery_id: str | None,
+    ) -> None:
+        task = asyncio.get_running_loop().create_task(
+            self._fan_out(targets, data, event_type, delivery_id)
+        )
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _wait_in_flight(self) -> None:
+        while self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    async def _fan_out(
+        self,
+        targets: list[WebhookClient],
+        data: dict[str, Any],
+        event_type: str | None,
+        delivery_id: str | None,
+    ) -> dict[str, WebhookDeliveryResult]:
+        """Serialize and sign once, then deliver to every target concurrently."""
+        payload = serialize_payload(data)
+        timestamp = str(int(time.time()))
+        signatures: dict[str, dict[str, str]] = {}  # One HMAC per distinct secret
+        deliveries = []
+        for client in targets:
+            headers, signature = client.prepare_headers(
+                payload, timestamp, event_type, delivery_id, signatures=signatures
+            )
+            deliveries.append(self._deliver(client, payload, headers, signature, delivery_id))
+        results = await asyncio.gather(*deliveries)
+        return {client.url: result for client, result in zip(targets, results, strict=True)}
+
+    async def _deliver(
+        self,
+        client: WebhookClient,
+        payload: bytes,
+        headers: dict[str, str],
+        signature: str | None,
+        delivery_id: str | None,
+    ) -> WebhookDeliveryResult:
+        start = time.monotonic()
+        try:
+            result = await client.send_payload(
+                payload,
+                headers,
+                signature=signature,
+                delivery_id=delivery_id,
+                http_client=self._http_client(client),
+            )
+        except Exception as e:
+            result = WebhookDeliveryResult(success=False, delivery_id=delivery_id, error=str(e))
+        if not result.success:
+            logger.warning("Webhook delivery to %s failed: %s", client.url, result.error)
+        stats = self._stats.setdefault(client.url, EndpointStats())
+        stats.record(result, (time.monotonic() - start) * 1000)
+        return result
+
+    def _http_client(self, client: WebhookClient) -> httpx.AsyncClient:
+        """Get the pooled AsyncClient for a client's host."""
+        url = httpx.URL(client.url)
+        key = (url.scheme, url.host, url.port, client.verify_ssl)
+        pooled = self._http_clients.get(key)
+        if pooled is None:
+            pooled = httpx.AsyncClient(
+                http2=self.http2,
+                verify=client.verify_ssl,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections_per_host,
+                    max_keepalive_connections=self.max_connections_per_host,
+                ),
+            )
+            self._http_clients[key] = pooled
+        return pooled
+
+    async def _shutdown(self) -> None:
+        """Cancel leftover deliveries and close the pools."""
+        for task in list(self._in_flight):
+            task.cancel()
+        await asyncio.gather(*self._in_flight, return_exceptions=True)
+        for pooled in self._http_clients.values():
+            await pooled.aclose()
+        self._http_clients.clear()
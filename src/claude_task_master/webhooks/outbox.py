@@ -0,0 +1,811 @@
+"""Durable on-disk webhook outbox with a background sender.
+
+Events are appended to an outbox before any delivery is attempted, so a
+receiver that is down (or a process that exits) never loses them:
+
+    .claude-task-master/webhooks/outbox/
+    ├── segment-000001.jsonl   # Append-only JSON lines, one event per line
+    ├── segment-000002.jsonl   # New segment once the current one is full
+    └── cursors/
+        └── <endpoint>.json    # Committed position of each endpoint
+
+Each endpoint keeps its own committed cursor: the position just after the
+last event it acknowledged. ``OutboxSender`` drains the outbox in batches
+from each cursor on a background event loop, backing off (with jitter) per
+endpoint while the receiver fails, and commits the cursor after every batch.
+Delivery is at-least-once; receivers can de-duplicate on
+``X-Webhook-Delivery-Id`` (the event ID).
+
+Segments are kept after delivery so events can be redelivered by event ID or
+time range (``claudetm webhooks replay``, ``POST /webhooks/replay``). Only
+the oldest segments beyond ``max_segments`` that every cursor has passed
+are deleted; cursors of endpoints that are no longer configured are retired
+(``retire_cursors``) so they don't pin the log forever.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from claude_task_master.core.agent_loop import BackgroundEventLoop
+from claude_task_master.core.retry import RetryPolicy
+from claude_task_master.core.shutdown import get_shutdown_manager
+from claude_task_master.webhooks.client import WebhookClient, WebhookDeliveryResult
+from claude_task_master.webhooks.dispatch import DEFAULT_FLUSH_TIMEOUT, DispatchStats
+
+logger = logging.getLogger(__name__)
+
+# Outbox location relative to the state directory
+OUTBOX_DIR = Path("webhooks") / "outbox"
+CURSORS_DIR = "cursors"
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".jsonl"
+
+# Default configuration
+DEFAULT_SEGMENT_MAX_BYTES = 1024 * 1024  # Start a new segment after 1 MiB
+DEFAULT_MAX_SEGMENTS = 16  # Delivered segments kept for replay
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_BASE_BACKOFF = 1.0
+DEFAULT_MAX_BACKOFF = 300.0
+
+
+class OutboxError(Exception):
+    """Error reading or writing the webhook outbox."""
+
+    pass
+
+
+# =============================================================================
+# Records and Positions
+# =============================================================================
+
+
+@dataclass(frozen=True, order=True)
+class OutboxPosition:
+    """A byte offset within a segment file."""
+
+    segment: int
+    offset: int
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to dictionary for serialization."""
+        return {"segment": self.segment, "offset": self.offset}
+
+
+@dataclass
+class OutboxRecord:
+    """One event in the outbox.
+
+    Attributes:
+        event_id: Event ID, sent as the delivery ID.
+        event_type: Event type, sent in the X-Webhook-Event header.
+        appended_at: UTC time the event was written to the outbox.
+        data: The event payload (``WebhookEvent.to_dict()``).
+        position: Where the record starts.
+        next_position: Where the following record starts.
+    """
+
+    event_id: str | None
+    event_type: str | None
+    appended_at: str
+    data: dict[str, Any]
+    position: OutboxPosition = field(default=OutboxPosition(0, 0), compare=False)
+    next_position: OutboxPosition = field(default=OutboxPosition(0, 0), compare=False)
+
+    def to_line(self) -> bytes:
+        """Serialize as one JSON line."""
+        record = {
+            "event_id": self.event_id,
+            "event_type": self.event_type,
+            "appended_at": self.appended_at,
+            "data": self.data,
+        }
+        return json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+
+    @property
+    def appended_datetime(self) -> datetime:
+        """Parse appended_at as an aware datetime."""
+        return _as_utc(datetime.fromisoformat(self.appended_at))
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def endpoint_key(url: str) -> str:
+    """Get the cursor file key for an endpoint URL."""
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+
+
+# =============================================================================
+# WebhookOutbox
+# =============================================================================
+
+
+class WebhookOutbox:
+    """Append-only segmented event log with per-endpoint cursors.
+
+    Thread-safe within one process.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+        fsync: bool = True,
+    ) -> None:
+        """Initialize the outbox (directories are created on first append).
+
+        Args:
+            root: Outbox directory.
+            segment_max_bytes: Size after which a new segment is started.
+            max_segments: Fully delivered segments kept for replay.
+            fsync: Whether appends and cursor commits are fsynced.
+        """
+        self.root = root
+        self.segment_max_bytes = segment_max_bytes
+        self.max_segments = max_segments
+        self.fsync = fsync
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_state_dir(cls, state_dir: Path, **kwargs: Any) -> WebhookOutbox:
+        """Get the outbox inside a state directory."""
+        return cls(state_dir / OUTBOX_DIR, **kwargs)
+
+    @property
+    def cursors_dir(self) -> Path:
+        """Directory holding one cursor file per endpoint."""
+        return self.root / CURSORS_DIR
+
+    # -------------------------------------------------------------------------
+    # Segments
+    # -------------------------------------------------------------------------
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.root / f"{SEGMENT_PREFIX}{segment:06d}{SEGMENT_SUFFIX}"
+
+    def segments(self) -> list[int]:
+        """List existing segment numbers in order."""
+        if not self.root.exists():
+            return []
+        numbers = []
+        for path in self.root.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"):
+            try:
+                numbers.append(int(path.name[len(SEGMENT_PREFIX) : -len(SEGMENT_SUFFIX)]))
+            except ValueError:
+                continue
+        return sorted(numbers)
+
+    def start_position(self) -> OutboxPosition:
+        """Position of the oldest record still on disk."""
+        segments = self.segments()
+        return OutboxPosition(segments[0] if segments else 1, 0)
+
+    def end_position(self) -> OutboxPosition:
+        """Position just after the newest record."""
+        segments = self.segments()
+        if not segments:
+            return OutboxPosition(1, 0)
+        last = segments[-1]
+        return OutboxPosition(last, self._segment_path(last).stat().st_size)
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+
+    def append(
+        self,
+        data: dict[str, Any],
+        event_type: str | None = None,
+        event_id: str | None = None,
+    ) -> OutboxRecord:
+        """Durably append an event.
+
+        Args:
+            data: The event payload.
+            event_type: Event type (default: ``data["event_type"]``).
+            event_id: Event ID (default: ``data["event_id"]``).
+
+        Returns:
+            The written record with its position.
+
+        Raises:
+            OutboxError: If the record could not be written.
+        """
+        record = OutboxRecord(
+            event_id=event_id or data.get("event_id"),
+            event_type=event_type or data.get("event_type"),
+            appended_at=datetime.now(timezone.utc).isoformat(),
+            data=data,
+        )
+        line = record.to_line()
+        with self._lock:
+            try:
+                self.root.mkdir(parents=True, exist_ok=True)
+                end = self.end_position()
+                if end.offset and end.offset + len(line) > self.segment_max_bytes:
+                    end = OutboxPosition(end.segment + 1, 0)
+                with open(self._segment_path(end.segment), "ab") as f:
+                    f.write(line)
+                    f.flush()
+                    if self.fsync:
+                        os.fsync(f.fileno())
+            except OSError as e:
+                raise OutboxError(f"Failed to append to webhook outbox: {e}") from e
+        record.position = end
+        record.next_position = OutboxPosition(end.segment, end.offset + len(line))
+        return record
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def read(self, position: OutboxPosition, limit: int = DEFAULT_BATCH_SIZE) -> list[OutboxRecord]:
+        """Read up to limit records starting at a position.
+
+        A partially written last line (from a crash mid-append) is skipped
+        until it is complete.
+
+        Args:
+            position: Where to start (a record boundary).
+            limit: Maximum records to return.
+
+        Returns:
+            Records in order, each with its position and next_position.
+        """
+        records: list[OutboxRecord] = []
+        for record in self._iter_from(position):
+            records.append(record)
+            if len(records) >= limit:
+                break
+        return records
+
+    def _iter_from(self, position: OutboxPosition) -> Iterator[OutboxRecord]:
+        for segment in self.segments():
+            if segment < position.segment:
+                continue
+            offset = position.offset if segment == position.segment else 0
+            yield from self._iter_segment(segment, offset)
+
+    def _iter_segment(self, segment: int, offset: int) -> Iterator[OutboxRecord]:
+        try:
+            with open(self._segment_path(segment), "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    start = offset
+                    offset += len(line)
+                    if not line.endswith(b"\n"):
+                        return  # Incomplete trailing write
+                    try:
+                        raw = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning("Skipping corrupt outbox record in segment %d", segment)
+                        continue
+                    yield OutboxRecord(
+                        event_id=raw.get("event_id"),
+                        event_type=raw.get("event_type"),
+                        appended_at=raw.get("appended_at", ""),
+                        data=raw.get("data", {}),
+                        position=OutboxPosition(segment, start),
+                        next_position=OutboxPosition(segment, offset),
+                    )
+        except FileNotFoundError:
+            return  # Pruned while reading
+
+    def find(
+        self,
+        event_ids: Iterable[str] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[OutboxRecord]:
+        """Find records by event ID and/or appended time range.
+
+        Args:
+            event_ids: Only records with these event IDs.
+            since: Only records appended at or after this time.
+            until: Only records appended at or before this time.
+
+        Returns:
+            Matching records in outbox order.
+        """
+        wanted = set(event_ids) if event_ids else None
+        since = _as_utc(since) if since else None
+        until = _as_utc(until) if until else None
+        matches = []
+        for record in self._iter_from(self.start_position()):
+            if wanted is not None and record.event_id not in wanted:
+                continue
+            if since or until:
+                try:
+                    appended = record.appended_datetime
+                except ValueError:
+                    continue
+                if (since and appended < since) or (until and appended > until):
+                    continue
+            matches.append(record)
+        return matches
+
+    # -------------------------------------------------------------------------
+    # Cursors
+    # -------------------------------------------------------------------------
+
+    def _cursor_path(self, url: str) -> Path:
+        return self.cursors_dir / f"{endpoint_key(url)}.json"
+
+    def get_cursor(self, url: str) -> OutboxPosition | None:
+        """Get an endpoint's committed position, or None if it has none."""
+        try:
+            raw = json.loads(self._cursor_path(url).read_text())
+            return OutboxPosition(int(raw["segment"]), int(raw["offset"]))
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return None
+
+    def ensure_cursor(self, url: str) -> OutboxPosition:
+        """Get an endpoint's cursor, starting a new endpoint at the end."""
+        with self._lock:
+            cursor = self.get_cursor(url)
+            if cursor is None:
+                cursor = self.end_position()
+                self.commit(url, cursor)
+            return cursor
+
+    def commit(self, url: str, position: OutboxPosition) -> None:
+        """Atomically record that an endpoint has received everything before position.
+
+        Args:
+            url: The endpoint URL.
+            position: The new committed position.
+        """
+        path = self._cursor_path(url)
+        data = {
+            "url": url,
+            **position.to_dict(),
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            os.replace(tmp, path)
+            self._prune()
+
+    def cursors(self) -> dict[str, OutboxPosition]:
+        """Get every endpoint's committed position, keyed by URL."""
+        result = {}
+        if self.cursors_dir.exists():
+            for path in self.cursors_dir.glob("*.json"):
+                try:
+                    raw = json.loads(path.read_text())
+                    result[raw["url"]] = OutboxPosition(int(raw["segment"]), int(raw["offset"]))
+                except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    continue
+        return result
+
+    def retire_cursors(self, keep: Iterable[str]) -> list[str]:
+        """Delete the cursors of endpoints not in ``keep``, then prune.
+
+        An endpoint that was removed from the configuration never commits
+        again, so its cursor would keep every later segment on disk.
+
+        Args:
+            keep: URLs of the endpoints still configured.
+
+        Returns:
+            URLs whose cursors were deleted.
+        """
+        keep_urls = set(keep)
+        retired = []
+        with self._lock:
+            for url in self.cursors():
+                if url not in keep_urls:
+                    self._cursor_path(url).unlink(missing_ok=True)
+                    retired.append(url)
+            if retired:
+                logger.info("Retired outbox cursors of removed endpoints: %s", retired)
+                self._prune()
+        return retired
+
+    def pending(self, url: str) -> int:
+        """Count records an endpoint has not yet acknowledged."""
+        cursor = self.get_cursor(url)
+        if cursor is None:
+            return 0
+        return sum(1 for _ in self._iter_from(cursor))
+
+    def _prune(self) -> None:
+        """Delete the oldest delivered segments beyond max_segments."""
+        segments = self.segments()
+        if len(segments) <= self.max_segments:
+            return
+        cursors = self.cursors().values()
+        oldest_needed = min((c.segment for c in cursors), default=segments[-1])
+        for segment in segments[: len(segments) - self.max_segments]:
+            if segment >= oldest_needed:
+                break
+            self._segment_path(segment).unlink(missing_ok=True)
+
+
+# =============================================================================
+# OutboxSender
+# =============================================================================
+
+
+@dataclass
+class OutboxStats(DispatchStats):
+    """Counters for an OutboxSender.
+
+    ``failed`` counts failed delivery attempts (they are retried), and
+    ``rejected`` counts events the receiver refused with a non-retryable
+    status; those are skipped but stay in the outbox for replay.
+    """
+
+    rejected: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {**super().to_dict(), "rejected": self.rejected}
+
+
+def _is_rejected(result: WebhookDeliveryResult) -> bool:
+    """Check whether a failure is a non-retryable 4xx response."""
+    status = result.status_code
+    return status is not None and 400 <= status < 500 and status != 429
+
+
+@dataclass
+class _Endpoint:
+    """Drain state for one endpoint (loop thread only)."""
+
+    client: WebhookClient
+    cursor: OutboxPosition
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    failures: int = 0
+    last_delay: float | None = None  # Previous backoff, for jitter
+    task: asyncio.Task[None] | None = None
+
+
+class OutboxSender:
+    """Write-ahead webhook delivery through a WebhookOutbox.
+
+    ``submit()`` appends the event to the outbox (the only work done on the
+    caller's thread) and wakes the endpoint's drain task on a background
+    event loop. Events left undelivered at ``close()`` stay in the outbox
+    and are sent when a sender for the same endpoint next starts.
+    """
+
+    def __init__(
+        self,
+        outbox: WebhookOutbox,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        base_backoff: float = DEFAULT_BASE_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        flush_timeout: float = DEFAULT_FLUSH_TIMEOUT,
+    ) -> None:
+        """Initialize the sender (the drain loop starts with the first endpoint).
+
+        Args:
+            outbox: The outbox to append to and drain.
+            batch_size: Records read and committed per batch.
+            base_backoff: Minimum delay after a failed delivery, in seconds.
+            max_backoff: Cap on the per-endpoint backoff delay.
+            flush_timeout: Seconds ``close()`` waits for pending deliveries.
+        """
+        self.outbox = outbox
+        self.batch_size = batch_size
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._retry_policy = RetryPolicy(base=base_backoff, cap=max_backoff)
+        self.flush_timeout = flush_timeout
+        self.stats = OutboxStats()
+
+        self._background = BackgroundEventLoop(name="claudetm-webhook-outbox")
+        self._lock = threading.Lock()
+        self._closed = False
+        self._shutdown_hook_registered = False
+        self._urls: set[str] = set()
+
+        # Loop-thread state
+        self._endpoints: dict[str, _Endpoint] = {}
+        self._http_clients: dict[bool, httpx.AsyncClient] = {}
+        self._stopping = asyncio.Event()
+
+    @property
+    def closed(self) -> bool:
+        """Check whether the sender has been closed."""
+        return self._closed
+
+    # -------------------------------------------------------------------------
+    # Producer API (any thread)
+    # -------------------------------------------------------------------------
+
+    def add_endpoint(self, client: WebhookClient) -> None:
+        """Start draining the outbox to an endpoint from its committed cursor.
+
+        Events left over from earlier runs are sent first.
+        """
+        with self._lock:
+            if not self._closed:
+                self._add_endpoint_locked(client)
+
+    def _add_endpoint_locked(self, client: WebhookClient) -> None:
+        """Schedule an endpoint's drain task; the caller holds ``_lock``."""
+        if client.url in self._urls:
+            return
+        self._urls.add(client.url)
+        cursor = self.outbox.ensure_cursor(client.url)
+        # Starts the loop on first use; close() can't stop it until this is
+        # scheduled, and a closed sender never restarts it
+        self._background.start().call_soon_threadsafe(self._start_endpoint, client, cursor)
+
+    def submit(
+        self,
+        client: WebhookClient,
+        data: dict[str, Any],
+        event_type: str | None = None,
+        delivery_id: str | None = None,
+    ) -> bool:
+        """Append an event to the outbox and schedule its delivery.
+
+        Args:
+            client: The webhook client to send with.
+            data: The JSON payload.
+            event_type: Optional event type for the X-Webhook-Event header.
+            delivery_id: Optional delivery ID (defaults to the event ID).
+
+        Returns:
+            False if the sender is closed or the outbox write failed.
+        """
+        with self._lock:
+            if self._closed:
+                return False
+            self._add_endpoint_locked(client)
+            try:
+                self.outbox.append(data, event_type=event_type, event_id=delivery_id)
+            except OutboxError as e:
+                logger.warning("%s", e)
+                return False
+            self._background.start().call_soon_threadsafe(self._wake, client.url)
+        return True
+
+    def flush(self, timeout: float | None = None, wait_for_failing: bool = True) -> bool:
+        """Wait until every endpoint has acknowledged every event.
+
+        Args:
+            timeout: Seconds to wait (default: ``flush_timeout``).
+            wait_for_failing: If False, give up as soon as every endpoint
+                still behind has failed its last delivery, instead of
+                waiting out its backoff until the timeout.
+
+        Returns:
+            True if the outbox drained, False otherwise.
+        """
+        if not self._background.is_running:
+            return True
+        wait = self.flush_timeout if timeout is None else timeout
+        deadline = time.monotonic() + wait
+        while time.monotonic() < deadline:
+            drained, failing = self._background.run(self._flush_progress(), timeout=wait)
+            if drained:
+                return True
+            if failing and not wait_for_failing:
+                return False
+            time.sleep(0.01)
+        return False
+
+    def pending(self) -> int:
+        """Count undelivered events across this sender's endpoints."""
+        with self._lock:
+            urls = list(self._urls)
+        return sum(self.outbox.pending(url) for url in urls)
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Flush, then stop the drain tasks and the loop.
+
+        Endpoints that are failing aren't waited for: their events stay in
+        the outbox and are sent on the next run.
+
+        Args:
+            timeout: Seconds to wait for the flush (default: ``flush_timeout``).
+
+        Returns:
+            True if every event was delivered before shutdown.
+        """
+        with self._lock:
+            if self._closed:
+                return True
+            self._closed = True
+        self.unregister_shutdown_hook()
+        if not self._background.is_running:
+            return True
+
+        drained = self.flush(timeout, wait_for_failing=False)
+        try:
+            self._background.run(self._shutdown(), timeout=DEFAULT_FLUSH_TIMEOUT)
+        except Exception as e:
+            logger.warning("Error shutting down webhook outbox sender: %s", e)
+        self._background.stop()
+        return drained
+
+    def register_shutdown_hook(self) -> None:
+        """Flush and close this sender when ShutdownManager callbacks run."""
+        if not self._shutdown_hook_registered:
+            get_shutdown_manager().add_callback(self._on_shutdown)
+            self._shutdown_hook_registered = True
+
+    def unregister_shutdown_hook(self) -> None:
+        """Remove the ShutdownManager callback, if registered."""
+        if self._shutdown_hook_registered:
+            get_shutdown_manager().remove_callback(self._on_shutdown)
+            self._shutdown_hook_registered = False
+
+    def _on_shutdown(self) -> None:
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Loop-thread internals
+    # -------------------------------------------------------------------------
+
+    def _start_endpoint(self, client: WebhookClient, cursor: OutboxPosition) -> None:
+        if client.url in self._endpoints:
+            return
+        endpoint = _Endpoint(client=client, cursor=cursor)
+        endpoint.task = asyncio.get_running_loop().create_task(self._drain(endpoint))
+        endpoint.wakeup.set()  # Send any backlog
+        self._endpoints[client.url] = endpoint
+
+    def _wake(self, url: str) -> None:
+        self.stats.submitted += 1
+        endpoint = self._endpoints.get(url)
+        if endpoint is not None:
+            endpoint.wakeup.set()
+
+    async def _flush_progress(self) -> tuple[bool, bool]:
+        """Whether all endpoints are caught up, and whether all others are failing."""
+        end = self.outbox.end_position()
+        behind = [e for e in self._endpoints.values() if e.cursor < end]
+        return not behind, bool(behind) and all(e.failures for e in behind)
+
+    def _http_client(self, verify_ssl: bool) -> httpx.AsyncClient:
+        client = self._http_clients.get(verify_ssl)
+        if client is None:
+            client = httpx.AsyncClient(verify=verify_ssl)
+            self._http_clients[verify_ssl] = client
+        return client
+
+    async def _drain(self, endpoint: _Endpoint) -> None:
+        """Deliver an endpoint's events in order, one batch at a time."""
+        while not self._stopping.is_set():
+            await endpoint.wakeup.wait()
+            endpoint.wakeup.clear()
+            while not self._stopping.is_set():
+                batch = self.outbox.read(endpoint.cursor, self.batch_size)
+                if not batch:
+                    break
+                delivered_all = await self._send_batch(endpoint, batch)
+                if not delivered_all:
+                    await self._backoff(endpoint)
+
+    async def _send_batch(self, endpoint: _Endpoint, batch: list[OutboxRecord]) -> bool:
+        """Send records until one fails, then commit the cursor.
+
+        Returns:
+            True if the whole batch was acknowledged.
+        """
+        committed = endpoint.cursor
+        try:
+            for record in batch:
+                start = time.monotonic()
+                try:
+                    # One attempt: failed deliveries are retried by _backoff
+                    result = await endpoint.client.send(
+                        data=record.data,
+                        event_type=record.event_type,
+                        delivery_id=record.event_id,
+                        http_client=self._http_client(endpoint.client.verify_ssl),
+                        max_attempts=1,
+                    )
+                except Exception as e:
+                    result = WebhookDeliveryResult(
+                        success=False, delivery_id=record.event_id, error=str(e)
+                    )
+                self.stats.latencies_ms.append((time.monotonic() - start) * 1000)
+
+                if result.success:
+                    self.stats.delivered += 1
+                elif _is_rejected(result):
+                    self.stats.rejected += 1
+                    logger.warning(
+                        "Webhook %s rejected by %s (%s); skipping",
+                        record.event_id,
+                        endpoint.client.url,
+                        result.error,
+                    )
+                else:
+                    self.stats.failed += 1
+                    endpoint.failures += 1
+                    logger.warning(
+                        "Webhook delivery to %s failed (%s); will retry",
+                        endpoint.client.url,
+                        result.error,
+                    )
+                    return False
+                committed = record.next_position
+                endpoint.failures = 0
+            return True
+        finally:
+            if committed != endpoint.cursor:
+                endpoint.cursor = committed
+                self.outbox.commit(endpoint.client.url, committed)
+
+    async def _backoff(self, endpoint: _Endpoint) -> None:
+        """Sleep before retrying an endpoint (cut short on shutdown)."""
+        previous = endpoint.last_delay if endpoint.failures > 1 else None
+        delay = endpoint.last_delay = self._retry_policy.next_delay(previous)
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _shutdown(self) -> None:
+        """Stop drain tasks and close HTTP clients."""
+        self._stopping.set()
+        tasks = [e.task for e in self._endpoints.values() if e.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for client in self._http_clients.values():
+            await client.aclose()
+        self._http_clients.clear()
+
+
+# =============================================================================
+# Replay
+# =============================================================================
+
+
+async def replay_records(
+    records: list[OutboxRecord],
+    client: WebhookClient,
+) -> list[tuple[OutboxRecord, WebhookDeliveryResult]]:
+    """Redeliver outbox records to an endpoint, in order, over one connection pool.
+
+    Cursors are not changed.
+
+    Args:
+        records: Records to send (e.g. from ``WebhookOutbox.find``).
+        client: The endpoint to send them to.
+
+    Returns:
+        List of (record, delivery result) pairs.
+    """
+    results = []
+    async with httpx.AsyncClient(verify=client.verify_ssl) as http_client:
+        for record in records:
+            result = await client.send(
+                data=record.data,
+                event_type=record.event_type,
+                delivery_id=record.event_id,
+                http_client=http_client,
+            )
+            results.append((record, result))
+    return results
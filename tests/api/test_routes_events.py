@@ -0,0 +1,266 @@
+"""Tests for the /events server-sent event stream."""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from claude_task_master.api.routes_events import (
+    EventHub,
+    EventSubscription,
+    StateEvent,
+    StateWatcher,
+    _event_stream,
+)
+
+
+def _write_state(state_dir: Path, **overrides) -> None:
+    state = {
+        "status": "working",
+        "workflow_stage": "working",
+        "current_task_index": 0,
+        "session_count": 1,
+        "current_pr": None,
+        "run_id": "20250118-120000",
+        "options": {"log_format": "text"},
+    }
+    state.update(overrides)
+    (state_dir / "state.json").write_text(json.dumps(state))
+
+
+@pytest.fixture
+def watched_dir(api_state_dir: Path, api_logs_dir: Path) -> Path:
+    """State directory with state, plan and an existing log."""
+    _write_state(api_state_dir)
+    (api_state_dir / "plan.md").write_text("- [ ] First task\n- [ ] Second task\n")
+    (api_logs_dir / "run-20250118-120000.txt").write_text("old line\n")
+    return api_state_dir
+
+
+class TestStateWatcher:
+    """Tests for StateWatcher polling."""
+
+    def test_first_poll_is_baseline(self, watched_dir: Path):
+        """Test that the first poll emits nothing and fills the snapshot."""
+        watcher = StateWatcher(watched_dir)
+
+        assert watcher.poll() == []
+        snapshot = watcher.snapshot()
+        assert snapshot["state"]["status"] == "working"
+        assert snapshot["plan"] == {"completed": 0, "total": 2}
+
+    def test_unchanged_files_emit_nothing(self, watched_dir: Path):
+        """Test that polling unchanged files emits no events."""
+        watcher = StateWatcher(watched_dir)
+        watcher.poll()
+
+        assert watcher.poll() == []
+
+    def test_state_change_event(self, watched_dir: Path):
+        """Test that TaskState field changes are reported."""
+        watcher = StateWatcher(watched_dir)
+        watcher.poll()
+
+        _write_state(watched_dir, status="paused", session_count=2)
+        events = watcher.poll()
+
+        assert [e.type for e in events] == ["state"]
+        changes = events[0].data["changes"]
+        assert changes["status"] == {"from": "working", "to": "paused"}
+        assert changes["session_count"] == {"from": 1, "to": 2}
+        assert "current_task_index" not in changes
+
+    def test_plan_checkbox_flip_event(self, watched_dir: Path):
+        """Test that checkbox flips are reported by index."""
+        watcher = StateWatcher(watched_dir)
+        watcher.poll()
+
+        (watched_dir / "plan.md").write_text("- [x] First task\n- [ ] Second task\n")
+        events = watcher.poll()
+
+        assert [e.type for e in events] == ["plan"]
+        assert events[0].data["changes"] == [{"index": 0, "task": "First task", "completed": True}]
+        assert events[0].data["completed"] == 1
+        assert events[0].data["replanned"] is False
+
+    def test_log_append_event(self, watched_dir: Path):
+        """Test that only newly appended log lines are pushed."""
+        watcher = StateWatcher(watched_dir)
+        watcher.poll()
+
+        log_file = watched_dir / "logs" / "run-20250118-120000.txt"
+        with open(log_file, "a") as f:
+            f.write("new line\n")
+        events = watcher.poll()
+
+        assert [e.type for e in events] == ["log"]
+        assert events[0].data["content"] == "new line\n"
+        assert events[0].data["next_offset"] == log_file.stat().st_size
+
+    def test_log_rotation_restarts_at_zero(self, watched_dir: Path):
+        """Test that a replaced log is read from the start even if it is larger."""
+        log_file = watched_dir / "logs" / "run-20250118-120000.txt"
+        watcher = StateWatcher(watched_dir)
+        watcher.poll()
+
+        log_file.rename(log_file.with_suffix(".txt.1"))
+        log_file.write_text("rotated " * 64 + "\n")
+        events = watcher.poll()
+
+        assert [e.type for e in events] == ["log"]
+        assert events[0].data["reset"] is True
+        assert events[0].data["content"] == "rotated " * 64 + "\n"
+
+    def test_follows_log_format(self, watched_dir: Path):
+        """Test that the log file matching log_format is followed."""
+        _write_state(watched_dir, options={"log_format": "jsonl"})
+        jsonl_file = watched_dir / "logs" / "run-20250118-120000.jsonl"
+        jsonl_file.write_text("")
+        watcher = StateWatcher(watched_dir)
+        watcher.poll()
+
+        jsonl_file.write_text('{"type":"prompt"}\n')
+        events = watcher.poll()
+
+        assert events[0].data["content"] == '{"type":"prompt"}\n'
+
+    def test_missing_state_dir(self, temp_dir: Path):
+        """Test polling a directory that doesn't exist yet."""
+        watcher = StateWatcher(temp_dir / "missing")
+
+        assert watcher.poll() == []
+        assert watcher.snapshot()["state"] == {}
+
+
+class TestEventSubscription:
+    """Tests for per-subscriber backpressure."""
+
+    async def test_drops_oldest_and_reports_lag(self):
+        """Test that a full queue drops the oldest events and reports lag."""
+        subscription = EventSubscription(max_queue=2)
+        for i in range(5):
+            subscription.put(StateEvent(type="log", data={"n": i}, id=i))
+
+        lagged = await subscription.get(timeout=0.1)
+        assert lagged is not None
+        assert lagged.type == "lagged"
+        assert lagged.data == {"dropped": 3}
+        assert subscription.dropped == 3
+
+        first = await subscription.get(timeout=0.1)
+        second = await subscription.get(timeout=0.1)
+        assert [first.data["n"], second.data["n"]] == [3, 4]
+
+    async def test_get_timeout_returns_none(self):
+        """Test that get returns None when nothing arrives."""
+        subscription = EventSubscription()
+
+        assert await subscription.get(timeout=0.01) is None
+
+
+class TestEventHub:
+    """Tests for fan-out through a shared watcher."""
+
+    async def test_snapshot_on_subscribe(self, watched_dir: Path):
+        """Test that subscribers start with a snapshot event."""
+        hub = EventHub(watched_dir, poll_interval=0.01)
+        subscription = await hub.subscribe()
+
+        event = await subscription.get(timeout=0.5)
+        assert event.type == "snapshot"
+        assert event.data["state"]["run_id"] == "20250118-120000"
+        await hub.close()
+
+    async def test_fan_out_with_single_watcher(self, watched_dir: Path):
+        """Test that all subscribers share one polling task."""
+        hub = EventHub(watched_dir, poll_interval=0.01)
+        subscriptions = [await hub.subscribe() for _ in range(3)]
+        for subscription in subscriptions:
+            await subscription.get(timeout=0.5)  # snapshot
+
+        assert hub.subscriber_count == 3
+        assert hub.running
+
+        _write_state(watched_dir, status="blocked", current_task_index=1)
+        for subscription in subscriptions:
+            event = await subscription.get(timeout=1.0)
+            assert event.type == "state"
+            assert event.data["state"]["status"] == "blocked"
+
+        for subscription in subscriptions:
+            await hub.unsubscribe(subscription)
+        assert hub.subscriber_count == 0
+        assert not hub.running
+
+    async def test_concurrent_subscribes_poll_one_at_a_time(self, watched_dir: Path):
+        """Test that simultaneous subscribers never poll the watcher concurrently."""
+        hub = EventHub(watched_dir, poll_interval=0.01)
+        poll = hub.watcher.poll
+        active = 0
+        peak = 0
+
+        def tracked_poll():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            try:
+                time.sleep(0.02)
+                return poll()
+            finally:
+                active -= 1
+
+        hub.watcher.poll = tracked_poll  # type: ignore[method-assign]
+        subscriptions = await asyncio.gather(*(hub.subscribe() for _ in range(3)))
+
+        assert peak == 1
+        assert len(subscriptions) == hub.subscriber_count == 3
+        assert hub.running
+        await hub.close()
+
+    async def test_event_stream_formats_sse(self, watched_dir: Path):
+        """Test the SSE generator output and cleanup on disconnect."""
+        hub = EventHub(watched_dir, poll_interval=0.01)
+        subscription = await hub.subscribe()
+        request = MagicMock()
+        disconnected = [False, True]
+
+        async def is_disconnected():
+            return disconnected.pop(0)
+
+        request.is_disconnected = is_disconnected
+
+        frames = [frame async for frame in _event_stream(request, hub, subscription)]
+
+        assert len(frames) == 1
+        assert frames[0].startswith("id: 1\nevent: snapshot\ndata: ")
+        assert frames[0].endswith("\n\n")
+        assert not hub.running
+
+
+def test_events_route_registered(api_client):
+    """Test that the /events route is registered on the app."""
+    paths = api_client.get("/openapi.json").json()["paths"]
+
+    assert "/events" in paths
+
+
+def test_state_event_to_sse():
+    """Test SSE frame formatting."""
+    frame = StateEvent(type="log", data={"content": "x\n"}, id=7).to_sse()
+
+    assert frame == 'id: 7\nevent: log\ndata: {"content":"x\\n"}\n\n'
+
+
+async def test_subscribe_without_running_loop_task(watched_dir: Path):
+    """Test that the hub restarts polling after all subscribers left."""
+    hub = EventHub(watched_dir, poll_interval=0.01)
+    subscription = await hub.subscribe()
+    await hub.unsubscribe(subscription)
+    assert not hub.running
+
+    subscription = await hub.subscribe()
+    assert hub.running
+    await asyncio.wait_for(hub.close(), 1.0)
@@ -4,6 +4,8 @@ Tests the read-only info endpoints that provide information about the current ta
 """
 
 import json
+import subprocess
+import sys
 from datetime import datetime
 
 # =============================================================================
@@ -694,6 +696,86 @@ Generated plan with 4 tasks:
     assert "Task 1: Design API" in data["log_content"]
 
 
+def test_get_logs_since_offset(api_client, api_complete_state, api_log_file, api_state_file):
+    """Test incremental polling with the since_offset cursor."""
+    timestamp = datetime.now().isoformat()
+    state_data = {
+        "status": "working",
+        "workflow_stage": None,
+        "current_task_index": 1,
+        "session_count": 2,
+        "current_pr": None,
+        "created_at": timestamp,
+        "updated_at": timestamp,
+        "run_id": "20250118-120000",
+        "model": "sonnet",
+        "options": {"log_format": "text"},
+    }
+    api_state_file.write_text(json.dumps(state_data))
+    api_log_file.write_text("first\nsecond\n")
+
+    first = api_client.get("/logs?tail=1").json()
+    assert first["log_content"] == "second\n"
+    assert first["next_offset"] == len("first\nsecond\n")
+
+    # Nothing new yet
+    empty = api_client.get(f"/logs?since_offset={first['next_offset']}").json()
+    assert empty["log_content"] == ""
+    assert empty["next_offset"] == first["next_offset"]
+
+    # Appended lines are returned; the unfinished line is held back
+    with open(api_log_file, "a") as f:
+        f.write("third\nfourth\npartial")
+    update = api_client.get(f"/logs?since_offset={first['next_offset']}").json()
+    assert update["log_content"] == "third\nfourth\n"
+    assert update["reset"] is False
+
+    # A cursor past the end (log rotated) restarts from the beginning
+    api_log_file.write_text("rotated\n")
+    rotated = api_client.get(f"/logs?since_offset={update['next_offset']}").json()
+    assert rotated["reset"] is True
+    assert rotated["log_content"] == "rotated\n"
+
+    # A replaced file that already grew past the cursor is caught by file_id
+    api_log_file.rename(api_log_file.with_suffix(".txt.1"))
+    api_log_file.write_text("replacement line that is longer than before\n")
+    replaced = api_client.get(
+        f"/logs?since_offset={rotated['next_offset']}&since_file_id={rotated['file_id']}"
+    ).json()
+    assert replaced["reset"] is True
+    assert replaced["log_content"] == "replacement line that is longer than before\n"
+    assert replaced["file_id"] != rotated["file_id"]
+
+
+def test_get_logs_uses_log_format_file(
+    api_client, api_complete_state, api_logs_dir, api_state_file
+):
+    """Test that the log file matching the run's log_format is read."""
+    timestamp = datetime.now().isoformat()
+    state_data = {
+        "status": "working",
+        "workflow_stage": None,
+        "current_task_index": 0,
+        "session_count": 1,
+        "current_pr": None,
+        "created_at": timestamp,
+        "updated_at": timestamp,
+        "run_id": "20250118-120000",
+        "model": "sonnet",
+        "options": {"log_format": "jsonl"},
+    }
+    api_state_file.write_text(json.dumps(state_data))
+    jsonl_file = api_logs_dir / "run-20250118-120000.jsonl"
+    jsonl_file.write_text('{"type":"prompt"}\n{"type":"response"}\n')
+
+    response = api_client.get("/logs?tail=1")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["log_file"].endswith(".jsonl")
+    assert data["log_content"] == '{"type":"response"}\n'
+
+
 # =============================================================================
 # GET /progress Tests
 # =============================================================================
@@ -1046,6 +1128,54 @@ def test_get_health_includes_version(api_client, api_complete_state):
     assert len(data["version"]) > 0
 
 
+def test_get_health_includes_circuit_breakers(api_client, api_complete_state):
+    """Test health endpoint reports registered circuit breakers."""
+    from claude_task_master.core.circuit_breaker import CircuitBreakerRegistry
+
+    registry = CircuitBreakerRegistry()
+    registry.clear()
+    breaker = registry.get_or_create("claude_api")
+    breaker.record_outcome(success=True, duration=0.2)
+    breaker.force_open()
+
+    response = api_client.get("/health")
+
+    registry.clear()
+    assert response.status_code == 200
+    info = response.json()["circuit_breakers"]["claude_api"]
+    assert info["state"] == "open"
+    assert info["mode"] == "consecutive"
+    assert info["metrics"]["successful_calls"] == 1
+    assert info["latency"]["p50_ms"] == 250
+    assert info["transitions"][-1]["reason"] == "forced open"
+
+
+def test_get_health_reads_breakers_published_by_runner(
+    api_client, api_complete_state, api_state_dir
+):
+    """Test health reports breakers registered in another (runner) process."""
+    from claude_task_master.core.circuit_breaker import CircuitBreakerRegistry
+
+    CircuitBreakerRegistry().clear()
+    runner = (
+        "import sys; from pathlib import Path\n"
+        "from claude_task_master.core.circuit_breaker import "
+        "CircuitBreakerRegistry, CircuitBreakerSnapshotFile\n"
+        "breaker = CircuitBreakerRegistry().get_or_create('claude_api')\n"
+        "snapshots = CircuitBreakerSnapshotFile.for_state_dir(Path(sys.argv[1]))\n"
+        "snapshots.attach(breaker)\n"
+        "breaker.force_open()\n"
+    )
+    subprocess.run([sys.executable, "-c", runner, str(api_state_dir)], check=True)
+
+    response = api_client.get("/health")
+
+    assert response.status_code == 200
+    info = response.json()["circuit_breakers"]["claude_api"]
+    assert info["state"] == "open"
+    assert info["transitions"][-1]["reason"] == "forced open"
+
+
 # =============================================================================
 # Integration Tests
 # =============================================================================
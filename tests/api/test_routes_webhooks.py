@@ -522,3 +522,79 @@ class TestTestWebhook:
             # Verify custom headers were passed
             call_kwargs = mock_client_class.call_args[1]
             assert call_kwargs["headers"] == {"X-Custom-Header": "value"}
+
+
+# =============================================================================
+# Replay Webhooks Tests
+# =============================================================================
+
+
+@pytest.fixture
+def outbox_events(api_state_dir: Path) -> list[str]:
+    """Write three events to the webhook outbox."""
+    from claude_task_master.webhooks.outbox import WebhookOutbox
+
+    outbox = WebhookOutbox.for_state_dir(api_state_dir, fsync=False)
+    ids = []
+    for n in range(3):
+        record = outbox.append({"event_type": "task.completed", "event_id": f"evt-{n}"})
+        ids.append(record.event_id)
+    return ids
+
+
+class TestReplayWebhooks:
+    """Tests for POST /webhooks/replay endpoint."""
+
+    def test_replay_by_event_id(self, api_client, webhooks_file, outbox_events):
+        """Test redelivering selected events to an existing webhook."""
+        with patch(
+            "claude_task_master.webhooks.client.WebhookClient.send", new_callable=AsyncMock
+        ) as send:
+            send.return_value = AsyncMock(success=True, status_code=200, error=None)
+
+            response = api_client.post(
+                "/webhooks/replay",
+                json={"event_ids": ["evt-2", "evt-0"], "webhook_id": "wh_abc12345_def67890"},
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["delivered"] == 2
+        assert [e["event_id"] for e in data["events"]] == ["evt-0", "evt-2"]
+        assert [c.kwargs["delivery_id"] for c in send.await_args_list] == ["evt-0", "evt-2"]
+
+    def test_replay_dry_run_by_time_range(self, api_client, outbox_events):
+        """Test listing events in a time range without sending them."""
+        response = api_client.post(
+            "/webhooks/replay",
+            json={"since": "2000-01-01T00:00:00Z", "dry_run": True},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["matched"] == 3
+        assert all(e["success"] is None for e in data["events"])
+
+    def test_replay_requires_filter(self, api_client, api_state_dir):
+        """Test that replaying everything needs an explicit filter."""
+        response = api_client.post("/webhooks/replay", json={"url": "https://example.com/h"})
+
+        assert response.status_code == 400
+        assert response.json()["error"] == "invalid_request"
+
+    def test_replay_no_matching_events(self, api_client, outbox_events):
+        """Test replaying unknown event IDs."""
+        response = api_client.post(
+            "/webhooks/replay",
+            json={"event_ids": ["missing"], "url": "https://example.com/h"},
+        )
+
+        assert response.status_code == 404
+
+    def test_replay_without_target(self, api_client, outbox_events):
+        """Test that a target is required when the run has no webhook."""
+        response = api_client.post("/webhooks/replay", json={"event_ids": ["evt-0"]})
+
+        assert response.status_code == 400
+        assert "webhook_id or url" in response.json()["message"]
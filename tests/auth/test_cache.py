@@ -0,0 +1,157 @@
+"""Tests for the verified-token cache and failed-attempt limiter.
+
+Tests cover:
+- Cache hits, TTL expiry and LRU eviction
+- HMAC keys (no plaintext tokens kept, config changes invalidate entries)
+- Disabling the cache
+- Failed-attempt lockout, expiry and reset
+- Bounded failed-attempt tracking (expired entries dropped, LRU cap)
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from claude_task_master.auth import cache as cache_module
+from claude_task_master.auth.cache import FailedAttemptLimiter, VerifiedTokenCache
+
+# =============================================================================
+# Test: VerifiedTokenCache
+# =============================================================================
+
+
+class TestVerifiedTokenCache:
+    """Tests for VerifiedTokenCache."""
+
+    def test_added_token_is_cached(self) -> None:
+        """Test that a verified token hits and an unknown one misses."""
+        cache = VerifiedTokenCache()
+        cache.add("secret", "hash")
+
+        assert cache.contains("secret", "hash")
+        assert not cache.contains("other", "hash")
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_entries_expire(self) -> None:
+        """Test that entries are dropped after the TTL."""
+        cache = VerifiedTokenCache(ttl=10)
+        with patch.object(cache_module.time, "monotonic", return_value=100.0):
+            cache.add("secret", "hash")
+        with patch.object(cache_module.time, "monotonic", return_value=109.0):
+            assert cache.contains("secret", "hash")
+        with patch.object(cache_module.time, "monotonic", return_value=111.0):
+            assert not cache.contains("secret", "hash")
+        assert len(cache) == 0
+
+    def test_least_recently_used_evicted(self) -> None:
+        """Test that the least recently used token is evicted first."""
+        cache = VerifiedTokenCache(max_entries=2)
+        cache.add("a", "hash")
+        cache.add("b", "hash")
+        cache.contains("a", "hash")  # a is now most recent
+
+        cache.add("c", "hash")
+
+        assert cache.contains("a", "hash")
+        assert not cache.contains("b", "hash")
+        assert cache.contains("c", "hash")
+
+    def test_config_change_invalidates(self) -> None:
+        """Test that a changed password configuration misses old entries."""
+        cache = VerifiedTokenCache()
+        cache.add("secret", "old-hash")
+
+        assert not cache.contains("secret", "new-hash")
+
+    def test_no_plaintext_kept(self) -> None:
+        """Test that entries are keyed by HMAC digests, not tokens."""
+        cache = VerifiedTokenCache()
+        cache.add("hunter2", "hash")
+
+        (key,) = cache._entries
+        assert b"hunter2" not in key
+        assert len(key) == 32
+
+    def test_zero_ttl_disables_cache(self) -> None:
+        """Test that ttl=0 never caches."""
+        cache = VerifiedTokenCache(ttl=0)
+        cache.add("secret", "hash")
+
+        assert not cache.enabled
+        assert not cache.contains("secret", "hash")
+        assert len(cache) == 0
+
+
+# =============================================================================
+# Test: FailedAttemptLimiter
+# =============================================================================
+
+
+class TestFailedAttemptLimiter:
+    """Tests for FailedAttemptLimiter."""
+
+    def test_blocks_after_max_failures(self) -> None:
+        """Test that a client is blocked once the limit is reached."""
+        limiter = FailedAttemptLimiter(max_failures=3, lockout=30)
+
+        assert not limiter.record_failure("1.2.3.4")
+        assert not limiter.record_failure("1.2.3.4")
+        assert limiter.record_failure("1.2.3.4")
+
+        assert 0 < limiter.retry_after("1.2.3.4") <= 30
+        assert limiter.retry_after("5.6.7.8") == 0.0
+
+    def test_old_failures_fall_out_of_window(self) -> None:
+        """Test that only failures within the window count."""
+        limiter = FailedAttemptLimiter(max_failures=2, window=10)
+        with patch.object(cache_module.time, "monotonic", return_value=100.0):
+            limiter.record_failure("client")
+        with patch.object(cache_module.time, "monotonic", return_value=120.0):
+            assert not limiter.record_failure("client")
+
+    def test_lockout_expires(self) -> None:
+        """Test that a blocked client may retry after the lockout."""
+        limiter = FailedAttemptLimiter(max_failures=1, lockout=5)
+        with patch.object(cache_module.time, "monotonic", return_value=100.0):
+            assert limiter.record_failure("client")
+        with patch.object(cache_module.time, "monotonic", return_value=106.0):
+            assert limiter.retry_after("client") == 0.0
+
+    def test_reset_clears_failures(self) -> None:
+        """Test that a successful attempt clears earlier failures."""
+        limiter = FailedAttemptLimiter(max_failures=2)
+        limiter.record_failure("client")
+        limiter.reset("client")
+
+        assert not limiter.record_failure("client")
+
+    def test_zero_max_failures_disables(self) -> None:
+        """Test that max_failures=0 never blocks."""
+        limiter = FailedAttemptLimiter(max_failures=0)
+
+        assert not any(limiter.record_failure("client") for _ in range(100))
+        assert limiter.retry_after("client") == 0.0
+
+    def test_expired_entries_are_dropped(self) -> None:
+        """Test that stale failures and ended lockouts don't stay tracked."""
+        limiter = FailedAttemptLimiter(max_failures=2, window=10, lockout=5)
+        with patch.object(cache_module.time, "monotonic", return_value=100.0):
+            for n in range(50):
+                limiter.record_failure(f"10.0.0.{n}")
+            limiter.record_failure("blocked")
+            limiter.record_failure("blocked")
+            assert len(limiter) == 51
+
+        with patch.object(cache_module.time, "monotonic", return_value=200.0):
+            assert limiter.retry_after("blocked") == 0.0
+            assert len(limiter) == 0
+
+    def test_tracked_clients_capped(self) -> None:
+        """Test that spraying addresses evicts the least recently failed."""
+        limiter = FailedAttemptLimiter(max_failures=3, max_clients=10)
+
+        for n in range(1000):
+            limiter.record_failure(f"10.0.{n // 256}.{n % 256}")
+
+        assert len(limiter) == 10
+        assert not limiter.record_failure("10.0.0.0")  # Evicted: starts over
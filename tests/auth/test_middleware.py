@@ -5,6 +5,7 @@ Tests cover:
 - Public path detection
 - Middleware authentication flow
 - Error responses (401, 403, 500)
+- Verified-token caching and failed-attempt limiting
 - Dependency injection alternative
 """
 
@@ -17,6 +18,7 @@ import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from claude_task_master.auth.cache import FailedAttemptLimiter
 from claude_task_master.auth.middleware import (
     PasswordAuthMiddleware,
     extract_bearer_token,
@@ -275,6 +277,67 @@ class TestPasswordAuthMiddleware:
             assert response.status_code == 200  # Still public via is_public_path()
 
 
+class TestMiddlewareVerificationCache:
+    """Tests for verified-token caching and failed-attempt limiting."""
+
+    def _create_client(self, **kwargs: object) -> TestClient:
+        app = FastAPI()
+        app.add_middleware(PasswordAuthMiddleware, **kwargs)
+
+        @app.get("/api/protected")
+        def protected() -> dict[str, str]:
+            return {"message": "protected"}
+
+        return TestClient(app)
+
+    def test_verified_token_skips_authenticate(self) -> None:
+        """Test that repeat requests with a verified token skip bcrypt."""
+        client = self._create_client()
+        headers = {"Authorization": "Bearer correct_password"}
+
+        with (
+            patch("claude_task_master.auth.password.is_auth_enabled", return_value=True),
+            patch("claude_task_master.auth.password.get_password_from_env", return_value="hash"),
+            patch("claude_task_master.auth.password.authenticate", return_value=True) as auth,
+        ):
+            for _ in range(3):
+                assert client.get("/api/protected", headers=headers).status_code == 200
+
+        assert auth.call_count == 1
+
+    def test_rejected_token_is_not_cached(self) -> None:
+        """Test that failed verifications are re-checked every time."""
+        client = self._create_client()
+        headers = {"Authorization": "Bearer wrong_password"}
+
+        with (
+            patch("claude_task_master.auth.password.is_auth_enabled", return_value=True),
+            patch("claude_task_master.auth.password.authenticate", return_value=False) as auth,
+        ):
+            for _ in range(2):
+                assert client.get("/api/protected", headers=headers).status_code == 403
+
+        assert auth.call_count == 2
+
+    def test_repeated_failures_return_429(self) -> None:
+        """Test that a client is locked out after too many failures."""
+        client = self._create_client(rate_limiter=FailedAttemptLimiter(max_failures=2))
+        bad = {"Authorization": "Bearer wrong_password"}
+
+        with (
+            patch("claude_task_master.auth.password.is_auth_enabled", return_value=True),
+            patch("claude_task_master.auth.password.authenticate", return_value=False) as auth,
+        ):
+            assert client.get("/api/protected", headers=bad).status_code == 403
+            assert client.get("/api/protected", headers=bad).status_code == 403
+            response = client.get("/api/protected", headers=bad)
+
+        assert response.status_code == 429
+        assert response.json()["error"] == "rate_limited"
+        assert int(response.headers["Retry-After"]) >= 1
+        assert auth.call_count == 2
+
+
 # =============================================================================
 # Test: get_password_auth_dependency
 # =============================================================================
@@ -320,6 +383,46 @@ class TestGetPasswordAuthDependency:
             response = client.get("/protected", headers={"Authorization": "Bearer correct"})
             assert response.status_code == 200
 
+    def test_dependency_repeated_failures_return_429(self) -> None:
+        """Test that the dependency rate-limits failed attempts like the middleware."""
+        from fastapi import Depends
+
+        limiter = FailedAttemptLimiter(max_failures=2)
+        bad = {"Authorization": "Bearer wrong_password"}
+        with (
+            patch("claude_task_master.auth.password.is_auth_enabled", return_value=True),
+            patch("claude_task_master.auth.password.authenticate", return_value=False) as auth,
+        ):
+            app = FastAPI()
+            dependency = get_password_auth_dependency(rate_limiter=limiter)
+
+            @app.get("/protected", dependencies=[Depends(dependency)])
+            def protected() -> dict[str, str]:
+                return {"message": "protected"}
+
+            client = TestClient(app)
+            assert client.get("/protected", headers=bad).status_code == 403
+            assert client.get("/protected", headers=bad).status_code == 403
+            response = client.get("/protected", headers=bad)
+
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+        assert auth.call_count == 2
+
+    def test_dependency_shares_middleware_limiter_by_default(self) -> None:
+        """Test that failures counted by the middleware also block the dependency."""
+        from claude_task_master.auth.cache import get_failed_attempt_limiter
+
+        limiter = get_failed_attempt_limiter()
+        for _ in range(limiter.max_failures):
+            limiter.record_failure("testclient")
+
+        with patch("claude_task_master.auth.password.is_auth_enabled", return_value=True):
+            client = TestClient(self._create_app_with_dependency())
+            response = client.get("/protected", headers={"Authorization": "Bearer guess"})
+
+        assert response.status_code == 429
+
     def test_dependency_public_path_skips_auth(self) -> None:
         """Test that public paths skip auth even with dependency."""
         app = self._create_app_with_dependency()
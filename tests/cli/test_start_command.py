@@ -5,6 +5,7 @@ from unittest.mock import patch
 from typer.testing import CliRunner
 
 from claude_task_master.cli import app
+from claude_task_master.core.config import generate_default_config
 from claude_task_master.core.state import StateManager
 
 # =============================================================================
@@ -75,6 +76,31 @@ class TestStartCommand:
 
         assert "opus" in result.output
 
+    def test_start_passes_conversation_mode(self, cli_runner: CliRunner, temp_dir):
+        """Test start builds the agent with the configured conversation mode."""
+        config = generate_default_config()
+        config.agent.conversation_mode = True
+        config.agent.client_idle_timeout = 60.0
+        with patch.object(StateManager, "STATE_DIR", temp_dir / ".claude-task-master"):
+            with patch(
+                "claude_task_master.cli_commands.workflow.CredentialManager"
+            ) as mock_cred_manager:
+                mock_cred_manager.return_value.get_valid_token.return_value = "test-token"
+                with (
+                    patch(
+                        "claude_task_master.cli_commands.workflow.get_config", return_value=config
+                    ),
+                    patch("claude_task_master.cli_commands.workflow.AgentWrapper") as mock_agent,
+                    patch("claude_task_master.cli_commands.workflow.Planner") as mock_planner,
+                ):
+                    mock_planner.return_value.create_plan.side_effect = Exception("Test stop")
+
+                    cli_runner.invoke(app, ["start", "Test goal"])
+
+        kwargs = mock_agent.call_args.kwargs
+        assert kwargs["conversation_mode"] is True
+        assert kwargs["client_idle_timeout"] == 60.0
+
     def test_start_credential_error(self, cli_runner: CliRunner, temp_dir):
         """Test start handles credential errors."""
         with patch.object(StateManager, "STATE_DIR", temp_dir / ".claude-task-master"):
@@ -624,6 +624,49 @@ class TestProgressFunction:
         assert any("Error" in str(call) for call in calls)
 
 
+# =============================================================================
+# Tests for export_state()
+# =============================================================================
+
+
+class TestExportStateFunction:
+    """Unit tests for the export_state() function."""
+
+    def test_export_state_no_active_task(self, temp_dir: Path, mock_console):
+        """Test export-state when no task exists."""
+        with patch.object(StateManager, "STATE_DIR", temp_dir / ".claude-task-master"):
+            with pytest.raises(typer.Exit) as exc_info:
+                info.export_state(output=None)
+
+        assert exc_info.value.exit_code == 1
+
+    def test_export_state_pretty_prints_compact_state(
+        self, info_state_dir: Path, info_state_file: Path, mock_console, capsys
+    ):
+        """Test that a compact state file is exported indented."""
+        manager = StateManager(info_state_dir, state_format="compact")
+        manager.save_state(manager.load_state())
+        assert "\n" not in (info_state_dir / "state.json").read_text()
+
+        with patch.object(StateManager, "STATE_DIR", info_state_dir):
+            info.export_state(output=None)
+
+        exported = capsys.readouterr().out
+        assert '\n  "status": "working"' in exported
+        assert "schema_version" not in exported
+
+    def test_export_state_to_file(
+        self, info_state_dir: Path, info_state_file: Path, temp_dir: Path, mock_console
+    ):
+        """Test exporting to a file."""
+        output = temp_dir / "export.json"
+
+        with patch.object(StateManager, "STATE_DIR", info_state_dir):
+            info.export_state(output=str(output))
+
+        assert json.loads(output.read_text())["status"] == "working"
+
+
 # =============================================================================
 # Tests for register_info_commands()
 # =============================================================================
@@ -648,13 +691,14 @@ class TestRegisterInfoCommands:
         assert "logs" in command_names
         assert "context" in command_names
         assert "progress" in command_names
+        assert "export_state" in command_names
 
     def test_register_commands_count(self):
-        """Test that exactly 5 commands are registered."""
+        """Test that exactly 6 commands are registered."""
         app = Typer()
         info.register_info_commands(app)
 
-        assert len(app.registered_commands) == 5
+        assert len(app.registered_commands) == 6
 
     def test_commands_are_callable(self):
         """Test that registered commands are callable."""
@@ -0,0 +1,73 @@
+"""Tests for CLI webhook commands - status, replay."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from claude_task_master.cli import app
+from claude_task_master.core.state import StateManager
+from claude_task_master.webhooks.client import WebhookClient, WebhookDeliveryResult
+from claude_task_master.webhooks.outbox import WebhookOutbox
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def outbox_state_dir(temp_dir: Path):
+    """Point StateManager at a temp state directory holding an outbox."""
+    state_dir = temp_dir / ".claude-task-master"
+    outbox = WebhookOutbox.for_state_dir(state_dir, fsync=False)
+    outbox.ensure_cursor("https://example.com/hook")
+    for n in range(3):
+        outbox.append({"event_type": "task.completed", "event_id": f"evt-{n}"})
+    with patch.object(StateManager, "STATE_DIR", state_dir):
+        yield state_dir
+
+
+# =============================================================================
+# Command Tests
+# =============================================================================
+
+
+class TestWebhooksCommands:
+    """Tests for the webhooks command group."""
+
+    def test_status_shows_pending(self, cli_runner, outbox_state_dir):
+        """Test that status lists undelivered events per endpoint."""
+        result = cli_runner.invoke(app, ["webhooks", "status"])
+
+        assert result.exit_code == 0
+        assert "https://example.com/hook: 3 pending" in result.output
+
+    def test_replay_by_event_id(self, cli_runner, outbox_state_dir):
+        """Test redelivering one event to an explicit URL."""
+        ok = WebhookDeliveryResult(success=True, status_code=200)
+        with patch.object(WebhookClient, "send", new_callable=AsyncMock) as send:
+            send.return_value = ok
+            result = cli_runner.invoke(
+                app,
+                ["webhooks", "replay", "-e", "evt-1", "--url", "https://example.com/other"],
+            )
+
+        assert result.exit_code == 0, result.output
+        assert "Redelivered 1/1" in result.output
+        assert send.await_args.kwargs["delivery_id"] == "evt-1"
+
+    def test_replay_dry_run(self, cli_runner, outbox_state_dir):
+        """Test listing events in a time range without sending them."""
+        result = cli_runner.invoke(
+            app, ["webhooks", "replay", "--since", "2000-01-01T00:00:00", "--dry-run"]
+        )
+
+        assert result.exit_code == 0
+        assert "3 event(s) would be redelivered" in result.output
+
+    def test_replay_requires_filter(self, cli_runner, outbox_state_dir):
+        """Test that replay refuses to resend everything implicitly."""
+        result = cli_runner.invoke(app, ["webhooks", "replay"])
+
+        assert result.exit_code == 1
+        assert "Specify --event-id" in result.output
@@ -381,6 +381,29 @@ def context_accumulator(state_manager):
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def clear_auth_limiter() -> Generator[None, None, None]:
+    """Reset the process-wide failed-attempt limiter around each test."""
+    from claude_task_master.auth.cache import get_failed_attempt_limiter
+
+    get_failed_attempt_limiter().clear()
+    yield
+    get_failed_attempt_limiter().clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_github_caches() -> Generator[None, None, None]:
+    """Reset process-wide GitHub caches (repo metadata, token) around each test."""
+    from claude_task_master.github import clear_repo_cache
+    from claude_task_master.github.transport import clear_token_cache
+
+    clear_repo_cache()
+    clear_token_cache()
+    yield
+    clear_repo_cache()
+    clear_token_cache()
+
+
 @pytest.fixture
 def mock_gh_cli_success():
     """Mock successful gh CLI operations."""
@@ -0,0 +1,208 @@
+"""Tests for cwd-independent queries and concurrent PR group sessions.
+
+This module contains tests for:
+- Queries passing cwd to the SDK without changing the process cwd
+- MessageProcessor paths relative to the agent's working directory
+- run_concurrent_work_sessions across many groups and directories (stress)
+- Rejecting sessions without their own checkout
+- Lazy creation of the conversation-mode loop and pool
+"""
+
+import asyncio
+import os
+import random
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from claude_task_master.core.agent import AgentWrapper, ModelType
+from claude_task_master.core.agent_concurrency import GroupWorkSession
+from claude_task_master.core.agent_message import MessageProcessor
+from claude_task_master.core.parallel import ParallelExecutorConfig, TaskStatus
+
+
+class ResultMessage:
+    """Stand-in for the SDK's final result message."""
+
+    def __init__(self, result: str) -> None:
+        self.result = result
+
+
+class RecordingSDK:
+    """Fake SDK whose query echoes the cwd it was given and the prompt's task."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.calls: list[tuple[str, str]] = []  # (options.cwd, process cwd)
+        self.active = 0
+        self.peak = 0
+        self.ClaudeAgentOptions = SimpleNamespace
+
+    async def query(self, prompt, options):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls.append((options.cwd, os.getcwd()))
+        try:
+            # Yield control so sessions interleave
+            await asyncio.sleep(random.uniform(0, 0.02))
+            task = prompt.split("TASK<", 1)[1].split(">", 1)[0]
+            yield ResultMessage(f"{options.cwd}|{task}")
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def as_module(self) -> MagicMock:
+        module = MagicMock()
+        module.query = self.query
+        module.ClaudeAgentOptions = self.ClaudeAgentOptions
+        return module
+
+
+def make_agent(sdk: RecordingSDK, working_dir: str) -> AgentWrapper:
+    with patch.dict("sys.modules", {"claude_agent_sdk": sdk.as_module()}):
+        return AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir=working_dir,
+        )
+
+
+# =============================================================================
+# cwd-independent Query Tests
+# =============================================================================
+
+
+class TestQueryWorkingDirectory:
+    """Tests that queries never change the process working directory."""
+
+    async def test_query_passes_cwd_without_chdir(self, temp_dir):
+        """Test that the SDK gets cwd= while the process cwd is untouched."""
+        sdk = RecordingSDK()
+        agent = make_agent(sdk, str(temp_dir))
+        original = os.getcwd()
+
+        output = await agent._query_executor._execute_query("TASK<one>", ["Read"])
+
+        assert output == f"{temp_dir}|one"
+        assert sdk.calls == [(str(temp_dir), original)]
+        assert os.getcwd() == original
+
+    def test_relative_path_uses_working_dir(self, temp_dir):
+        """Test that tool paths are shown relative to the agent's directory."""
+        processor = MessageProcessor(working_dir=str(temp_dir))
+
+        detail = processor.format_tool_detail("Read", {"file_path": str(temp_dir / "a.py")})
+
+        assert detail == "→ a.py"
+
+
+# =============================================================================
+# Concurrent Work Session Tests
+# =============================================================================
+
+
+class TestConcurrentWorkSessions:
+    """Tests for AgentWrapper.run_concurrent_work_sessions."""
+
+    def test_stress_no_cross_talk(self, temp_dir):
+        """Test many groups in many directories each get only their own results."""
+        sdk = RecordingSDK()
+        agent = make_agent(sdk, str(temp_dir))
+        original = os.getcwd()
+        dirs = []
+        for i in range(24):
+            path = temp_dir / f"worktree_{i}"
+            path.mkdir()
+            dirs.append(str(path))
+        sessions = [
+            GroupWorkSession(
+                group_id=f"pr_{n}",
+                task_description=f"TASK<pr_{n}>",
+                working_dir=dirs[n],
+                create_pr=False,
+                pr_group_info={"name": f"Group {n}"},
+            )
+            for n in range(24)
+        ]
+
+        results = agent.run_concurrent_work_sessions(
+            sessions, ParallelExecutorConfig(max_workers=8, max_retries=0)
+        )
+
+        assert len(results) == 24
+        for session in sessions:
+            result = results[session.group_id]
+            assert result.status == TaskStatus.COMPLETED, result.error
+            assert result.result["output"] == f"{session.working_dir}|{session.group_id}"
+        assert {process_cwd for _, process_cwd in sdk.calls} == {original}
+        assert sdk.peak > 1
+        assert os.getcwd() == original
+
+    def test_siblings_share_circuit_breaker(self, temp_dir):
+        """Test that per-directory wrappers reuse the agent's settings."""
+        agent = make_agent(RecordingSDK(), str(temp_dir))
+
+        sibling = agent.for_working_dir(str(temp_dir / "other"))
+
+        assert agent.for_working_dir(str(temp_dir)) is agent
+        assert sibling.working_dir == str(temp_dir / "other")
+        assert sibling.circuit_breaker is agent.circuit_breaker
+        assert sibling._query_executor.circuit_breaker is agent.circuit_breaker
+        assert sibling.hooks is agent.hooks
+
+    def test_duplicate_group_ids_rejected(self, temp_dir):
+        """Test that two sessions for one group can't run at once."""
+        agent = make_agent(RecordingSDK(), str(temp_dir))
+        sessions = [
+            GroupWorkSession(group_id="pr_1", task_description="TASK<a>", working_dir=str(path))
+            for path in (temp_dir / "a", temp_dir / "b")
+        ]
+
+        with pytest.raises(ValueError, match="already exists"):
+            agent.run_concurrent_work_sessions(sessions)
+
+    def test_missing_working_dir_rejected(self, temp_dir):
+        """Test that a session must name its own checkout."""
+        agent = make_agent(RecordingSDK(), str(temp_dir))
+        sessions = [GroupWorkSession(group_id="pr_1", task_description="TASK<a>")]
+
+        with pytest.raises(ValueError, match="has no working_dir"):
+            agent.run_concurrent_work_sessions(sessions)
+
+    def test_shared_working_dir_rejected(self, temp_dir):
+        """Test that two sessions can't edit the same checkout at once."""
+        sdk = RecordingSDK()
+        agent = make_agent(sdk, str(temp_dir))
+        sessions = [
+            GroupWorkSession(group_id="pr_1", task_description="TASK<a>", working_dir="wt"),
+            GroupWorkSession(group_id="pr_2", task_description="TASK<b>", working_dir="./wt/"),
+        ]
+
+        with pytest.raises(ValueError, match="share working_dir"):
+            agent.run_concurrent_work_sessions(sessions)
+        assert sdk.calls == []
+
+    def test_lazy_event_loop_created_once(self, temp_dir):
+        """Test that concurrent first uses share one loop and one client pool."""
+        agent = make_agent(RecordingSDK(), str(temp_dir))
+        loops: list[object] = []
+        managers: list[object] = []
+        barrier = threading.Barrier(8)
+
+        def first_use() -> None:
+            barrier.wait()
+            loops.append(agent.event_loop)
+            managers.append(agent.conversation_manager)
+
+        threads = [threading.Thread(target=first_use) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        agent.close()
+
+        assert len({id(loop) for loop in loops}) == 1
+        assert len({id(manager) for manager in managers}) == 1
@@ -7,6 +7,8 @@ This module contains tests for:
 - Message processing
 """
 
+import asyncio
+import math
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -262,6 +264,7 @@ class TestAgentWrapperRetryLogic:
                 max_retries=2,
                 initial_backoff=0.1,  # Fast backoff for tests
                 max_backoff=0.5,
+                requests_per_second=50.0,  # Opt in to the shared rate limiter
             )
             agent = AgentWrapper(
                 access_token="test-token",
@@ -410,6 +413,100 @@ class TestAgentWrapperRetryLogic:
 
         assert call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_rate_limit_honours_retry_after_and_pauses_siblings(self, agent, temp_dir):
+        """Test that a 429 waits for Retry-After and pauses the shared limiter."""
+        call_count = 0
+
+        class RateLimited(Exception):
+            retry_after = 12.0
+
+        async def mock_query_gen(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                raise RateLimited("rate limit exceeded")
+            yield MagicMock(content=None)
+
+        agent._query_executor.query = mock_query_gen
+        sibling = agent.for_working_dir(str(temp_dir / "other"))
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await agent._run_query("test prompt", ["Read"])
+
+        assert call_count == 2
+        assert mock_sleep.await_args_list[0].args[0] == 12.0
+        assert sibling.rate_limiter is agent.rate_limiter
+        assert agent.rate_limiter.paused_for > 10
+
+    @pytest.mark.asyncio
+    async def test_interleaved_calls_timed_separately(self, agent):
+        """Test that overlapping queries report their own durations to the breaker."""
+        executor = agent._query_executor
+        first_done = asyncio.Event()
+
+        with patch("claude_task_master.core.agent_query.time") as mock_time:
+            mock_time.monotonic.return_value = 0.0
+
+            async def first():
+                mock_time.monotonic.return_value = 5.0
+                await asyncio.sleep(0)  # The second call starts now
+                mock_time.monotonic.return_value = 6.0
+                first_done.set()
+                return "first"
+
+            async def second():
+                await first_done.wait()
+                mock_time.monotonic.return_value = 20.0
+                return "second"
+
+            with patch.object(
+                executor.circuit_breaker,
+                "record_outcome",
+                wraps=executor.circuit_breaker.record_outcome,
+            ) as record:
+                results = await asyncio.gather(
+                    executor._call_through_breaker(first),
+                    executor._call_through_breaker(second),
+                )
+
+        assert results == ["first", "second"]
+        durations = [c.kwargs["duration"] for c in record.call_args_list]
+        assert durations == [6.0, 15.0]
+
+    @pytest.mark.asyncio
+    async def test_default_limiter_unthrottled_but_shares_429_pauses(self, temp_dir):
+        """Test that without a configured rate, a 429 still pauses every session."""
+        mock_sdk = MagicMock()
+        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
+            agent = AgentWrapper(
+                access_token="test-token",
+                model=ModelType.SONNET,
+                working_dir=str(temp_dir),
+            )
+        sibling = agent.for_working_dir(str(temp_dir / "other"))
+        assert agent.rate_limiter.rate == math.inf
+        assert sibling._query_executor.rate_limiter is agent.rate_limiter
+        assert [agent.rate_limiter.reserve() for _ in range(50)] == [0.0] * 50
+
+        class RateLimited(Exception):
+            retry_after = 12.0
+
+        calls = 0
+
+        async def mock_query_gen(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RateLimited("rate limit exceeded")
+            yield MagicMock(content=None)
+
+        agent._query_executor.query = mock_query_gen
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            await agent._run_query("test prompt", ["Read"])
+
+        assert sibling.rate_limiter.paused_for > 10
+
 
 # =============================================================================
 # AgentWrapper Error Classification Tests
@@ -0,0 +1,152 @@
+"""Tests for the adaptive CI poll scheduler."""
+
+import json
+
+from claude_task_master.core.ci_polling import CIPollScheduler
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# =============================================================================
+# Backoff Tests
+# =============================================================================
+
+
+class TestBackoff:
+    """Tests for interval growth while nothing changes."""
+
+    def test_grows_geometrically_to_cap(self):
+        """Test that unchanged polls back off up to max_interval."""
+        scheduler = CIPollScheduler(min_interval=10, max_interval=40, backoff=2.0)
+        scheduler.start(1, "sha")
+
+        waits = [scheduler.next_interval(changed=False) for _ in range(4)]
+
+        assert waits == [20.0, 40.0, 40.0, 40.0]
+
+    def test_change_resets(self):
+        """Test that a change drops back to min_interval."""
+        scheduler = CIPollScheduler(min_interval=10, max_interval=120, backoff=2.0)
+        scheduler.start(1, "sha")
+        scheduler.next_interval(changed=False)
+        scheduler.next_interval(changed=False)
+
+        assert scheduler.next_interval(changed=True) == 10.0
+
+    def test_queued_keeps_backing_off(self):
+        """Test that changes while checks are queued don't reset the backoff."""
+        scheduler = CIPollScheduler(min_interval=10, max_interval=120, backoff=2.0)
+        scheduler.start(1, "sha")
+
+        waits = [scheduler.next_interval(changed=True, queued=True) for _ in range(3)]
+
+        assert waits == [20.0, 40.0, 80.0]
+
+    def test_new_head_restarts(self):
+        """Test that a new head commit restarts the backoff."""
+        scheduler = CIPollScheduler(min_interval=10, max_interval=120, backoff=2.0)
+        scheduler.start(1, "old")
+        scheduler.next_interval(changed=False)
+        scheduler.next_interval(changed=False)
+
+        scheduler.start(1, "new")
+
+        assert scheduler.next_interval(changed=False) == 20.0
+
+
+# =============================================================================
+# Expected Completion Tests
+# =============================================================================
+
+
+class TestExpectedCompletion:
+    """Tests for tightening polls around the learned CI duration."""
+
+    def _learned(self, clock: FakeClock, duration: float) -> CIPollScheduler:
+        scheduler = CIPollScheduler(min_interval=10, max_interval=120, backoff=2.0, clock=clock)
+        scheduler.start(1, "first")
+        scheduler.next_interval(changed=False)
+        clock.now += duration
+        scheduler.record_completion()
+        return scheduler
+
+    def test_wakes_at_expected_completion(self):
+        """Test that the wait never overshoots the expected completion time."""
+        clock = FakeClock()
+        scheduler = self._learned(clock, 300)
+        scheduler.start(2, "second")
+        for _ in range(5):
+            scheduler.next_interval(changed=False)
+
+        clock.now += 270
+
+        assert scheduler.expected_duration == 300
+        assert scheduler.next_interval(changed=False) == 30.0
+
+    def test_polls_tightly_just_past_expected(self):
+        """Test min_interval polling within the completion window."""
+        clock = FakeClock()
+        scheduler = self._learned(clock, 300)
+        scheduler.start(2, "second")
+        for _ in range(5):
+            scheduler.next_interval(changed=False)
+
+        clock.now += 320
+
+        assert scheduler.next_interval(changed=False) == 10.0
+
+    def test_backs_off_again_long_after_expected(self):
+        """Test that a run far past the estimate backs off normally."""
+        clock = FakeClock()
+        scheduler = self._learned(clock, 100)
+        scheduler.start(2, "second")
+
+        clock.now += 1000
+
+        assert scheduler.next_interval(changed=False) == 20.0
+
+
+# =============================================================================
+# History Tests
+# =============================================================================
+
+
+class TestHistory:
+    """Tests for persisting completed CI durations."""
+
+    def test_persisted_and_reloaded(self, temp_dir):
+        """Test that durations survive into a new scheduler."""
+        clock = FakeClock()
+        path = temp_dir / "ci_timings.json"
+        scheduler = CIPollScheduler(history_path=path, clock=clock)
+        scheduler.start(1, "sha")
+        scheduler.next_interval(changed=False)
+        clock.now += 90
+
+        assert scheduler.record_completion() == 90
+        assert json.loads(path.read_text()) == {"durations": [90.0]}
+        assert CIPollScheduler(history_path=path).expected_duration == 90
+
+    def test_not_recorded_without_waiting(self, temp_dir):
+        """Test that CI already finished at the first poll isn't recorded."""
+        path = temp_dir / "ci_timings.json"
+        scheduler = CIPollScheduler(history_path=path)
+        scheduler.start(1, "sha")
+
+        assert scheduler.record_completion() is None
+        assert not path.exists()
+
+    def test_corrupt_history_ignored(self, temp_dir):
+        """Test that an unreadable timings file is ignored."""
+        path = temp_dir / "ci_timings.json"
+        path.write_text("not json")
+
+        assert CIPollScheduler(history_path=path).expected_duration is None
@@ -8,11 +8,35 @@ from claude_task_master.core.circuit_breaker import (
     CircuitBreakerError,
     CircuitBreakerMetrics,
     CircuitBreakerRegistry,
+    CircuitBreakerSnapshotFile,
     CircuitState,
+    LatencyHistogram,
+    SlidingWindow,
     get_circuit_breaker,
 )
 
 
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def windowed_breaker(**overrides) -> tuple[CircuitBreaker, FakeClock]:
+    """Create a sliding-window breaker driven by a fake clock."""
+    options = {"window_seconds": 10.0, "failure_rate_threshold": 50.0, "minimum_calls": 4}
+    options.update(overrides)
+    cb = CircuitBreaker(name="windowed", config=CircuitBreakerConfig.windowed(**options))
+    clock = FakeClock()
+    assert cb._window is not None
+    cb._window._clock = clock
+    return cb, clock
+
+
 class TestCircuitBreakerConfig:
     """Tests for CircuitBreakerConfig."""
 
@@ -265,3 +289,249 @@ class TestGetCircuitBreaker:
         cb = get_circuit_breaker("test")
         assert cb.name == "test"
         assert cb.is_closed
+
+
+# =============================================================================
+# Sliding Window, Latency and Snapshot Tests
+# =============================================================================
+
+
+class TestSlidingWindow:
+    """Tests for the ring-buffer sliding window."""
+
+    def test_counts_within_window(self):
+        """Test that calls, failures and slow calls are summed."""
+        clock = FakeClock()
+        window = SlidingWindow(10.0, buckets=5, clock=clock)
+
+        window.record(failed=True)
+        clock.now += 3
+        window.record(failed=False, slow=True)
+        window.record(failed=False)
+
+        assert window.totals() == (3, 1, 1)
+        assert window.to_dict()["failure_rate"] == pytest.approx(100 / 3)
+
+    def test_old_buckets_expire(self):
+        """Test that calls older than the window no longer count."""
+        clock = FakeClock()
+        window = SlidingWindow(10.0, buckets=5, clock=clock)
+        window.record(failed=True)
+
+        clock.now += 6
+        window.record(failed=False)
+        assert window.totals() == (2, 1, 0)
+
+        clock.now += 6
+        assert window.totals() == (1, 0, 0)
+
+    def test_reused_slot_is_zeroed(self):
+        """Test that a ring slot reused a full lap later starts from zero."""
+        clock = FakeClock()
+        window = SlidingWindow(10.0, buckets=5, clock=clock)
+        window.record(failed=True)
+
+        clock.now += 10  # Same slot, next lap
+        window.record(failed=False)
+
+        assert window.totals() == (1, 0, 0)
+
+
+class TestLatencyHistogram:
+    """Tests for the latency histogram."""
+
+    def test_percentiles(self):
+        """Test bucket counts and percentile estimates."""
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.observe(0.04)  # 40ms -> <=50ms bucket
+        for _ in range(10):
+            histogram.observe(2.0)  # 2s -> <=2500ms bucket
+
+        data = histogram.to_dict()
+        assert data["count"] == 100
+        assert data["p50_ms"] == 50
+        assert data["p90_ms"] == 50
+        assert data["p99_ms"] == 2_500
+        assert data["mean_ms"] == pytest.approx(236.0)
+
+    def test_overflow_bucket(self):
+        """Test that durations above every bound land in the open bucket."""
+        histogram = LatencyHistogram(bounds_ms=(10, 100))
+        histogram.observe(5.0)
+
+        assert histogram.to_dict()["buckets"][-1] == {"le_ms": None, "count": 1}
+        assert histogram.percentile(99) == 100
+
+    def test_empty(self):
+        """Test that an empty histogram has no percentiles."""
+        assert LatencyHistogram().to_dict()["p50_ms"] is None
+
+
+class TestSlidingWindowMode:
+    """Tests for the sliding-window trip mode."""
+
+    def test_trips_on_failure_rate(self):
+        """Test that the circuit opens once the failure rate reaches the threshold."""
+        cb, _ = windowed_breaker()
+
+        for success in (True, False, True):
+            cb.record_outcome(success=success)
+        assert cb.is_closed  # Below minimum_calls
+
+        cb.record_outcome(success=False)  # 2/4 = 50%
+        assert cb.is_open
+
+    def test_minimum_calls_guard(self):
+        """Test that a few failures on low traffic don't trip the circuit."""
+        cb, _ = windowed_breaker(minimum_calls=10)
+
+        for _ in range(9):
+            cb.record_outcome(success=False)
+
+        assert cb.is_closed
+
+    def test_interleaved_failures_trip(self):
+        """Test that non-consecutive failures count (unlike consecutive mode)."""
+        cb, _ = windowed_breaker(failure_rate_threshold=40.0, minimum_calls=10)
+
+        for i in range(10):
+            cb.record_outcome(success=i % 2 == 0)
+
+        assert cb.is_open
+
+    def test_old_failures_age_out(self):
+        """Test that failures outside the window don't count."""
+        cb, clock = windowed_breaker()
+        for _ in range(3):
+            cb.record_outcome(success=False)
+
+        clock.now += 11
+        for success in (True, True, True, False):
+            cb.record_outcome(success=success)
+
+        assert cb.is_closed
+
+    def test_trips_on_slow_call_rate(self):
+        """Test that slow successful calls can open the circuit."""
+        cb, _ = windowed_breaker(slow_call_duration=1.0, slow_call_rate_threshold=75.0)
+
+        for duration in (2.0, 2.0, 0.1):
+            cb.record_outcome(success=True, duration=duration)
+        assert cb.is_closed
+
+        cb.record_outcome(success=True, duration=5.0)  # 3/4 slow
+        assert cb.is_open
+        assert cb.metrics.slow_calls == 3
+
+    def test_window_cleared_on_recovery(self):
+        """Test that closing the circuit forgets pre-recovery failures."""
+        cb, _ = windowed_breaker()
+        for _ in range(4):
+            cb.record_outcome(success=False)
+        assert cb.is_open
+
+        cb.force_close()
+        cb.record_outcome(success=False)
+
+        assert cb.is_closed
+        assert cb._window is not None
+        assert cb._window.totals() == (1, 1, 0)
+
+
+class TestSnapshot:
+    """Tests for exporting breaker state."""
+
+    def test_snapshot_contents(self):
+        """Test that a snapshot includes metrics, latency and transitions."""
+        cb = CircuitBreaker(name="snap", config=CircuitBreakerConfig(failure_threshold=2))
+        cb.call(lambda: "ok")
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                cb.call(lambda: (_ for _ in ()).throw(ValueError("boom")))
+
+        snapshot = cb.snapshot()
+
+        assert snapshot["name"] == "snap"
+        assert snapshot["state"] == "open"
+        assert snapshot["mode"] == "consecutive"
+        assert snapshot["window"] is None
+        assert snapshot["metrics"]["failed_calls"] == 2
+        assert snapshot["latency"]["count"] == 3
+        (transition,) = snapshot["transitions"]
+        assert transition["from_state"] == "closed"
+        assert transition["to_state"] == "open"
+        assert transition["reason"] == "2 consecutive failures"
+
+    def test_record_outcome_duration_feeds_latency(self):
+        """Test that durations passed with outcomes reach the histogram."""
+        cb = CircuitBreaker(name="timed")
+
+        cb.acquire()
+        cb.record_outcome(success=True, duration=0.2)
+        with cb:  # Untimed: counted, but not in the histogram
+            pass
+
+        assert cb.snapshot()["latency"]["count"] == 1
+        assert cb.metrics.successful_calls == 2
+
+    def test_transitions_bounded(self):
+        """Test that the timeline keeps only recent transitions."""
+        cb = CircuitBreaker(name="flappy")
+        for _ in range(40):
+            cb.force_open()
+            cb.force_close()
+
+        assert len(cb.snapshot()["transitions"]) == 50
+
+    def test_registry_snapshot_all(self):
+        """Test registering an external breaker and exporting all breakers."""
+        registry = CircuitBreakerRegistry()
+        registry.clear()
+        external = CircuitBreaker(name="external")
+
+        registry.register(external)
+        registry.get_or_create("internal")
+
+        assert registry.get("external") is external
+        assert set(registry.snapshot_all()) == {"external", "internal"}
+
+
+class TestSnapshotFile:
+    """Tests for publishing snapshots to other processes."""
+
+    def test_transitions_written_immediately_outcomes_throttled(self, tmp_path):
+        """Test that transitions bypass the write throttle and outcomes don't."""
+        registry = CircuitBreakerRegistry()
+        registry.clear()
+        breaker = registry.get_or_create("published", CircuitBreakerConfig(failure_threshold=1))
+        snapshots = CircuitBreakerSnapshotFile.for_state_dir(tmp_path, min_interval=3600)
+        snapshots.attach(breaker)
+        snapshots.write()
+
+        breaker.record_outcome(success=True)
+        assert (
+            CircuitBreakerSnapshotFile.read_state_dir(tmp_path)["published"]["metrics"][
+                "successful_calls"
+            ]
+            == 0
+        )
+
+        breaker.record_outcome(success=False)
+        published = CircuitBreakerSnapshotFile.read_state_dir(tmp_path)["published"]
+        registry.clear()
+        assert published["state"] == "open"
+        assert published["metrics"]["successful_calls"] == 1
+
+    def test_read_missing_or_corrupt(self, tmp_path):
+        """Test that an unreadable file reads as no breakers."""
+        assert CircuitBreakerSnapshotFile.read_state_dir(tmp_path) == {}
+        (tmp_path / "circuit-breakers.json").write_text("{not json")
+        assert CircuitBreakerSnapshotFile.read_state_dir(tmp_path) == {}
+
+    def test_listener_errors_swallowed(self):
+        """Test that a failing listener doesn't fail the recorded call."""
+        breaker = CircuitBreaker(name="noisy")
+        breaker.add_listener(lambda cb, transitioned: 1 / 0)
+
+        assert breaker.call(lambda: "ok") == "ok"
@@ -0,0 +1,335 @@
+"""Tests for the SDK client pool and the background event loop.
+
+This module contains tests for:
+- BackgroundEventLoop sync facade, reuse across calls and shutdown
+- SDKClientPool reuse per key, discard on error, idle eviction and LRU trim
+- ConversationManager client reuse through a pool
+- AgentWrapper conversation mode across a multi-task PR group
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from claude_task_master.core.agent import AgentWrapper, ModelType
+from claude_task_master.core.agent_loop import BackgroundEventLoop
+from claude_task_master.core.client_pool import SDKClientPool
+from claude_task_master.core.conversation import ConversationManager
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_connect(clients: list):
+    """Build a connect factory that records each new client."""
+
+    async def connect():
+        client = AsyncMock()
+        clients.append(client)
+        return client
+
+    return connect
+
+
+# =============================================================================
+# BackgroundEventLoop Tests
+# =============================================================================
+
+
+class TestBackgroundEventLoop:
+    """Tests for BackgroundEventLoop."""
+
+    def test_runs_coroutines_on_one_persistent_loop(self):
+        """Test that consecutive runs share the same loop and thread."""
+        background = BackgroundEventLoop()
+
+        async def where():
+            return asyncio.get_running_loop(), threading.current_thread()
+
+        try:
+            first = background.run(where())
+            second = background.run(where())
+        finally:
+            background.stop()
+
+        assert first == second
+        assert first[1] is not threading.current_thread()
+        assert not background.is_running
+
+    def test_exceptions_propagate(self):
+        """Test that coroutine errors are raised to the caller."""
+        background = BackgroundEventLoop()
+
+        async def fail():
+            raise ValueError("boom")
+
+        try:
+            with pytest.raises(ValueError, match="boom"):
+                background.run(fail())
+        finally:
+            background.stop()
+
+    def test_timeout_cancels_coroutine(self):
+        """Test that a timed-out coroutine is cancelled."""
+        background = BackgroundEventLoop()
+        cancelled = threading.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        try:
+            with pytest.raises(TimeoutError):
+                background.run(slow(), timeout=0.05)
+            assert cancelled.wait(2)
+        finally:
+            background.stop()
+
+    def test_stop_without_start_is_noop(self):
+        """Test that stopping an unused loop does nothing."""
+        BackgroundEventLoop().stop()
+
+
+# =============================================================================
+# SDKClientPool Tests
+# =============================================================================
+
+
+class TestSDKClientPool:
+    """Tests for SDKClientPool."""
+
+    async def test_reuses_client_for_same_key(self):
+        """Test that a second lease for the same key skips connecting."""
+        pool = SDKClientPool()
+        clients: list = []
+        key = pool.make_key("pr_1", "sonnet", ["Read", "Bash"])
+
+        async with pool.lease(key, make_connect(clients)) as (first, setup1):
+            pass
+        async with pool.lease(pool.make_key("pr_1", "sonnet", ["Bash", "Read"]), None) as (
+            second,
+            setup2,
+        ):
+            pass
+        await pool.close()
+
+        assert first is second
+        assert len(clients) == 1
+        assert not setup1.reused and setup2.reused
+        assert pool.stats.connects == 1 and pool.stats.reuses == 1
+        first.disconnect.assert_awaited_once()
+
+    async def test_different_keys_get_different_clients(self):
+        """Test that group, model and tools all separate clients."""
+        pool = SDKClientPool()
+        clients: list = []
+        connect = make_connect(clients)
+
+        for key in [
+            pool.make_key("pr_1", "sonnet", ["Read"]),
+            pool.make_key("pr_2", "sonnet", ["Read"]),
+            pool.make_key("pr_1", "opus", ["Read"]),
+        ]:
+            async with pool.lease(key, connect):
+                pass
+        await pool.close()
+
+        assert len(clients) == 3
+
+    async def test_error_discards_client(self):
+        """Test that a client whose lease raised is not reused."""
+        pool = SDKClientPool()
+        clients: list = []
+        key = pool.make_key("pr_1", "sonnet", [])
+
+        with pytest.raises(RuntimeError):
+            async with pool.lease(key, make_connect(clients)):
+                raise RuntimeError("query failed")
+
+        assert pool.idle_count == 0
+        assert pool.stats.discards == 1
+        clients[0].disconnect.assert_awaited_once()
+        await pool.close()
+
+    async def test_idle_clients_are_evicted(self):
+        """Test that clients idle past the timeout are disconnected."""
+        clock = FakeClock()
+        pool = SDKClientPool(idle_timeout=60, clock=clock)
+        clients: list = []
+        key = pool.make_key("pr_1", "sonnet", [])
+
+        async with pool.lease(key, make_connect(clients)):
+            pass
+        clock.now = 61
+        async with pool.lease(key, make_connect(clients)):
+            pass
+        await pool.close()
+
+        assert len(clients) == 2
+        assert pool.stats.evictions == 1
+        clients[0].disconnect.assert_awaited_once()
+
+    async def test_max_idle_trims_least_recently_used(self):
+        """Test that idle clients beyond max_idle are disconnected."""
+        pool = SDKClientPool(max_idle=1)
+        clients: list = []
+        connect = make_connect(clients)
+
+        async with pool.lease(pool.make_key("a", "sonnet", []), connect):
+            pass
+        async with pool.lease(pool.make_key("b", "sonnet", []), connect):
+            pass
+
+        assert pool.idle_count == 1
+        clients[0].disconnect.assert_awaited_once()
+        await pool.close()
+
+    async def test_closed_pool_rejects_leases(self):
+        """Test that leasing from a closed pool fails."""
+        pool = SDKClientPool()
+        await pool.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            async with pool.lease(pool.make_key("a", "sonnet", []), make_connect([])):
+                pass
+
+
+# =============================================================================
+# ConversationManager / AgentWrapper Integration Tests
+# =============================================================================
+
+
+def _pooled_manager(temp_dir, clients: list) -> ConversationManager:
+    manager = ConversationManager(working_dir=str(temp_dir), client_pool=SDKClientPool())
+
+    def new_client(options):
+        client = AsyncMock()
+        client.receive_response = MagicMock(return_value=_no_messages())
+        clients.append(client)
+        return client
+
+    manager._sdk_client_class = MagicMock(side_effect=new_client)
+    manager._options_class = MagicMock(return_value=MagicMock())
+    return manager
+
+
+async def _no_messages():
+    return
+    yield  # pragma: no cover - makes this an async generator
+
+
+class TestPooledConversations:
+    """Tests for client reuse in ConversationManager and AgentWrapper."""
+
+    async def test_conversation_reuses_pooled_client(self, temp_dir):
+        """Test that a group's second conversation continues on the same client."""
+        clients: list = []
+        manager = _pooled_manager(temp_dir, clients)
+
+        with patch(
+            "claude_task_master.core.conversation.get_agents_for_working_dir", return_value=None
+        ):
+            async with manager.conversation("pr_1") as first:
+                pass
+            async with manager.conversation("pr_1") as second:
+                pass
+
+        assert first.client is second.client
+        assert [s.reused for s in manager.connection_setups] == [False, True]
+        clients[0].connect.assert_awaited_once()
+        clients[0].disconnect.assert_not_awaited()
+
+        await manager.close_all()
+        clients[0].disconnect.assert_awaited_once()
+
+    def test_agent_conversation_mode_reuses_client_across_group(self, temp_dir, mock_sdk):
+        """Test that tasks in one PR group share a client on the persistent loop."""
+        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
+            agent = AgentWrapper(
+                access_token="test-token",
+                model=ModelType.SONNET,
+                working_dir=str(temp_dir),
+                conversation_mode=True,
+            )
+        clients: list = []
+        pooled = _pooled_manager(temp_dir, clients)
+        agent._conversation_manager = pooled
+
+        try:
+            with patch(
+                "claude_task_master.core.conversation.get_agents_for_working_dir",
+                return_value=None,
+            ):
+                for _ in range(2):
+                    result = agent.run_work_session(
+                        "Do the task", pr_group_info={"name": "Schema", "group_id": "pr_1"}
+                    )
+                    # Fresh receive stream for the next query
+                    clients[0].receive_response = MagicMock(return_value=_no_messages())
+        finally:
+            agent.close()
+
+        assert len(clients) == 1
+        assert result["client_reused"] is True
+        assert agent.get_connection_stats() == {}  # Manager released on close
+        clients[0].disconnect.assert_awaited_once()
+        assert clients[0].query.await_count == 2
+
+    def test_agent_conversation_mode_retries_through_executor(self, temp_dir, mock_sdk):
+        """Test that a transient error in a pooled query is retried on a fresh client."""
+        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
+            agent = AgentWrapper(
+                access_token="test-token",
+                model=ModelType.SONNET,
+                working_dir=str(temp_dir),
+                conversation_mode=True,
+            )
+        agent._conversation_manager = _pooled_manager(temp_dir, [])
+        overloaded = Exception("Service unavailable")
+        overloaded.status_code = 503  # type: ignore[attr-defined]
+        failing = AsyncMock()
+        failing.query.side_effect = overloaded
+        healthy = AsyncMock()
+        healthy.receive_response = MagicMock(return_value=_no_messages())
+        agent._conversation_manager._sdk_client_class.side_effect = [failing, healthy]
+
+        try:
+            with (
+                patch(
+                    "claude_task_master.core.conversation.get_agents_for_working_dir",
+                    return_value=None,
+                ),
+                patch.object(agent._query_executor, "_wait_before_retry", new=AsyncMock()),
+            ):
+                result = agent.run_work_session(
+                    "Do the task", pr_group_info={"name": "Schema", "group_id": "pr_1"}
+                )
+        finally:
+            agent.close()
+
+        assert result["success"] is True
+        failing.disconnect.assert_awaited_once()  # Broken client dropped from the pool
+        healthy.query.assert_awaited_once()
+        assert agent._query_executor._consecutive_failures == 0
+
+    def test_work_session_without_group_uses_single_turn(self, agent_with_temp_dir):
+        """Test that conversation mode off keeps the phase executor path."""
+        with patch.object(
+            agent_with_temp_dir._phase_executor, "run_work_session", return_value={"output": ""}
+        ) as run:
+            agent_with_temp_dir.run_work_session("task", pr_group_info={"group_id": "pr_1"})
+
+        run.assert_called_once()
+        assert agent_with_temp_dir._event_loop is None
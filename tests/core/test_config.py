@@ -20,6 +20,7 @@ from claude_task_master.core.config import (
     APIConfig,
     ClaudeTaskMasterConfig,
     GitConfig,
+    GitHubConfig,
     ModelConfig,
     ToolsConfig,
     generate_default_config,
@@ -109,6 +110,21 @@ class TestGitConfig:
         assert config.auto_push is False
 
 
+class TestGitHubConfig:
+    """Tests for GitHubConfig model."""
+
+    def test_default_values(self) -> None:
+        """Test that GitHub API calls go through gh by default."""
+        config = GitHubConfig()
+        assert config.transport == "gh"
+        assert config.api_url == "https://api.github.com"
+
+    def test_invalid_transport(self) -> None:
+        """Test that an unknown transport is rejected."""
+        with pytest.raises(ValidationError):
+            GitHubConfig(transport="grpc")  # type: ignore[arg-type]
+
+
 class TestToolsConfig:
     """Tests for ToolsConfig model."""
 
@@ -569,6 +585,25 @@ class TestEnvironmentVariableOverrides:
 
         assert overridden.git.target_branch == "develop"
 
+    def test_apply_env_overrides_github_transport(self) -> None:
+        """Test env var selects the GitHub transport."""
+        config = generate_default_config()
+
+        with patch.dict(os.environ, {"CLAUDETM_GITHUB_TRANSPORT": "http"}):
+            overridden = apply_env_overrides(config)
+
+        assert overridden.github.transport == "http"
+
+    def test_apply_env_overrides_conversation_mode(self) -> None:
+        """Test env var turns on conversation mode."""
+        config = generate_default_config()
+        assert config.agent.conversation_mode is False
+
+        with patch.dict(os.environ, {"CLAUDETM_CONVERSATION_MODE": "true"}):
+            overridden = apply_env_overrides(config)
+
+        assert overridden.agent.conversation_mode is True
+
     def test_apply_env_overrides_ignores_empty_values(self) -> None:
         """Test env var overrides ignores empty string values."""
         config = ClaudeTaskMasterConfig(api=APIConfig(anthropic_api_key="original-key"))
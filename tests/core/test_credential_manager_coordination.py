@@ -0,0 +1,285 @@
+"""Tests for proactive, single-flight credential refresh.
+
+This module tests refreshing before expiry, the parsed-credentials cache,
+refresh coordination between threads and processes, and the background
+CredentialRefresher.
+"""
+
+import fcntl
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from claude_task_master.core import credentials as credentials_module
+from claude_task_master.core.credentials import (
+    CredentialManager,
+    CredentialRefresher,
+    Credentials,
+    NetworkConnectionError,
+    RefreshLockTimeoutError,
+)
+
+
+def _expiry_ms(delta: timedelta) -> int:
+    return int((datetime.now() + delta).timestamp() * 1000)
+
+
+def _write_credentials(path: Path, access_token: str, expires_in: timedelta) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "claudeAiOauth": {
+            "accessToken": access_token,
+            "refreshToken": "refresh-token",
+            "expiresAt": _expiry_ms(expires_in),
+            "tokenType": "Bearer",
+        }
+    }
+    path.write_text(json.dumps(data))
+
+
+def _token_response(access_token: str = "refreshed-token") -> MagicMock:
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {
+        "access_token": access_token,
+        "expires_at": _expiry_ms(timedelta(hours=8)),
+    }
+    return response
+
+
+@pytest.fixture
+def credentials_path(temp_dir):
+    """Point CredentialManager at a temp credentials file."""
+    path = temp_dir / ".claude" / ".credentials.json"
+    with patch.object(CredentialManager, "CREDENTIALS_PATH", path):
+        yield path
+
+
+# =============================================================================
+# Proactive Refresh Tests
+# =============================================================================
+
+
+class TestProactiveRefresh:
+    """Tests for refreshing within the skew window."""
+
+    def test_needs_refresh_within_skew(self):
+        """Test that a token close to expiry needs refreshing but isn't expired."""
+        manager = CredentialManager(refresh_skew=300)
+        creds = Credentials(
+            accessToken="a", refreshToken="r", expiresAt=_expiry_ms(timedelta(minutes=2))
+        )
+
+        assert manager.needs_refresh(creds)
+        assert not manager.is_expired(creds)
+        assert manager.seconds_until_refresh(creds) == 0.0
+
+    def test_seconds_until_refresh(self):
+        """Test the delay until the refresh window opens."""
+        manager = CredentialManager(refresh_skew=600)
+        creds = Credentials(
+            accessToken="a", refreshToken="r", expiresAt=_expiry_ms(timedelta(hours=1))
+        )
+
+        assert 2990 < manager.seconds_until_refresh(creds) <= 3000
+
+    def test_get_valid_token_refreshes_early(self, credentials_path):
+        """Test that a token about to expire is refreshed before it does."""
+        _write_credentials(credentials_path, "old-token", timedelta(minutes=2))
+
+        with patch.object(httpx, "post", return_value=_token_response()) as post:
+            token = CredentialManager().get_valid_token()
+
+        assert token == "refreshed-token"
+        post.assert_called_once()
+
+    def test_failed_early_refresh_keeps_current_token(self, credentials_path):
+        """Test that an early refresh failure doesn't fail a still-valid token."""
+        _write_credentials(credentials_path, "old-token", timedelta(minutes=2))
+
+        with patch.object(httpx, "post", side_effect=httpx.ConnectError("down")):
+            token = CredentialManager().get_valid_token()
+
+        assert token == "old-token"
+
+    def test_failed_refresh_of_expired_token_raises(self, credentials_path):
+        """Test that a refresh failure still raises once the token expired."""
+        _write_credentials(credentials_path, "old-token", timedelta(minutes=-1))
+
+        with patch.object(httpx, "post", side_effect=httpx.ConnectError("down")):
+            with pytest.raises(NetworkConnectionError):
+                CredentialManager().get_valid_token()
+
+
+# =============================================================================
+# Parsed Credentials Cache Tests
+# =============================================================================
+
+
+class TestCredentialsCache:
+    """Tests for the mtime-keyed parsed-credentials cache."""
+
+    def test_unchanged_file_not_reread(self, credentials_path):
+        """Test that repeated loads reuse the parsed credentials."""
+        _write_credentials(credentials_path, "token", timedelta(hours=1))
+        manager = CredentialManager()
+        first = manager.load_credentials()
+
+        with patch("builtins.open", side_effect=AssertionError("file re-read")):
+            assert manager.load_credentials() is first
+            assert CredentialManager().load_credentials() is first
+
+    def test_changed_file_reloaded(self, credentials_path):
+        """Test that a rewritten file is parsed again."""
+        _write_credentials(credentials_path, "token", timedelta(hours=1))
+        manager = CredentialManager()
+        manager.load_credentials()
+
+        _write_credentials(credentials_path, "a-longer-new-token", timedelta(hours=1))
+
+        assert manager.load_credentials().accessToken == "a-longer-new-token"
+
+    def test_save_updates_cache(self, credentials_path):
+        """Test that saved credentials are served without re-reading."""
+        credentials_path.parent.mkdir(parents=True)
+        manager = CredentialManager()
+        creds = Credentials(accessToken="saved", refreshToken="r", expiresAt=9999999999999)
+        manager._save_credentials(creds)
+
+        with patch("builtins.open", side_effect=AssertionError("file re-read")):
+            assert manager.load_credentials() is creds
+        assert credentials_path.stat().st_mode & 0o777 == 0o600
+        assert not list(credentials_path.parent.glob("*.tmp"))
+
+
+# =============================================================================
+# Single-Flight Tests
+# =============================================================================
+
+
+class TestSingleFlightRefresh:
+    """Tests for coordinating refreshes between threads and processes."""
+
+    def test_concurrent_threads_refresh_once(self, credentials_path):
+        """Test that concurrent callers share one refresh request."""
+        _write_credentials(credentials_path, "old-token", timedelta(minutes=-1))
+        tokens: list[str] = []
+
+        def slow_post(*args, **kwargs):
+            time.sleep(0.05)
+            return _token_response()
+
+        def worker() -> None:
+            tokens.append(CredentialManager().get_valid_token())
+
+        with patch.object(httpx, "post", side_effect=slow_post) as post:
+            threads = [threading.Thread(target=worker) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert post.call_count == 1
+        assert tokens == ["refreshed-token"] * 5
+
+    def test_waiter_uses_token_refreshed_by_other_process(self, credentials_path):
+        """Test that a caller blocked on the lock reuses the winner's token."""
+        _write_credentials(credentials_path, "old-token", timedelta(minutes=-1))
+        manager = CredentialManager()
+        result: list[Credentials] = []
+
+        with open(manager.lock_path, "a") as other_process:
+            fcntl.flock(other_process.fileno(), fcntl.LOCK_EX)
+            waiter = threading.Thread(target=lambda: result.append(manager.refresh_if_needed()))
+            with patch.object(httpx, "post") as post:
+                waiter.start()
+                time.sleep(0.2)
+                _write_credentials(credentials_path, "other-process-token", timedelta(hours=8))
+                fcntl.flock(other_process.fileno(), fcntl.LOCK_UN)
+                waiter.join(5)
+
+        post.assert_not_called()
+        assert result[0].accessToken == "other-process-token"
+
+    def test_unwritable_lock_falls_back(self, credentials_path):
+        """Test that refresh still works when the lock file can't be created."""
+        _write_credentials(credentials_path, "old-token", timedelta(minutes=-1))
+        manager = CredentialManager()
+
+        with (
+            patch.object(
+                CredentialManager, "lock_path", credentials_path.parent / "missing" / "x.lock"
+            ),
+            patch.object(httpx, "post", return_value=_token_response()),
+        ):
+            assert manager.refresh_if_needed().accessToken == "refreshed-token"
+
+    def test_lock_timeout(self, credentials_path):
+        """Test that a lock held too long raises RefreshLockTimeoutError."""
+        _write_credentials(credentials_path, "old-token", timedelta(minutes=-1))
+        manager = CredentialManager()
+
+        with open(manager.lock_path, "a") as other_process:
+            fcntl.flock(other_process.fileno(), fcntl.LOCK_EX)
+            with patch.object(credentials_module, "REFRESH_LOCK_TIMEOUT", 0.2):
+                with pytest.raises(RefreshLockTimeoutError):
+                    manager.refresh_if_needed()
+
+
+# =============================================================================
+# Background Refresher Tests
+# =============================================================================
+
+
+class TestCredentialRefresher:
+    """Tests for the background refresher thread."""
+
+    def test_refreshes_due_token(self, credentials_path):
+        """Test that the refresher renews a token entering its refresh window."""
+        _write_credentials(credentials_path, "old-token", timedelta(minutes=2))
+        manager = CredentialManager()
+
+        with patch.object(httpx, "post", return_value=_token_response()) as post:
+            with CredentialRefresher(manager) as refresher:
+                deadline = time.monotonic() + 5
+                while not post.called and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                assert refresher.running
+
+        assert not refresher.running
+        post.assert_called_once()
+        assert manager.load_credentials().accessToken == "refreshed-token"
+
+    def test_idle_until_refresh_window(self, credentials_path):
+        """Test that a fresh token is left alone and stop() is prompt."""
+        _write_credentials(credentials_path, "token", timedelta(hours=8))
+        manager = CredentialManager()
+
+        with patch.object(httpx, "post") as post:
+            refresher = manager.start_background_refresh()
+            time.sleep(0.05)
+            start = time.monotonic()
+            refresher.stop()
+
+        assert time.monotonic() - start < 1
+        post.assert_not_called()
+
+    def test_failure_retried_later(self, credentials_path):
+        """Test that a failed background refresh is logged and retried."""
+        _write_credentials(credentials_path, "old-token", timedelta(minutes=-1))
+        refresher = CredentialRefresher(CredentialManager(), retry_interval=0.01)
+
+        with patch.object(httpx, "post", side_effect=httpx.ConnectError("down")) as post:
+            refresher.start()
+            deadline = time.monotonic() + 5
+            while post.call_count < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            refresher.stop()
+
+        assert post.call_count >= 2
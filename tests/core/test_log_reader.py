@@ -0,0 +1,228 @@
+"""Tests for log_reader module - tailing logs without full-file reads."""
+
+import json
+from pathlib import Path
+
+from claude_task_master.core.log_reader import read_since, read_tail, tail_jsonl, tail_lines
+
+
+class TestTailLines:
+    """Tests for tail_lines."""
+
+    def test_returns_last_lines(self, temp_dir: Path):
+        """Test that the last N lines are returned in order."""
+        log_file = temp_dir / "run.txt"
+        log_file.write_text("".join(f"line {i}\n" for i in range(10)))
+
+        assert tail_lines(log_file, 3) == ["line 7\n", "line 8\n", "line 9\n"]
+
+    def test_more_lines_than_file(self, temp_dir: Path):
+        """Test requesting more lines than the file has."""
+        log_file = temp_dir / "run.txt"
+        log_file.write_text("a\nb\n")
+
+        assert tail_lines(log_file, 100) == ["a\n", "b\n"]
+
+    def test_no_trailing_newline(self, temp_dir: Path):
+        """Test a file whose last line lacks a newline."""
+        log_file = temp_dir / "run.txt"
+        log_file.write_text("a\nb\nc")
+
+        assert tail_lines(log_file, 2) == ["b\n", "c"]
+
+    def test_empty_file_and_zero_count(self, temp_dir: Path):
+        """Test empty files and non-positive counts."""
+        log_file = temp_dir / "run.txt"
+        log_file.write_text("")
+
+        assert tail_lines(log_file, 5) == []
+        log_file.write_text("a\n")
+        assert tail_lines(log_file, 0) == []
+
+    def test_small_block_size_spans_blocks(self, temp_dir: Path):
+        """Test that lines spanning block boundaries are reassembled."""
+        log_file = temp_dir / "run.txt"
+        lines = [f"{'x' * 37} {i}\n" for i in range(50)]
+        log_file.write_text("".join(lines))
+
+        assert tail_lines(log_file, 12, block_size=16) == lines[-12:]
+
+    def test_reads_only_tail(self, temp_dir: Path):
+        """Test that a large file is not read in full."""
+        from unittest.mock import patch
+
+        log_file = temp_dir / "run.txt"
+        log_file.write_text("".join(f"line {i}\n" for i in range(100_000)))
+
+        real_open = open
+        read_sizes: list[int] = []
+
+        class _Recorder:
+            def __init__(self, f):
+                self._f = f
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                self._f.close()
+
+            def read(self, size=-1):
+                data = self._f.read(size)
+                read_sizes.append(len(data))
+                return data
+
+            def __getattr__(self, name):
+                return getattr(self._f, name)
+
+        with patch("builtins.open", side_effect=lambda *a, **kw: _Recorder(real_open(*a, **kw))):
+            result = tail_lines(log_file, 5, block_size=1024)
+
+        assert result[-1] == "line 99999\n"
+        assert sum(read_sizes) <= 1024
+
+
+class TestTailJsonl:
+    """Tests for tail_jsonl."""
+
+    def test_parses_last_entries(self, temp_dir: Path):
+        """Test that the last N entries are parsed."""
+        log_file = temp_dir / "run.jsonl"
+        log_file.write_text("".join(json.dumps({"n": i}) + "\n" for i in range(10)))
+
+        assert tail_jsonl(log_file, 2) == [{"n": 8}, {"n": 9}]
+
+    def test_skips_partial_and_blank_lines(self, temp_dir: Path):
+        """Test that a partially written last line is skipped."""
+        log_file = temp_dir / "run.jsonl"
+        log_file.write_text('{"n": 1}\n\n{"n": 2}\n{"n": ')
+
+        assert tail_jsonl(log_file, 4) == [{"n": 1}, {"n": 2}]
+
+
+class TestReadTail:
+    """Tests for read_tail offsets."""
+
+    def test_offsets(self, temp_dir: Path):
+        """Test that offsets bracket the returned lines."""
+        log_file = temp_dir / "run.txt"
+        log_file.write_text("aa\nbb\ncc\n")
+
+        chunk = read_tail(log_file, 2)
+
+        assert chunk.content == "bb\ncc\n"
+        assert chunk.start_offset == 3
+        assert chunk.next_offset == 9
+
+    def test_leaves_partial_line_for_read_since(self, temp_dir: Path):
+        """Test that an unfinished last line is neither returned nor skipped."""
+        log_file = temp_dir / "run.txt"
+        log_file.write_text("aa\nbb\ncc")
+
+        chunk = read_tail(log_file, 2)
+
+        assert chunk.content == "aa\nbb\n"
+        assert (chunk.start_offset, chunk.next_offset) == (0, 6)
+        with open(log_file, "a") as f:
+            f.write("c\n")
+        assert read_since(log_file, chunk.next_offset).content == "ccc\n"
+
+    def test_include_partial(self, temp_dir: Path):
+        """Test that include_partial returns the unfinished line up to the end."""
+        log_file = temp_dir / "run.txt"
+        log_file.write_text("aa\nbb\ncc")
+
+        chunk = read_tail(log_file, 2, include_partial=True)
+
+        assert chunk.content == "bb\ncc"
+        assert (chunk.start_offset, chunk.next_offset) == (3, 8)
+
+    def test_lines_only_split_on_newline(self, temp_dir: Path):
+        """Test that form feeds and unicode separators don't split lines."""
+        log_file = temp_dir / "run.txt"
+        log_file.write_text("a\x0cb\nc d\n", encoding="utf-8")
+
+        assert tail_lines(log_file, 1) == ["c d\n"]
+
+
+class TestReadSince:
+    """Tests for read_since incremental reads."""
+
+    def test_reads_appended_lines(self, temp_dir: Path):
+        """Test reading lines appended after a cursor."""
+        log_file = temp_dir / "run.txt"
+        log_file.write_text("one\n")
+        cursor = read_tail(log_file, 10).next_offset
+
+        with open(log_file, "a") as f:
+            f.write("two\nthree\n")
+
+        chunk = read_since(log_file, cursor)
+        assert chunk.content == "two\nthree\n"
+        assert chunk.next_offset == log_file.stat().st_size
+        assert read_since(log_file, chunk.next_offset).content == ""
+
+    def test_holds_back_partial_line(self, temp_dir: Path):
+        """Test that an unfinished line is left for the next read."""
+        log_file = temp_dir / "run.txt"
+        log_file.write_text("done\npart")
+
+        chunk = read_since(log_file, 0)
+        assert chunk.content == "done\n"
+        assert chunk.next_offset == 5
+
+    def test_max_bytes_stops_at_line_boundary(self, temp_dir: Path):
+        """Test that chunks respect max_bytes on line boundaries."""
+        log_file = temp_dir / "run.txt"
+        log_file.write_text("aaaa\nbbbb\ncccc\n")
+
+        chunk = read_since(log_file, 0, max_bytes=12)
+        assert chunk.content == "aaaa\nbbbb\n"
+        chunk = read_since(log_file, chunk.next_offset, max_bytes=12)
+        assert chunk.content == "cccc\n"
+
+    def test_oversized_line_does_not_stall(self, temp_dir: Path):
+        """Test that a line longer than max_bytes still advances the cursor."""
+        log_file = temp_dir / "run.txt"
+        log_file.write_text("x" * 20 + "\n")
+
+        chunk = read_since(log_file, 0, max_bytes=8)
+        assert chunk.next_offset == 8
+
+    def test_cursor_past_end_resets(self, temp_dir: Path):
+        """Test that a cursor beyond the file size restarts at zero."""
+        log_file = temp_dir / "run.txt"
+        log_file.write_text("new\n")
+
+        chunk = read_since(log_file, 1000)
+        assert chunk.reset is True
+        assert chunk.start_offset == 0
+        assert chunk.content == "new\n"
+
+    def test_rotated_file_resets(self, temp_dir: Path):
+        """Test that a replaced file restarts at zero even when it is larger."""
+        log_file = temp_dir / "run.txt"
+        log_file.write_text("old line\n")
+        first = read_since(log_file, 0)
+
+        log_file.rename(temp_dir / "run.txt.1")
+        log_file.write_text("rotated line one\nrotated line two\n")
+
+        chunk = read_since(log_file, first.next_offset, file_id=first.file_id)
+        assert chunk.reset is True
+        assert chunk.start_offset == 0
+        assert chunk.content == "rotated line one\nrotated line two\n"
+        assert chunk.file_id != first.file_id
+
+    def test_same_file_keeps_cursor(self, temp_dir: Path):
+        """Test that an unchanged file_id resumes from the offset."""
+        log_file = temp_dir / "run.txt"
+        log_file.write_text("a\n")
+        first = read_tail(log_file, 10)
+        with open(log_file, "a") as f:
+            f.write("b\n")
+
+        chunk = read_since(log_file, first.next_offset, file_id=first.file_id)
+        assert chunk.reset is False
+        assert chunk.content == "b\n"
+        assert chunk.file_id == first.file_id
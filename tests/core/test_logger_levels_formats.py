@@ -264,3 +264,124 @@ class TestLogLevelAndFormatCombinations:
         assert "Prompt - should be skipped" not in content
         assert "Response - should be skipped" not in content
         assert "[TOOL]" not in content
+
+
+class TestJsonlFormat:
+    """Tests for the append-only JSONL streaming format."""
+
+    def test_jsonl_format_writes_one_entry_per_line(self, log_file: Path):
+        """Test that JSONL format writes each entry as a single JSON line."""
+        from claude_task_master.core.logger import LogFormat, LogLevel, TaskLogger
+
+        jsonl_log_file = log_file.with_suffix(".jsonl")
+        logger = TaskLogger(jsonl_log_file, log_format=LogFormat.JSONL, level=LogLevel.VERBOSE)
+
+        logger.start_session(1, "work")
+        logger.log_prompt("Prompt")
+        logger.log_tool_use("Read", {"file_path": "a.py"})
+        logger.end_session("done")
+
+        lines = jsonl_log_file.read_text().splitlines()
+        entries = [json.loads(line) for line in lines]
+        assert [e["type"] for e in entries] == [
+            "session_start",
+            "prompt",
+            "tool_use",
+            "session_end",
+        ]
+        logger.close()
+
+    def test_jsonl_format_appends_across_loggers(self, log_file: Path):
+        """Test that JSONL format appends without rewriting earlier entries."""
+        from claude_task_master.core.logger import LogFormat, TaskLogger
+
+        jsonl_log_file = log_file.with_suffix(".jsonl")
+        logger = TaskLogger(jsonl_log_file, log_format=LogFormat.JSONL)
+        logger.start_session(1, "planning")
+        logger.end_session("done")
+        logger.close()
+        first_content = jsonl_log_file.read_text()
+
+        logger2 = TaskLogger(jsonl_log_file, log_format=LogFormat.JSONL)
+        logger2.start_session(2, "work")
+        logger2.end_session("done")
+        logger2.close()
+
+        content = jsonl_log_file.read_text()
+        assert content.startswith(first_content)
+        sessions = [
+            json.loads(line)["session"]
+            for line in content.splitlines()
+            if json.loads(line)["type"] == "session_start"
+        ]
+        assert sessions == [1, 2]
+
+    def test_jsonl_format_keeps_single_handle(self, log_file: Path):
+        """Test that entries are buffered on one handle and visible after flush."""
+        from claude_task_master.core.logger import LogFormat, TaskLogger
+
+        jsonl_log_file = log_file.with_suffix(".jsonl")
+        logger = TaskLogger(jsonl_log_file, log_format=LogFormat.JSONL, fsync_interval=0)
+
+        logger.start_session(1, "work")
+        handle = logger._jsonl_writer._handle
+        logger.log_error("boom")
+        assert logger._jsonl_writer._handle is handle
+
+        logger.end_session("failed")
+        assert len(jsonl_log_file.read_text().splitlines()) == 3
+        logger.close()
+        assert logger._jsonl_writer._handle is None
+
+    def test_jsonl_fsync_cadence(self, log_file: Path):
+        """Test that fsync runs every fsync_interval entries."""
+        from unittest.mock import patch
+
+        from claude_task_master.core.logger import LogFormat, TaskLogger
+
+        jsonl_log_file = log_file.with_suffix(".jsonl")
+        logger = TaskLogger(jsonl_log_file, log_format=LogFormat.JSONL, fsync_interval=2)
+
+        with patch("claude_task_master.core.logger.os.fsync") as mock_fsync:
+            logger.log_error("one")
+            assert mock_fsync.call_count == 0
+            logger.log_error("two")
+            assert mock_fsync.call_count == 1
+            logger.log_error("three")
+            logger.log_error("four")
+            assert mock_fsync.call_count == 2
+        logger.close()
+
+    def test_jsonl_rotates_by_size(self, log_file: Path):
+        """Test that the active file is rotated once it exceeds max_bytes."""
+        from claude_task_master.core.logger import LogFormat, TaskLogger
+
+        jsonl_log_file = log_file.with_suffix(".jsonl")
+        logger = TaskLogger(
+            jsonl_log_file, log_format=LogFormat.JSONL, max_bytes=300, backup_count=2
+        )
+
+        for i in range(20):
+            logger.log_error(f"error number {i}")
+        logger.close()
+
+        rotated_1 = jsonl_log_file.with_name(jsonl_log_file.name + ".1")
+        rotated_2 = jsonl_log_file.with_name(jsonl_log_file.name + ".2")
+        rotated_3 = jsonl_log_file.with_name(jsonl_log_file.name + ".3")
+        assert rotated_1.exists()
+        assert rotated_2.exists()
+        assert not rotated_3.exists()
+        assert jsonl_log_file.stat().st_size <= 300
+
+        # The newest entry is in the active file
+        last = json.loads(jsonl_log_file.read_text().splitlines()[-1])
+        assert last["message"] == "error number 19"
+
+    def test_get_log_file_for_format(self, log_file: Path):
+        """Test that log file suffixes follow the format."""
+        from claude_task_master.core.logger import LogFormat, get_log_file_for_format
+
+        assert get_log_file_for_format(log_file, LogFormat.TEXT).suffix == ".txt"
+        assert get_log_file_for_format(log_file, "json").suffix == ".json"
+        assert get_log_file_for_format(log_file, "jsonl").suffix == ".jsonl"
+        assert get_log_file_for_format(log_file, "unknown").suffix == ".txt"
@@ -732,6 +732,33 @@ class TestRunWorkflowCycle:
         ):
             basic_orchestrator._run_workflow_cycle(basic_task_state)
 
+    def test_workflow_cycle_records_github_calls(
+        self, basic_orchestrator, mock_github_client, state_manager, basic_task_state
+    ):
+        """Should record the GitHub calls each PR stage cycle makes."""
+        state_manager.state_dir.mkdir(exist_ok=True)
+        basic_task_state.workflow_stage = "waiting_reviews"
+        mock_github_client.api_calls = 10
+
+        def handle(state):
+            mock_github_client.api_calls += 2
+
+        with patch.object(
+            basic_orchestrator.stage_handler, "handle_waiting_reviews_stage", side_effect=handle
+        ):
+            basic_orchestrator._run_workflow_cycle(basic_task_state)
+            basic_orchestrator._run_workflow_cycle(basic_task_state)
+
+        cycles = basic_orchestrator.tracker.get_summary()["github_cycles"]
+        assert cycles["waiting_reviews"] == {"cycles": 2, "calls": 4, "calls_per_cycle": 2.0}
+
+    def test_workflow_cycle_shares_pr_snapshots(self, basic_orchestrator):
+        """Should give the stage handler and PR context the same snapshot cache."""
+        snapshots = basic_orchestrator.pr_snapshots
+
+        assert basic_orchestrator.stage_handler.snapshots is snapshots
+        assert basic_orchestrator.pr_context.snapshots is snapshots
+
 
 # =============================================================================
 # Test Main Run Method
@@ -6,14 +6,34 @@ import pytest
 
 from claude_task_master.core.parallel import (
     AsyncParallelExecutor,
+    CancellationToken,
+    ExecutorBackend,
     ParallelExecutor,
     ParallelExecutorConfig,
     ParallelTask,
+    TaskCancelledError,
     TaskResult,
     TaskStatus,
 )
 
 
+def _square(n: int = 7) -> int:
+    """Module-level task function so it can be pickled for the process backend."""
+    return n * n
+
+
+def _report_pid() -> int:
+    """Return the worker's process ID."""
+    import os
+
+    return os.getpid()
+
+
+def _raise_value_error() -> None:
+    """Fail with a picklable exception."""
+    raise ValueError("bad input")
+
+
 class TestTaskResult:
     """Tests for TaskResult."""
 
@@ -187,6 +207,528 @@ class TestParallelExecutor:
         assert results["task2"].status == TaskStatus.COMPLETED
 
 
+class TestParallelExecutorScheduling:
+    """Tests for dependency-aware ready-queue scheduling."""
+
+    def test_slow_task_does_not_stall_unrelated_dependents(self):
+        """Test that a dependent starts as soon as its own dependency finishes."""
+        import time
+
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(max_workers=2, use_circuit_breaker=False)
+        )
+        executor.add_task(ParallelTask(task_id="slow", func=lambda: time.sleep(0.3)))
+        executor.add_task(ParallelTask(task_id="fast", func=lambda: "fast"))
+        executor.add_task(
+            ParallelTask(task_id="after_fast", func=lambda: "done", dependencies=["fast"])
+        )
+
+        results = executor.execute_all()
+
+        assert results["after_fast"].status == TaskStatus.COMPLETED
+        assert results["after_fast"].end_time < results["slow"].end_time
+
+    def test_priority_order_when_workers_are_scarce(self):
+        """Test that ready tasks are started highest priority first."""
+        order: list[str] = []
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(max_workers=1, use_circuit_breaker=False)
+        )
+        for task_id, priority in [("low", 0), ("high", 10), ("mid", 5)]:
+            executor.add_task(
+                ParallelTask(
+                    task_id=task_id,
+                    func=lambda t=task_id: order.append(t),  # type: ignore[misc]
+                    priority=priority,
+                )
+            )
+
+        executor.execute_all()
+
+        assert order == ["high", "mid", "low"]
+
+    def test_batch_size_does_not_limit_concurrency(self):
+        """Test that ready tasks are not pushed into later waves by batch_size."""
+        import threading
+
+        barrier = threading.Barrier(3, timeout=1.0)
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(max_workers=3, batch_size=1, use_circuit_breaker=False)
+        )
+        for i in range(3):
+            executor.add_task(ParallelTask(task_id=f"task{i}", func=barrier.wait))
+
+        results = executor.execute_all()
+
+        assert all(r.status == TaskStatus.COMPLETED for r in results.values())
+
+    def test_dependents_run_after_failed_dependency(self):
+        """Test that a failed dependency still releases its dependents."""
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(max_retries=0, use_circuit_breaker=False)
+        )
+
+        def fail():
+            raise RuntimeError("boom")
+
+        executor.add_task(ParallelTask(task_id="a", func=fail))
+        executor.add_task(ParallelTask(task_id="b", func=lambda: "b", dependencies=["a"]))
+
+        results = executor.execute_all()
+
+        assert results["a"].status == TaskStatus.FAILED
+        assert results["b"].status == TaskStatus.COMPLETED
+
+    def test_cycle_detected_before_execution(self):
+        """Test that circular dependencies fail all tasks without running any."""
+        calls: list[str] = []
+        executor = ParallelExecutor()
+        executor.add_task(
+            ParallelTask(task_id="a", func=lambda: calls.append("a"), dependencies=["c"])
+        )
+        executor.add_task(
+            ParallelTask(task_id="b", func=lambda: calls.append("b"), dependencies=["a"])
+        )
+        executor.add_task(
+            ParallelTask(task_id="c", func=lambda: calls.append("c"), dependencies=["b"])
+        )
+        executor.add_task(ParallelTask(task_id="free", func=lambda: calls.append("free")))
+
+        results = executor.execute_all()
+
+        assert calls == []
+        assert all(r.status == TaskStatus.FAILED for r in results.values())
+        assert "Circular dependency" in str(results["a"].error)
+        assert "'free'" not in str(results["a"].error)
+
+    def test_unknown_dependency(self):
+        """Test that a dependency on an unknown task fails all tasks."""
+        executor = ParallelExecutor()
+        executor.add_task(ParallelTask(task_id="a", func=lambda: "a", dependencies=["missing"]))
+
+        results = executor.execute_all()
+
+        assert results["a"].status == TaskStatus.FAILED
+        assert "missing" in str(results["a"].error)
+
+    def test_critical_path_timing(self):
+        """Test that the critical path follows the longest dependency chain."""
+        import time
+
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(max_workers=4, use_circuit_breaker=False)
+        )
+        executor.add_task(ParallelTask(task_id="a", func=lambda: time.sleep(0.05)))
+        executor.add_task(
+            ParallelTask(task_id="b", func=lambda: time.sleep(0.1), dependencies=["a"])
+        )
+        executor.add_task(ParallelTask(task_id="c", func=lambda: None, dependencies=["a"]))
+        executor.add_task(ParallelTask(task_id="d", func=lambda: None))
+
+        executor.execute_all()
+        path, duration = executor.get_critical_path()
+        timing = executor.get_timing()
+
+        assert path == ["a", "b"]
+        assert duration >= 0.15
+        assert timing["critical_path"] == ["a", "b"]
+        assert timing["wall_time"] >= duration
+        assert timing["busy_time"] >= duration
+        assert timing["parallelism"] > 0
+
+    def test_critical_path_empty(self):
+        """Test critical path before any run."""
+        executor = ParallelExecutor()
+
+        assert executor.get_critical_path() == ([], 0.0)
+        assert executor.get_timing()["wall_time"] == 0.0
+
+
+class TestParallelExecutorRetriesAndTimeouts:
+    """Tests for delay-queue retries and cooperative cancellation."""
+
+    def test_retry_backoff_does_not_hold_a_worker(self, monkeypatch):
+        """Test that a task waiting to retry leaves its worker free."""
+        monkeypatch.setattr(
+            ParallelExecutor, "_calculate_backoff", lambda self, task_id, error: 0.2
+        )
+        calls = {"flaky": 0}
+
+        def flaky():
+            calls["flaky"] += 1
+            if calls["flaky"] == 1:
+                raise RuntimeError("transient")
+            return "ok"
+
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(max_workers=1, max_retries=1, use_circuit_breaker=False)
+        )
+        executor.add_task(ParallelTask(task_id="flaky", func=flaky, priority=10))
+        executor.add_task(ParallelTask(task_id="other", func=lambda: "other"))
+
+        results = executor.execute_all()
+
+        assert results["flaky"].status == TaskStatus.COMPLETED
+        assert results["flaky"].retries == 1
+        # The other task ran during flaky's backoff, not after it
+        assert results["other"].end_time < results["flaky"].end_time
+
+    def test_timeout_cancels_token_and_frees_slot(self):
+        """Test that a timed-out cooperative task stops and releases its worker."""
+        seen: dict[str, CancellationToken] = {}
+
+        def long_running(cancel_token: CancellationToken) -> None:
+            seen["token"] = cancel_token
+            while not cancel_token.wait(0.01):
+                pass
+            cancel_token.raise_if_cancelled()
+
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(max_workers=1, use_circuit_breaker=False)
+        )
+        executor.add_task(
+            ParallelTask(task_id="stuck", func=long_running, timeout=0.1, priority=10)
+        )
+        executor.add_task(ParallelTask(task_id="next", func=lambda: "next"))
+
+        results = executor.execute_all()
+
+        assert results["stuck"].status == TaskStatus.FAILED
+        assert isinstance(results["stuck"].error, TimeoutError)
+        assert results["next"].status == TaskStatus.COMPLETED
+        assert seen["token"].cancelled
+        assert seen["token"].reason == "timed out"
+        assert results["stuck"].duration < 1.0
+
+    def test_timed_out_task_is_not_retried(self):
+        """Test that timeouts fail the task without further attempts."""
+        calls = {"count": 0}
+
+        def slow(cancel_token: CancellationToken) -> None:
+            calls["count"] += 1
+            cancel_token.wait(1.0)
+
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(max_workers=1, max_retries=3, use_circuit_breaker=False)
+        )
+        executor.add_task(ParallelTask(task_id="slow", func=slow, timeout=0.05))
+
+        results = executor.execute_all()
+
+        assert results["slow"].status == TaskStatus.FAILED
+        assert calls["count"] == 1
+
+    def test_cancel_propagates_to_running_tasks(self):
+        """Test that cancel() signals the tokens of running tasks."""
+        import threading
+
+        started = threading.Event()
+
+        def worker(cancel_token: CancellationToken) -> None:
+            started.set()
+            cancel_token.wait(2.0)
+            cancel_token.raise_if_cancelled()
+
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(max_workers=1, use_circuit_breaker=False)
+        )
+        executor.add_task(ParallelTask(task_id="running", func=worker, priority=10))
+        executor.add_task(ParallelTask(task_id="queued", func=lambda: "never"))
+
+        def cancel_when_started() -> None:
+            started.wait(1.0)
+            executor.cancel()
+
+        canceller = threading.Thread(target=cancel_when_started)
+        canceller.start()
+        results = executor.execute_all()
+        canceller.join()
+
+        assert results["running"].status == TaskStatus.CANCELLED
+        assert isinstance(results["running"].error, TaskCancelledError)
+        assert results["queued"].status == TaskStatus.CANCELLED
+
+    def test_cancel_marks_waiting_dependents(self):
+        """Test that tasks waiting on a cancelled task are cancelled and yielded."""
+        import threading
+
+        started = threading.Event()
+
+        def worker(cancel_token: CancellationToken) -> None:
+            started.set()
+            cancel_token.wait(2.0)
+            cancel_token.raise_if_cancelled()
+
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(max_workers=2, use_circuit_breaker=False)
+        )
+        executor.add_task(ParallelTask(task_id="root", func=worker))
+        executor.add_task(ParallelTask(task_id="child", func=lambda: 1, dependencies=["root"]))
+        executor.add_task(
+            ParallelTask(task_id="grandchild", func=lambda: 2, dependencies=["child"])
+        )
+
+        def cancel_when_started() -> None:
+            started.wait(1.0)
+            executor.cancel()
+
+        canceller = threading.Thread(target=cancel_when_started)
+        canceller.start()
+        streamed = {result.task_id: result for result in executor.iter_results()}
+        canceller.join()
+
+        assert set(streamed) == {"root", "child", "grandchild"}
+        assert all(r.status == TaskStatus.CANCELLED for r in streamed.values())
+        assert "'root'" in str(streamed["child"].error)
+        assert "'child'" in str(streamed["grandchild"].error)
+
+    def test_self_cancelled_task_skips_only_its_dependents(self):
+        """Test that a task cancelling itself cancels dependents but not other tasks."""
+
+        def stop() -> None:
+            raise TaskCancelledError("stopped")
+
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(max_workers=2, use_circuit_breaker=False)
+        )
+        executor.add_task(ParallelTask(task_id="stopped", func=stop))
+        executor.add_task(ParallelTask(task_id="after", func=lambda: 1, dependencies=["stopped"]))
+        executor.add_task(ParallelTask(task_id="other", func=lambda: 2))
+
+        results = executor.execute_all()
+
+        assert results["stopped"].status == TaskStatus.CANCELLED
+        assert results["after"].status == TaskStatus.CANCELLED
+        assert results["after"].start_time is None
+        assert results["other"].status == TaskStatus.COMPLETED
+
+    def test_progress_reports_wasted_worker_seconds(self, monkeypatch):
+        """Test that failed attempts are counted as wasted worker time."""
+        import time
+
+        monkeypatch.setattr(
+            ParallelExecutor, "_calculate_backoff", lambda self, task_id, error: 0.0
+        )
+
+        def failing():
+            time.sleep(0.05)
+            raise RuntimeError("boom")
+
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(max_workers=2, max_retries=1, use_circuit_breaker=False)
+        )
+        executor.add_task(ParallelTask(task_id="failing", func=failing))
+        executor.add_task(ParallelTask(task_id="ok", func=lambda: time.sleep(0.05)))
+
+        executor.execute_all()
+        progress = executor.get_progress()
+
+        assert progress["failed"] == 1
+        assert progress["completed"] == 1
+        assert progress["wasted_worker_seconds"] >= 0.1
+        assert progress["busy_worker_seconds"] >= progress["wasted_worker_seconds"] + 0.05
+        assert progress["idle_worker_seconds"] >= 0.0
+
+    def test_cancellation_token_deadline(self):
+        """Test token deadline and remaining time."""
+        import time
+
+        token = CancellationToken(deadline=time.time() + 10)
+        assert 9 < token.remaining() <= 10
+        assert CancellationToken().remaining() is None
+
+        token.cancel("stop")
+        token.cancel("ignored")
+        assert token.reason == "stop"
+        with pytest.raises(TaskCancelledError):
+            token.raise_if_cancelled()
+
+
+class TestParallelExecutorBackends:
+    """Tests for the thread, process and asyncio execution backends."""
+
+    def test_process_backend_runs_in_worker_processes(self):
+        """Test that the process backend runs tasks outside the parent process."""
+        import functools
+        import os
+
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(
+                max_workers=2, backend=ExecutorBackend.PROCESS, use_circuit_breaker=False
+            )
+        )
+        executor.add_task(ParallelTask(task_id="pid", func=_report_pid))
+        executor.add_task(ParallelTask(task_id="square", func=functools.partial(_square, 9)))
+
+        results = executor.execute_all()
+
+        assert results["square"].result == 81
+        assert results["pid"].status == TaskStatus.COMPLETED
+        assert results["pid"].result != os.getpid()
+
+    def test_process_backend_returns_errors(self):
+        """Test that exceptions raised in worker processes reach the parent."""
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(
+                max_retries=0, backend=ExecutorBackend.PROCESS, use_circuit_breaker=False
+            )
+        )
+        executor.add_task(ParallelTask(task_id="bad", func=_raise_value_error))
+
+        results = executor.execute_all()
+
+        assert results["bad"].status == TaskStatus.FAILED
+        assert isinstance(results["bad"].error, ValueError)
+
+    def test_process_backend_rejects_unpicklable_function(self):
+        """Test that lambdas are rejected when the task is added."""
+        executor = ParallelExecutor(config=ParallelExecutorConfig(backend=ExecutorBackend.PROCESS))
+
+        with pytest.raises(ValueError, match="not picklable"):
+            executor.add_task(ParallelTask(task_id="lambda", func=lambda: 1))
+
+    def test_coroutine_function_requires_asyncio_backend(self):
+        """Test that coroutine functions are rejected on the thread backend."""
+
+        async def work() -> int:
+            return 1
+
+        executor = ParallelExecutor()
+
+        with pytest.raises(ValueError, match="asyncio backend"):
+            executor.add_task(ParallelTask(task_id="coro", func=work))
+
+    def test_asyncio_backend_awaits_coroutines_and_runs_plain_functions(self):
+        """Test that the asyncio backend handles both kinds of task function."""
+
+        async def fetch() -> str:
+            await asyncio.sleep(0.01)
+            return "fetched"
+
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(
+                backend=ExecutorBackend.ASYNCIO, use_circuit_breaker=False
+            )
+        )
+        executor.add_task(ParallelTask(task_id="coro", func=fetch))
+        executor.add_task(ParallelTask(task_id="plain", func=lambda: "plain"))
+
+        results = executor.execute_all()
+
+        assert results["coro"].result == "fetched"
+        assert results["plain"].result == "plain"
+
+    def test_asyncio_backend_cancels_coroutine_on_timeout(self):
+        """Test that a timed-out coroutine is cancelled and frees its slot."""
+        cancelled = []
+
+        async def hang() -> None:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(
+                max_workers=1, backend=ExecutorBackend.ASYNCIO, use_circuit_breaker=False
+            )
+        )
+        executor.add_task(ParallelTask(task_id="hang", func=hang, timeout=0.05, priority=1))
+        executor.add_task(ParallelTask(task_id="next", func=lambda: "next"))
+
+        results = executor.execute_all()
+
+        assert isinstance(results["hang"].error, TimeoutError)
+        assert results["next"].status == TaskStatus.COMPLETED
+        assert cancelled == [True]
+
+    def test_asyncio_backend_closes_loop_without_waiting(self, monkeypatch):
+        """Test that the loop is closed even when shutdown can't wait for workers."""
+        import time
+
+        from claude_task_master.core import parallel
+
+        backends = []
+        create_backend = parallel._create_backend
+
+        def recording_create_backend(config):
+            backend = create_backend(config)
+            backends.append(backend)
+            return backend
+
+        monkeypatch.setattr(parallel, "_create_backend", recording_create_backend)
+
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(
+                max_workers=1, backend=ExecutorBackend.ASYNCIO, use_circuit_breaker=False
+            )
+        )
+        # Ignores its token, so the run ends with an abandoned attempt
+        executor.add_task(ParallelTask(task_id="stuck", func=lambda: time.sleep(0.3), timeout=0.05))
+
+        results = executor.execute_all()
+
+        assert isinstance(results["stuck"].error, TimeoutError)
+        (backend,) = backends
+        backend._thread.join(2.0)
+        assert not backend._thread.is_alive()
+        assert backend._loop.is_closed()
+
+    def test_circuit_breaker_state_is_shared_with_process_workers(self):
+        """Test that an open breaker in the parent rejects process-backend tasks."""
+        from claude_task_master.core.circuit_breaker import (
+            CircuitBreakerError,
+            get_circuit_breaker,
+        )
+
+        breaker = get_circuit_breaker("parallel_shared_breaker_test")
+        breaker.force_open()
+        try:
+            executor = ParallelExecutor(
+                config=ParallelExecutorConfig(max_retries=0, backend=ExecutorBackend.PROCESS)
+            )
+            executor.add_task(
+                ParallelTask(task_id="t", func=_square, task_type="shared_breaker_test")
+            )
+
+            results = executor.execute_all()
+        finally:
+            breaker.reset()
+
+        assert results["t"].status == TaskStatus.FAILED
+        assert isinstance(results["t"].error, CircuitBreakerError)
+
+    def test_iter_results_streams_in_completion_order(self):
+        """Test that results are yielded as tasks finish."""
+        import time
+
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(max_workers=2, use_circuit_breaker=False)
+        )
+        executor.add_task(ParallelTask(task_id="slow", func=lambda: time.sleep(0.1)))
+        executor.add_task(ParallelTask(task_id="fast", func=lambda: "fast"))
+
+        streamed = [result.task_id for result in executor.iter_results()]
+
+        assert streamed == ["fast", "slow"]
+
+    def test_closing_iter_results_cancels_remaining_tasks(self):
+        """Test that abandoning the iterator cancels queued work."""
+        executor = ParallelExecutor(
+            config=ParallelExecutorConfig(max_workers=1, use_circuit_breaker=False)
+        )
+        for i in range(3):
+            executor.add_task(ParallelTask(task_id=f"t{i}", func=lambda: "ok", priority=-i))
+
+        results = executor.iter_results()
+        first = next(results)
+        results.close()
+
+        assert first.task_id == "t0"
+        assert executor.get_results()["t2"].status == TaskStatus.CANCELLED
+
+
 class TestAsyncParallelExecutor:
     """Tests for AsyncParallelExecutor."""
 
@@ -244,3 +786,107 @@ class TestAsyncParallelExecutor:
         assert results["task_0"].result == 2
         assert results["task_1"].result == 4
         assert results["task_2"].result == 6
+
+
+class TestAsyncParallelExecutorImap:
+    """Tests for the streaming imap() API."""
+
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order(self):
+        """Test that results arrive as items finish, not in input order."""
+        executor = AsyncParallelExecutor(max_concurrent=3)
+
+        async def wait(delay):
+            await asyncio.sleep(delay)
+            return delay
+
+        results = [r async for r in executor.imap(wait, [0.05, 0.01, 0.03])]
+
+        assert [r.result for r in results] == [0.01, 0.03, 0.05]
+        assert [r.task_id for r in results] == ["task_1", "task_2", "task_0"]
+
+    @pytest.mark.asyncio
+    async def test_pulls_async_input_lazily(self):
+        """Test that no more than max_concurrent items are pulled ahead."""
+        executor = AsyncParallelExecutor(max_concurrent=2)
+        pulled = []
+        running = 0
+        peak = 0
+
+        async def source():
+            for i in range(6):
+                pulled.append(i)
+                yield i
+
+        async def work(item):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return item
+
+        stream = executor.imap(work, source())
+        first = await stream.__anext__()
+        assert first.status == TaskStatus.COMPLETED
+        assert len(pulled) <= 3
+
+        rest = [r async for r in stream]
+
+        assert len(rest) == 5
+        assert peak == 2
+        assert executor.stream_metrics.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_per_item_timeout(self):
+        """Test that slow items fail with a timeout without blocking others."""
+        executor = AsyncParallelExecutor()
+
+        async def work(delay):
+            await asyncio.sleep(delay)
+            return delay
+
+        results = {r.task_id: r async for r in executor.imap(work, [1.0, 0.0], timeout=0.05)}
+
+        assert results["task_0"].status == TaskStatus.FAILED
+        assert isinstance(results["task_0"].error, asyncio.TimeoutError)
+        assert results["task_1"].status == TaskStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_cancel_on_error(self):
+        """Test that the first failure cancels in-flight work and stops input."""
+        executor = AsyncParallelExecutor(max_concurrent=2)
+
+        async def work(item):
+            if item == "bad":
+                raise ValueError("bad item")
+            await asyncio.sleep(1.0)
+            return item
+
+        results = [
+            r async for r in executor.imap(work, ["slow", "bad", "never"], cancel_on_error=True)
+        ]
+
+        statuses = {r.task_id: r.status for r in results}
+        assert statuses == {"task_1": TaskStatus.FAILED, "task_0": TaskStatus.CANCELLED}
+        assert executor.stream_metrics.started == 2
+
+    @pytest.mark.asyncio
+    async def test_metrics(self):
+        """Test throughput metrics after a run."""
+        executor = AsyncParallelExecutor(max_concurrent=4)
+
+        async def work(item):
+            if item == 3:
+                raise ValueError("boom")
+            return item
+
+        results = [r async for r in executor.imap(work, range(5))]
+        metrics = executor.stream_metrics.to_dict()
+
+        assert len(results) == 5
+        assert metrics["started"] == 5
+        assert metrics["completed"] == 4
+        assert metrics["failed"] == 1
+        assert metrics["in_flight"] == 0
+        assert metrics["throughput"] > 0
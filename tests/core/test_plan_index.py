@@ -0,0 +1,156 @@
+"""Tests for the structured plan index.
+
+This module contains tests for:
+- Building a PlanIndex from plan markdown (tasks, groups, complexity)
+- O(1) completion lookups and maintained counts
+- In-place checkbox toggles in memory and on disk
+- StateManager.load_plan_index / set_task_complete integration
+"""
+
+import pytest
+
+from claude_task_master.core.plan_index import PlanIndex
+from claude_task_master.core.task_group import TaskComplexity, parse_tasks_with_groups
+
+PLAN = """# Plan
+
+### PR 1: Schema – Fixes
+- [ ] `[coding]` Create migration
+- [x] `[quick]` Update model
+
+### PR 2: Services
+  - [X] Fix service spec
+- [ ] `[general]` Wire up café endpoint
+- [ ]
+
+Notes - [ ] not a task
+"""
+
+
+class TestPlanIndexBuild:
+    """Tests for building a PlanIndex."""
+
+    def test_tasks_and_counts(self):
+        """Test task descriptions, completion bits and counts."""
+        index = PlanIndex.from_text(PLAN)
+
+        assert index.total == 4
+        assert index.completed_count == 2
+        assert index.pending_count == 2
+        assert [index.is_complete(i) for i in range(4)] == [False, True, True, False]
+        assert index.description(3) == "`[general]` Wire up café endpoint"
+        assert not index.is_complete(99)
+
+    def test_groups_and_complexity(self):
+        """Test group membership and complexity tags."""
+        index = PlanIndex.from_text(PLAN)
+
+        assert [g.id for g in index.groups] == ["pr_1", "pr_2"]
+        assert index.get_group("pr_1").name == "Schema – Fixes"
+        assert index.tasks_in_group("pr_2") == [2, 3]
+        assert index.group_id(0) == "pr_1"
+        assert index.group_progress("pr_2") == (1, 2)
+        assert index.complexity(0) == TaskComplexity.CODING
+        assert index.complexity(1) == TaskComplexity.QUICK
+        assert index.complexity(2) == TaskComplexity.CODING  # Untagged default
+
+    def test_plan_without_groups_uses_default(self):
+        """Test that ungrouped tasks fall into the default group."""
+        index = PlanIndex.from_text("- [ ] one\n- [ ] two")
+
+        assert [g.id for g in index.groups] == ["default"]
+        assert index.tasks_in_group("default") == [0, 1]
+
+    def test_matches_parse_tasks_with_groups(self):
+        """Test that the task_group API is served by the index."""
+        tasks, groups = parse_tasks_with_groups(PLAN)
+        index = PlanIndex.from_text(PLAN)
+
+        assert [t.description for t in tasks] == index.descriptions
+        assert [t.is_complete for t in tasks] == [c for _, c in index.items()]
+        assert [g.task_indices for g in groups] == [[0, 1], [2, 3]]
+
+
+class TestPlanIndexToggle:
+    """Tests for in-place checkbox toggles."""
+
+    def test_set_complete_rewrites_only_the_mark(self):
+        """Test that toggling changes a single character of the text."""
+        index = PlanIndex.from_text(PLAN)
+
+        assert index.set_complete(3)
+        assert not index.set_complete(3)  # Already complete
+
+        expected = PLAN.replace("- [ ] `[general]`", "- [x] `[general]`")
+        assert index.text == expected
+        assert index.completed_count == 3
+
+    def test_clear_checkbox(self):
+        """Test unchecking an indented uppercase-X task."""
+        index = PlanIndex.from_text(PLAN)
+
+        assert index.set_complete(2, complete=False)
+
+        assert "  - [ ] Fix service spec" in index.text
+        assert index.completed_count == 1
+
+    def test_out_of_range(self):
+        """Test that toggling a missing task raises IndexError."""
+        with pytest.raises(IndexError):
+            PlanIndex.from_text(PLAN).set_complete(10)
+
+    def test_copy_is_independent(self):
+        """Test that toggling a copy leaves the original unchanged."""
+        index = PlanIndex.from_text(PLAN)
+        clone = index.copy()
+
+        clone.set_complete(0)
+
+        assert not index.is_complete(0)
+        assert index.text == PLAN
+
+    def test_write_mark_updates_file_in_place(self, temp_dir):
+        """Test that write_mark rewrites one byte of the plan file."""
+        plan_file = temp_dir / "plan.md"
+        plan_file.write_text(PLAN)
+        index = PlanIndex.from_text(PLAN)
+
+        index.set_complete(3)
+        index.write_mark(plan_file, 3)
+
+        assert plan_file.read_text() == index.text
+
+    def test_write_mark_rejects_changed_file(self, temp_dir):
+        """Test that a plan changed on disk isn't patched blindly."""
+        plan_file = temp_dir / "plan.md"
+        plan_file.write_text(PLAN + "- [ ] New task\n")
+        index = PlanIndex.from_text(PLAN)
+        index.set_complete(0)
+
+        with pytest.raises(ValueError, match="changed"):
+            index.write_mark(plan_file, 0)
+
+
+class TestStateManagerPlanIndex:
+    """Tests for StateManager plan index helpers."""
+
+    def test_set_task_complete(self, state_manager):
+        """Test toggling a task through StateManager."""
+        state_manager.state_dir.mkdir(exist_ok=True)
+        state_manager.save_plan(PLAN)
+
+        assert state_manager.set_task_complete(0)
+        assert not state_manager.set_task_complete(0)
+
+        index = state_manager.load_plan_index()
+        assert index.is_complete(0)
+        assert state_manager.load_plan().startswith("# Plan\n\n### PR 1: Schema – Fixes\n- [x]")
+
+    def test_load_plan_index_without_plan(self, state_manager):
+        """Test that a missing plan yields an empty index."""
+        state_manager.state_dir.mkdir(exist_ok=True)
+
+        index = state_manager.load_plan_index()
+
+        assert index.total == 0
+        assert state_manager.load_plan_tasks() == []
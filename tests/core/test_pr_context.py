@@ -4,7 +4,7 @@ This module tests:
 - CI failure saving
 - PR comment fetching and saving
 - Comment reply posting
-- Thread resolution
+- Batched reply/resolve mutations
 - Non-actionable comment filtering
 """
 
@@ -22,6 +22,7 @@ import pytest
 
 from claude_task_master.core.pr_context import PRContextManager
 from claude_task_master.core.state import StateManager
+from claude_task_master.github import GitHubClient
 
 # =============================================================================
 # Test Fixtures
@@ -39,11 +40,17 @@ def state_manager(tmp_path: Path) -> Generator[StateManager, None, None]:
 
 
 @pytest.fixture
-def mock_github_client() -> MagicMock:
-    """Create a mock GitHub client."""
-    client = MagicMock()
-    client.get_failed_run_logs.return_value = "Error: Test failed\nLine 42"
-    client.get_pr_status.return_value = MagicMock(check_details=[])
+def mock_github_client() -> GitHubClient:
+    """Create a GitHub client with its high-level calls mocked.
+
+    Raw GraphQL requests still run through the client's gh runner, so tests
+    fake them by patching ``subprocess.run``.
+    """
+    with patch("subprocess.run", return_value=MagicMock(returncode=0)):
+        client = GitHubClient(transport="gh")
+    client.get_failed_run_logs = MagicMock(return_value="Error: Test failed\nLine 42")
+    client.get_repo_name = MagicMock(return_value="owner/repo")
+    client.get_pr_status = MagicMock(return_value=MagicMock(check_details=[]))
     return client
 
 
@@ -60,6 +67,64 @@ def make_graphql_response(threads: list[dict[str, Any]]) -> dict[str, Any]:
     return {"data": {"repository": {"pullRequest": {"reviewThreads": {"nodes": threads}}}}}
 
 
+class FakeReviewThreadsGh:
+    """Fake ``gh`` serving review threads to the paginated, incremental sync.
+
+    Answers the cursor-paginated ``reviewThreads`` listing and the aliased
+    ``node`` comment lookups from a make_graphql_response() payload, and
+    records every command.
+    """
+
+    def __init__(self, response: dict[str, Any], page_size: int = 100) -> None:
+        self.threads = response["data"]["repository"]["pullRequest"]["reviewThreads"]["nodes"]
+        self.page_size = page_size
+        self.calls: list[list[str]] = []
+
+    @property
+    def fetched_thread_ids(self) -> list[str]:
+        """Thread IDs whose comments were requested, in order."""
+        return [
+            arg.split("=", 1)[1]
+            for cmd in self.calls
+            if "node(id:" in cmd[4]
+            for arg in cmd[5:]
+            if arg.startswith("id")
+        ]
+
+    def __call__(self, cmd: list[str], **kwargs: Any) -> MagicMock:
+        self.calls.append(cmd)
+        variables = dict(arg.split("=", 1) for arg in cmd[5:] if "=" in arg)
+        if "reviewThreads" in cmd[4]:
+            start = int(variables.get("cursor", 0))
+            page = self.threads[start : start + self.page_size]
+            nodes = [
+                {
+                    "id": t["id"],
+                    "isResolved": t["isResolved"],
+                    "comments": {
+                        "totalCount": len(t["comments"]["nodes"]),
+                        "nodes": [
+                            {"updatedAt": c.get("updatedAt", "2025-01-01T00:00:00Z")}
+                            for c in t["comments"]["nodes"]
+                        ],
+                    },
+                }
+                for t in page
+            ]
+            end = start + len(page)
+            page_info = {"hasNextPage": end < len(self.threads), "endCursor": str(end)}
+            connection = {"pageInfo": page_info, "nodes": nodes}
+            data = {"repository": {"pullRequest": {"reviewThreads": connection}}}
+            return MagicMock(stdout=json.dumps({"data": data}), returncode=0)
+        by_id = {t["id"]: t for t in self.threads}
+        data = {
+            f"t{name[2:]}": {"comments": by_id[value]["comments"]} if value in by_id else None
+            for name, value in variables.items()
+            if name.startswith("id")
+        }
+        return MagicMock(stdout=json.dumps({"data": data}), stderr="", returncode=0)
+
+
 # =============================================================================
 # Constructor Tests
 # =============================================================================
@@ -212,28 +277,24 @@ class TestSavePRComments:
             pr_context_manager.save_pr_comments(None)
             mock_run.assert_not_called()
 
-    def test_clears_old_comments(
+    def test_keeps_comments_when_fetch_fails(
         self,
         pr_context_manager: PRContextManager,
         state_manager: StateManager,
     ) -> None:
-        """Test that old comments are cleared before saving new ones."""
-        # Setup: create old comments
+        """Test that the last synced comments stay in place if a sync fails."""
         pr_dir = state_manager.get_pr_dir(123)
         comments_dir = pr_dir / "comments"
         comments_dir.mkdir(parents=True)
         old_file = comments_dir / "old_comment.txt"
         old_file.write_text("Old comment")
-        summary_file = pr_dir / "comments_summary.txt"
-        summary_file.write_text("Old summary")
 
         with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = Exception("Stop after cleanup")
-            pr_context_manager.save_pr_comments(123)
+            mock_run.side_effect = Exception("GitHub unavailable")
+            with patch("claude_task_master.core.pr_context.console"):
+                assert pr_context_manager.save_pr_comments(123) == 0
 
-        # Old files should be gone
-        assert not old_file.exists()
-        assert not summary_file.exists()
+        assert old_file.exists()
 
     def test_fetches_and_saves_comments(
         self,
@@ -263,10 +324,7 @@ class TestSavePRComments:
 
         with patch("subprocess.run") as mock_run:
             # First call: repo info
-            mock_run.side_effect = [
-                MagicMock(stdout="owner/repo\n"),
-                MagicMock(stdout=json.dumps(graphql_response)),
-            ]
+            mock_run.side_effect = FakeReviewThreadsGh(graphql_response)
 
             pr_context_manager.save_pr_comments(123)
 
@@ -317,10 +375,7 @@ class TestSavePRComments:
         )
 
         with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                MagicMock(stdout="owner/repo\n"),
-                MagicMock(stdout=json.dumps(graphql_response)),
-            ]
+            mock_run.side_effect = FakeReviewThreadsGh(graphql_response)
 
             pr_context_manager.save_pr_comments(123)
 
@@ -379,10 +434,7 @@ class TestSavePRComments:
         )
 
         with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                MagicMock(stdout="owner/repo\n"),
-                MagicMock(stdout=json.dumps(graphql_response)),
-            ]
+            mock_run.side_effect = FakeReviewThreadsGh(graphql_response)
 
             pr_context_manager.save_pr_comments(123)
 
@@ -409,6 +461,138 @@ class TestSavePRComments:
                 mock_console.warning.assert_called()
 
 
+# =============================================================================
+# Review Thread Sync Tests
+# =============================================================================
+
+
+def _thread(thread_id: str, body: str, updated_at: str = "2025-01-01T00:00:00Z") -> dict:
+    return {
+        "id": thread_id,
+        "isResolved": False,
+        "comments": {
+            "nodes": [
+                {
+                    "id": f"{thread_id}_c1",
+                    "author": {"login": "reviewer"},
+                    "body": body,
+                    "path": "src/app.py",
+                    "line": 7,
+                    "updatedAt": updated_at,
+                }
+            ]
+        },
+    }
+
+
+class TestReviewThreadSync:
+    """Tests for the paginated, incremental review-thread sync."""
+
+    def test_paginates_past_first_page(
+        self,
+        pr_context_manager: PRContextManager,
+        state_manager: StateManager,
+    ) -> None:
+        """Test that threads beyond the first page are not lost."""
+        threads = [_thread(f"t{n}", f"Please handle case number {n}") for n in range(250)]
+        fake = FakeReviewThreadsGh(make_graphql_response(threads))
+
+        with patch("subprocess.run", side_effect=fake):
+            assert pr_context_manager.save_pr_comments(123, _also_save_ci=False) == 250
+
+        listings = [cmd for cmd in fake.calls if "reviewThreads" in cmd[4]]
+        assert len(listings) == 3
+        assert listings[1][-2:] == ["-f", "cursor=100"]
+        assert len(fake.fetched_thread_ids) == 250
+        assert len(state_manager.load_review_threads(123)) == 250
+
+    def test_requests_run_through_client(
+        self,
+        pr_context_manager: PRContextManager,
+        mock_github_client: GitHubClient,
+    ) -> None:
+        """Test that listing and fetching use the client's runner (timeout, accounting)."""
+        fake = FakeReviewThreadsGh(make_graphql_response([_thread("t1", "A review comment")]))
+
+        with patch("subprocess.run", side_effect=fake) as mock_run:
+            pr_context_manager.save_pr_comments(123, _also_save_ci=False)
+
+        assert mock_run.call_count == 2
+        assert all(call.kwargs["timeout"] == 30 for call in mock_run.call_args_list)
+        assert mock_github_client.api_calls == 2
+
+    def test_listing_timeout_saves_nothing(
+        self,
+        pr_context_manager: PRContextManager,
+        state_manager: StateManager,
+    ) -> None:
+        """Test that a timed-out listing is reported instead of hanging the sync."""
+        with (
+            patch("subprocess.run", side_effect=subprocess.TimeoutExpired("gh", 30)),
+            patch("claude_task_master.core.pr_context.console") as mock_console,
+        ):
+            assert pr_context_manager.save_pr_comments(123, _also_save_ci=False) == 0
+
+        assert "timed out" in str(mock_console.warning.call_args)
+        assert state_manager.load_review_threads(123) == {}
+
+    def test_only_new_or_changed_threads_refetched(
+        self,
+        pr_context_manager: PRContextManager,
+        state_manager: StateManager,
+    ) -> None:
+        """Test that a second sync fetches and rewrites only what changed."""
+        threads = [
+            _thread("same", "This stays exactly the same"),
+            _thread("edited", "Original wording of the comment"),
+        ]
+        with patch(
+            "subprocess.run", side_effect=FakeReviewThreadsGh(make_graphql_response(threads))
+        ):
+            pr_context_manager.save_pr_comments(123, _also_save_ci=False)
+        comments_dir = state_manager.get_pr_dir(123) / "comments"
+        same_file = next(f for f in comments_dir.glob("*.txt") if "stays" in f.read_text())
+        same_mtime = same_file.stat().st_mtime_ns
+
+        threads[1] = _thread("edited", "Edited wording of the comment", "2025-01-02T00:00:00Z")
+        threads.append(_thread("new", "A brand new review comment"))
+        fake = FakeReviewThreadsGh(make_graphql_response(threads))
+        with (
+            patch("subprocess.run", side_effect=fake),
+            patch("claude_task_master.core.pr_context.console"),
+        ):
+            assert pr_context_manager.save_pr_comments(123, _also_save_ci=False) == 3
+
+        assert fake.fetched_thread_ids == ["edited", "new"]
+        assert same_file.stat().st_mtime_ns == same_mtime
+        context = state_manager.load_pr_context(123)
+        assert "Edited wording" in context
+        assert "Original wording" not in context
+
+    def test_removed_threads_dropped(
+        self,
+        pr_context_manager: PRContextManager,
+        state_manager: StateManager,
+    ) -> None:
+        """Test that resolved or deleted threads leave the comment set."""
+        threads = [_thread("kept", "Keep this one around please"), _thread("gone", "Delete me")]
+        with patch(
+            "subprocess.run", side_effect=FakeReviewThreadsGh(make_graphql_response(threads))
+        ):
+            pr_context_manager.save_pr_comments(123, _also_save_ci=False)
+
+        resolved = _thread("kept", "Keep this one around please")
+        resolved["isResolved"] = True
+        fake = FakeReviewThreadsGh(make_graphql_response([resolved]))
+        with patch("subprocess.run", side_effect=fake):
+            assert pr_context_manager.save_pr_comments(123, _also_save_ci=False) == 0
+
+        assert fake.fetched_thread_ids == []
+        assert not list((state_manager.get_pr_dir(123) / "comments").glob("*.txt"))
+        assert state_manager.load_review_threads(123)["kept"]["is_resolved"] is True
+        assert "gone" not in state_manager.load_review_threads(123)
+
+
 # =============================================================================
 # post_comment_replies Tests
 # =============================================================================
@@ -476,7 +660,9 @@ class TestPostCommentReplies:
             # Second call: get resolved threads (graphql)
             # Third call: post reply
             # Fourth call: resolve thread
-            mock_run.return_value = MagicMock(stdout=json.dumps(make_graphql_response([])))
+            mock_run.return_value = MagicMock(
+                stdout=json.dumps(make_graphql_response([])), returncode=0
+            )
 
             with patch("claude_task_master.core.pr_context.console"):
                 pr_context_manager.post_comment_replies(123)
@@ -512,8 +698,7 @@ class TestPostCommentReplies:
 
         with patch("subprocess.run") as mock_run:
             mock_run.side_effect = [
-                MagicMock(stdout="owner/repo\n"),  # repo info
-                MagicMock(stdout=json.dumps(resolved_response)),  # get resolved
+                MagicMock(stdout=json.dumps(resolved_response), returncode=0),  # get resolved
             ]
 
             with patch("claude_task_master.core.pr_context.console") as mock_console:
@@ -544,7 +729,9 @@ class TestPostCommentReplies:
         )
 
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(stdout=json.dumps(make_graphql_response([])))
+            mock_run.return_value = MagicMock(
+                stdout=json.dumps(make_graphql_response([])), returncode=0
+            )
 
             with patch("claude_task_master.core.pr_context.console"):
                 pr_context_manager.post_comment_replies(123)
@@ -576,7 +763,9 @@ class TestPostCommentReplies:
         )
 
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(stdout=json.dumps(make_graphql_response([])))
+            mock_run.return_value = MagicMock(
+                stdout=json.dumps(make_graphql_response([])), returncode=0
+            )
 
             with patch("claude_task_master.core.pr_context.console"):
                 pr_context_manager.post_comment_replies(123)
@@ -608,7 +797,9 @@ class TestPostCommentReplies:
         )
 
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(stdout=json.dumps(make_graphql_response([])))
+            mock_run.return_value = MagicMock(
+                stdout=json.dumps(make_graphql_response([])), returncode=0
+            )
 
             with patch("claude_task_master.core.pr_context.console"):
                 pr_context_manager.post_comment_replies(123)
@@ -643,7 +834,7 @@ class TestPostCommentReplies:
             nonlocal call_count
             call_count += 1
             if call_count <= 2:  # First two calls succeed (repo info, get resolved)
-                return MagicMock(stdout=json.dumps(make_graphql_response([])))
+                return MagicMock(stdout=json.dumps(make_graphql_response([])), returncode=0)
             # Third call (post reply) fails
             raise subprocess.CalledProcessError(1, "gh")
 
@@ -656,71 +847,133 @@ class TestPostCommentReplies:
 
 
 # =============================================================================
-# _post_thread_reply Tests
+# Batched Mutation Tests
 # =============================================================================
 
 
-class TestPostThreadReply:
-    """Tests for _post_thread_reply method."""
+def _mutation_result(stdout: dict[str, Any], returncode: int = 0) -> MagicMock:
+    return MagicMock(stdout=json.dumps(stdout), stderr="", returncode=returncode)
 
-    def test_posts_reply_via_graphql(self, pr_context_manager: PRContextManager) -> None:
-        """Test that reply is posted via GraphQL mutation."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock()
 
-            pr_context_manager._post_thread_reply("thread_id_123", "Reply body")
+def _write_resolutions(state_manager: StateManager, resolutions: list[dict[str, str]]) -> None:
+    resolve_file = state_manager.get_pr_dir(123) / "resolve-comments.json"
+    resolve_file.write_text(json.dumps({"resolutions": resolutions}))
 
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args
-        args = call_args[0][0]
 
-        assert "gh" in args
-        assert "graphql" in args
-        # Should contain mutation and thread ID
-        assert any("mutation" in str(a) for a in args)
-        assert any("thread_id_123" in str(a) for a in args)
+class TestBatchedMutations:
+    """Tests for packing replies and resolutions into aliased GraphQL mutations."""
 
-    def test_raises_on_subprocess_error(self, pr_context_manager: PRContextManager) -> None:
-        """Test that subprocess errors are raised."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.CalledProcessError(1, "gh")
+    def test_many_threads_take_few_requests(
+        self,
+        pr_context_manager: PRContextManager,
+        state_manager: StateManager,
+    ) -> None:
+        """Test that 45 fixed threads cost one query plus 3 reply and 3 resolve requests."""
+        _write_resolutions(
+            state_manager,
+            [{"thread_id": f"t{n}", "action": "fixed", "message": "Done"} for n in range(45)],
+        )
+
+        with (
+            patch.object(pr_context_manager, "_get_resolved_thread_ids", return_value=set()),
+            patch("subprocess.run", return_value=_mutation_result({"data": {}})) as mock_run,
+            patch("claude_task_master.core.pr_context.console"),
+        ):
+            pr_context_manager.post_comment_replies(123)
 
-            with pytest.raises(subprocess.CalledProcessError):
-                pr_context_manager._post_thread_reply("thread_id", "body")
+        queries = [call.args[0][4] for call in mock_run.call_args_list]
+        assert len(queries) == 6
+        assert all("addPullRequestReviewThreadReply" in q for q in queries[:3])
+        assert all("resolveReviewThread" in q for q in queries[3:])
+        assert "m19: addPullRequestReviewThreadReply" in queries[0]
+        assert "m20:" not in queries[0]
+        assert len(state_manager.get_addressed_threads(123)) == 45
+
+    def test_aliased_variables(self, pr_context_manager: PRContextManager) -> None:
+        """Test that each aliased mutation gets its own raw-string variables."""
+        with patch("subprocess.run", return_value=_mutation_result({"data": {}})) as mock_run:
+            errors = pr_context_manager._post_thread_replies({"a": "@first", "b": "second"})
+
+        cmd = mock_run.call_args.args[0]
+        assert errors == {"a": None, "b": None}
+        assert "$threadId1: ID!" in cmd[4]
+        assert "pullRequestReviewThreadId: $threadId1, body: $body1" in cmd[4]
+        assert cmd[5:] == [
+            *["-f", "threadId0=a", "-f", "body0=@first"],
+            *["-f", "threadId1=b", "-f", "body1=second"],
+        ]
+
+    def test_partial_failure_maps_to_threads(
+        self,
+        pr_context_manager: PRContextManager,
+        state_manager: StateManager,
+    ) -> None:
+        """Test that a failed reply is reported per thread and not resolved."""
+        _write_resolutions(
+            state_manager,
+            [
+                {"thread_id": "ok", "action": "fixed", "message": "Done"},
+                {"thread_id": "gone", "action": "fixed", "message": "Done"},
+            ],
+        )
+        reply_result = _mutation_result(
+            {
+                "data": {"m0": {"comment": {"id": "c1"}}, "m1": None},
+                "errors": [{"message": "Could not resolve to a node", "path": ["m1"]}],
+            },
+            returncode=1,
+        )
+        resolve_result = _mutation_result({"data": {"m0": {"thread": {"isResolved": True}}}})
 
+        with (
+            patch.object(pr_context_manager, "_get_resolved_thread_ids", return_value=set()),
+            patch("subprocess.run", side_effect=[reply_result, resolve_result]) as mock_run,
+            patch("claude_task_master.core.pr_context.console") as mock_console,
+        ):
+            pr_context_manager.post_comment_replies(123)
 
-# =============================================================================
-# resolve_thread Tests
-# =============================================================================
+        resolve_cmd = mock_run.call_args_list[1].args[0]
+        assert resolve_cmd[5:] == ["-f", "threadId0=ok"]
+        assert state_manager.get_addressed_threads(123) == {"ok"}
+        assert any(
+            "Could not resolve to a node" in str(c) for c in mock_console.warning.call_args_list
+        )
 
+    def test_request_failure_fails_whole_chunk(self, pr_context_manager: PRContextManager) -> None:
+        """Test that an unparseable response fails every thread in the chunk."""
+        failed = MagicMock(stdout="", stderr="HTTP 502", returncode=1)
 
-class TestResolveThread:
-    """Tests for resolve_thread method."""
+        with patch("subprocess.run", return_value=failed):
+            errors = pr_context_manager._resolve_threads(["a", "b"])
 
-    def test_resolves_thread_via_graphql(self, pr_context_manager: PRContextManager) -> None:
-        """Test that thread is resolved via GraphQL mutation."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock()
+        assert errors == {"a": "HTTP 502", "b": "HTTP 502"}
+
+    def test_runs_through_client(
+        self, pr_context_manager: PRContextManager, mock_github_client: GitHubClient
+    ) -> None:
+        """Test that mutations use the client's runner (timeout and call accounting)."""
+        with patch("subprocess.run", return_value=_mutation_result({"data": {}})) as mock_run:
+            pr_context_manager._resolve_threads(["a"])
 
-            pr_context_manager.resolve_thread("thread_to_resolve")
+        assert mock_run.call_args.kwargs["timeout"] == 30
+        assert mock_github_client.api_calls == 1
 
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args
-        args = call_args[0][0]
+    def test_timeout_fails_whole_chunk(self, pr_context_manager: PRContextManager) -> None:
+        """Test that a timed-out request fails every thread in the chunk."""
+        timeout = subprocess.TimeoutExpired("gh", 30)
 
-        assert "gh" in args
-        assert "graphql" in args
-        # Should contain resolve mutation
-        assert any("resolveReviewThread" in str(a) for a in args)
-        assert any("thread_to_resolve" in str(a) for a in args)
+        with patch("subprocess.run", side_effect=timeout):
+            errors = pr_context_manager._resolve_threads(["a", "b"])
 
-    def test_raises_on_subprocess_error(self, pr_context_manager: PRContextManager) -> None:
-        """Test that subprocess errors are raised."""
+        assert errors["a"] == errors["b"]
+        assert "timed out" in str(errors["a"])
+
+    def test_no_threads_no_requests(self, pr_context_manager: PRContextManager) -> None:
+        """Test that an empty batch makes no requests."""
         with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.CalledProcessError(1, "gh")
+            assert pr_context_manager._resolve_threads([]) == {}
 
-            with pytest.raises(subprocess.CalledProcessError):
-                pr_context_manager.resolve_thread("thread_id")
+        mock_run.assert_not_called()
 
 
 # =============================================================================
@@ -743,8 +996,7 @@ class TestGetResolvedThreadIds:
 
         with patch("subprocess.run") as mock_run:
             mock_run.side_effect = [
-                MagicMock(stdout="owner/repo\n"),  # repo info
-                MagicMock(stdout=json.dumps(graphql_response)),  # graphql query
+                MagicMock(stdout=json.dumps(graphql_response), returncode=0),  # graphql query
             ]
 
             result = pr_context_manager._get_resolved_thread_ids(123)
@@ -767,10 +1019,7 @@ class TestGetResolvedThreadIds:
         graphql_response = make_graphql_response([])
 
         with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                MagicMock(stdout="owner/repo\n"),
-                MagicMock(stdout=json.dumps(graphql_response)),
-            ]
+            mock_run.side_effect = FakeReviewThreadsGh(graphql_response)
 
             result = pr_context_manager._get_resolved_thread_ids(123)
 
@@ -902,15 +1151,11 @@ class TestActionEmojiMapping:
         def capture_post(*args, **kwargs):
             nonlocal posted_body
             cmd = args[0]
-            # Look for body parameter
-            for i, arg in enumerate(cmd):
-                if arg == "body=" or (isinstance(arg, str) and "body=" in arg):
-                    # Extract body from next arg or same arg
-                    if "body=" in arg:
-                        posted_body = arg.split("body=", 1)[1]
-                    elif i + 1 < len(cmd):
-                        posted_body = cmd[i + 1]
-            return MagicMock(stdout=json.dumps(make_graphql_response([])))
+            # Look for the (aliased) body variable of the batched reply mutation
+            for arg in cmd:
+                if isinstance(arg, str) and arg.startswith("body0="):
+                    posted_body = arg.split("=", 1)[1]
+            return MagicMock(stdout=json.dumps(make_graphql_response([])), returncode=0)
 
         with patch("subprocess.run") as mock_run:
             mock_run.side_effect = capture_post
@@ -959,10 +1204,7 @@ class TestPRContextIntegration:
         )
 
         with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                MagicMock(stdout="owner/repo\n"),
-                MagicMock(stdout=json.dumps(graphql_response)),
-            ]
+            mock_run.side_effect = FakeReviewThreadsGh(graphql_response)
             pr_context_manager.save_pr_comments(123)
 
         # Verify comments were saved
@@ -988,7 +1230,9 @@ class TestPRContextIntegration:
 
         # Step 3: Post replies
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(stdout=json.dumps(make_graphql_response([])))
+            mock_run.return_value = MagicMock(
+                stdout=json.dumps(make_graphql_response([])), returncode=0
+            )
 
             with patch("claude_task_master.core.pr_context.console"):
                 pr_context_manager.post_comment_replies(123)
@@ -1038,10 +1282,7 @@ class TestPRContextIntegration:
         )
 
         with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                MagicMock(stdout="owner/repo\n"),
-                MagicMock(stdout=json.dumps(graphql_response)),
-            ]
+            mock_run.side_effect = FakeReviewThreadsGh(graphql_response)
             pr_context_manager.save_pr_comments(123)
 
         # Verify both are in context
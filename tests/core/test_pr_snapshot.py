@@ -0,0 +1,257 @@
+"""Tests for per-cycle PR snapshots.
+
+This module tests PRSnapshotCache memoisation, and the GitHub calls a
+workflow cycle makes with and without shared snapshots.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from claude_task_master.core.pr_context import PRContextManager
+from claude_task_master.core.pr_snapshot import PRSnapshotCache
+from claude_task_master.core.state import StateManager
+from claude_task_master.github import GitHubClient, PRSnapshot, PRStatus
+
+
+def _snapshot(head_sha: str = "abc123", pr_number: int = 7) -> PRSnapshot:
+    status = PRStatus(
+        number=pr_number,
+        ci_state="FAILURE",
+        unresolved_threads=0,
+        check_details=[],
+        head_sha=head_sha,
+    )
+    return PRSnapshot(status=status)
+
+
+@pytest.fixture
+def github_client() -> MagicMock:
+    client = MagicMock()
+    client.get_pr_snapshot.side_effect = lambda pr: _snapshot(pr_number=pr)
+    return client
+
+
+# =============================================================================
+# PRSnapshotCache Tests
+# =============================================================================
+
+
+class TestPRSnapshotCache:
+    """Tests for memoising snapshots per cycle and logs per head SHA."""
+
+    def test_reused_within_cycle(self, github_client):
+        """Test that a snapshot is fetched once per PR per cycle."""
+        cache = PRSnapshotCache(github_client)
+        cache.begin_cycle()
+
+        first = cache.get(7)
+        assert cache.get(7) is first
+        cache.get(8)
+
+        assert github_client.get_pr_snapshot.call_count == 2
+        assert (cache.fetches, cache.hits) == (2, 1)
+
+    def test_refetched_next_cycle(self, github_client):
+        """Test that a new cycle fetches fresh PR data."""
+        cache = PRSnapshotCache(github_client)
+        cache.begin_cycle()
+        first = cache.get(7)
+        cache.begin_cycle()
+
+        assert cache.get(7) is not first
+        assert github_client.get_pr_snapshot.call_count == 2
+
+    def test_invalidate(self, github_client):
+        """Test that an invalidated PR is refetched within the same cycle."""
+        cache = PRSnapshotCache(github_client)
+        cache.begin_cycle()
+        cache.get(7)
+        cache.invalidate(7)
+        cache.get(7)
+
+        assert github_client.get_pr_snapshot.call_count == 2
+
+    def test_run_logs_memoised_per_head(self, github_client):
+        """Test that run logs are loaded once per head SHA and run."""
+        cache = PRSnapshotCache(github_client)
+        load = MagicMock(return_value="logs")
+
+        assert cache.run_logs("abc123", 1, load) == "logs"
+        assert cache.run_logs("abc123", 1, load) == "logs"
+        cache.run_logs("abc123", 2, load)
+
+        assert load.call_count == 2
+
+    def test_run_logs_dropped_when_head_moves(self, github_client):
+        """Test that logs of an old head are forgotten once the PR head changes."""
+        heads = iter(["abc123", "def456"])
+        github_client.get_pr_snapshot.side_effect = lambda pr: _snapshot(next(heads))
+        cache = PRSnapshotCache(github_client)
+        load = MagicMock(return_value="logs")
+
+        cache.begin_cycle()
+        cache.get(7)
+        cache.run_logs("abc123", 1, load)
+        cache.begin_cycle()
+        cache.get(7)  # New head commit
+        cache.run_logs("abc123", 1, load)
+
+        assert load.call_count == 2
+
+    def test_run_logs_failure_not_memoised(self, github_client):
+        """Test that a failed log load is retried."""
+        cache = PRSnapshotCache(github_client)
+        load = MagicMock(side_effect=[RuntimeError("boom"), "logs"])
+
+        with pytest.raises(RuntimeError):
+            cache.run_logs("abc123", 1, load)
+        assert cache.run_logs("abc123", 1, load) == "logs"
+
+
+# =============================================================================
+# GitHub Calls per Cycle Tests
+# =============================================================================
+
+
+class FakeGh:
+    """Fake ``gh`` for a PR with one failed check and one unresolved thread."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def _checks(self, with_run: bool) -> dict[str, Any]:
+        check: dict[str, Any] = {
+            "__typename": "CheckRun",
+            "name": "tests",
+            "status": "COMPLETED",
+            "conclusion": "FAILURE",
+            "detailsUrl": None,
+        }
+        if with_run:
+            check["checkSuite"] = {"workflowRun": {"databaseId": 987}}
+        rollup = {"state": "FAILURE", "contexts": {"nodes": [check]}}
+        return {"nodes": [{"commit": {"statusCheckRollup": rollup}}]}
+
+    def _threads(self) -> dict[str, Any]:
+        node = {
+            "id": "T1",
+            "isResolved": False,
+            "comments": {"totalCount": 1, "nodes": [{"updatedAt": "2025-01-01T00:00:00Z"}]},
+        }
+        return {"pageInfo": {"hasNextPage": False, "endCursor": None}, "nodes": [node]}
+
+    def popen(self, cmd: list[str], **kwargs: Any) -> MagicMock:
+        """Streamed commands (``gh run view --log-failed``)."""
+        self.calls.append(cmd)
+        process = MagicMock()
+        process.stdout = io.StringIO("FAILED test_x\n")
+        process.wait.return_value = 0
+        return process
+
+    def __call__(self, cmd: list[str], **kwargs: Any) -> MagicMock:
+        self.calls.append(cmd)
+        if cmd[:3] == ["gh", "repo", "view"]:
+            return MagicMock(returncode=0, stdout="owner/repo\n", stderr="")
+        if cmd[:3] == ["gh", "run", "list"]:
+            run = {
+                "databaseId": 987,
+                "name": "CI",
+                "status": "completed",
+                "conclusion": "failure",
+                "url": "https://example.com/runs/987",
+                "headBranch": "feature",
+                "event": "pull_request",
+            }
+            return MagicMock(returncode=0, stdout=json.dumps([run]), stderr="")
+        if cmd[:3] != ["gh", "api", "graphql"]:
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        query = cmd[4]
+        if "node(id:" in query:
+            comment = {
+                "id": "C1",
+                "author": {"login": "reviewer"},
+                "body": "Please rename this",
+                "path": "src/app.py",
+                "line": 3,
+            }
+            data: dict[str, Any] = {"t0": {"comments": {"nodes": [comment]}}}
+        else:
+            pr: dict[str, Any] = {"reviewThreads": self._threads()}
+            if "headRefOid" in query:
+                commits = self._checks(with_run="checkSuite" in query)
+                pr.update(state="OPEN", headRefOid="abc123", commits=commits)
+            data = {"repository": {"pullRequest": pr}}
+        return MagicMock(returncode=0, stdout=json.dumps({"data": data}), stderr="")
+
+
+class TestGitHubCallsPerCycle:
+    """Compare GitHub calls per cycle with and without shared snapshots."""
+
+    @pytest.fixture
+    def client(self) -> GitHubClient:
+        with patch("subprocess.run", return_value=MagicMock(returncode=0)):
+            return GitHubClient(transport="gh")
+
+    def _ci_failed_cycle(self, client: GitHubClient, state_dir: Path, shared: bool) -> int:
+        """Gather CI failure context for PR #7 and return the GitHub calls made."""
+        snapshots = PRSnapshotCache(client) if shared else None
+        pr_context = PRContextManager(StateManager(state_dir), client, snapshots=snapshots)
+        fake = FakeGh()
+        before = client.api_calls
+        with (
+            patch("subprocess.run", side_effect=fake),
+            patch("subprocess.Popen", side_effect=fake.popen),
+        ):
+            if snapshots is not None:
+                snapshots.begin_cycle()
+            pr_context.save_ci_failures(7)
+        assert client.api_calls - before == len(fake.calls)
+        return client.api_calls - before
+
+    def test_ci_failed_cycle_calls(self, client, tmp_path):
+        """Test that one snapshot replaces status, thread and run list queries."""
+        # The repository name is looked up once per process either way
+        with patch("subprocess.run", side_effect=FakeGh()):
+            client.get_repo_name()
+
+        # Threads listing, thread comments, gh run list, gh run view, status query
+        assert self._ci_failed_cycle(client, tmp_path / "before", shared=False) == 5
+        # Snapshot, thread comments, gh run view
+        assert self._ci_failed_cycle(client, tmp_path / "after", shared=True) == 3
+
+    def test_snapshot_cycle_saves_same_context(self, client, tmp_path):
+        """Test that both paths save the same comments and CI logs."""
+        with patch("subprocess.run", side_effect=FakeGh()):
+            client.get_repo_name()
+        self._ci_failed_cycle(client, tmp_path / "before", shared=False)
+        self._ci_failed_cycle(client, tmp_path / "after", shared=True)
+
+        def saved(state_dir: Path) -> list[str]:
+            pr_dir = StateManager(state_dir).get_pr_dir(7)
+            return sorted(p.read_text() for p in pr_dir.rglob("*.txt"))
+
+        assert saved(tmp_path / "before") == saved(tmp_path / "after")
+
+    def test_run_logs_reused_for_same_head(self, client, tmp_path):
+        """Test that a later cycle on the same head doesn't download logs again."""
+        snapshots = PRSnapshotCache(client)
+        pr_context = PRContextManager(StateManager(tmp_path), client, snapshots=snapshots)
+        fake = FakeGh()
+
+        with (
+            patch("subprocess.run", side_effect=fake),
+            patch("subprocess.Popen", side_effect=fake.popen),
+        ):
+            for _ in range(2):
+                snapshots.begin_cycle()
+                pr_context.save_ci_failures(7)
+
+        assert sum(cmd[:3] == ["gh", "run", "view"] for cmd in fake.calls) == 1
@@ -287,6 +287,32 @@ class TestExecutionTracker:
         assert "Cost Report" in report
         assert "Total Sessions: 1" in report
 
+    def test_cost_report_pr_polls(self):
+        """Test that PR polls and API quota burn appear in the cost report."""
+        tracker = ExecutionTracker()
+        tracker.record_pr_poll(42, quota_points=1)
+        tracker.record_pr_poll(42, unchanged=True, rate_limit_remaining=4990)
+        tracker.record_pr_poll(42, unchanged=True)
+
+        report = tracker.get_cost_report()
+
+        assert tracker.get_summary()["pr_polls"][42]["polls"] == 3
+        assert "PR #42: 3 polls (2 unchanged), 1 API points" in report
+        assert "REST Rate Limit Remaining: 4990" in report
+
+    def test_cost_report_github_calls_per_cycle(self):
+        """Test that GitHub calls per workflow cycle appear in the cost report."""
+        tracker = ExecutionTracker()
+        tracker.record_github_cycle("waiting_ci", 1)
+        tracker.record_github_cycle("waiting_ci", 2)
+        tracker.record_github_cycle("ci_failed", 3)
+
+        report = tracker.get_cost_report()
+
+        assert tracker.get_summary()["github_cycles"]["waiting_ci"]["calls"] == 3
+        assert "waiting_ci: 1.5 calls/cycle (3 calls in 2 cycles)" in report
+        assert "ci_failed: 3.0 calls/cycle (3 calls in 1 cycles)" in report
+
     def test_reset(self):
         """Test resetting tracker."""
         tracker = ExecutionTracker()
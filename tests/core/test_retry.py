@@ -0,0 +1,301 @@
+"""Tests for the shared retry engine.
+
+Tests cover:
+- Decorrelated-jitter delays, caps and Retry-After floors
+- Per-error-kind policies built from RateLimitConfig
+- Error and status classification
+- Retry-After / rate-limit header parsing
+- TokenBucket bursts, reservation order and shared pauses
+"""
+
+import math
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import pytest
+
+from claude_task_master.core.agent_exceptions import (
+    APIConnectionError,
+    APIRateLimitError,
+    APIServerError,
+    APITimeoutError,
+)
+from claude_task_master.core.rate_limit import RateLimitConfig
+from claude_task_master.core.retry import (
+    ErrorKind,
+    RetryPolicies,
+    RetryPolicy,
+    TokenBucket,
+    classify_error,
+    classify_status,
+    parse_retry_after,
+    retry_after_from_error,
+    status_code_from_error,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# =============================================================================
+# RetryPolicy Tests
+# =============================================================================
+
+
+class TestRetryPolicy:
+    """Tests for decorrelated-jitter delays."""
+
+    def test_delays_bounded_by_previous(self):
+        """Test each delay lies in [base, min(cap, previous * multiplier)]."""
+        policy = RetryPolicy(base=1.0, cap=20.0, multiplier=3.0)
+        rng = random.Random(42)
+
+        previous = None
+        for _ in range(50):
+            delay = policy.next_delay(previous, rng=rng)
+            assert 1.0 <= delay <= min(20.0, (previous or 1.0) * 3)
+            previous = delay
+
+    def test_jitter_spreads_delays(self):
+        """Test that concurrent retries don't all pick the same delay."""
+        policy = RetryPolicy(base=1.0, cap=30.0)
+        rng = random.Random(7)
+
+        delays = {round(policy.next_delay(4.0, rng=rng), 3) for _ in range(20)}
+
+        assert len(delays) > 10
+
+    def test_retry_after_is_a_floor(self):
+        """Test that a server hint longer than the jittered delay wins."""
+        policy = RetryPolicy(base=1.0, cap=5.0)
+
+        assert policy.next_delay(retry_after=42.0) == 42.0
+        assert 1.0 <= policy.next_delay(retry_after=0.5) <= 5.0
+
+    def test_retry_after_bounded(self):
+        """Test that absurd hints are clamped and can be ignored."""
+        assert RetryPolicy(max_retry_after=60.0).next_delay(retry_after=3600) == 60.0
+        assert RetryPolicy(respect_retry_after=False).next_delay(retry_after=3600) <= 30.0
+
+
+class TestRetryPolicies:
+    """Tests for per-error-kind policies."""
+
+    def test_from_rate_limit_config(self):
+        """Test that RateLimitConfig drives the policies."""
+        config = RateLimitConfig(initial_backoff=2.0, max_backoff=40.0, backoff_multiplier=2.0)
+
+        policies = RetryPolicies.from_rate_limit_config(config)
+
+        assert policies.server == RetryPolicy(base=2.0, cap=40.0, multiplier=2.0)
+        assert policies.rate_limit.base == 4.0
+        assert policies.timeout.cap == 20.0
+        assert policies.policy_for(ErrorKind.CONNECTION) is policies.connection
+
+    def test_backoff_tracks_sequence(self):
+        """Test that a Backoff feeds each delay into the next."""
+        backoff = RetryPolicies.uniform(base=1.0, cap=100.0).backoff(rng=random.Random(1))
+
+        first = backoff.next_delay(ErrorKind.SERVER)
+        second = backoff.next_delay(ErrorKind.SERVER)
+
+        assert backoff.attempts == 2
+        assert backoff.previous == second
+        assert 1.0 <= second <= first * 3
+
+
+# =============================================================================
+# Classification and Header Tests
+# =============================================================================
+
+
+class TestClassification:
+    """Tests for mapping errors and statuses to ErrorKinds."""
+
+    @pytest.mark.parametrize(
+        ("error", "kind"),
+        [
+            (APIRateLimitError(5.0), ErrorKind.RATE_LIMIT),
+            (APIServerError(503), ErrorKind.SERVER),
+            (APITimeoutError(30.0), ErrorKind.TIMEOUT),
+            (TimeoutError(), ErrorKind.TIMEOUT),
+            (APIConnectionError(OSError("reset")), ErrorKind.CONNECTION),
+            (ConnectionResetError(), ErrorKind.CONNECTION),
+            (ValueError("boom"), ErrorKind.OTHER),
+        ],
+    )
+    def test_classify_error(self, error, kind):
+        """Test exception classification."""
+        assert classify_error(error) is kind
+
+    def test_classify_status(self):
+        """Test that only 429 and transient 5xx are retryable."""
+        assert classify_status(429) is ErrorKind.RATE_LIMIT
+        assert classify_status(503) is ErrorKind.SERVER
+        assert classify_status(400) is None
+        assert classify_status(501) is None
+
+    def test_retry_after_from_error(self):
+        """Test hints from attributes and attached response headers."""
+        response = SimpleNamespace(headers={"retry-after": "9"})
+        sdk_error = SimpleNamespace(response=response)
+        wrapped = APIRateLimitError(None, sdk_error)  # type: ignore[arg-type]
+
+        assert retry_after_from_error(APIRateLimitError(3.0)) == 3.0
+        assert retry_after_from_error(wrapped) == 9.0
+        assert retry_after_from_error(ValueError()) is None
+
+    def test_status_code_from_error(self):
+        """Test status codes from attributes and attached responses, not messages."""
+        sdk_error = SimpleNamespace(response=SimpleNamespace(status_code=429))
+        wrapped = APIRateLimitError(None, sdk_error)  # type: ignore[arg-type]
+        server_error = SimpleNamespace(status_code=503)
+
+        assert status_code_from_error(server_error) == 503  # type: ignore[arg-type]
+        assert status_code_from_error(wrapped) == 429
+        assert status_code_from_error(ValueError("HTTP 429")) is None
+
+
+class TestParseRetryAfter:
+    """Tests for parsing server wait hints."""
+
+    def test_seconds_and_milliseconds(self):
+        """Test numeric Retry-After and retry-after-ms."""
+        assert parse_retry_after({"Retry-After": "30"}) == 30.0
+        assert parse_retry_after({"retry-after-ms": "1500", "Retry-After": "30"}) == 1.5
+
+    def test_http_date(self):
+        """Test an HTTP-date Retry-After."""
+        now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        later = format_datetime(datetime(2025, 1, 1, 12, 0, 45, tzinfo=timezone.utc), usegmt=True)
+
+        assert parse_retry_after({"Retry-After": later}, now=now.timestamp()) == 45.0
+
+    def test_rate_limit_reset(self):
+        """Test reset headers as delta seconds, Unix timestamps and ISO times."""
+        now = 1_700_000_000.0
+
+        assert parse_retry_after({"X-RateLimit-Reset": "20"}, now=now) == 20.0
+        assert parse_retry_after({"X-RateLimit-Reset": str(now + 60)}, now=now) == 60.0
+        assert parse_retry_after({"ratelimit-reset": str(now - 5)}, now=now) == 0.0
+        iso = datetime.fromtimestamp(now + 10, tz=timezone.utc).isoformat()
+        assert parse_retry_after({"X-RateLimit-Reset": iso}, now=now) == pytest.approx(10.0)
+
+    def test_missing_or_invalid(self):
+        """Test that unusable headers give None."""
+        assert parse_retry_after({}) is None
+        assert parse_retry_after({"Retry-After": "soon"}) is None
+
+
+# =============================================================================
+# TokenBucket Tests
+# =============================================================================
+
+
+class TestTokenBucket:
+    """Tests for the shared rate limiter."""
+
+    def test_burst_then_rate(self):
+        """Test that capacity requests go at once and the rest queue at rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=3, clock=clock)
+
+        waits = [bucket.reserve() for _ in range(5)]
+
+        assert waits == [0.0, 0.0, 0.0, 0.5, 1.0]
+
+    def test_refills_over_time(self):
+        """Test that tokens come back at rate, up to capacity."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+
+        clock.now += 10
+        assert bucket.reserve() == 0.0
+        assert bucket.stats()["tokens"] == 1.0
+
+    def test_pause_staggers_all_callers(self):
+        """Test that after a 429 everyone waits, then resumes one at a time."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=5, clock=clock)
+
+        bucket.pause(30.0)
+        waits = [bucket.reserve() for _ in range(3)]
+
+        assert waits == [31.0, 32.0, 33.0]
+        assert bucket.paused_for == 30.0
+
+    def test_shorter_pause_ignored(self):
+        """Test that a shorter pause doesn't cut an active one short."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=1, clock=clock)
+
+        bucket.pause(30.0)
+        bucket.pause(5.0)
+
+        assert bucket.paused_for == 30.0
+
+    def test_thread_safe_reservations(self):
+        """Test that concurrent reservations each get a distinct slot."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10.0, capacity=1, clock=clock)
+        waits: list[float] = []
+        lock = threading.Lock()
+
+        def reserve() -> None:
+            for _ in range(25):
+                wait = bucket.reserve()
+                with lock:
+                    waits.append(wait)
+
+        threads = [threading.Thread(target=reserve) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(round(w, 6) for w in waits) == [round(n / 10, 6) for n in range(100)]
+
+    def test_from_rate_limit_config(self):
+        """Test that the configured rate and burst size the bucket."""
+        bucket = TokenBucket.from_rate_limit_config(
+            RateLimitConfig(requests_per_second=5.0, burst=2)
+        )
+        assert (bucket.rate, bucket.capacity) == (5.0, 2)
+
+    def test_unthrottled_without_rate(self):
+        """Test that without a rate only pauses make callers wait."""
+        assert TokenBucket.from_rate_limit_config(RateLimitConfig()).rate == math.inf
+        clock = FakeClock()
+        bucket = TokenBucket(rate=math.inf, capacity=8, clock=clock)
+
+        assert [bucket.reserve() for _ in range(100)] == [0.0] * 100
+
+        bucket.pause(30.0)
+        assert [bucket.reserve() for _ in range(3)] == [30.0] * 3
+        clock.now += 30.0
+        assert bucket.reserve() == 0.0
+        assert bucket.stats()["tokens"] == bucket.capacity
+
+    def test_invalid_configuration(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError, match="positive"):
+            TokenBucket(rate=0, capacity=1)
+
+    async def test_acquire_sleeps_for_reservation(self):
+        """Test that acquire() waits out its reservation."""
+        bucket = TokenBucket(rate=100.0, capacity=1)
+
+        assert await bucket.acquire() == 0.0
+        assert 0 < await bucket.acquire() <= 0.01
@@ -0,0 +1,179 @@
+"""Tests for the process-wide state read cache.
+
+This module contains tests for:
+- StateReadCache hit/miss behaviour keyed on mtime and size
+- Racy-window protection for recently modified files
+- StateManager reads served from the cache and invalidated by writes
+"""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from claude_task_master.core.state import StateManager, TaskOptions
+from claude_task_master.core.state_cache import StateReadCache, get_state_read_cache
+
+
+def _age(path: Path, seconds: float = 60.0) -> None:
+    """Backdate a file's mtime so it is outside the racy window."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture(autouse=True)
+def clear_read_cache():
+    """Isolate the shared cache between tests."""
+    get_state_read_cache().clear()
+    yield
+    get_state_read_cache().clear()
+
+
+# =============================================================================
+# StateReadCache Tests
+# =============================================================================
+
+
+class TestStateReadCache:
+    """Tests for StateReadCache."""
+
+    def test_hit_for_unchanged_file(self, temp_dir):
+        """Test that an unchanged file is loaded once."""
+        path = temp_dir / "plan.md"
+        path.write_text("- [ ] one")
+        _age(path)
+        cache = StateReadCache()
+        loader = MagicMock(side_effect=path.read_text)
+
+        assert cache.get(path, "text", loader) == "- [ ] one"
+        assert cache.get(path, "text", loader) == "- [ ] one"
+
+        assert loader.call_count == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_miss_when_file_changes(self, temp_dir):
+        """Test that a changed mtime or size forces a reload."""
+        path = temp_dir / "plan.md"
+        path.write_text("- [ ] one")
+        _age(path, 120)
+        cache = StateReadCache()
+        cache.get(path, "text", path.read_text)
+
+        path.write_text("- [x] one")  # Same size, new mtime
+        _age(path, 60)
+
+        assert cache.get(path, "text", path.read_text) == "- [x] one"
+
+    def test_recently_modified_file_is_not_cached(self, temp_dir):
+        """Test that files inside the racy window are always re-read."""
+        path = temp_dir / "plan.md"
+        path.write_text("fresh")
+        cache = StateReadCache(racy_window=60.0)
+        loader = MagicMock(side_effect=path.read_text)
+
+        cache.get(path, "text", loader)
+        cache.get(path, "text", loader)
+
+        assert loader.call_count == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_missing_file_is_not_cached(self, temp_dir):
+        """Test that the loader decides what a missing file means."""
+        cache = StateReadCache()
+
+        assert cache.get(temp_dir / "missing.md", "text", lambda: None) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_kinds_are_cached_separately(self, temp_dir):
+        """Test that one file can cache several parsed forms."""
+        path = temp_dir / "plan.md"
+        path.write_text("- [ ] one\n- [ ] two")
+        _age(path)
+        cache = StateReadCache()
+
+        text = cache.get(path, "text", path.read_text)
+        lines = cache.get(path, "lines", lambda: path.read_text().splitlines())
+
+        assert text.startswith("- [ ]")
+        assert len(lines) == 2
+        cache.invalidate(path)
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction(self, temp_dir):
+        """Test that the oldest entries are evicted beyond max_entries."""
+        cache = StateReadCache(max_entries=2)
+        for name in ("a", "b", "c"):
+            path = temp_dir / name
+            path.write_text(name)
+            _age(path)
+            cache.get(path, "text", path.read_text)
+
+        assert cache.stats()["entries"] == 2
+
+
+# =============================================================================
+# StateManager Integration Tests
+# =============================================================================
+
+
+class TestStateManagerReadCache:
+    """Tests for StateManager reads through the shared cache."""
+
+    def test_load_state_returns_independent_copies(self, state_manager):
+        """Test that mutating a loaded state doesn't affect the cache."""
+        state_manager.initialize(goal="goal", model="sonnet", options=TaskOptions())
+        _age(state_manager.state_file)
+
+        first = state_manager.load_state()
+        first.session_count = 99
+        second = state_manager.load_state()
+
+        assert second.session_count == 0
+        assert StateManager.get_cache_stats()["hits"] >= 1
+
+    def test_save_state_invalidates(self, state_manager):
+        """Test that saving state is visible to the next load."""
+        state = state_manager.initialize(goal="goal", model="sonnet", options=TaskOptions())
+        _age(state_manager.state_file)
+        state_manager.load_state()
+
+        state.session_count = 3
+        state_manager.save_state(state)
+        _age(state_manager.state_file)
+
+        assert state_manager.load_state().session_count == 3
+
+    def test_save_plan_invalidates_plan_and_tasks(self, state_manager):
+        """Test that plan text and parsed tasks refresh after save_plan."""
+        state_manager.state_dir.mkdir(exist_ok=True)
+        state_manager.save_plan("- [ ] one")
+        _age(state_manager.state_dir / "plan.md")
+        assert state_manager.load_plan_tasks() == ["one"]
+
+        state_manager.save_plan("- [ ] one\n- [ ] two")
+
+        assert state_manager.load_plan() == "- [ ] one\n- [ ] two"
+        assert state_manager.load_plan_tasks() == ["one", "two"]
+
+    def test_repeated_plan_reads_hit_cache(self, state_manager):
+        """Test that polling an unchanged plan doesn't re-read it."""
+        state_manager.state_dir.mkdir(exist_ok=True)
+        state_manager.save_plan("- [ ] one")
+        _age(state_manager.state_dir / "plan.md")
+
+        for _ in range(5):
+            StateManager(state_manager.state_dir).load_plan()
+
+        stats = StateManager.get_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 4
+
+    def test_load_goal_missing_raises(self, state_manager):
+        """Test that a missing goal file still raises."""
+        state_manager.state_dir.mkdir(exist_ok=True)
+
+        with pytest.raises(FileNotFoundError):
+            state_manager.load_goal()
@@ -0,0 +1,130 @@
+"""Tests for state.json encoding and schema versioning.
+
+This module contains tests for:
+- Pretty and compact encodings with a schema version header
+- Decoding and migrating legacy (headerless) state files
+- StateManager writes in the configured format and transparent reads
+"""
+
+import json
+
+import pytest
+
+from claude_task_master.core import state_codec
+from claude_task_master.core.state import StateError, StateManager, TaskOptions
+from claude_task_master.core.state_codec import (
+    SCHEMA_VERSION_KEY,
+    STATE_SCHEMA_VERSION,
+    StateFormat,
+    StateSchemaError,
+    decode_state,
+    encode_state,
+)
+
+STATE = {"status": "working", "session_count": 3, "options": {"auto_merge": True}}
+
+
+# =============================================================================
+# Codec Tests
+# =============================================================================
+
+
+class TestStateCodec:
+    """Tests for encode_state / decode_state."""
+
+    def test_pretty_json_has_header_first(self):
+        """Test that the default format is indented with a leading header."""
+        encoded = encode_state(STATE).decode()
+
+        assert encoded.startswith('{\n  "schema_version": 2,')
+        assert json.loads(encoded)[SCHEMA_VERSION_KEY] == STATE_SCHEMA_VERSION
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_compact_round_trip(self, monkeypatch, use_orjson):
+        """Test compact encoding with and without orjson."""
+        if use_orjson and not state_codec.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(state_codec, "ORJSON_AVAILABLE", use_orjson)
+
+        encoded = encode_state(STATE, StateFormat.COMPACT)
+
+        assert b"\n" not in encoded
+        assert b": " not in encoded
+        assert decode_state(encoded) == STATE
+
+    def test_legacy_file_is_migrated(self):
+        """Test that headerless files are read as schema version 1."""
+        assert decode_state(json.dumps(STATE, indent=2)) == STATE
+
+    def test_newer_schema_rejected(self):
+        """Test that files from a newer claudetm are not misread."""
+        with pytest.raises(StateSchemaError, match="schema version 99"):
+            decode_state(json.dumps({SCHEMA_VERSION_KEY: 99, **STATE}))
+
+    def test_non_object_is_decode_error(self):
+        """Test that a JSON array is reported like a parse error."""
+        with pytest.raises(json.JSONDecodeError):
+            decode_state("[1, 2]")
+
+
+# =============================================================================
+# StateManager Integration Tests
+# =============================================================================
+
+
+class TestStateManagerFormats:
+    """Tests for StateManager reading and writing state formats."""
+
+    def test_compact_state_round_trip(self, state_dir):
+        """Test that compact state is written on one line and loads back."""
+        manager = StateManager(state_dir, state_format="compact")
+        manager.initialize(goal="goal", model="sonnet", options=TaskOptions())
+
+        raw = manager.state_file.read_text()
+        assert "\n" not in raw
+        assert manager.load_state().status == "planning"
+
+    def test_migrates_legacy_state_on_save(self, state_manager):
+        """Test that a pre-header state.json is read and rewritten with a header."""
+        state = state_manager.initialize(goal="goal", model="sonnet", options=TaskOptions())
+        legacy = state.model_dump()
+        state_manager.state_file.write_text(json.dumps(legacy, indent=2))
+
+        compact = StateManager(state_manager.state_dir, state_format=StateFormat.COMPACT)
+        loaded = compact.load_state()
+        compact.save_state(loaded)
+
+        data = json.loads(compact.state_file.read_text())
+        assert data[SCHEMA_VERSION_KEY] == STATE_SCHEMA_VERSION
+        assert data["run_id"] == legacy["run_id"]
+
+    def test_format_from_config(self, state_dir, monkeypatch):
+        """Test that the write format defaults to the configured one."""
+        from claude_task_master.core.config_loader import reset_config
+
+        monkeypatch.setenv("CLAUDETM_STATE_FORMAT", "compact")
+        reset_config()
+        try:
+            assert StateManager(state_dir).state_format == StateFormat.COMPACT
+        finally:
+            monkeypatch.delenv("CLAUDETM_STATE_FORMAT")
+            reset_config()
+
+    def test_newer_schema_raises_state_error(self, state_manager):
+        """Test that an unsupported schema doesn't trigger backup recovery."""
+        state_manager.state_dir.mkdir(exist_ok=True)
+        state_manager.state_file.write_text(json.dumps({SCHEMA_VERSION_KEY: 99, **STATE}))
+
+        with pytest.raises(StateError, match="Unsupported state file schema"):
+            state_manager.load_state()
+        assert not state_manager.backup_dir.exists()
+
+    def test_export_state_is_pretty(self, state_dir):
+        """Test that export_state indents compact state and drops the header."""
+        manager = StateManager(state_dir, state_format="compact")
+        manager.initialize(goal="goal", model="sonnet", options=TaskOptions())
+
+        exported = manager.export_state()
+
+        assert '\n  "status": "planning"' in exported
+        assert SCHEMA_VERSION_KEY not in exported
@@ -217,6 +217,31 @@ class TestPRContextMethods:
         # Check that / is replaced in filename
         assert "/" not in comment_files[0].name
 
+    def test_save_pr_comments_skips_unchanged_files(self, state_manager: StateManager) -> None:
+        """Test that re-saving the same comments doesn't rewrite their files."""
+        comments = [{"comment_id": "c1", "path": "a.py", "line": 3, "body": "Fix this"}]
+        state_manager.save_pr_comments(123, comments)
+        comment_file = next((state_manager.get_pr_dir(123) / "comments").glob("*.txt"))
+        mtime = comment_file.stat().st_mtime_ns
+
+        state_manager.save_pr_comments(123, comments)
+
+        assert comment_file.stat().st_mtime_ns == mtime
+
+    def test_review_threads_round_trip(self, state_manager: StateManager) -> None:
+        """Test saving and loading the local review-thread index."""
+        threads = {"t1": {"updated_at": "2025-01-01T00:00:00Z", "comment_count": 1}}
+
+        state_manager.save_review_threads(123, threads)
+
+        assert state_manager.load_review_threads(123) == threads
+
+    def test_review_threads_corrupt_index(self, state_manager: StateManager) -> None:
+        """Test that an unreadable index loads as empty."""
+        (state_manager.get_pr_dir(123) / "review_threads.json").write_text("{not json")
+
+        assert state_manager.load_review_threads(123) == {}
+
 
 class TestAddressedThreadsTracking:
     """Tests for addressed threads tracking (avoiding re-downloading replied comments)."""
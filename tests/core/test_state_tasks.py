@@ -106,27 +106,23 @@ class TestParsePlanTasks:
         tasks = state_manager._parse_plan_tasks(plan)
         assert tasks == ["Task #1: Complete step 2"]
 
-    def test_parse_tasks_lowercase_x_only(self, state_manager):
-        """Test that only lowercase x is recognized.
-
-        Note: The current implementation only supports lowercase x for checked items.
-        Uppercase X is not recognized as a checked task marker.
-        """
+    def test_parse_tasks_lowercase_x(self, state_manager):
+        """Test that lowercase x is recognized."""
         plan = """- [ ] Unchecked
 - [x] Lowercase x
 """
         tasks = state_manager._parse_plan_tasks(plan)
         assert tasks == ["Unchecked", "Lowercase x"]
 
-    def test_parse_tasks_uppercase_x_not_recognized(self, state_manager):
-        """Test that uppercase X is not recognized as a task marker.
+    def test_parse_tasks_uppercase_x_recognized(self, state_manager):
+        """Test that uppercase X is recognized, matching the PR group parser.
 
-        This documents current behavior - uppercase X is NOT supported.
+        Task indices must line up with parse_tasks_with_groups, which has
+        always accepted [X].
         """
         plan = "- [X] Task with uppercase X"
         tasks = state_manager._parse_plan_tasks(plan)
-        # Current implementation doesn't recognize uppercase X
-        assert tasks == []
+        assert tasks == ["Task with uppercase X"]
 
     def test_parse_tasks_with_special_characters(self, state_manager):
         """Test parsing tasks with special characters."""
@@ -716,6 +716,7 @@ class TestRunWorkSession:
         call_kwargs = mock_agent.run_work_session.call_args.kwargs
         assert "pr_group_info" in call_kwargs
         assert call_kwargs["pr_group_info"]["name"] == "Setup Changes"
+        assert call_kwargs["pr_group_info"]["group_id"] == "pr_1"
 
     @patch("claude_task_master.core.task_runner.get_current_branch")
     @patch("claude_task_master.core.task_runner.console")
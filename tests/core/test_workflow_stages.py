@@ -17,8 +17,11 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from claude_task_master.core.pr_snapshot import PRSnapshotCache
+from claude_task_master.core.progress_tracker import ExecutionTracker
 from claude_task_master.core.state import TaskOptions, TaskState
 from claude_task_master.core.workflow_stages import WorkflowStageHandler
+from claude_task_master.github.client_pr import PRChangeProbe, PRSnapshot, PRStatus
 
 # =============================================================================
 # Test Fixtures
@@ -439,6 +442,177 @@ class TestHandleWaitingCIStage:
         mock_sleep.assert_called_once()
 
 
+class TestAdaptiveCIPolling:
+    """Tests for change-probed, backed-off CI polling."""
+
+    @pytest.fixture
+    def pending_status(self, mock_pr_status):
+        """A pending PR status with a known head commit."""
+        mock_pr_status.state = "OPEN"
+        mock_pr_status.head_sha = "abc123"
+        mock_pr_status.ci_state = "PENDING"
+        mock_pr_status.checks_pending = 1
+        mock_pr_status.check_details = [{"name": "Build", "status": "IN_PROGRESS"}]
+        return mock_pr_status
+
+    @pytest.fixture
+    def mock_github_client(self, mock_github_client):
+        """A client on the HTTP transport, where change probes are cheap."""
+        mock_github_client.uses_http_transport = True
+        return mock_github_client
+
+    @patch("claude_task_master.core.workflow_stages.interruptible_sleep")
+    @patch("claude_task_master.core.workflow_stages.console")
+    def test_unchanged_probe_skips_full_query(
+        self,
+        mock_console,
+        mock_sleep,
+        mock_agent,
+        state_manager,
+        mock_github_client,
+        mock_pr_context,
+        basic_task_state,
+        pending_status,
+    ):
+        """Should reuse the cached status, back off and record unchanged polls."""
+        state_manager.state_dir.mkdir(exist_ok=True)
+        tracker = ExecutionTracker()
+        handler = WorkflowStageHandler(
+            agent=mock_agent,
+            state_manager=state_manager,
+            github_client=mock_github_client,
+            pr_context=mock_pr_context,
+            tracker=tracker,
+        )
+        basic_task_state.current_pr = 42
+        mock_github_client.get_pr_status.return_value = pending_status
+        mock_github_client.get_required_status_checks.return_value = []
+        mock_github_client.probe_pr_changes.return_value = PRChangeProbe(
+            changed=False, requests=3, not_modified=3, rate_limit_remaining=4900
+        )
+        mock_sleep.return_value = True
+
+        for _ in range(3):
+            handler.handle_waiting_ci_stage(basic_task_state)
+
+        mock_github_client.get_pr_status.assert_called_once()
+        waits = [call.args[0] for call in mock_sleep.call_args_list]
+        assert waits[0] == handler.CI_POLL_INTERVAL
+        assert waits[0] < waits[1] < waits[2]
+        polls = tracker.get_summary()["pr_polls"][42]
+        assert (polls["polls"], polls["unchanged_polls"], polls["quota_points"]) == (3, 2, 1)
+
+    @patch("claude_task_master.core.workflow_stages.interruptible_sleep")
+    @patch("claude_task_master.core.workflow_stages.console")
+    def test_changed_probe_fetches_full_status(
+        self,
+        mock_console,
+        mock_sleep,
+        workflow_handler,
+        state_manager,
+        basic_task_state,
+        mock_github_client,
+        pending_status,
+    ):
+        """Should run the full status query when the probe sees a change."""
+        state_manager.state_dir.mkdir(exist_ok=True)
+        basic_task_state.current_pr = 42
+        mock_github_client.get_pr_status.return_value = pending_status
+        mock_github_client.probe_pr_changes.return_value = PRChangeProbe(changed=True)
+        mock_sleep.return_value = True
+
+        workflow_handler.handle_waiting_ci_stage(basic_task_state)
+        workflow_handler.handle_waiting_ci_stage(basic_task_state)
+
+        assert mock_github_client.get_pr_status.call_count == 2
+        mock_github_client.probe_pr_changes.assert_called_once_with(42, "abc123")
+
+    @patch("claude_task_master.core.workflow_stages.interruptible_sleep")
+    @patch("claude_task_master.core.workflow_stages.console")
+    def test_gh_transport_skips_probe(
+        self,
+        mock_console,
+        mock_sleep,
+        workflow_handler,
+        state_manager,
+        basic_task_state,
+        mock_github_client,
+        pending_status,
+    ):
+        """Should run the full query every poll when probes would spawn gh."""
+        state_manager.state_dir.mkdir(exist_ok=True)
+        basic_task_state.current_pr = 42
+        mock_github_client.uses_http_transport = False
+        mock_github_client.get_pr_status.return_value = pending_status
+        mock_sleep.return_value = True
+
+        workflow_handler.handle_waiting_ci_stage(basic_task_state)
+        workflow_handler.handle_waiting_ci_stage(basic_task_state)
+
+        assert mock_github_client.get_pr_status.call_count == 2
+        mock_github_client.probe_pr_changes.assert_not_called()
+
+    @patch("claude_task_master.core.workflow_stages.interruptible_sleep")
+    @patch("claude_task_master.core.workflow_stages.console")
+    def test_gh_transport_unchanged_status_backs_off(
+        self,
+        mock_console,
+        mock_sleep,
+        workflow_handler,
+        state_manager,
+        basic_task_state,
+        mock_github_client,
+    ):
+        """Should back off when full queries return an unchanged in-progress PR."""
+        state_manager.state_dir.mkdir(exist_ok=True)
+        basic_task_state.current_pr = 42
+        mock_github_client.uses_http_transport = False
+        mock_github_client.get_required_status_checks.return_value = []
+
+        def in_progress(*args, **kwargs):
+            # A fresh, equal status per query, as the gh transport returns
+            return PRStatus(
+                number=42,
+                ci_state="PENDING",
+                unresolved_threads=0,
+                checks_pending=1,
+                check_details=[{"name": "Build", "status": "IN_PROGRESS"}],
+                head_sha="abc123",
+            )
+
+        mock_github_client.get_pr_status.side_effect = in_progress
+        mock_sleep.return_value = True
+
+        workflow_handler.handle_waiting_ci_stage(basic_task_state)
+        workflow_handler.handle_waiting_ci_stage(basic_task_state)
+
+        assert mock_github_client.get_pr_status.call_count == 2
+        waits = [call.args[0] for call in mock_sleep.call_args_list]
+        assert waits[0] == workflow_handler.CI_POLL_INTERVAL
+        assert waits[1] > waits[0]
+
+    @patch("claude_task_master.core.workflow_stages.console")
+    def test_merged_pr_drops_cached_status(
+        self,
+        mock_console,
+        workflow_handler,
+        state_manager,
+        basic_task_state,
+        mock_github_client,
+        pending_status,
+    ):
+        """Should forget the cached status of a PR found merged."""
+        state_manager.state_dir.mkdir(exist_ok=True)
+        basic_task_state.current_pr = 42
+        pending_status.state = "MERGED"
+        mock_github_client.get_pr_status.return_value = pending_status
+
+        workflow_handler.handle_waiting_ci_stage(basic_task_state)
+
+        assert basic_task_state.workflow_stage == "merged"
+        assert 42 not in workflow_handler._pr_status_cache
+
+
 # =============================================================================
 # Test Handle CI Failed Stage
 # =============================================================================
@@ -1118,3 +1292,63 @@ class TestWorkflowIntegration:
         assert basic_task_state.workflow_stage == "waiting_ci"
         assert basic_task_state.session_count == 2
         mock_agent.run_work_session.assert_called_once()
+
+
+# =============================================================================
+# Shared PR Snapshot Tests
+# =============================================================================
+
+
+class TestSharedPRSnapshots:
+    """Tests for stage handlers reading PR data from per-cycle snapshots."""
+
+    @pytest.fixture
+    def snapshots(self, mock_github_client):
+        status = PRStatus(
+            number=42, state="MERGED", ci_state="SUCCESS", unresolved_threads=0, check_details=[]
+        )
+        mock_github_client.get_pr_snapshot.return_value = PRSnapshot(status=status)
+        cache = PRSnapshotCache(mock_github_client)
+        cache.begin_cycle()
+        return cache
+
+    @pytest.fixture
+    def handler(self, mock_agent, state_manager, mock_github_client, mock_pr_context, snapshots):
+        state_manager.state_dir.mkdir(exist_ok=True)
+        return WorkflowStageHandler(
+            agent=mock_agent,
+            state_manager=state_manager,
+            github_client=mock_github_client,
+            pr_context=mock_pr_context,
+            snapshots=snapshots,
+        )
+
+    @patch("claude_task_master.core.workflow_stages.console")
+    def test_status_read_from_snapshot(
+        self, mock_console, handler, mock_github_client, snapshots, basic_task_state
+    ):
+        """Should use the cycle's snapshot instead of a separate status query."""
+        basic_task_state.current_pr = 42
+        snapshots.get(42)  # e.g. already fetched by the PR context this cycle
+
+        handler.handle_waiting_reviews_stage(basic_task_state)
+
+        assert basic_task_state.workflow_stage == "merged"
+        mock_github_client.get_pr_snapshot.assert_called_once_with(42)
+        mock_github_client.get_pr_status.assert_not_called()
+
+    @patch("claude_task_master.core.workflow_stages.interruptible_sleep")
+    @patch("claude_task_master.core.workflow_stages.console")
+    def test_snapshot_refetched_after_agent_session(
+        self, mock_console, mock_sleep, handler, mock_github_client, snapshots, basic_task_state
+    ):
+        """Should not reuse PR data from before the agent pushed fixes."""
+        basic_task_state.current_pr = 42
+        mock_sleep.return_value = True
+        snapshots.get(42)
+
+        with patch.object(WorkflowStageHandler, "_get_current_branch", return_value="main"):
+            handler.handle_addressing_reviews_stage(basic_task_state)
+        snapshots.get(42)
+
+        assert mock_github_client.get_pr_snapshot.call_count == 2
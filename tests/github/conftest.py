@@ -5,8 +5,14 @@ This module provides shared fixtures for all GitHub client tests, organized by:
 - GraphQL response fixtures (for PR status, review threads, CI checks)
 - Workflow run fixtures
 - Common subprocess mock fixtures
+- Fake GitHub API server (for the in-process HTTP transport)
 """
 
+import io
+import json
+import threading
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -413,8 +419,140 @@ def mock_subprocess_failure():
         yield mock_run
 
 
+def fake_log_process(stdout: str = "", returncode: int = 0, stderr: str = ""):
+    """Build a subprocess.Popen side effect for streamed gh commands.
+
+    The fake process yields ``stdout`` line by line and writes ``stderr`` to
+    the file passed as ``stderr=``, like a real process would.
+    """
+
+    def popen(cmd, **kwargs):
+        if stderr and kwargs.get("stderr") is not None:
+            kwargs["stderr"].write(stderr)
+        process = MagicMock()
+        process.args = cmd
+        process.stdout = io.StringIO(stdout)
+        process.wait.return_value = returncode
+        return process
+
+    return popen
+
+
 @pytest.fixture
 def mock_repo_info(github_client):
     """Provide a context manager that mocks _get_repo_info."""
     with patch.object(github_client, "_get_repo_info", return_value="owner/repo"):
         yield github_client
+
+
+# =============================================================================
+# Fake GitHub API Server
+# =============================================================================
+
+
+class FakeGitHubServer:
+    """Local stand-in for the GitHub API.
+
+    Answers ``POST /graphql`` with ``graphql_response`` and GETs with the
+    ``routes`` registered for their path; a GET carrying the route's ETag in
+    ``If-None-Match`` gets ``304 Not Modified``. Every request is recorded.
+    """
+
+    def __init__(self) -> None:
+        self.graphql_response: dict[str, Any] = {"data": {}}
+        self.routes: dict[str, tuple[int, Any, str | None]] = {}
+        self.requests: list[dict[str, Any]] = []
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def add_route(self, path: str, body: Any, status: int = 200, etag: str | None = None) -> None:
+        """Serve ``body`` as JSON for GETs of ``path``."""
+        self.routes[path] = (status, body, etag)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _send(self, status: int, body: Any, headers: dict[str, str]) -> None:
+                payload = b"" if body is None else json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _record(self, body: Any = None) -> None:
+                server.requests.append(
+                    {
+                        "method": self.command,
+                        "path": self.path,
+                        "headers": dict(self.headers),
+                        "json": body,
+                    }
+                )
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                self._record(json.loads(self.rfile.read(length) or b"null"))
+                if self.path != "/graphql":
+                    self._send(404, {"message": "Not Found"}, {})
+                    return
+                self._send(200, server.graphql_response, {})
+
+            def do_GET(self) -> None:
+                self._record()
+                if self.path not in server.routes:
+                    self._send(404, {"message": "Not Found"}, {})
+                    return
+                status, body, etag = server.routes[self.path]
+                headers = {"X-RateLimit-Remaining": "4999"}
+                if etag:
+                    headers["ETag"] = etag
+                    if self.headers.get("If-None-Match") == etag:
+                        self._send(304, None, headers)
+                        return
+                self._send(status, body, headers)
+
+        return Handler
+
+
+@pytest.fixture
+def fake_github() -> Generator[FakeGitHubServer, None, None]:
+    """Provide a running FakeGitHubServer."""
+    server = FakeGitHubServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def http_github_client(fake_github, monkeypatch):
+    """Provide a GitHubClient using the HTTP transport against fake_github.
+
+    The repository is "owner/repo" and ``subprocess.run`` fails the test if
+    anything spawns a process after construction.
+    """
+    monkeypatch.setenv("GH_TOKEN", "test-token")
+    from claude_task_master.github.client import GitHubClient
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+        client = GitHubClient(transport="http", api_url=fake_github.url)
+    with (
+        patch.object(client, "get_repo_name", return_value="owner/repo"),
+        patch("subprocess.run", side_effect=AssertionError("gh was spawned")),
+    ):
+        yield client
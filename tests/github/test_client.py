@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from claude_task_master.github import clear_repo_cache
 from claude_task_master.github.client import (
     GitHubAuthError,
     GitHubClient,
@@ -15,6 +16,8 @@ from claude_task_master.github.client import (
     PRStatus,
 )
 
+from .conftest import fake_log_process
+
 # =============================================================================
 # PRStatus Model Tests
 # =============================================================================
@@ -1125,6 +1128,7 @@ class TestGitHubClientGetRepoInfo:
             "CamelCase/RepoName",
         ]
         for expected in test_cases:
+            clear_repo_cache()
             with patch("subprocess.run") as mock_run:
                 mock_run.return_value = MagicMock(
                     returncode=0,
@@ -1143,6 +1147,60 @@ class TestGitHubClientGetRepoInfo:
             with pytest.raises(subprocess.CalledProcessError):
                 github_client._get_repo_info()
 
+    def test_get_repo_info_cached(self, github_client):
+        """Test that the repository name is looked up only once per process."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="owner/repo\n", stderr="")
+            assert github_client._get_repo_info() == "owner/repo"
+            assert GitHubClient().get_repo_name() == "owner/repo"
+
+        repo_views = [c for c in mock_run.call_args_list if c[0][0][:3] == ["gh", "repo", "view"]]
+        assert len(repo_views) == 1
+
+    def test_failed_lookup_not_cached(self, github_client):
+        """Test that a failed lookup is retried on the next call."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                subprocess.CalledProcessError(1, "gh repo view", stderr="network"),
+                MagicMock(returncode=0, stdout="owner/repo\n", stderr=""),
+            ]
+            with pytest.raises(subprocess.CalledProcessError):
+                github_client._get_repo_info()
+            assert github_client._get_repo_info() == "owner/repo"
+
+    def test_get_default_branch_cached(self, github_client):
+        """Test that the default branch is looked up once and cached."""
+        with (
+            patch.object(github_client, "get_repo_name", return_value="owner/repo"),
+            patch("subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(returncode=0, stdout="main\n", stderr="")
+            assert github_client.get_default_branch() == "main"
+            assert github_client.get_default_branch() == "main"
+
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args[0][0]
+        assert cmd[:4] == ["gh", "repo", "view", "owner/repo"]
+        assert ".defaultBranchRef.name" in cmd
+
+    def test_metadata_shared_across_directories(self, github_client, tmp_path, monkeypatch):
+        """Test that directories of one repository share its cached metadata."""
+        worktrees = [tmp_path / "a", tmp_path / "b"]
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = lambda cmd, **kwargs: MagicMock(
+                returncode=0,
+                stdout="owner/repo\n" if ".nameWithOwner" in cmd else "main\n",
+                stderr="",
+            )
+            for worktree in worktrees:
+                worktree.mkdir()
+                monkeypatch.chdir(worktree)
+                assert github_client.get_default_branch() == "main"
+
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        assert sum(".nameWithOwner" in cmd for cmd in commands) == 2  # Once per directory
+        assert sum(".defaultBranchRef.name" in cmd for cmd in commands) == 1
+
 
 # =============================================================================
 # Integration Tests
@@ -1696,12 +1754,7 @@ class TestGitHubClientGetFailedRunLogs:
         log_output = """test-job\tError: Test failed
 test-job\tAssertionError: expected True
 test-job\t  at test_file.py:42"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout=log_output,
-                stderr="",
-            )
+        with patch("subprocess.Popen", side_effect=fake_log_process(log_output)):
             logs = github_client.get_failed_run_logs(run_id=123)
 
             assert "Error: Test failed" in logs
@@ -1723,16 +1776,18 @@ test-job\t  at test_file.py:42"""
                 }
             ]
         )
-        with patch("subprocess.run") as mock_run:
-            # First call returns workflow runs, second returns logs
-            mock_run.side_effect = [
-                MagicMock(returncode=0, stdout=workflow_runs_response, stderr=""),
-                MagicMock(returncode=0, stdout=log_output, stderr=""),
-            ]
+        with (
+            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen", side_effect=fake_log_process(log_output)) as mock_popen,
+        ):
+            # gh run list returns workflow runs, the streamed gh run view returns logs
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout=workflow_runs_response, stderr=""
+            )
             result = github_client.get_failed_run_logs()
 
-            # Check that second call (log fetch) has correct args
-            call_args = mock_run.call_args_list[1][0][0]
+            # Check that the log fetch has correct args
+            call_args = mock_popen.call_args[0][0]
             assert "gh" in call_args
             assert "run" in call_args
             assert "view" in call_args
@@ -1746,28 +1801,21 @@ test-job\t  at test_file.py:42"""
         log_lines = [f"Line {i}: Some error message" for i in range(200)]
         log_output = "\n".join(log_lines)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout=log_output,
-                stderr="",
-            )
+        with patch("subprocess.Popen", side_effect=fake_log_process(log_output)):
             logs = github_client.get_failed_run_logs(run_id=123, max_lines=100)
 
-            # Should be truncated
-            assert "more lines" in logs
-            # Should only show first 100 lines
-            assert "Line 0:" in logs
-            assert "Line 99:" in logs or "Line 100:" not in logs.split("...")[0]
+            # Should be truncated to the last 100 lines
+            assert logs.startswith("... (100 lines omitted)")
+            assert "Line 99:" not in logs
+            assert "Line 100:" in logs
+            assert logs.endswith("Line 199: Some error message")
 
     def test_get_failed_run_logs_error(self, github_client):
         """Test handling of errors when getting logs."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=1,
-                stdout="",
-                stderr="Run not found",
-            )
+        with patch(
+            "subprocess.Popen",
+            side_effect=fake_log_process("", returncode=1, stderr="Run not found"),
+        ):
             logs = github_client.get_failed_run_logs(run_id=999)
 
             assert "Error getting logs" in logs
@@ -1775,16 +1823,11 @@ test-job\t  at test_file.py:42"""
     def test_get_failed_run_logs_short_output(self, github_client):
         """Test that short logs are not truncated."""
         log_output = "Line 1\nLine 2\nLine 3"
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout=log_output,
-                stderr="",
-            )
+        with patch("subprocess.Popen", side_effect=fake_log_process(log_output)):
             logs = github_client.get_failed_run_logs(run_id=123, max_lines=100)
 
             assert logs == "Line 1\nLine 2\nLine 3"
-            assert "more lines" not in logs
+            assert "lines omitted" not in logs
 
 
 # =============================================================================
@@ -6,6 +6,8 @@ from unittest.mock import MagicMock, patch
 from claude_task_master.github.client import PRStatus
 from claude_task_master.github.client_ci import WorkflowRun
 
+from .conftest import fake_log_process
+
 # =============================================================================
 # GitHubClient.get_workflow_runs Tests
 # =============================================================================
@@ -382,12 +384,7 @@ class TestGitHubClientGetFailedRunLogs:
         log_output = """test-job\tError: Test failed
 test-job\tAssertionError: expected True
 test-job\t  at test_file.py:42"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout=log_output,
-                stderr="",
-            )
+        with patch("subprocess.Popen", side_effect=fake_log_process(log_output)):
             logs = github_client.get_failed_run_logs(run_id=123)
 
             assert "Error: Test failed" in logs
@@ -409,16 +406,18 @@ test-job\t  at test_file.py:42"""
                 }
             ]
         )
-        with patch("subprocess.run") as mock_run:
-            # First call returns workflow runs, second returns logs
-            mock_run.side_effect = [
-                MagicMock(returncode=0, stdout=workflow_runs_response, stderr=""),
-                MagicMock(returncode=0, stdout=log_output, stderr=""),
-            ]
+        with (
+            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen", side_effect=fake_log_process(log_output)) as mock_popen,
+        ):
+            # gh run list returns workflow runs, the streamed gh run view returns logs
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout=workflow_runs_response, stderr=""
+            )
             result = github_client.get_failed_run_logs()
 
-            # Check that second call (log fetch) has correct args
-            call_args = mock_run.call_args_list[1][0][0]
+            # Check that the log fetch has correct args
+            call_args = mock_popen.call_args[0][0]
             assert "gh" in call_args
             assert "run" in call_args
             assert "view" in call_args
@@ -432,28 +431,21 @@ test-job\t  at test_file.py:42"""
         log_lines = [f"Line {i}: Some error message" for i in range(200)]
         log_output = "\n".join(log_lines)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout=log_output,
-                stderr="",
-            )
+        with patch("subprocess.Popen", side_effect=fake_log_process(log_output)):
             logs = github_client.get_failed_run_logs(run_id=123, max_lines=100)
 
-            # Should be truncated
-            assert "more lines" in logs
-            # Should only show first 100 lines
-            assert "Line 0:" in logs
-            assert "Line 99:" in logs or "Line 100:" not in logs.split("...")[0]
+            # Should be truncated to the last 100 lines
+            assert logs.startswith("... (100 lines omitted)")
+            assert "Line 99:" not in logs
+            assert "Line 100:" in logs
+            assert logs.endswith("Line 199: Some error message")
 
     def test_get_failed_run_logs_error(self, github_client):
         """Test handling of errors when getting logs."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=1,
-                stdout="",
-                stderr="Run not found",
-            )
+        with patch(
+            "subprocess.Popen",
+            side_effect=fake_log_process("", returncode=1, stderr="Run not found"),
+        ):
             logs = github_client.get_failed_run_logs(run_id=999)
 
             assert "Error getting logs" in logs
@@ -461,32 +453,22 @@ test-job\t  at test_file.py:42"""
     def test_get_failed_run_logs_short_output(self, github_client):
         """Test that short logs are not truncated."""
         log_output = "Line 1\nLine 2\nLine 3"
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout=log_output,
-                stderr="",
-            )
+        with patch("subprocess.Popen", side_effect=fake_log_process(log_output)):
             logs = github_client.get_failed_run_logs(run_id=123, max_lines=100)
 
             assert logs == "Line 1\nLine 2\nLine 3"
-            assert "more lines" not in logs
+            assert "lines omitted" not in logs
 
     def test_get_failed_run_logs_exact_limit(self, github_client):
         """Test logs at exactly the limit."""
         log_lines = [f"Line {i}" for i in range(100)]
         log_output = "\n".join(log_lines)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout=log_output,
-                stderr="",
-            )
+        with patch("subprocess.Popen", side_effect=fake_log_process(log_output)):
             logs = github_client.get_failed_run_logs(run_id=123, max_lines=100)
 
             # Should not be truncated at exactly the limit
-            assert "more lines" not in logs
+            assert "lines omitted" not in logs
 
     def test_get_failed_run_logs_various_error_formats(self, github_client):
         """Test logs with various error message formats."""
@@ -496,12 +478,7 @@ test\tFAILED tests/test_main.py::test_function - AssertionError
 test\tTraceback (most recent call last):
 test\t  File "test_main.py", line 42, in test_function
 test\t    assert result == expected"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout=log_output,
-                stderr="",
-            )
+        with patch("subprocess.Popen", side_effect=fake_log_process(log_output)):
             logs = github_client.get_failed_run_logs(run_id=123)
 
             assert "ERROR" in logs
@@ -0,0 +1,139 @@
+"""Tests for conditional (ETag) requests and PR change probes."""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from claude_task_master.github.client import GitHubError
+from claude_task_master.github.conditional import ETagCache, parse_http_response
+
+
+def _gh_output(status: str, body: str = "", etag: str | None = None, remaining: int = 4999):
+    """Build `gh api --include` output."""
+    headers = [f"HTTP/2.0 {status}", "Content-Type: application/json"]
+    if etag:
+        headers.append(f"Etag: {etag}")
+    headers.append(f"X-Ratelimit-Remaining: {remaining}")
+    return MagicMock(
+        spec=subprocess.CompletedProcess,
+        returncode=0,
+        stdout="\r\n".join(headers) + "\r\n\r\n" + body,
+        stderr="",
+    )
+
+
+# =============================================================================
+# Response Parsing and Cache Tests
+# =============================================================================
+
+
+class TestParseHttpResponse:
+    """Tests for splitting gh api --include output."""
+
+    def test_status_headers_body(self):
+        """Test parsing a full response."""
+        status, headers, body = parse_http_response(
+            'HTTP/2.0 200 OK\r\nETag: W/"abc"\r\n\r\n{"a": 1}'
+        )
+
+        assert status == 200
+        assert headers["etag"] == 'W/"abc"'
+        assert body == '{"a": 1}'
+
+    def test_unparseable(self):
+        """Test output without a status line."""
+        assert parse_http_response("")[0] is None
+
+
+class TestETagCache:
+    """Tests for the ETag cache."""
+
+    def test_oldest_evicted(self):
+        """Test that the cache is bounded."""
+        cache = ETagCache(max_entries=2)
+        for name in ("a", "b", "c"):
+            cache.put(name, f'"{name}"', {})
+
+        assert cache.get("a") is None
+        assert cache.get("c") == ('"c"', {})
+        assert len(cache) == 2
+
+
+# =============================================================================
+# Conditional GET Tests
+# =============================================================================
+
+
+class TestApiGetConditional:
+    """Tests for GitHubClient._api_get_conditional."""
+
+    def test_etag_sent_and_304_reuses_body(self, github_client):
+        """Test that a repeat request sends If-None-Match and reuses the body on 304."""
+        responses = [
+            _gh_output("200 OK", '{"state": "open"}', etag='W/"v1"'),
+            _gh_output("304 Not Modified", remaining=4998),
+        ]
+        with patch("subprocess.run", side_effect=responses) as mock_run:
+            first = github_client._api_get_conditional("repos/o/r/pulls/1")
+            second = github_client._api_get_conditional("repos/o/r/pulls/1")
+
+        assert not first.not_modified
+        assert second.not_modified
+        assert second.data == {"state": "open"}
+        assert second.rate_limit_remaining == 4998
+        second_cmd = mock_run.call_args_list[1][0][0]
+        assert second_cmd[-2:] == ["-H", 'If-None-Match: W/"v1"']
+
+    def test_error_status_raises(self, github_client):
+        """Test that HTTP errors raise GitHubError."""
+        response = _gh_output("404 Not Found", '{"message": "Not Found"}')
+        response.returncode = 1
+        with patch("subprocess.run", return_value=response):
+            with pytest.raises(GitHubError):
+                github_client._api_get_conditional("repos/o/r/pulls/999")
+
+
+class TestProbePRChanges:
+    """Tests for GitHubClient.probe_pr_changes."""
+
+    def test_unchanged_after_first_probe(self, github_client):
+        """Test that the first probe reports a change and an all-304 probe doesn't."""
+        first = [_gh_output("200 OK", "{}", etag=f'"{n}"') for n in ("pr", "runs", "status")]
+        second = [_gh_output("304 Not Modified", remaining=4990) for _ in range(3)]
+
+        with (
+            patch.object(github_client, "_get_repo_info", return_value="o/r"),
+            patch("subprocess.run", side_effect=first + second) as mock_run,
+        ):
+            initial = github_client.probe_pr_changes(7, "abc123")
+            repeat = github_client.probe_pr_changes(7, "abc123")
+
+        assert initial.changed
+        assert initial.quota_points == 3
+        assert not repeat.changed
+        assert repeat.quota_points == 0
+        assert repeat.rate_limit_remaining == 4990
+        endpoints = [call[0][0][3] for call in mock_run.call_args_list[:3]]
+        assert endpoints == [
+            "repos/o/r/pulls/7",
+            "repos/o/r/commits/abc123/check-runs?per_page=100",
+            "repos/o/r/commits/abc123/status",
+        ]
+
+    def test_any_change_reported(self, github_client):
+        """Test that one modified resource makes the probe report a change."""
+        github_client._etag_cache.put("repos/o/r/pulls/7", '"pr"', {})
+        responses = [
+            _gh_output("304 Not Modified"),
+            _gh_output("200 OK", "{}", etag='"runs2"'),
+            _gh_output("304 Not Modified"),
+        ]
+        with (
+            patch.object(github_client, "_get_repo_info", return_value="o/r"),
+            patch("subprocess.run", side_effect=responses),
+        ):
+            probe = github_client.probe_pr_changes(7, "abc123")
+
+        assert probe.changed
+        assert (probe.requests, probe.not_modified) == (3, 1)
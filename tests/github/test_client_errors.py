@@ -16,6 +16,8 @@ from claude_task_master.github.client import (
     PRStatus,
 )
 
+from .conftest import fake_log_process
+
 # =============================================================================
 # GitHubClient Initialization Error Tests
 # =============================================================================
@@ -217,8 +219,10 @@ class TestTimeoutErrors:
 
     def test_get_failed_run_logs_timeout(self, github_client):
         """Test failed run logs timeout returns error message."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.TimeoutExpired("gh run view", 60)
+        with patch(
+            "claude_task_master.github.client.stream_command",
+            side_effect=subprocess.TimeoutExpired("gh run view", 60),
+        ):
             result = github_client.get_failed_run_logs(run_id=123)
             assert "timed out" in result.lower() or "Error" in result
 
@@ -447,23 +451,16 @@ class TestGhCLICommandErrors:
 
     def test_get_failed_run_logs_run_not_found(self, github_client):
         """Test getting logs when run doesn't exist."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=1,
-                stdout="",
-                stderr="Run not found",
-            )
+        with patch(
+            "subprocess.Popen",
+            side_effect=fake_log_process("", returncode=1, stderr="Run not found"),
+        ):
             result = github_client.get_failed_run_logs(run_id=999999)
             assert "Error getting logs" in result
 
     def test_get_failed_run_logs_no_failed_jobs(self, github_client):
         """Test getting failed logs when no jobs failed."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="",  # No failed job logs
-                stderr="",
-            )
+        with patch("subprocess.Popen", side_effect=fake_log_process("")):
             result = github_client.get_failed_run_logs(run_id=123)
             # Should return empty or minimal output
             assert result == "" or "No" in result or result.strip() == ""
@@ -525,14 +522,15 @@ class TestErrorRecoveryAndEdgeCases:
                 }
             ]
         )
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                MagicMock(returncode=0, stdout=runs_response, stderr=""),
-                MagicMock(returncode=0, stdout="", stderr=""),  # No failed logs
-            ]
+        with (
+            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen", side_effect=fake_log_process("")) as mock_popen,
+        ):
+            mock_run.return_value = MagicMock(returncode=0, stdout=runs_response, stderr="")
             github_client.get_failed_run_logs()
             # Should use latest run as fallback
-            assert mock_run.call_count == 2
+            assert mock_run.call_count == 1
+            assert "123" in mock_popen.call_args[0][0]
 
     def test_get_failed_run_logs_without_run_id_no_runs(self, github_client):
         """Test getting failed logs without run_id when no runs exist."""
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from claude_task_master.github import clear_repo_cache
 from claude_task_master.github.client import (
     GitHubMergeError,
     GitHubTimeoutError,
@@ -208,6 +209,7 @@ class TestGitHubClientGetRepoInfo:
             "CamelCase/RepoName",
         ]
         for expected in test_cases:
+            clear_repo_cache()
             with patch("subprocess.run") as mock_run:
                 mock_run.return_value = MagicMock(
                     returncode=0,
@@ -476,6 +478,7 @@ class TestGitHubClientMergeEdgeCases:
             "ORG/REPO",
         ]
         for expected in test_cases:
+            clear_repo_cache()
             with patch("subprocess.run") as mock_run:
                 mock_run.return_value = MagicMock(
                     returncode=0,
@@ -670,6 +670,186 @@ class TestGitHubClientGetPRStatus:
                 assert "build" in names
 
 
+# =============================================================================
+# GitHubClient.run_graphql Tests
+# =============================================================================
+
+
+class TestGitHubClientRunGraphQL:
+    """Tests for running raw GraphQL documents through the client."""
+
+    def test_runs_document_with_variables(self, github_client):
+        """Test that the document and variables are passed to gh api graphql."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout='{"data": {}}', stderr="")
+            result = github_client.run_graphql("query { viewer { login } }", ["-f", "a=b"])
+
+        assert result.stdout == '{"data": {}}'
+        cmd = mock_run.call_args[0][0]
+        assert cmd == [
+            "gh",
+            "api",
+            "graphql",
+            "-f",
+            "query=query { viewer { login } }",
+            "-f",
+            "a=b",
+        ]
+        assert mock_run.call_args.kwargs["timeout"] == 30
+
+    def test_check_false_returns_failed_result(self, github_client):
+        """Test that check=False returns the result of a failed request."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=1, stdout='{"errors": []}', stderr="x")
+            result = github_client.run_graphql("mutation { x }", check=False)
+
+        assert result.returncode == 1
+
+    def test_timeout_raises(self, github_client):
+        """Test that a timeout raises GitHubTimeoutError."""
+        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("gh", 30)):
+            with pytest.raises(GitHubTimeoutError):
+                github_client.run_graphql("query { x }")
+
+
+# =============================================================================
+# GitHubClient.get_pr_snapshot Tests
+# =============================================================================
+
+
+def _snapshot_page(threads, has_next=False, cursor=None):
+    """Build one page of the PR snapshot GraphQL response."""
+    return {
+        "data": {
+            "repository": {
+                "pullRequest": {
+                    "state": "OPEN",
+                    "mergeable": "MERGEABLE",
+                    "mergeStateStatus": "CLEAN",
+                    "baseRefName": "main",
+                    "headRefOid": "abc123",
+                    "commits": {
+                        "nodes": [
+                            {
+                                "commit": {
+                                    "statusCheckRollup": {
+                                        "state": "FAILURE",
+                                        "contexts": {
+                                            "nodes": [
+                                                {
+                                                    "__typename": "CheckRun",
+                                                    "name": "tests",
+                                                    "status": "COMPLETED",
+                                                    "conclusion": "FAILURE",
+                                                    "detailsUrl": "https://example.com/1",
+                                                    "checkSuite": {
+                                                        "workflowRun": {"databaseId": 987}
+                                                    },
+                                                },
+                                                {
+                                                    "__typename": "StatusContext",
+                                                    "context": "ci/external",
+                                                    "state": "SUCCESS",
+                                                    "targetUrl": None,
+                                                },
+                                            ]
+                                        },
+                                    }
+                                }
+                            }
+                        ]
+                    },
+                    "reviewThreads": {
+                        "pageInfo": {"hasNextPage": has_next, "endCursor": cursor},
+                        "nodes": threads,
+                    },
+                }
+            }
+        }
+    }
+
+
+def _thread_node(thread_id, resolved=False, updated="2025-01-01T00:00:00Z"):
+    return {
+        "id": thread_id,
+        "isResolved": resolved,
+        "comments": {"totalCount": 1, "nodes": [{"updatedAt": updated}]},
+    }
+
+
+class TestGitHubClientGetPRSnapshot:
+    """Tests for the combined PR snapshot query."""
+
+    def test_snapshot_in_one_query(self, github_client):
+        """Test that status, checks and thread markers come from one request."""
+        page = _snapshot_page([_thread_node("T1"), _thread_node("T2", resolved=True)])
+        with patch.object(github_client, "_get_repo_info", return_value="owner/repo"):
+            with patch("subprocess.run") as mock_run:
+                mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(page), stderr="")
+                snapshot = github_client.get_pr_snapshot(5)
+
+        mock_run.assert_called_once()
+        assert snapshot.head_sha == "abc123"
+        assert snapshot.status.mergeable == "MERGEABLE"
+        assert (snapshot.status.total_threads, snapshot.status.unresolved_threads) == (2, 1)
+        assert snapshot.review_threads[0] == {
+            "id": "T1",
+            "is_resolved": False,
+            "comment_count": 1,
+            "updated_at": "2025-01-01T00:00:00Z",
+        }
+        assert snapshot.status.check_details[0]["run_id"] == 987
+        assert "run_id" not in snapshot.status.check_details[1]
+
+    def test_snapshot_pages_review_threads(self, github_client):
+        """Test that more than one page of review threads is followed by cursor."""
+        pages = [
+            _snapshot_page([_thread_node("T1")], has_next=True, cursor="c1"),
+            _snapshot_page([_thread_node("T2")]),
+        ]
+        with patch.object(github_client, "_get_repo_info", return_value="owner/repo"):
+            with patch("subprocess.run") as mock_run:
+                mock_run.side_effect = [
+                    MagicMock(returncode=0, stdout=json.dumps(p), stderr="") for p in pages
+                ]
+                snapshot = github_client.get_pr_snapshot(5)
+
+        assert [t["id"] for t in snapshot.review_threads] == ["T1", "T2"]
+        assert snapshot.status.total_threads == 2
+        next_page = mock_run.call_args_list[1][0][0]
+        assert "cursor=c1" in next_page
+        # Later pages list only review threads, not the checks again
+        assert "statusCheckRollup" not in next_page[4]
+
+    def test_snapshot_counts_api_calls(self, github_client):
+        """Test that GitHub calls are counted on the client."""
+        page = _snapshot_page([])
+        before = github_client.api_calls
+        with patch.object(github_client, "_get_repo_info", return_value="owner/repo"):
+            with patch("subprocess.run") as mock_run:
+                mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(page), stderr="")
+                github_client.get_pr_snapshot(5)
+
+        assert github_client.api_calls == before + 1
+
+    def test_list_review_threads(self, github_client):
+        """Test that thread markers are listed page by page from a cursor."""
+        pages = [
+            _snapshot_page([_thread_node("T2")], has_next=True, cursor="c2"),
+            _snapshot_page([_thread_node("T3", resolved=True)]),
+        ]
+        with patch.object(github_client, "_get_repo_info", return_value="owner/repo"):
+            with patch("subprocess.run") as mock_run:
+                mock_run.side_effect = [
+                    MagicMock(returncode=0, stdout=json.dumps(p), stderr="") for p in pages
+                ]
+                threads = github_client.list_review_threads(5, after="c1")
+
+        assert [(t["id"], t["is_resolved"]) for t in threads] == [("T2", False), ("T3", True)]
+        assert mock_run.call_args_list[0][0][0][-2:] == ["-f", "cursor=c1"]
+        assert mock_run.call_args_list[1][0][0][-2:] == ["-f", "cursor=c2"]
+
+
 # =============================================================================
 # GitHubClient.get_pr_comments Tests
 # =============================================================================
@@ -0,0 +1,111 @@
+"""Tests for bounded, streaming capture of failed CI logs."""
+
+import subprocess
+import sys
+
+import pytest
+
+from claude_task_master.github.log_capture import FailedLogCapture, stream_command
+
+# =============================================================================
+# FailedLogCapture Tests
+# =============================================================================
+
+
+class TestFailedLogCapture:
+    """Tests for keeping the tail and error regions of each job."""
+
+    def test_short_log_kept_verbatim(self):
+        """Test that a log within the limit is returned unchanged."""
+        capture = FailedLogCapture(max_lines=10)
+        for line in ["build\tstep 1\n", "build\tstep 2\n"]:
+            capture.feed(line)
+
+        assert capture.render() == "build\tstep 1\nbuild\tstep 2"
+        assert capture.total_lines == 2
+
+    def test_keeps_tail_per_job(self):
+        """Test that each job keeps its own last lines."""
+        capture = FailedLogCapture(max_lines=2)
+        for i in range(5):
+            capture.feed(f"lint\tline {i}")
+            capture.feed(f"test\tline {i}")
+
+        assert capture.jobs == ["lint", "test"]
+        assert capture.render().split("\n") == [
+            "... (3 lines omitted)",
+            "lint\tline 3",
+            "lint\tline 4",
+            "... (3 lines omitted)",
+            "test\tline 3",
+            "test\tline 4",
+        ]
+
+    def test_keeps_traceback_far_from_end(self):
+        """Test that an early traceback survives a long tail of output."""
+        capture = FailedLogCapture(max_lines=20)
+        for i in range(10):
+            capture.feed(f"test\tsetup {i}")
+        capture.feed("test\tTraceback (most recent call last):")
+        capture.feed('test\t  File "app.py", line 3, in main')
+        capture.feed("test\tValueError: bad input")
+        for i in range(1000):
+            capture.feed(f"test\tcleanup {i}")
+
+        logs = capture.render()
+        assert "test\tsetup 6" not in logs
+        assert "test\tsetup 7" in logs  # Context before the traceback
+        assert "Traceback (most recent call last):" in logs
+        assert "ValueError: bad input" in logs
+        assert logs.endswith("test\tcleanup 999")
+        assert "... (7 lines omitted)" in logs
+
+    def test_memory_bounded(self):
+        """Test that the kept lines don't grow with the log."""
+        capture = FailedLogCapture(max_lines=20)
+        for i in range(50_000):
+            capture.feed(f"test\tERROR: failure {i}")
+
+        assert capture.total_lines == 50_000
+        # Up to max_lines of error regions plus max_lines of tail, plus markers
+        assert len(list(capture.lines())) <= 2 * 20 + 2
+
+    def test_empty_log(self):
+        """Test that an empty log renders as an empty string."""
+        assert FailedLogCapture().render() == ""
+
+
+# =============================================================================
+# stream_command Tests
+# =============================================================================
+
+
+class TestStreamCommand:
+    """Tests for piping a subprocess's stdout line by line."""
+
+    def test_streams_lines(self):
+        """Test that every stdout line reaches the callback."""
+        lines: list[str] = []
+        code = "import sys\nfor i in range(3): print(i)\nsys.stderr.write('warn')"
+
+        result = stream_command([sys.executable, "-c", code], lines.append, idle_timeout=30)
+
+        assert lines == ["0\n", "1\n", "2\n"]
+        assert result.returncode == 0
+        assert result.stdout == ""
+        assert result.stderr == "warn"
+
+    def test_reports_exit_code(self):
+        """Test that a failing command's exit code is returned, not raised."""
+        result = stream_command(
+            [sys.executable, "-c", "raise SystemExit(3)"], lambda line: None, idle_timeout=30
+        )
+
+        assert result.returncode == 3
+
+    def test_idle_timeout_kills_process(self):
+        """Test that a command without output is killed after the idle timeout."""
+        code = "import time; print('start', flush=True); time.sleep(30)"
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            stream_command([sys.executable, "-c", code], lambda line: None, idle_timeout=0.2)
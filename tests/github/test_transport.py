@@ -0,0 +1,212 @@
+"""Tests for the in-process GitHub HTTP transport.
+
+This module tests parsing of ``gh api`` command lines, and GitHubClient
+running against a local fake GitHub server with ``transport="http"``.
+"""
+
+import json
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from claude_task_master.github import transport as transport_module
+from claude_task_master.github.exceptions import GitHubError, GitHubTimeoutError
+from claude_task_master.github.transport import HttpTransport, _parse_gh_api, read_gh_token
+
+# =============================================================================
+# Command Parsing Tests
+# =============================================================================
+
+
+class TestParseGhApi:
+    """Tests for recognizing supported gh api invocations."""
+
+    def test_graphql_fields(self):
+        """Test that -f fields stay strings and -F fields are typed."""
+        call = _parse_gh_api(
+            ["gh", "api", "graphql", "-f", "query=q", "-F", "pr=12", "-F", "draft=true"]
+        )
+
+        assert call is not None
+        assert call.method == "POST"
+        assert call.fields == {"query": "q", "pr": 12, "draft": True}
+
+    def test_rest_get_with_jq_and_headers(self):
+        """Test a REST GET with a simple --jq path and a header."""
+        call = _parse_gh_api(
+            ["gh", "api", "-i", "repos/o/r", "--jq", ".a.b", "-H", "If-None-Match: x"]
+        )
+
+        assert call is not None
+        assert (call.endpoint, call.method, call.jq, call.include) == (
+            "repos/o/r",
+            "GET",
+            ".a.b",
+            True,
+        )
+        assert call.headers == {"If-None-Match": "x"}
+
+    @pytest.mark.parametrize(
+        "cmd",
+        [
+            ["gh", "pr", "view", "1"],
+            ["gh", "api", "repos/o/r/pulls", "--paginate"],
+            ["gh", "api", "repos/o/r", "--jq", ".[] | .name"],
+            ["gh", "api", "repos/o/r/issues", "-X", "POST", "-f", "title=t"],
+            ["gh", "api", "repos/{owner}/{repo}"],
+            ["gh", "api", "graphql", "-F", "query=@file.graphql"],
+        ],
+    )
+    def test_unsupported(self, cmd):
+        """Test that anything the transport can't mirror exactly is left to gh."""
+        assert _parse_gh_api(cmd) is None
+
+
+# =============================================================================
+# Token Tests
+# =============================================================================
+
+
+class TestReadGhToken:
+    """Tests for reading the token once per process."""
+
+    def test_env_token(self, monkeypatch):
+        """Test that GH_TOKEN is used without running gh."""
+        monkeypatch.setenv("GH_TOKEN", "env-token")
+        with patch("subprocess.run") as mock_run:
+            assert read_gh_token() == "env-token"
+        mock_run.assert_not_called()
+
+    def test_gh_auth_token_read_once(self, monkeypatch):
+        """Test that `gh auth token` runs only on the first call."""
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="gho_abc\n")
+            assert read_gh_token() == "gho_abc"
+            assert read_gh_token() == "gho_abc"
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["gh", "auth", "token"]
+
+    def test_no_token(self, monkeypatch):
+        """Test that a missing token raises GitHubError."""
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        with patch("subprocess.run", return_value=MagicMock(returncode=1, stdout="")):
+            with pytest.raises(GitHubError, match="No GitHub token"):
+                read_gh_token()
+
+
+# =============================================================================
+# GitHubClient over HTTP Tests
+# =============================================================================
+
+
+class TestHttpTransportClient:
+    """Tests for GitHubClient(transport="http") against a fake server."""
+
+    def test_reports_http_transport(self, http_github_client, github_client):
+        """Test that only the HTTP client reports in-process API calls."""
+        assert http_github_client.uses_http_transport is True
+        assert github_client.uses_http_transport is False
+
+    def test_get_pr_status(self, http_github_client, fake_github, graphql_pr_success_response):
+        """Test that the PR status query is answered without spawning gh."""
+        fake_github.graphql_response = graphql_pr_success_response
+
+        status = http_github_client.get_pr_status(42)
+
+        assert status.ci_state == "SUCCESS"
+        request = fake_github.requests[-1]
+        assert request["headers"]["Authorization"] == "Bearer test-token"
+        assert request["json"]["variables"] == {"owner": "owner", "repo": "repo", "pr": 42}
+        assert "pullRequest(number: $pr)" in request["json"]["query"]
+
+    def test_graphql_errors_raise(self, http_github_client, fake_github):
+        """Test that GraphQL errors become a failed command."""
+        fake_github.graphql_response = {"errors": [{"message": "Could not resolve"}]}
+
+        with pytest.raises(GitHubError, match="Could not resolve"):
+            http_github_client.get_pr_status(42)
+
+    def test_required_status_checks_cached(self, http_github_client, fake_github):
+        """Test --jq evaluation and that branch protection is fetched once."""
+        path = "/repos/owner/repo/branches/main/protection/required_status_checks"
+        fake_github.add_route(path, {"strict": True, "contexts": ["tests", "lint"]})
+
+        assert http_github_client.get_required_status_checks("main") == ["tests", "lint"]
+        assert http_github_client.get_required_status_checks("main") == ["tests", "lint"]
+
+        assert [r["path"] for r in fake_github.requests] == [path]
+
+    def test_unprotected_branch(self, http_github_client, fake_github):
+        """Test that a 404 from branch protection means no required checks."""
+        assert http_github_client.get_required_status_checks("main") == []
+
+    def test_conditional_get_not_modified(self, http_github_client, fake_github):
+        """Test that a repeated conditional GET is served from the ETag cache."""
+        fake_github.add_route("/repos/owner/repo/pulls/1", {"number": 1}, etag='"v1"')
+
+        first = http_github_client._api_get_conditional("repos/owner/repo/pulls/1")
+        second = http_github_client._api_get_conditional("repos/owner/repo/pulls/1")
+
+        assert (first.status, first.data, first.rate_limit_remaining) == (200, {"number": 1}, 4999)
+        assert second.not_modified and second.data == {"number": 1}
+        assert fake_github.requests[-1]["headers"]["If-None-Match"] == '"v1"'
+
+    def test_rest_error_raises(self, http_github_client, fake_github):
+        """Test that a REST error status raises GitHubError with gh's message format."""
+        with pytest.raises(GitHubError, match=r"Not Found \(HTTP 404\)"):
+            http_github_client._run_gh_command(["gh", "api", "repos/owner/missing"])
+
+    def test_unsupported_command_uses_gh(self, http_github_client, fake_github):
+        """Test that commands the transport doesn't handle still run through gh."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+            result = http_github_client._run_gh_command(["gh", "pr", "view", "1"])
+
+        assert result.stdout == "ok"
+        mock_run.assert_called_once()
+        assert fake_github.requests == []
+
+    def test_timeout(self):
+        """Test that an HTTP timeout surfaces like a gh timeout."""
+        client = MagicMock(spec=httpx.Client)
+        client.get.side_effect = httpx.ReadTimeout("slow")
+        transport = HttpTransport(token="t", client=client)
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            transport.run(["gh", "api", "repos/o/r"], timeout=1)
+
+    def test_timeout_maps_to_github_timeout_error(self, http_github_client):
+        """Test that GitHubClient reports transport timeouts as GitHubTimeoutError."""
+        with patch.object(
+            transport_module.HttpTransport,
+            "run",
+            side_effect=subprocess.TimeoutExpired(["gh"], 1),
+        ):
+            with pytest.raises(GitHubTimeoutError):
+                http_github_client._run_gh_command(["gh", "api", "repos/o/r"], timeout=1)
+
+    def test_missing_token_raises_github_error(self, http_github_client, monkeypatch):
+        """Test that GitHubClient callers catching GitHubError see a missing token."""
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        transport_module.clear_token_cache()
+
+        with patch("subprocess.run", return_value=MagicMock(returncode=1, stdout="")):
+            with pytest.raises(GitHubError, match="No GitHub token"):
+                http_github_client._run_gh_command(["gh", "api", "repos/o/r"])
+
+    def test_include_output_parses(self, http_github_client, fake_github):
+        """Test that --include output has gh's status line and headers."""
+        fake_github.add_route("/rate_limit", {"rate": {}})
+
+        result = http_github_client._run_gh_command(["gh", "api", "-i", "rate_limit"])
+
+        head, _, body = result.stdout.partition("\r\n\r\n")
+        assert head.startswith("HTTP/1.") and " 200 " in head.split("\r\n")[0]
+        assert json.loads(body) == {"rate": {}}
@@ -15,6 +15,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from claude_task_master.github import PRSnapshot, PRStatus
+
 # =============================================================================
 # Mock Claude Agent SDK Module
 # =============================================================================
@@ -755,7 +757,7 @@ def mock_github_client():
     mock = MagicMock()
     mock.create_pr = MagicMock(return_value=123)
     mock.get_pr_status = MagicMock(
-        return_value=MagicMock(
+        return_value=PRStatus(
             number=123,
             ci_state="SUCCESS",
             unresolved_threads=0,
@@ -766,11 +768,14 @@ def mock_github_client():
             checks_failed=0,
             checks_pending=0,
             checks_skipped=0,
-            mergeable=True,
-            merged=False,
+            mergeable="MERGEABLE",
             base_branch="main",
         )
     )
+    # Stage handlers read the status from the per-cycle snapshot
+    mock.get_pr_snapshot = MagicMock(
+        side_effect=lambda pr_number: PRSnapshot(status=mock.get_pr_status(pr_number))
+    )
     mock.get_pr_comments = MagicMock(return_value="")
     mock.merge_pr = MagicMock()
     mock.get_pr_for_current_branch = MagicMock(return_value=123)
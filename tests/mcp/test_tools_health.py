@@ -3,6 +3,7 @@
 Tests the health_check MCP tool implementation.
 """
 
+import json
 import time
 
 import pytest
@@ -70,3 +71,51 @@ class TestHealthCheckTool:
         # Should still return healthy even if state is corrupted
         assert result["status"] == "healthy"
         assert result["active_tasks"] == 0
+
+    def test_health_check_includes_circuit_breakers(self, temp_dir):
+        """Test health check reports sliding-window breaker snapshots."""
+        from claude_task_master.core.circuit_breaker import (
+            CircuitBreakerConfig,
+            CircuitBreakerRegistry,
+        )
+        from claude_task_master.mcp.tools import health_check
+
+        registry = CircuitBreakerRegistry()
+        registry.clear()
+        breaker = registry.get_or_create("github", CircuitBreakerConfig.windowed(minimum_calls=2))
+        breaker.record_outcome(success=False)
+
+        result = health_check(temp_dir, "test-server")
+
+        registry.clear()
+        info = result["circuit_breakers"]["github"]
+        assert info["mode"] == "sliding_window"
+        assert info["window"]["calls"] == 1
+        assert info["window"]["failure_rate"] == 100.0
+
+    def test_health_check_reads_published_breakers(self, temp_dir):
+        """Test health check reports breakers published by the runner process."""
+        from claude_task_master.core.circuit_breaker import (
+            CircuitBreaker,
+            CircuitBreakerRegistry,
+        )
+        from claude_task_master.mcp.tools import health_check
+
+        CircuitBreakerRegistry().clear()
+        state_dir = temp_dir / ".claude-task-master"
+        state_dir.mkdir(parents=True)
+        # Written by the runner; this process's registry stays empty
+        breaker = CircuitBreaker(name="claude_api")
+        breaker.force_open()
+        (state_dir / "circuit-breakers.json").write_text(
+            json.dumps(
+                {
+                    "updated_at": "2026-01-01T00:00:00",
+                    "breakers": {"claude_api": breaker.snapshot()},
+                }
+            )
+        )
+
+        result = health_check(temp_dir, "test-server")
+
+        assert result["circuit_breakers"]["claude_api"]["state"] == "open"
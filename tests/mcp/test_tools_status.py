@@ -117,3 +117,27 @@ class TestGetLogsTool:
         # Should only have last 5 lines
         lines = result["log_content"].strip().split("\n")
         assert len(lines) == 5
+
+    def test_get_logs_since_offset(self, initialized_state, state_dir):
+        """Test get_logs returns only lines appended after the cursor."""
+        from claude_task_master.mcp.tools import get_logs
+
+        state_manager, state = initialized_state
+
+        log_dir = state_dir / "logs"
+        log_dir.mkdir(exist_ok=True)
+        log_file = log_dir / f"run-{state.run_id}.txt"
+        log_file.write_text("Line 1\nLine 2\n")
+
+        first = get_logs(state_dir.parent, tail=1, state_dir=str(state_dir))
+        assert first["next_offset"] == log_file.stat().st_size
+
+        with open(log_file, "a") as f:
+            f.write("Line 3\n")
+
+        result = get_logs(
+            state_dir.parent, state_dir=str(state_dir), since_offset=first["next_offset"]
+        )
+        assert result["success"] is True
+        assert result["log_content"] == "Line 3\n"
+        assert result["next_offset"] == log_file.stat().st_size
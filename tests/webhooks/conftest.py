@@ -0,0 +1,29 @@
+"""Shared fixtures for webhook tests."""
+
+from collections.abc import Callable, Generator
+from typing import Any
+
+import pytest
+
+
+@pytest.fixture
+def closing() -> Generator[Callable[..., Callable[..., Any]], None, None]:
+    """Wrap a factory so everything it creates is closed after the test.
+
+    ``closing(cls, **defaults)`` returns a factory that builds ``cls`` with
+    ``defaults`` (overridable per call) and closes every instance it built
+    once the test finishes, so background threads never outlive a test.
+    """
+    created: list[Any] = []
+
+    def wrap(factory: Callable[..., Any], **defaults: Any) -> Callable[..., Any]:
+        def make(*args: Any, **kwargs: Any) -> Any:
+            obj = factory(*args, **{**defaults, **kwargs})
+            created.append(obj)
+            return obj
+
+        return make
+
+    yield wrap
+    for obj in reversed(created):
+        obj.close(timeout=1.0)
@@ -5,12 +5,13 @@ Tests cover:
 - WebhookClient initialization and configuration
 - Payload preparation and headers
 - Async and sync delivery methods
-- Retry logic and error handling
+- Retry logic, jittered backoff and Retry-After, and error handling
 - WebhookDeliveryResult and error classes
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -18,6 +19,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 
+from claude_task_master.core.retry import ErrorKind
 from claude_task_master.webhooks.client import (
     DEFAULT_MAX_RETRIES,
     DEFAULT_TIMEOUT,
@@ -458,6 +460,22 @@ class TestAsyncSend:
         assert result.success is False
         assert result.attempt_count == 2
 
+    @pytest.mark.asyncio
+    async def test_send_max_attempts_overrides_retries(self) -> None:
+        """Test that max_attempts=1 sends once without waiting to retry."""
+        client = WebhookClient("https://example.com/webhook", max_retries=3, retry_delay=30.0)
+
+        with patch.object(httpx.AsyncClient, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.side_effect = httpx.ConnectError("Connection refused")
+
+            result = await asyncio.wait_for(
+                client.send({"event": "test"}, max_attempts=1), timeout=5
+            )
+
+        assert result.success is False
+        assert result.attempt_count == 1
+        assert mock_post.call_count == 1
+
     @pytest.mark.asyncio
     async def test_send_recovery_after_retry(self) -> None:
         """Test successful delivery after initial failure."""
@@ -484,6 +502,19 @@ class TestAsyncSend:
         assert result.success is True
         assert result.attempt_count == 2
 
+    @pytest.mark.asyncio
+    async def test_send_with_shared_http_client(self) -> None:
+        """Test that a provided AsyncClient is used and left open."""
+        client = WebhookClient("https://example.com/webhook")
+        shared = MagicMock(spec=httpx.AsyncClient)
+        shared.post = AsyncMock(return_value=MagicMock(status_code=200, text="OK"))
+
+        result = await client.send({"event": "test"}, http_client=shared)
+
+        assert result.success is True
+        shared.post.assert_awaited_once()
+        shared.aclose.assert_not_called()
+
 
 # =============================================================================
 # Test: Sync Send
@@ -679,36 +710,60 @@ class TestRetryBackoff:
     """Tests for retry backoff behavior."""
 
     @pytest.mark.asyncio
-    async def test_exponential_backoff_calculation(self) -> None:
-        """Test that backoff increases exponentially."""
-        client = WebhookClient(
-            "https://example.com/webhook",
-            retry_delay=1.0,
-        )
-
-        # Test delay calculation (without actually sleeping)
-        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-            await client._wait_before_retry(1)
-            # First retry: 1.0 * 2^0 = 1.0
-            mock_sleep.assert_called_with(1.0)
+    async def test_jittered_backoff_grows_within_bounds(self) -> None:
+        """Test that delays stay between retry_delay and 3x the previous delay."""
+        client = WebhookClient("https://example.com/webhook", retry_delay=1.0, max_retries=10)
+        backoff = client.retry_policies.backoff()
 
+        delays = []
         with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-            await client._wait_before_retry(2)
-            # Second retry: 1.0 * 2^1 = 2.0
-            mock_sleep.assert_called_with(2.0)
+            for attempt in range(1, 6):
+                await client._wait_before_retry(attempt, backoff, ErrorKind.SERVER)
+                delays.append(mock_sleep.call_args.args[0])
 
-        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-            await client._wait_before_retry(3)
-            # Third retry: 1.0 * 2^2 = 4.0
-            mock_sleep.assert_called_with(4.0)
+        previous = 1.0
+        for delay in delays:
+            assert 1.0 <= delay <= min(30.0, previous * 3)
+            previous = delay
 
     def test_backoff_capped_at_30_seconds(self) -> None:
         """Test that backoff is capped at 30 seconds."""
         client = WebhookClient(
             "https://example.com/webhook",
             retry_delay=10.0,  # Large base delay
+            max_retries=10,
         )
+        backoff = client.retry_policies.backoff()
+
+        with patch("time.sleep") as mock_sleep:
+            for attempt in range(1, 6):
+                client._wait_before_retry_sync(attempt, backoff, ErrorKind.SERVER)
+                assert 10.0 <= mock_sleep.call_args.args[0] <= 30.0
+
+    def test_no_wait_after_last_attempt(self) -> None:
+        """Test that the final failed attempt returns without sleeping."""
+        client = WebhookClient("https://example.com/webhook", max_retries=2)
+        backoff = client.retry_policies.backoff()
 
         with patch("time.sleep") as mock_sleep:
-            client._wait_before_retry_sync(5)  # Would be 10 * 2^4 = 160, but capped
-            mock_sleep.assert_called_with(30.0)
+            client._wait_before_retry_sync(2, backoff, ErrorKind.SERVER)
+
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_429_honours_retry_after(self) -> None:
+        """Test that a 429's Retry-After header sets the delay."""
+        client = WebhookClient("https://example.com/webhook", max_retries=2, retry_delay=0.1)
+        limited = MagicMock(status_code=429, text="slow down", headers={"Retry-After": "7"})
+        ok = MagicMock(status_code=200, text="OK", headers={})
+
+        with (
+            patch.object(httpx.AsyncClient, "post", new_callable=AsyncMock) as mock_post,
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            mock_post.side_effect = [limited, ok]
+            result = await client.send({"event": "test"})
+
+        assert result.success is True
+        assert result.attempt_count == 2
+        mock_sleep.assert_awaited_once_with(7.0)
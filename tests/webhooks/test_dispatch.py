@@ -0,0 +1,290 @@
+"""Tests for the background webhook dispatch queue.
+
+Tests cover:
+- Non-blocking submit and flush
+- Per-endpoint concurrency limits
+- Overflow policies (drop oldest, drop newest, spill)
+- Spilling leftovers on close and flushing from ShutdownManager
+- Latency metrics and pooled httpx client reuse
+- WebhookEmitter queueing through a dispatcher
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from claude_task_master.core.orchestrator import WebhookEmitter
+from claude_task_master.core.shutdown import get_shutdown_manager
+from claude_task_master.webhooks.client import WebhookClient, WebhookDeliveryResult
+from claude_task_master.webhooks.dispatch import OverflowPolicy, WebhookDispatchQueue
+
+
+class FakeClient:
+    """Stand-in WebhookClient that records deliveries and concurrency."""
+
+    def __init__(self, url: str = "https://example.com/hook", delay: float = 0.0) -> None:
+        self.url = url
+        self.verify_ssl = True
+        self.delay = delay
+        self.gate: threading.Event | None = None  # Blocks sends until set
+        self.started = threading.Event()
+        self.sent: list[str | None] = []
+        self.active = 0
+        self.peak = 0
+
+    async def send(
+        self,
+        data: dict[str, Any],
+        event_type: str | None = None,
+        delivery_id: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> WebhookDeliveryResult:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.started.set()
+        try:
+            if self.gate is not None:
+                while not self.gate.is_set():
+                    await asyncio.sleep(0.005)
+            await asyncio.sleep(self.delay)
+            self.sent.append(delivery_id)
+            return WebhookDeliveryResult(success=True, status_code=200, delivery_id=delivery_id)
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def dispatch_queue(closing):
+    """Create queues that are always closed after the test."""
+    return closing(WebhookDispatchQueue)
+
+
+# =============================================================================
+# Delivery Tests
+# =============================================================================
+
+
+class TestDelivery:
+    """Tests for submitting and delivering webhooks."""
+
+    def test_submit_does_not_block(self, dispatch_queue):
+        """Test that submit returns before a slow delivery finishes."""
+        queue = dispatch_queue()
+        client = FakeClient(delay=0.3)
+
+        start = time.monotonic()
+        assert queue.submit(client, {"n": 1}, delivery_id="d1")
+        assert time.monotonic() - start < 0.1
+
+        assert queue.flush(timeout=5)
+        assert client.sent == ["d1"]
+        assert queue.stats.delivered == 1
+
+    def test_endpoint_concurrency_limit(self, dispatch_queue):
+        """Test that each endpoint gets at most endpoint_concurrency sends."""
+        queue = dispatch_queue(endpoint_concurrency=2)
+        first = FakeClient("https://a.example.com", delay=0.03)
+        second = FakeClient("https://b.example.com", delay=0.03)
+
+        for i in range(6):
+            queue.submit(first, {}, delivery_id=f"a{i}")
+            queue.submit(second, {}, delivery_id=f"b{i}")
+
+        assert queue.flush(timeout=5)
+        assert first.peak == 2 and second.peak == 2
+        assert sorted(first.sent) == [f"a{i}" for i in range(6)]
+
+    def test_latency_metrics(self, dispatch_queue):
+        """Test that submit-to-delivery latencies are recorded."""
+        queue = dispatch_queue()
+        client = FakeClient(delay=0.01)
+
+        for i in range(5):
+            queue.submit(client, {}, delivery_id=str(i))
+        queue.flush(timeout=5)
+
+        stats = queue.stats.to_dict()
+        assert stats["submitted"] == 5
+        assert stats["latency_p99_ms"] >= stats["latency_p50_ms"] >= 10
+
+    def test_closed_queue_rejects_submit(self, dispatch_queue):
+        """Test that a closed queue refuses new deliveries."""
+        queue = dispatch_queue()
+        queue.close()
+
+        assert queue.submit(FakeClient(), {}) is False
+
+    def test_submit_racing_close(self, dispatch_queue):
+        """Test that deliveries accepted during close are sent and the loop stays stopped."""
+        queue = dispatch_queue()
+        client = FakeClient()
+        accepted: list[bool] = []
+        go = threading.Event()
+
+        def producer() -> None:
+            go.wait()
+            for _ in range(50):
+                accepted.append(queue.submit(client, {}))
+
+        threads = [threading.Thread(target=producer) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        queue.submit(client, {})  # Start the loop
+        go.set()
+        assert queue.close(timeout=5)
+        for thread in threads:
+            thread.join()
+
+        assert len(client.sent) == 1 + sum(accepted)
+        assert not queue._background.is_running
+
+    def test_pooled_http_client_is_reused(self, dispatch_queue):
+        """Test that real clients send through one shared AsyncClient."""
+        queue = dispatch_queue()
+        client = WebhookClient("https://example.com/hook")
+        response = MagicMock(status_code=200, text="ok")
+
+        with patch.object(httpx.AsyncClient, "post", new_callable=AsyncMock) as post:
+            post.return_value = response
+            with patch.object(httpx.AsyncClient, "aclose", new_callable=AsyncMock) as aclose:
+                for i in range(3):
+                    queue.submit(client, {"n": i}, delivery_id=str(i))
+                assert queue.flush(timeout=5)
+                aclose.assert_not_awaited()  # Not closed per delivery
+
+        assert post.await_count == 3
+        assert queue.stats.delivered == 3
+        assert len(queue._http_clients) == 1
+
+
+# =============================================================================
+# Overflow Tests
+# =============================================================================
+
+
+def _fill(queue: WebhookDispatchQueue, client: FakeClient, count: int) -> None:
+    """Start one delivery (held by the gate), then submit more."""
+    client.gate = threading.Event()
+    queue.submit(client, {"n": 0}, delivery_id="0")
+    assert client.started.wait(2)
+    for i in range(1, count):
+        queue.submit(client, {"n": i}, delivery_id=str(i))
+
+
+class TestOverflow:
+    """Tests for full-queue policies."""
+
+    def test_drop_oldest(self, dispatch_queue):
+        """Test that the oldest queued delivery makes room for the new one."""
+        queue = dispatch_queue(max_size=2, endpoint_concurrency=1)
+        client = FakeClient()
+
+        _fill(queue, client, 4)
+        client.gate.set()
+
+        assert queue.flush(timeout=5)
+        assert client.sent == ["0", "2", "3"]
+        assert queue.stats.dropped == 1
+
+    def test_drop_newest(self, dispatch_queue):
+        """Test that new deliveries are dropped while the queue is full."""
+        queue = dispatch_queue(max_size=2, endpoint_concurrency=1, overflow="drop_newest")
+        client = FakeClient()
+
+        _fill(queue, client, 4)
+        client.gate.set()
+
+        assert queue.flush(timeout=5)
+        assert client.sent == ["0", "1", "2"]
+        assert queue.stats.dropped == 1
+
+    def test_spill(self, dispatch_queue, temp_dir):
+        """Test that overflow is written to the spill file without secrets."""
+        spill = temp_dir / "spill.jsonl"
+        queue = dispatch_queue(
+            max_size=1, endpoint_concurrency=1, overflow=OverflowPolicy.SPILL, spill_path=spill
+        )
+        client = FakeClient()
+
+        _fill(queue, client, 3)
+        client.gate.set()
+        assert queue.flush(timeout=5)
+
+        records = [json.loads(line) for line in spill.read_text().splitlines()]
+        assert [r["delivery_id"] for r in records] == ["2"]
+        assert records[0]["url"] == client.url
+        assert "secret" not in records[0]
+        assert queue.stats.spilled == 1
+
+    def test_close_spills_leftovers(self, dispatch_queue, temp_dir):
+        """Test that deliveries still queued at close time are spilled."""
+        spill = temp_dir / "spill.jsonl"
+        queue = dispatch_queue(endpoint_concurrency=1, spill_path=spill)
+        client = FakeClient()
+
+        _fill(queue, client, 3)
+
+        assert queue.close(timeout=0.05) is False
+        assert len(spill.read_text().splitlines()) == 2
+
+    def test_invalid_sizes_rejected(self):
+        """Test that a queue needs room for at least one delivery."""
+        with pytest.raises(ValueError, match="max_size"):
+            WebhookDispatchQueue(max_size=0)
+
+
+# =============================================================================
+# Shutdown and Emitter Integration Tests
+# =============================================================================
+
+
+class TestIntegration:
+    """Tests for ShutdownManager and WebhookEmitter integration."""
+
+    def test_shutdown_callbacks_flush_queue(self, dispatch_queue):
+        """Test that ShutdownManager callbacks flush and close the queue."""
+        queue = dispatch_queue()
+        queue.register_shutdown_hook()
+        client = FakeClient(delay=0.05)
+        queue.submit(client, {}, delivery_id="last")
+
+        get_shutdown_manager().run_callbacks()
+
+        assert queue.closed
+        assert client.sent == ["last"]
+        assert queue._on_shutdown not in get_shutdown_manager()._callbacks
+
+    def test_emitter_queues_events(self, dispatch_queue):
+        """Test that the emitter hands events to the dispatcher."""
+        queue = dispatch_queue()
+        client = FakeClient()
+        client.send_sync = MagicMock()
+
+        WebhookEmitter(client, run_id="run-1", dispatcher=queue).emit(
+            "task.started", task_index=0, task_description="Do it"
+        )
+        queue.flush(timeout=5)
+
+        assert len(client.sent) == 1
+        client.send_sync.assert_not_called()
+
+    def test_emitter_falls_back_when_closed(self, dispatch_queue):
+        """Test that events are sent directly once the dispatcher is closed."""
+        queue = dispatch_queue()
+        queue.close()
+        client = MagicMock()
+        client.send_sync.return_value = MagicMock(success=True)
+
+        WebhookEmitter(client, dispatcher=queue).emit(
+            "task.started", task_index=0, task_description="Do it"
+        )
+
+        client.send_sync.assert_called_once()
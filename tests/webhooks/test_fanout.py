@@ -0,0 +1,261 @@
+"""Tests for multi-endpoint webhook fan-out.
+
+Tests cover:
+- Loading webhooks.json (REST API and list layouts) and reloading on change
+- Concurrent delivery to subscribed endpoints only
+- One serialization per event and one HMAC per distinct secret
+- Pooled AsyncClients per host and per-endpoint latency stats
+- WebhookEmitter fan-out without a single webhook client
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from claude_task_master.core.orchestrator import WebhookEmitter
+from claude_task_master.webhooks import client as client_module
+from claude_task_master.webhooks import fanout as fanout_module
+from claude_task_master.webhooks.client import HEADER_SIGNATURE_256, verify_signature
+from claude_task_master.webhooks.fanout import HTTP2_AVAILABLE, WebhookFanout
+
+
+def write_webhooks(path: Path, webhooks: dict[str, dict[str, Any]]) -> None:
+    """Write webhooks.json in the REST API layout, bumping the mtime."""
+    path.write_text(json.dumps({"webhooks": webhooks, "updated_at": "2025-01-18T12:00:00"}))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class RecordingPost:
+    """Replacement for httpx.AsyncClient.post that records requests."""
+
+    def __init__(self, delay: float = 0.0, status: int = 200) -> None:
+        self.delay = delay
+        self.status = status
+        self.requests: list[tuple[str, bytes, dict[str, str]]] = []
+
+    async def __call__(self, url, content=None, headers=None, timeout=None):
+        self.requests.append((url, content, headers))
+        await asyncio.sleep(self.delay)
+        return MagicMock(status_code=self.status, text="ok")
+
+
+@pytest.fixture
+def webhooks_file(temp_dir: Path) -> Path:
+    path = temp_dir / "webhooks.json"
+    write_webhooks(
+        path,
+        {
+            "wh_a": {"url": "https://a.example.com/hook", "secret": "s1"},
+            "wh_b": {"url": "https://a.example.com/other", "secret": "s1"},
+            "wh_c": {
+                "url": "https://c.example.com/hook",
+                "secret": "s2",
+                "events": ["pr.created"],
+            },
+            "wh_d": {"url": "https://d.example.com/hook", "enabled": False},
+        },
+    )
+    return path
+
+
+@pytest.fixture
+def make_fanout(closing):
+    """Create fan-outs that are always closed after the test."""
+    return closing(WebhookFanout)
+
+
+def _event(event_type: str = "task.completed") -> dict[str, Any]:
+    return {"event_type": event_type, "event_id": "evt-1", "task_index": 0}
+
+
+# =============================================================================
+# Configuration Tests
+# =============================================================================
+
+
+class TestConfiguration:
+    """Tests for loading and watching webhooks.json."""
+
+    def test_endpoints_filtered_by_event(self, webhooks_file, make_fanout):
+        """Test that only enabled, subscribed endpoints are selected."""
+        fanout = make_fanout(webhooks_file)
+
+        task_urls = [c.url for c in fanout.endpoints_for("task.completed")]
+        pr_urls = [c.url for c in fanout.endpoints_for("pr.created")]
+
+        assert task_urls == ["https://a.example.com/hook", "https://a.example.com/other"]
+        assert "https://c.example.com/hook" in pr_urls
+        assert len(pr_urls) == 3
+
+    def test_excluded_urls_skipped(self, webhooks_file, make_fanout):
+        """Test that the --webhook-url endpoint isn't sent the event a second time."""
+        fanout = make_fanout(webhooks_file, exclude_urls=["https://a.example.com/hook"])
+
+        assert [c.url for c in fanout.endpoints_for("task.completed")] == [
+            "https://a.example.com/other"
+        ]
+
+    def test_reloads_changed_file(self, webhooks_file, make_fanout):
+        """Test that edits to webhooks.json are picked up."""
+        fanout = make_fanout(webhooks_file, reload_interval=0)
+        write_webhooks(webhooks_file, {"wh_x": {"url": "https://x.example.com/hook"}})
+
+        assert [c.url for c in fanout.endpoints_for("task.completed")] == [
+            "https://x.example.com/hook"
+        ]
+
+    def test_invalid_file_keeps_previous_config(self, webhooks_file, make_fanout):
+        """Test that a broken edit doesn't drop the working configuration."""
+        fanout = make_fanout(webhooks_file, reload_interval=0)
+        webhooks_file.write_text("{not json")
+
+        assert len(fanout.endpoints_for("task.completed")) == 2
+
+    def test_missing_file_means_no_endpoints(self, temp_dir, make_fanout):
+        """Test that submit is a cheap no-op without webhooks.json."""
+        fanout = make_fanout(temp_dir / "webhooks.json")
+
+        assert fanout.submit(_event()) is True
+        assert fanout.latency_stats() == {}
+
+    @pytest.mark.skipif(HTTP2_AVAILABLE, reason="h2 is installed")
+    def test_http2_requires_h2(self, webhooks_file):
+        """Test that requesting HTTP/2 without h2 fails early."""
+        with pytest.raises(ValueError, match="h2"):
+            WebhookFanout(webhooks_file, http2=True)
+
+
+# =============================================================================
+# Delivery Tests
+# =============================================================================
+
+
+class TestFanOut:
+    """Tests for delivering one event to many endpoints."""
+
+    def test_concurrent_delivery(self, webhooks_file, make_fanout):
+        """Test that endpoints are sent to concurrently, not one by one."""
+        fanout = make_fanout(webhooks_file)
+        post = RecordingPost(delay=0.2)
+
+        with patch.object(httpx.AsyncClient, "post", new=post):
+            start = time.monotonic()
+            results = fanout.send_sync(_event("pr.created"), delivery_id="evt-1")
+            elapsed = time.monotonic() - start
+
+        assert len(results) == 3
+        assert all(r.success for r in results.values())
+        assert elapsed < 0.5
+
+    def test_serialize_and_sign_once(self, webhooks_file, make_fanout):
+        """Test one serialization per event and one HMAC per distinct secret."""
+        fanout = make_fanout(webhooks_file)
+        post = RecordingPost()
+
+        with (
+            patch.object(httpx.AsyncClient, "post", new=post),
+            patch.object(
+                fanout_module, "serialize_payload", wraps=client_module.serialize_payload
+            ) as serialize,
+            patch.object(client_module, "sign_payload", wraps=client_module.sign_payload) as sign,
+        ):
+            fanout.send_sync(_event("pr.created"), delivery_id="evt-1")
+
+        assert serialize.call_count == 1
+        assert sorted(c.args[1] for c in sign.call_args_list) == ["s1", "s2"]
+        payloads = {content for _, content, _ in post.requests}
+        assert len(payloads) == 1
+        for url, content, headers in post.requests:
+            secret = "s2" if "c.example" in url else "s1"
+            timestamp = headers["X-Webhook-Timestamp"]
+            assert verify_signature(
+                f"{timestamp}.".encode() + content, secret, headers[HEADER_SIGNATURE_256]
+            )
+
+    def test_pooled_client_per_host(self, webhooks_file, make_fanout):
+        """Test that endpoints on one host share a pooled AsyncClient."""
+        fanout = make_fanout(webhooks_file)
+
+        with patch.object(httpx.AsyncClient, "post", new=RecordingPost()):
+            for _ in range(3):
+                fanout.send_sync(_event("pr.created"))
+
+        hosts = sorted(key[1] for key in fanout._http_clients)
+        assert hosts == ["a.example.com", "c.example.com"]
+
+    def test_submit_and_latency_stats(self, webhooks_file, make_fanout):
+        """Test background delivery and per-endpoint p50/p99 latency."""
+        fanout = make_fanout(webhooks_file)
+
+        with patch.object(httpx.AsyncClient, "post", new=RecordingPost(delay=0.01)):
+            for _ in range(5):
+                assert fanout.submit(_event())
+            assert fanout.flush(timeout=5)
+
+        stats = fanout.latency_stats()
+        assert set(stats) == {"https://a.example.com/hook", "https://a.example.com/other"}
+        hook = stats["https://a.example.com/hook"]
+        assert hook["delivered"] == 5
+        assert hook["latency_p99_ms"] >= hook["latency_p50_ms"] >= 10
+
+    def test_closed_fanout_rejects_submit(self, webhooks_file, make_fanout):
+        """Test that a closed fanout refuses new events."""
+        fanout = make_fanout(webhooks_file)
+        fanout.close()
+
+        assert fanout.submit(_event()) is False
+
+    def test_submit_racing_close(self, webhooks_file, make_fanout):
+        """Test that events accepted during close are sent and the loop stays stopped."""
+        fanout = make_fanout(webhooks_file)
+        recorder = RecordingPost()
+        accepted: list[bool] = []
+        go = threading.Event()
+
+        def producer() -> None:
+            go.wait()
+            for _ in range(20):
+                accepted.append(fanout.submit(_event()))
+
+        with patch.object(httpx.AsyncClient, "post", new=recorder):
+            threads = [threading.Thread(target=producer) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            fanout.submit(_event())  # Start the loop
+            go.set()
+            assert fanout.close(timeout=5)
+            for thread in threads:
+                thread.join()
+
+        # Two endpoints subscribe to task.completed
+        assert len(recorder.requests) == 2 * (1 + sum(accepted))
+        assert not fanout._background.is_running
+
+
+class TestEmitterFanOut:
+    """Tests for WebhookEmitter with a fan-out fanout."""
+
+    def test_emitter_fans_out_without_client(self, webhooks_file, make_fanout):
+        """Test that webhooks.json endpoints work without --webhook-url."""
+        fanout = make_fanout(webhooks_file)
+        post = RecordingPost()
+        emitter = WebhookEmitter(None, run_id="run-1", fanout=fanout)
+
+        with patch.object(httpx.AsyncClient, "post", new=post):
+            emitter.emit("task.started", task_index=0, task_description="Do it")
+            assert fanout.flush(timeout=5)
+
+        assert emitter.enabled
+        assert len(post.requests) == 2
+        assert all(h["X-Webhook-Event"] == "task.started" for _, _, h in post.requests)
@@ -0,0 +1,337 @@
+"""Tests for the durable webhook outbox.
+
+Tests cover:
+- Appending, reading and segment rollover
+- Per-endpoint cursors, pending counts and pruning
+- Finding events by ID and time range
+- OutboxSender delivery, backoff, rejection and cross-run backlog
+- Replaying records to an endpoint
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from claude_task_master.webhooks.client import WebhookClient, WebhookDeliveryResult
+from claude_task_master.webhooks.outbox import (
+    OutboxPosition,
+    OutboxSender,
+    WebhookOutbox,
+    replay_records,
+)
+
+
+class ScriptedClient:
+    """Stand-in WebhookClient that returns scripted status codes."""
+
+    def __init__(self, url: str = "https://example.com/hook", statuses: list[int] | None = None):
+        self.url = url
+        self.verify_ssl = True
+        self.statuses = list(statuses or [])  # Consumed per send; 200 when empty
+        self.sent: list[str | None] = []
+        self.max_attempts: int | None = None  # Of the last send
+        self.lock = threading.Lock()
+
+    async def send(
+        self,
+        data: dict[str, Any],
+        event_type: str | None = None,
+        delivery_id: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        max_attempts: int | None = None,
+    ) -> WebhookDeliveryResult:
+        await asyncio.sleep(0)
+        self.max_attempts = max_attempts
+        with self.lock:
+            status = self.statuses.pop(0) if self.statuses else 200
+            if status < 400:
+                self.sent.append(delivery_id)
+        return WebhookDeliveryResult(
+            success=status < 400,
+            status_code=status,
+            delivery_id=delivery_id,
+            error=None if status < 400 else f"HTTP {status}",
+        )
+
+
+def _event(n: int) -> dict[str, Any]:
+    return {"event_type": "task.completed", "event_id": f"evt-{n}", "task_index": n}
+
+
+@pytest.fixture
+def outbox(temp_dir) -> WebhookOutbox:
+    return WebhookOutbox.for_state_dir(temp_dir, fsync=False)
+
+
+@pytest.fixture
+def make_sender(closing):
+    """Create senders that are always closed after the test."""
+    return closing(OutboxSender, base_backoff=0.01)
+
+
+# =============================================================================
+# WebhookOutbox Tests
+# =============================================================================
+
+
+class TestWebhookOutbox:
+    """Tests for the on-disk event log."""
+
+    def test_append_and_read(self, outbox):
+        """Test that records round-trip with chained positions."""
+        first = outbox.append(_event(1))
+        second = outbox.append(_event(2))
+
+        records = outbox.read(OutboxPosition(1, 0))
+
+        assert [r.event_id for r in records] == ["evt-1", "evt-2"]
+        assert records[0].event_type == "task.completed"
+        assert records[0].next_position == second.position == first.next_position
+        assert outbox.end_position() == second.next_position
+
+    def test_segment_rollover(self, temp_dir):
+        """Test that a full segment starts a new one and reads span both."""
+        outbox = WebhookOutbox(temp_dir / "outbox", segment_max_bytes=200, fsync=False)
+
+        for n in range(6):
+            outbox.append(_event(n))
+
+        assert len(outbox.segments()) > 1
+        records = outbox.read(outbox.start_position(), limit=100)
+        assert [r.event_id for r in records] == [f"evt-{n}" for n in range(6)]
+
+    def test_incomplete_trailing_line_skipped(self, outbox):
+        """Test that a torn write is ignored until it is complete."""
+        record = outbox.append(_event(1))
+        with open(outbox.root / "segment-000001.jsonl", "ab") as f:
+            f.write(b'{"event_id": "torn"')
+
+        assert [r.event_id for r in outbox.read(record.position)] == ["evt-1"]
+
+    def test_new_endpoint_starts_at_end(self, outbox):
+        """Test that a new endpoint only receives events appended after it joins."""
+        outbox.append(_event(1))
+        url = "https://example.com/hook"
+
+        cursor = outbox.ensure_cursor(url)
+        outbox.append(_event(2))
+
+        assert [r.event_id for r in outbox.read(cursor)] == ["evt-2"]
+        assert outbox.pending(url) == 1
+
+    def test_commit_persists_cursor(self, outbox):
+        """Test that committed cursors survive a new outbox instance."""
+        url = "https://example.com/hook"
+        outbox.ensure_cursor(url)
+        record = outbox.append(_event(1))
+
+        outbox.commit(url, record.next_position)
+
+        reopened = WebhookOutbox(outbox.root)
+        assert reopened.get_cursor(url) == record.next_position
+        assert reopened.pending(url) == 0
+        assert reopened.cursors() == {url: record.next_position}
+
+    def test_find_by_id_and_time(self, outbox):
+        """Test filtering records by event ID and appended time."""
+        for n in range(3):
+            outbox.append(_event(n))
+        now = datetime.now(timezone.utc)
+
+        assert [r.event_id for r in outbox.find(event_ids=["evt-2", "evt-0"])] == [
+            "evt-0",
+            "evt-2",
+        ]
+        assert len(outbox.find(since=now - timedelta(minutes=1))) == 3
+        assert outbox.find(until=now - timedelta(minutes=1)) == []
+
+    def test_prune_keeps_undelivered_segments(self, temp_dir):
+        """Test that only segments every cursor has passed are deleted."""
+        outbox = WebhookOutbox(
+            temp_dir / "outbox", segment_max_bytes=100, max_segments=1, fsync=False
+        )
+        slow = "https://slow.example.com"
+        fast = "https://fast.example.com"
+        outbox.ensure_cursor(slow)
+        outbox.ensure_cursor(fast)
+        records = [outbox.append(_event(n)) for n in range(4)]
+        assert len(outbox.segments()) == 4
+
+        outbox.commit(fast, records[-1].next_position)
+        assert len(outbox.segments()) == 4  # slow still needs them
+
+        outbox.commit(slow, records[2].position)
+        assert outbox.segments() == [3, 4]
+
+    def test_removed_endpoint_stops_pinning_segments(self, temp_dir):
+        """Test that retiring a removed endpoint's cursor lets segments be pruned."""
+        outbox = WebhookOutbox(
+            temp_dir / "outbox", segment_max_bytes=100, max_segments=1, fsync=False
+        )
+        removed = "https://old.example.com"
+        current = "https://new.example.com"
+        outbox.ensure_cursor(removed)
+        outbox.ensure_cursor(current)
+        records = [outbox.append(_event(n)) for n in range(4)]
+        outbox.commit(current, records[-1].next_position)
+        assert len(outbox.segments()) == 4  # Pinned by the removed endpoint
+
+        assert outbox.retire_cursors([current]) == [removed]
+
+        assert outbox.segments() == [4]
+        assert set(outbox.cursors()) == {current}
+        assert outbox.retire_cursors([current]) == []
+
+
+# =============================================================================
+# OutboxSender Tests
+# =============================================================================
+
+
+class TestOutboxSender:
+    """Tests for background delivery from the outbox."""
+
+    def test_submit_delivers_and_commits(self, outbox, make_sender):
+        """Test that submitted events are delivered in order and committed."""
+        sender = make_sender(outbox)
+        client = ScriptedClient()
+
+        for n in range(5):
+            assert sender.submit(client, _event(n), delivery_id=f"evt-{n}")
+        assert sender.flush(timeout=5)
+
+        assert client.sent == [f"evt-{n}" for n in range(5)]
+        assert outbox.pending(client.url) == 0
+        assert sender.stats.delivered == 5
+        assert client.max_attempts == 1  # Retries are the sender's backoff
+
+    def test_failures_back_off_and_retry(self, outbox, make_sender):
+        """Test that a failing endpoint is retried until it accepts events."""
+        sender = make_sender(outbox)
+        client = ScriptedClient(statuses=[503, 503, 200, 200])
+
+        sender.submit(client, _event(1), delivery_id="evt-1")
+        sender.submit(client, _event(2), delivery_id="evt-2")
+
+        assert sender.flush(timeout=5)
+        assert client.sent == ["evt-1", "evt-2"]
+        assert sender.stats.failed == 2
+
+    def test_rejected_events_are_skipped(self, outbox, make_sender):
+        """Test that a non-retryable 4xx does not block later events."""
+        sender = make_sender(outbox)
+        client = ScriptedClient(statuses=[400])
+
+        sender.submit(client, _event(1), delivery_id="evt-1")
+        sender.submit(client, _event(2), delivery_id="evt-2")
+
+        assert sender.flush(timeout=5)
+        assert client.sent == ["evt-2"]
+        assert sender.stats.rejected == 1
+        assert outbox.find(event_ids=["evt-1"])  # Kept for replay
+
+    def test_undelivered_events_sent_on_next_run(self, outbox, make_sender):
+        """Test that events left at close are delivered by the next sender."""
+        down = ScriptedClient(statuses=[503] * 1000)
+        first = make_sender(outbox, base_backoff=0.05)
+        first.submit(down, _event(1), delivery_id="evt-1")
+
+        assert first.close(timeout=0.1) is False
+        assert outbox.pending(down.url) == 1
+
+        up = ScriptedClient(url=down.url)
+        second = make_sender(outbox)
+        second.add_endpoint(up)
+        assert second.flush(timeout=5)
+        assert up.sent == ["evt-1"]
+
+    def test_close_does_not_wait_for_failing_endpoint(self, outbox, make_sender):
+        """Test that close gives up on a failing endpoint instead of timing out."""
+        down = ScriptedClient(statuses=[503] * 1000)
+        sender = make_sender(outbox, base_backoff=30.0)
+        sender.submit(down, _event(1), delivery_id="evt-1")
+
+        start = time.monotonic()
+        assert sender.close(timeout=10) is False
+
+        assert time.monotonic() - start < 5
+        assert outbox.pending(down.url) == 1  # Kept for the next run
+
+    def test_submit_racing_close(self, outbox, make_sender):
+        """Test that events accepted during close are sent and the loop stays stopped."""
+        sender = make_sender(outbox)
+        client = ScriptedClient()
+        accepted: list[bool] = []
+        go = threading.Event()
+
+        def producer() -> None:
+            go.wait()
+            for n in range(20):
+                accepted.append(sender.submit(client, _event(n)))
+
+        threads = [threading.Thread(target=producer) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        sender.submit(client, _event(0))  # Start the loop
+        go.set()
+        assert sender.close(timeout=5)
+        for thread in threads:
+            thread.join()
+
+        assert len(client.sent) == 1 + sum(accepted)
+        assert not sender._background.is_running
+
+    def test_closed_sender_rejects_submit(self, outbox, make_sender):
+        """Test that a closed sender refuses new events."""
+        sender = make_sender(outbox)
+        sender.close()
+
+        assert sender.submit(ScriptedClient(), _event(1)) is False
+        assert outbox.segments() == []
+
+
+# =============================================================================
+# Replay Tests
+# =============================================================================
+
+
+class TestReplay:
+    """Tests for redelivering outbox records."""
+
+    async def test_replay_records(self, outbox):
+        """Test that records are resent with their original delivery IDs."""
+        for n in range(3):
+            outbox.append(_event(n))
+        client = WebhookClient("https://example.com/hook")
+        ok = WebhookDeliveryResult(success=True, status_code=200)
+
+        with patch.object(WebhookClient, "send", new_callable=AsyncMock) as send:
+            send.return_value = ok
+            results = await replay_records(outbox.find(event_ids=["evt-1", "evt-2"]), client)
+
+        assert [r.event_id for r, _ in results] == ["evt-1", "evt-2"]
+        assert [c.kwargs["delivery_id"] for c in send.await_args_list] == ["evt-1", "evt-2"]
+        assert send.await_args_list[0].kwargs["data"] == _event(1)
+
+    def test_records_omit_secrets(self, outbox, make_sender):
+        """Test that the outbox stores payloads but never endpoint secrets."""
+        sender = make_sender(outbox)
+        client = ScriptedClient()
+        client.secret = "hunter2"  # type: ignore[attr-defined]
+
+        sender.submit(client, _event(1), delivery_id="evt-1")
+        sender.flush(timeout=5)
+
+        for path in outbox.root.rglob("*.json*"):
+            assert "hunter2" not in path.read_text()
+        line = json.loads((outbox.root / "segment-000001.jsonl").read_text())
+        assert line["data"] == _event(1)